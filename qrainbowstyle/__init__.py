@@ -46,12 +46,25 @@ Alternatively, from environment variables provided by QtPy, Qt.Py
     # Qt.Py
     stylesheet = qrainbowstyle.load_stylesheet(style='oceanic', qt_api=Qt.__binding__)
 
+Stylesheet can also be rendered at runtime from your own palette class, which
+subclasses qrainbowstyle.palette.BasePalette. Icons are taken from the style
+
+.. code-block:: python
+
+    stylesheet = qrainbowstyle.load_stylesheet(style='oceanic', palette=MyPalette)
+
 Finally, set your QApplication with it
 
 .. code-block:: python
 
     app.setStyleSheet(stylesheet)
 
+To theme only one window or widget subtree, load stylesheet scoped to its object name
+
+.. code-block:: python
+
+    window.setStyleSheet(qrainbowstyle.load_scoped_stylesheet(window.objectName(), style='oceanic'))
+
 To load frameless window in your app import both qrainbowstyle and qrainbowstyle.windows modules
 
 .. code-block:: python
@@ -92,10 +105,21 @@ Enjoy!
 
 # Standard library imports
 import os
+import re
+import math
 import sys
+import json
+import hashlib
 import inspect
 import logging
+import functools
 import platform
+import importlib
+import importlib.util
+import types
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 import qrainbowstyle
 
 __version__ = "0.9.6"
@@ -114,12 +138,18 @@ RC_PATH = os.path.join(PACKAGE_PATH, 'rc')
 SVG_PATH = os.path.join(PACKAGE_PATH, 'svg')
 STYLES_PATH = os.path.join(PACKAGE_PATH, 'styles')
 
+# Directory in STYLES_PATH with resources identical in all styles
+SHARED_RESOURCES_DIR = '_shared'
+
 BUTTONS_DARWIN_PATH = os.path.join(SVG_PATH, 'buttons_darwin')
 BUTTONS_NT_PATH = os.path.join(SVG_PATH, 'buttons_nt')
 
 # File names
 QSS_FILE = 'style.qss'
 QRC_FILE = QSS_FILE.replace('.qss', '.qrc')
+RCC_FILE = QSS_FILE.replace('.qss', '.rcc')
+QSS_TEMPLATE_FILE = 'style_template.py'
+MANIFEST_FILE = 'manifest.json'
 
 MAIN_SCSS_FILE = 'main.scss'
 STYLES_SCSS_FILE = '_styles.scss'
@@ -129,6 +159,9 @@ VARIABLES_SCSS_FILE = '_variables.scss'
 QSS_FILEPATH = os.path.join(PACKAGE_PATH, QSS_FILE)
 QRC_FILEPATH = os.path.join(PACKAGE_PATH, QRC_FILE)
 
+MANIFEST_FILEPATH = os.path.join(STYLES_PATH, MANIFEST_FILE)
+QSS_TEMPLATE_FILEPATH = os.path.join(STYLES_PATH, SHARED_RESOURCES_DIR, QSS_TEMPLATE_FILE)
+
 MAIN_SCSS_FILEPATH = os.path.join(QSS_PATH, MAIN_SCSS_FILE)
 STYLES_SCSS_FILEPATH = os.path.join(QSS_PATH, STYLES_SCSS_FILE)
 VARIABLES_SCSS_FILEPATH = os.path.join(QSS_PATH, VARIABLES_SCSS_FILE)
@@ -142,6 +175,64 @@ APP_NAME = None
 # Path to app icon
 APP_ICON_PATH = None
 
+# Register binary .rcc resources instead of importing style_rc.py when available
+USE_BINARY_RESOURCES = True
+
+# Recolor base svg images at load time instead of registering png images of styles
+USE_SVG_RESOURCES = False
+
+# Render images for device pixel ratios of screens, which are not contained in styles
+USE_HIGH_DPI_IMAGES = True
+
+# Maximum number of palettes with compiled substitution of rainbowize
+RAINBOWIZE_CACHE_SIZE = 32
+IDENTIFIER_CHAR_PATTERN = re.compile(r"[A-Za-z0-9_]")
+
+# Maximum number of patched stylesheets (and their resources) kept in memory
+STYLESHEET_CACHE_SIZE = 8
+
+# Cache of loaded styles, (style, frozen palette, binding, Qt version, OS) -> (style_rc module, stylesheet)
+_stylesheet_cache = OrderedDict()
+
+# Palette of loaded stylesheet
+_current_palette = None
+
+# ThemeState following _current_palette, created by getCurrentTheme
+_theme = None
+
+# Styles prepared by preloadStylesheet, cache key -> Future of _prepare_stylesheet result
+_preloaded = OrderedDict()
+_preload_executor = None
+
+# Styles registered for scoped stylesheets, style -> resource root (None if not available)
+_scoped_resources = {}
+
+# Svg images registered for palettes, palette -> (resource root, image names, compiled resources)
+_svg_resources = {}
+
+# Images of themes created by create_custom_theme, palette values -> (resource root, image names,
+# compiled resources), the least recently used themes are unregistered
+_custom_themes = OrderedDict()
+
+# Images rendered for device pixel ratios of screens, (resource directory, palette) ->
+# {"images": name -> size at 1x, "resources": ratio -> compiled resources, "registered": registered ratios}
+_high_dpi_images = {}
+
+# Keys of _high_dpi_images used by loaded stylesheets, (style directory, palette, active) -> list of keys
+_high_dpi_styles = {}
+
+# Stylesheet and style directory of the active style, rendered again when screens change
+_active_high_dpi_style = None
+_screen_signals_connected = False
+
+# Urls of style resources in stylesheet
+RESOURCE_URL_PATTERN = re.compile(r'url\(":/(qss_icons/[^"]+)"\)')
+PNG_URL_PATTERN = re.compile(r'url\(":/([^"]+)/([^"/]+\.png)"\)')
+
+# Manifest of compiled styles and lowercase style name -> style name map, read once
+_manifest = None
+_style_names = {}
+
 
 def setAppIcon(icon_path: str):
     """Set path to app icon which will be used in titlebars"""
@@ -160,36 +251,200 @@ def useDarwinButtons():
     _logger.info("Darwin buttons style has been enabled")
 
 
+def useBinaryResources(enabled: bool = True):
+    """Register styles from binary .rcc files instead of style_rc.py modules"""
+    qrainbowstyle.USE_BINARY_RESOURCES = enabled
+    clearStylesheetCache()
+    _logger.info("Binary resources have been {}".format("enabled" if enabled else "disabled"))
+
+
+def useSvgResources(enabled: bool = True):
+    """Recolor svg images at load time instead of using png images of styles"""
+    qrainbowstyle.USE_SVG_RESOURCES = enabled
+    clearStylesheetCache()
+    _logger.info("Svg resources have been {}".format("enabled" if enabled else "disabled"))
+
+
+def useHighDpiImages(enabled: bool = True):
+    """Render images for device pixel ratios of screens, which are not contained in styles"""
+    qrainbowstyle.USE_HIGH_DPI_IMAGES = enabled
+    _logger.info("High DPI images have been {}".format("enabled" if enabled else "disabled"))
+
+
+def _get_manifest():
+    """
+    Read manifest of compiled styles.
+
+    Manifest is created by scripts/process_qrc.py. If it is missing, styles
+    are searched in styles directory.
+
+    Returns:
+        dict: manifest data.
+    """
+    global _manifest
+
+    if _manifest is None:
+        try:
+            with open(MANIFEST_FILEPATH, 'r') as fh:
+                manifest = json.load(fh)
+        except FileNotFoundError:
+            _logger.debug("Manifest not found, searching for styles in: " + STYLES_PATH)
+            styles = [x for x in os.listdir(STYLES_PATH)
+                      if x not in ('__pycache__', '__init__.py', SHARED_RESOURCES_DIR, MANIFEST_FILE)]
+            manifest = {"styles": {name: {"palette": name} for name in styles}}
+
+        _style_names.update({name.lower(): name for name in manifest["styles"]})
+        _manifest = manifest
+
+    return _manifest
+
+
 def getAvailableStyles():
     """Get list of available styles"""
-    return [x for x in os.listdir(STYLES_PATH) if x not in ('__pycache__', '__init__.py')]
+    return list(_get_manifest()["styles"])
 
 
 def getAvailablePalettes() -> list:
     """Get list of available palettes"""
     import qrainbowstyle.palette as source
     palettes = []
-    for name, obj in inspect.getmembers(source):
-        if inspect.isclass(obj) and issubclass(obj, source.BasePalette) and obj is not source.BasePalette:
-            palettes.append(obj)
+    for style in _get_manifest()["styles"].values():
+        palette = getattr(source, style["palette"], None)
+        if inspect.isclass(palette) and issubclass(palette, source.BasePalette) and palette not in palettes:
+            palettes.append(palette)
     return palettes
 
 
+def clearStylesheetCache():
+    """Remove all cached stylesheets and unload resources of inactive styles"""
+    active = sys.modules.get("style_rc")
+    for style_rc, _ in _stylesheet_cache.values():
+        if style_rc is not active:
+            sys.modules.pop(style_rc.__name__, None)
+    _stylesheet_cache.clear()
+    _preloaded.clear()
+    _logger.debug("Stylesheet cache cleared")
+
+
 def getCurrentPalette():
     """Returns loaded palette"""
-    try:
-        from style_rc import palette  # noqa
-        return palette
-    except ModuleNotFoundError:
+    if _current_palette is None:
         raise ModuleNotFoundError("Cannot find current palette. Did you load style sheet?")
+    return _current_palette
+
+
+def getCurrentTheme():
+    """Returns ThemeState object holding loaded palette and emitting paletteChanged signal"""
+    global _theme
+
+    if _theme is None:
+        from qrainbowstyle.utils import ThemeState
+        _theme = ThemeState(_current_palette)
+    return _theme
+
 
+def _set_current_palette(palette):
+    """Set loaded palette and notify ThemeState"""
+    global _current_palette
 
-def rainbowize(text: str) -> str:
+    _current_palette = palette
+    if _theme is not None:
+        _theme.setPalette(palette)
+
+
+@functools.lru_cache(maxsize=RAINBOWIZE_CACHE_SIZE)
+def _compile_rainbowize(frozen):
+    """
+    Compile substitution of palette variable names in text.
+
+    Names are matched as whole identifiers, so e.g. COLOR_ACCENT_1x is not
+    changed. Values have references to other variables expanded.
+
+    Args:
+        frozen (FrozenPalette): palette, palettes with equal values share the substitution.
+
+    Returns:
+        callable: function replacing names in text.
+    """
+    values = {name: str(frozen[name]) for name, _ in frozen.variables}
+
+    # the match is extended to the end of identifier, start of identifier is checked
+    # in _replace, a lookbehind would disable fast search of literal prefixes
+    names = sorted(values, key=len, reverse=True)
+    pattern = re.compile("(?:{})[A-Za-z0-9_]*".format("|".join(map(re.escape, names))))
+
+    def _replace(match):
+        name = match.group(0)
+        start = match.start()
+        if name not in values or (start and IDENTIFIER_CHAR_PATTERN.match(match.string, start - 1)):
+            return name
+        return values[name]
+
+    return functools.partial(pattern.sub, _replace)
+
+
+def rainbowize(text: str, palette=None) -> str:
     """Replaces color names with hashes in text"""
-    color_dict = getCurrentPalette().to_dict()
-    for color in color_dict:
-        text = text.replace(color, str(color_dict[color]))
-    return text
+    return rainbowizeMany([text], palette)[0]
+
+
+def rainbowizeMany(texts, palette=None) -> list:
+    """
+    Replace names of palette variables with their values in many texts at once.
+
+    Text is scanned only once, substitution is compiled once for every palette.
+
+    Args:
+        texts (iterable(str)): texts, e.g. stylesheets of widgets.
+        palette (BasePalette, optional): palette class. Default is None, i.e. palette of loaded style.
+
+    Returns:
+        list(str): texts with replaced names.
+    """
+    palette = palette or getCurrentPalette()
+    substitute = _compile_rainbowize(palette.freeze())
+    return [substitute(text) for text in texts]
+
+
+def _get_template_values(palette):
+    """
+    Get values of palette variables used in QSS template.
+
+    References to other variables, e.g. in borders, are expanded. Quotes are
+    removed from string values, because the template already contains them.
+
+    Args:
+        palette (BasePalette): palette class.
+
+    Returns:
+        dict: variable name to value.
+    """
+    from qrainbowstyle.palette import VARIABLES
+
+    frozen = palette.freeze()
+    return {name: str(frozen[name]).strip("'\"") for name in VARIABLES}
+
+
+def _render_stylesheet(palette, tokens=None):
+    """
+    Render stylesheet from palette using QSS template compiled by qtsass.
+
+    OS, binding and version patches are not applied.
+
+    Args:
+        palette (BasePalette): palette class.
+        tokens (tuple): QSS template. Default is None, i.e. the pre-compiled one.
+
+    Returns:
+        str: stylesheet string (css).
+    """
+    if tokens is None:
+        from qrainbowstyle.styles._shared.style_template import TOKENS as tokens
+
+    values = _get_template_values(palette)
+    parts = list(tokens)
+    parts[1::2] = [values[name] for name in tokens[1::2]]
+    return "".join(parts)
 
 
 def _apply_os_patches(palette):
@@ -294,94 +549,385 @@ def _apply_application_patches(palette, QCoreApplication, QPalette, QColor):
                         "instantiation of QApplication to take effect. ")
 
 
-def _load_stylesheet(qt_api='', style=''):
+def _import_style_rcc(module_name, rcc_filepath, palette_name=None):
     """
-    Load the stylesheet based on QtPy abstraction layer environment variable.
+    Create module with the same interface as style_rc, backed by .rcc file.
 
-    If the argument is not passed, it uses the current QT_API environment
-    variable to make the imports of Qt bindings. If passed, it sets this
-    variable then make the imports.
+    Args:
+        module_name (str): name of created module.
+        rcc_filepath (str): path to binary resources file.
+        palette_name (str, optional): name of palette class used to generate resources.
+
+    Returns:
+        module: style_rc module with registered resources.
+    """
+    from qtpy.QtCore import QResource
+    import qrainbowstyle.palette
+
+    style_rc = types.ModuleType(module_name)
+    style_rc.__file__ = rcc_filepath
+    if palette_name is not None:
+        style_rc.palette = getattr(qrainbowstyle.palette, palette_name)
+
+    def qInitResources():
+        if not QResource.registerResource(rcc_filepath):
+            raise FileNotFoundError("Failed to register resources from file: {}".format(rcc_filepath))
+
+    def qCleanupResources():
+        QResource.unregisterResource(rcc_filepath)
+
+    style_rc.qInitResources = qInitResources
+    style_rc.qCleanupResources = qCleanupResources
+
+    qInitResources()
+    sys.modules[module_name] = style_rc
+    return style_rc
+
+
+def _register_shared_resources():
+    """
+    Register resources shared by all styles.
+
+    Shared resources are registered only once and never unregistered.
+    Older builds do not contain shared resources, in this case nothing is done.
+    """
+    module_name = "qrainbowstyle.styles.{}.style_rc".format(SHARED_RESOURCES_DIR)
+    if module_name in sys.modules:
+        return
+
+    shared_dir = os.path.join(STYLES_PATH, SHARED_RESOURCES_DIR)
+    rcc_filepath = os.path.join(shared_dir, RCC_FILE)
+    if USE_BINARY_RESOURCES and os.path.isfile(rcc_filepath):
+        _import_style_rcc(module_name, rcc_filepath)
+    elif os.path.isfile(os.path.join(shared_dir, "style_rc.py")):
+        importlib.import_module(module_name)
+    else:
+        return
+
+    _logger.debug("Registered shared resources from directory: " + shared_dir)
+
+
+def _register_style_resources(style_dir, prepared_code=None):
+    """
+    Register resources of style and unregister resources of previously loaded style.
+
+    Every style_rc module is imported only once, later it is reactivated
+    with qInitResources. The active module is also available as ``style_rc``
+    in sys.modules.
+
+    If USE_BINARY_RESOURCES is set and the style directory contains .rcc file,
+    resources are registered from this file, which Qt can map into memory
+    instead of keeping the data on Python heap. Otherwise style_rc.py is imported.
 
     Args:
-        qt_api (str): qt binding name to set QT_API environment variable.
-                      Default is ''. Possible values are pyside2,
-                      pyqt5. Not case sensitive.
+        style_dir (str): name of style directory.
+        prepared_code (tuple, optional): module spec and code object of style_rc.py
+                                         compiled by _prepare_stylesheet.
+
+    Returns:
+        module: style_rc module of the style.
+    """
+    module_name = "qrainbowstyle.styles.{}.style_rc".format(style_dir)
+    style_rc = sys.modules.get(module_name)
+    active_rc = sys.modules.get("style_rc")
+
+    if style_rc is not None and style_rc is active_rc:
+        return style_rc
+
+    _register_shared_resources()
+
+    if active_rc is not None:
+        _logger.info("Found already imported style in sys.modules")
+        # use qCleanupResources to remove all resource files
+        active_rc.qCleanupResources()
+
+    rcc_filepath = os.path.join(STYLES_PATH, style_dir, RCC_FILE)
+    if style_rc is None and USE_BINARY_RESOURCES and os.path.isfile(rcc_filepath):
+        _logger.debug("Loading binary resources from file: " + rcc_filepath)
+        style_rc = _import_style_rcc(module_name, rcc_filepath, style_dir)
+    elif style_rc is None and prepared_code is not None:
+        _logger.debug("Loading preloaded style from directory: " + style_dir)
+        spec, code = prepared_code
+        style_rc = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = style_rc
+        # resources are registered when module code is executed
+        exec(code, style_rc.__dict__)
+    elif style_rc is None:
+        _logger.debug("Loading style from directory: " + style_dir)
+        try:
+            # resources are registered on import
+            style_rc = importlib.import_module(module_name)
+        except ModuleNotFoundError:
+            raise ModuleNotFoundError("Failed to import style_rc from directory: {}"
+                                      .format(os.path.join(STYLES_PATH, style_dir)))
+    else:
+        style_rc.qInitResources()
+
+    sys.modules["style_rc"] = style_rc
+    return style_rc
 
-    Note:
-        - Note that the variable QT_API is read when first imported. So,
-          pay attention to the import order.
-        - OS, binding and binding version number, and application specific
-          patches are applied in this order.
+
+def _uses_svg_resources(style_dir):
+    """Check if images of style are svg images recolored at load time."""
+    return USE_SVG_RESOURCES or _get_manifest()["styles"][style_dir].get("images") == "svg"
+
+
+def _register_svg_images(palette, root):
+    """
+    Recolor base svg images with palette colors and register them from memory.
+
+    Args:
+        palette (BasePalette): palette class.
+        root (str): resource root of the images.
 
     Returns:
-        str: stylesheet string (css).
+        tuple: set of image names and compiled resources, which must be kept alive.
     """
+    from qtpy.QtCore import qRegisterResourceData
+    from qrainbowstyle.utils.images import get_svg_images
+    from qrainbowstyle.utils.rcc import compile_resources
 
-    if qt_api:
-        os.environ['QT_API'] = qt_api
+    images = get_svg_images(palette)
+    # svg data is small, it is not compressed to make loading faster
+    resources = compile_resources({"{}/{}".format(root, name): data for name, data in images.items()},
+                                  compress_level=0)
+    if not qRegisterResourceData(1, resources.structs[1], resources.names, resources.data):
+        raise RuntimeError("Failed to register svg images of palette: " + palette.__name__)
 
-    # Import is made after setting QT_API
-    from qtpy.QtCore import QCoreApplication, QFile, QTextStream
-    from qtpy.QtGui import QColor, QPalette
-    from qtpy import QT_VERSION
+    _logger.debug("Registered {} svg images of palette {}".format(len(images), palette.__name__))
+    # Qt does not copy registered data, it must be kept alive
+    return set(images), resources
 
-    # Search for style in styles directory
-    style_dir = None
 
-    available_styles = getAvailableStyles()
-    _logger.debug(f"Available styles: {available_styles}")
-    for stl in available_styles:
-        if style.lower() == stl.lower():
-            style_dir = stl
-            break
+def _unregister_svg_images(resources):
+    """Unregister svg images registered by _register_svg_images."""
+    from qtpy.QtCore import qUnregisterResourceData
 
-    if style_dir is None:
-        stylesheet = ""
-        raise FileNotFoundError("Style " + style + " does not exists")
+    qUnregisterResourceData(1, resources.structs[1], resources.names, resources.data)
 
-    # check if any style_rc was loaded before
-    if "style_rc" in sys.modules:
-        _logger.info("Found already imported style in sys.modules")
 
-        # use qCleanupResources to remove all resource files
-        global style_rc  # noqa
-        style_rc.qCleanupResources()
+def _register_svg_resources(palette):
+    """
+    Register svg images recolored with palette colors.
 
-        # remove imported modules
-        for x in [module for module in sys.modules if module.startswith("style_rc")]:
-            del sys.modules[x]
-            del style_rc
+    Images are registered once for every palette and stay registered,
+    so stylesheets of several palettes can be used at the same time.
 
-        # remove path to previously imported style from sys.path
-        for stylepath in [path for path in sys.path if any(style for style in getAvailableStyles() if style in path)]:
-            sys.path.remove(stylepath)
-        _logger.debug("Removed all imported styles")
+    Args:
+        palette (BasePalette): palette class.
 
-    try:
-        _logger.debug("Loading style from directory: " + style_dir)
-        old_working_dir = os.getcwd()
-        # set style directory
-        package_dir = os.path.join(STYLES_PATH, style_dir)
-        os.chdir(package_dir)
+    Returns:
+        tuple: resource root of the images and set of their names.
+    """
+    if palette in _svg_resources:
+        return _svg_resources[palette][:2]
 
-        # append directory to sys.path and import style_rc
-        sys.path.append(package_dir)
-        try:
-            import style_rc  # noqa
-            # get palette
-            palette = style_rc.palette
+    root = "qrainbowstyle_svg/{}_{}".format(palette.__name__, len(_svg_resources))
+    names, resources = _register_svg_images(palette, root)
+    _svg_resources[palette] = (root, names, resources)
+    return root, names
 
-        except ModuleNotFoundError:
-            raise ModuleNotFoundError("Failed to import style_rc from directory: {}".format(package_dir))
 
-        finally:
-            os.chdir(old_working_dir)
+def _replace_svg_urls(stylesheet, root, names):
+    """Replace urls of png images in stylesheet with svg images registered under `root`."""
+    def _replace_url(match):
+        name = match.group(1).rsplit("/", 1)[-1][:-len(".png")] + ".svg"
+        if name in names:
+            return 'url(":/{}/{}")'.format(root, name)
+        return match.group(0)
+
+    return RESOURCE_URL_PATTERN.sub(_replace_url, stylesheet)
+
+
+def _use_svg_resources(stylesheet, palette):
+    """Replace urls of png images in stylesheet with svg images recolored with palette."""
+    root, names = _register_svg_resources(palette)
+    return _replace_svg_urls(stylesheet, root, names)
+
+
+def _get_screen_dprs(app):
+    """Return device pixel ratios of screens rounded up, like Qt does when searching @Nx images."""
+    return {math.ceil(screen.devicePixelRatio()) for screen in app.screens()}
+
+
+def _rasterize_high_dpi_images(key, dprs):
+    """
+    Render images of resource directory for device pixel ratios, which are not rendered yet.
+
+    Args:
+        key (tuple): resource directory and palette, see _register_high_dpi_images.
+        dprs (set(int)): device pixel ratios.
+    """
+    from qrainbowstyle.utils.rasterizer import rasterize_images
+    from qrainbowstyle.utils.rcc import compile_resources
+
+    directory, palette = key
+    entry = _high_dpi_images[key]
+
+    for dpr in sorted(dprs - set(entry["resources"])):
+        images = rasterize_images(palette, entry["images"], dpr)
+        # Qt does not copy registered data, it must be kept alive
+        entry["resources"][dpr] = compile_resources({"{}/{}".format(directory, name): data
+                                                     for name, data in images.items()}, compress_level=0)
+        _logger.debug("Rendered {} images for device pixel ratio {} in: {}".format(len(images), dpr, directory))
 
-    except FileExistsError:
-        raise FileNotFoundError("Missing style_rc.py file")
 
-    _logger.info("Style resources imported successfully")
+def _activate_high_dpi_images(key, active):
+    """
+    Register or unregister rendered images of resource directory, their data are kept.
+
+    Returns:
+        bool: True if any images were registered or unregistered.
+    """
+    from qtpy.QtCore import qRegisterResourceData, qUnregisterResourceData
+
+    entry = _high_dpi_images[key]
+    changed = False
+
+    for dpr, resources in entry["resources"].items():
+        if active and dpr not in entry["registered"]:
+            if not qRegisterResourceData(1, resources.structs[1], resources.names, resources.data):
+                raise RuntimeError("Failed to register images for device pixel ratio {} in: {}".format(dpr, key[0]))
+            entry["registered"].add(dpr)
+            changed = True
+        elif not active and dpr in entry["registered"]:
+            qUnregisterResourceData(1, resources.structs[1], resources.names, resources.data)
+            entry["registered"].discard(dpr)
+            changed = True
+
+    return changed
+
+
+def _unregister_high_dpi_images():
+    """Unregister and forget all images rendered for device pixel ratios."""
+    global _active_high_dpi_style
+
+    for key in _high_dpi_images:
+        _activate_high_dpi_images(key, False)
+    _high_dpi_images.clear()
+    _high_dpi_styles.clear()
+    _active_high_dpi_style = None
+
+
+def _on_screens_changed(*args):
+    """Render images for device pixel ratios of changed screens and polish application again."""
+    from qtpy.QtCore import QCoreApplication
+
+    if _active_high_dpi_style is None:
+        return
+
+    app = QCoreApplication.instance()
+    if _register_high_dpi_images(*_active_high_dpi_style) and app.styleSheet():
+        # images are resolved when stylesheet is parsed, scoped stylesheets are updated on their next load
+        app.setStyleSheet(app.styleSheet())
+
+
+def _connect_screen_signals(screen):
+    """Follow changes of device pixel ratio of screen, Qt 5 has no signal of the ratio itself."""
+    screen.logicalDotsPerInchChanged.connect(_on_screens_changed)
+    screen.physicalDotsPerInchChanged.connect(_on_screens_changed)
+
+
+def _on_screen_added(screen):
+    """Follow new screen and render images for its device pixel ratio."""
+    _connect_screen_signals(screen)
+    _on_screens_changed()
+
+
+def _register_high_dpi_images(stylesheet, style_dir, active=True):
+    """
+    Register images of stylesheet for device pixel ratios of screens, which are not contained in style.
+
+    Images are rendered from svg files with colors of the style palette the first
+    time a screen with such ratio is found, then they are read from the user cache.
+    Nothing is done while all screens use ratios contained in the style.
+
+    Args:
+        stylesheet (str): stylesheet string (css).
+        style_dir (str): name of style directory, which images are used.
+        active (bool, optional): Stylesheet uses images of the active style, images
+                                 of the previously active style are unregistered.
 
+    Returns:
+        bool: True if any images were registered or unregistered.
+    """
+    global _active_high_dpi_style, _screen_signals_connected
+
+    from qtpy.QtCore import QCoreApplication
+
+    app = QCoreApplication.instance()
+    if not USE_HIGH_DPI_IMAGES or not hasattr(app, "screens") or _uses_svg_resources(style_dir):
+        return False
+
+    if not _screen_signals_connected:
+        app.screenAdded.connect(_on_screen_added)
+        for screen in app.screens():
+            _connect_screen_signals(screen)
+        _screen_signals_connected = True
+
+    if active:
+        _active_high_dpi_style = (stylesheet, style_dir)
+
+    style = _get_manifest()["styles"][style_dir]
+    dprs = _get_screen_dprs(app) - set(style.get("dprs", [1, 2]))
+    if not dprs:
+        return False
+
+    import qrainbowstyle.palette
+    palette = getattr(qrainbowstyle.palette, style["palette"])
+
+    style_key = (style_dir, palette, active)
+    keys = _high_dpi_styles.get(style_key)
+    if keys is None:
+        keys = _create_high_dpi_entries(stylesheet, palette)
+        _high_dpi_styles[style_key] = keys
+
+    changed = False
+    for key in keys:
+        if active:
+            # other palettes render the same image names in the directory
+            for other in _high_dpi_images:
+                if other[0] == key[0] and other[1] is not palette:
+                    changed |= _activate_high_dpi_images(other, False)
+        _rasterize_high_dpi_images(key, dprs)
+        changed |= _activate_high_dpi_images(key, True)
+
+    return changed
+
+
+def _create_high_dpi_entries(stylesheet, palette):
+    """Collect sizes of png images of stylesheet by resource directory, return keys of _high_dpi_images."""
+    from qtpy.QtGui import QImage
+
+    directories = {}
+    for match in PNG_URL_PATTERN.finditer(stylesheet):
+        directories.setdefault(match.group(1), set()).add(match.group(2))
+
+    keys = []
+    for directory, names in directories.items():
+        key = (directory, palette)
+        if key not in _high_dpi_images:
+            images = {}
+            for name in names:
+                size = QImage(":/{}/{}".format(directory, name)).size()
+                if not size.isEmpty():
+                    images[name] = (size.width(), size.height())
+            _high_dpi_images[key] = {"images": images, "resources": {}, "registered": set()}
+        keys.append(key)
+
+    return keys
+
+
+def _read_stylesheet(QFile, QTextStream):
+    """
+    Read QSS file from registered style resources.
+
+    The import names args must be passed here because the import is done
+    inside the load_stylesheet() function.
+
+    Returns:
+        str: stylesheet string (css).
+    """
     # Thus, by importing the binary we can access the resources
     package_dir = os.path.basename(PACKAGE_PATH)
     qss_rc_path = ":" + os.path.join(package_dir, QSS_FILE)
@@ -403,25 +949,469 @@ def _load_stylesheet(qt_api='', style=''):
         raise FileNotFoundError("Unable to find QSS file '{}' "
                                 "in resources.".format(qss_rc_path))
 
+    return stylesheet
+
+
+def _apply_stylesheet_patches(palette, qt_version):
+    """
+    Apply OS, binding and version specific stylesheet patches.
+
+    Returns:
+        str: stylesheet string (css).
+    """
     _logger.debug("Checking patches for being applied.")
 
     # Todo: check execution order for these functions
     # 1. Apply OS specific patches
-    stylesheet += _apply_os_patches(palette)
+    stylesheet = _apply_os_patches(palette)
 
     # 2. Apply binding specific patches
     stylesheet += _apply_binding_patches()
 
     # 3. Apply binding version specific patches
-    stylesheet += _apply_version_patches(QT_VERSION)
+    stylesheet += _apply_version_patches(qt_version)
+
+    return stylesheet
+
+
+def _get_style_dir(style):
+    """
+    Search for style in manifest.
+
+    Args:
+        style (str): Style name, not case sensitive.
+
+    Returns:
+        str: name of style directory.
+    """
+    _get_manifest()
+    style_dir = _style_names.get(style.lower())
+
+    if style_dir is None:
+        raise FileNotFoundError("Style {} does not exists. Available styles: {}"
+                                .format(style, ", ".join(getAvailableStyles())))
+
+    return style_dir
+
+
+def _prepare_stylesheet(style_dir, palette, qt_version):
+    """
+    Prepare style in background thread, without calling Qt.
+
+    The binary resources file is read to warm up the OS file cache or
+    style_rc.py is compiled to code object. Stylesheet is rendered from palette,
+    or read from QSS file of the style, the same as in its resources, and patched.
+    Resources are registered later by _load_stylesheet in main thread.
+
+    Args:
+        style_dir (str): name of style directory.
+        palette (BasePalette): palette class, None to use palette of the style.
+        qt_version (str): Qt string version.
+
+    Returns:
+        tuple: spec and code object of style_rc.py (None if not needed), stylesheet
+        (None if QSS file is only in resources).
+    """
+    module_name = "qrainbowstyle.styles.{}.style_rc".format(style_dir)
+    rcc_filepath = os.path.join(STYLES_PATH, style_dir, RCC_FILE)
+    prepared_code = None
+
+    if module_name in sys.modules:
+        pass
+    elif USE_BINARY_RESOURCES and os.path.isfile(rcc_filepath):
+        with open(rcc_filepath, 'rb') as fh:
+            while fh.read(1 << 20):
+                pass
+    else:
+        spec = importlib.util.find_spec(module_name)
+        if spec is None:
+            raise ModuleNotFoundError("Failed to find style_rc in directory: {}"
+                                      .format(os.path.join(STYLES_PATH, style_dir)))
+        prepared_code = (spec, spec.loader.get_code(module_name))
+
+    if palette is None:
+        import qrainbowstyle.palette
+        palette = getattr(qrainbowstyle.palette, _get_manifest()["styles"][style_dir]["palette"])
+
+        # built stylesheet may differ from the template, e.g. it is minified
+        qss_filepath = os.path.join(STYLES_PATH, style_dir, QSS_FILE)
+        if not os.path.isfile(qss_filepath):
+            return prepared_code, None
+        with open(qss_filepath, 'r', encoding='utf-8') as fh:
+            stylesheet = fh.read()
+    else:
+        stylesheet = _render_stylesheet(palette)
+
+    stylesheet += _apply_stylesheet_patches(palette, qt_version)
+    return prepared_code, stylesheet
+
+
+def _get_cache_key(style_dir, palette):
+    """Return key of _stylesheet_cache, palettes are compared by values, so changed palettes are rendered again."""
+    from qtpy import API_NAME, QT_VERSION
+
+    frozen = None if palette is None else palette.freeze()
+    return style_dir, frozen, API_NAME, QT_VERSION, platform.system()
+
+
+def preloadStylesheet(style: str, palette=None):
+    """
+    Prepare style in background thread.
+
+    Next load_stylesheet call with the same style and palette only registers
+    resources in the main thread. Call it after the Qt binding has been
+    selected, e.g. after the first load_stylesheet.
+
+    Args:
+        style (str): Style to preload.
+        palette (BasePalette, optional): Palette class used to render the stylesheet.
+
+    Returns:
+        concurrent.futures.Future: pending preload, None if style is already cached.
+    """
+    global _preload_executor
+    from qtpy import QT_VERSION
+
+    style_dir = _get_style_dir(style)
+    cache_key = _get_cache_key(style_dir, palette)
+
+    if cache_key in _stylesheet_cache:
+        return None
+    if cache_key in _preloaded:
+        return _preloaded[cache_key]
+
+    if _preload_executor is None:
+        _preload_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="qrainbowstyle")
+
+    _logger.debug("Preloading style {}".format(style_dir))
+    future = _preload_executor.submit(_prepare_stylesheet, style_dir, palette, QT_VERSION)
+    _preloaded[cache_key] = future
+
+    while len(_preloaded) > max(STYLESHEET_CACHE_SIZE, 1):
+        _, evicted = _preloaded.popitem(last=False)
+        evicted.cancel()
+
+    return future
+
+
+def _load_stylesheet(qt_api='', style='', palette=None):
+    """
+    Load the stylesheet based on QtPy abstraction layer environment variable.
+
+    If the argument is not passed, it uses the current QT_API environment
+    variable to make the imports of Qt bindings. If passed, it sets this
+    variable then make the imports.
+
+    Args:
+        qt_api (str): qt binding name to set QT_API environment variable.
+                      Default is ''. Possible values are pyside2,
+                      pyqt5. Not case sensitive.
+        style (str): style which resources are loaded.
+        palette (BasePalette): palette class used to render stylesheet
+                               instead of the pre-compiled one. Icons are
+                               still taken from `style`.
+
+    Note:
+        - Note that the variable QT_API is read when first imported. So,
+          pay attention to the import order.
+        - OS, binding and binding version number, and application specific
+          patches are applied in this order.
+        - Patched stylesheets and imported resources of the last
+          STYLESHEET_CACHE_SIZE styles are cached, so loading them again
+          only registers their resources.
+
+    Returns:
+        str: stylesheet string (css).
+    """
+
+    if qt_api:
+        os.environ['QT_API'] = qt_api
+
+    # Import is made after setting QT_API
+    from qtpy.QtCore import QCoreApplication, QFile, QTextStream
+    from qtpy.QtGui import QColor, QPalette
+    from qtpy import QT_VERSION
+
+    style_dir = _get_style_dir(style)
+
+    cache_key = _get_cache_key(style_dir, palette)
+
+    if cache_key in _stylesheet_cache:
+        _logger.debug("Loading style {} from cache".format(style_dir))
+        _stylesheet_cache.move_to_end(cache_key)
+        style_rc, stylesheet = _stylesheet_cache[cache_key]
+        _register_style_resources(style_dir)
+        _register_high_dpi_images(stylesheet, style_dir)
+        palette = palette or style_rc.palette
+        _apply_application_patches(palette, QCoreApplication, QPalette, QColor)
+        _set_current_palette(palette)
+        return stylesheet
+
+    prepared = _preloaded.pop(cache_key, None)
+    if prepared is not None:
+        try:
+            prepared_code, stylesheet = prepared.result()
+        except Exception as error:
+            _logger.warning("Preloading of style {} failed: {}".format(style_dir, error))
+            prepared = None
+
+    if prepared is not None:
+        _logger.debug("Loading style {} from preloaded data".format(style_dir))
+        style_rc = _register_style_resources(style_dir, prepared_code)
+        palette = palette or style_rc.palette
+        if stylesheet is None:
+            stylesheet = _read_stylesheet(QFile, QTextStream) + _apply_stylesheet_patches(palette, QT_VERSION)
+    else:
+
+        style_rc = _register_style_resources(style_dir)
+        _logger.info("Style resources imported successfully")
+
+        if palette is not None:
+            _logger.debug("Rendering stylesheet from palette: " + palette.__name__)
+            stylesheet = _render_stylesheet(palette)
+        else:
+            palette = style_rc.palette
+            stylesheet = _read_stylesheet(QFile, QTextStream)
+
+        stylesheet += _apply_stylesheet_patches(palette, QT_VERSION)
+
+    if _uses_svg_resources(style_dir):
+        stylesheet = _use_svg_resources(stylesheet, palette)
+
+    _register_high_dpi_images(stylesheet, style_dir)
 
     # 4. Apply palette fix. See issue #139
     _apply_application_patches(palette, QCoreApplication, QPalette, QColor)
+    _set_current_palette(palette)
+
+    _stylesheet_cache[cache_key] = (style_rc, stylesheet)
+    while len(_stylesheet_cache) > max(STYLESHEET_CACHE_SIZE, 1):
+        _, (evicted_rc, _) = _stylesheet_cache.popitem(last=False)
+        # the same style may be cached with other palette, binding or Qt version
+        in_use = any(x is evicted_rc for x, _ in _stylesheet_cache.values())
+        if not in_use and evicted_rc is not sys.modules.get("style_rc"):
+            sys.modules.pop(evicted_rc.__name__, None)
+
+        _logger.debug("Evicted {} from stylesheet cache".format(evicted_rc.__name__))
 
     return stylesheet
 
 
-def load_stylesheet(qt_api="", style='qdarkstyle3'):
+def _register_scoped_resources(style_dir):
+    """
+    Register binary resources of style under its own root, next to the active style.
+
+    Args:
+        style_dir (str): name of style directory.
+
+    Returns:
+        str: resource root of the style, None if style has no binary resources.
+    """
+    if style_dir in _scoped_resources:
+        return _scoped_resources[style_dir]
+
+    from qtpy.QtCore import QResource
+
+    root = "/qrainbowstyle/" + style_dir
+    rcc_filepath = os.path.join(STYLES_PATH, style_dir, RCC_FILE)
+
+    if not (os.path.isfile(rcc_filepath) and QResource.registerResource(rcc_filepath, root)):
+        _logger.warning("Binary resources of style {} not found, "
+                        "images of the active style will be used".format(style_dir))
+        root = None
+
+    _scoped_resources[style_dir] = root
+    return root
+
+
+def load_scoped_stylesheet(scope, style='qdarkstyle3', palette=None, qt_api=""):
+    """
+    Load the stylesheet limited to widget with object name `scope` and its children.
+
+    Set it with `widget.setStyleSheet` to theme one window or widget subtree
+    without re-polishing the whole application. Images of the style are registered
+    under their own resource root, so windows with different styles can be shown
+    at the same time. Application palette is not changed.
+
+    Args:
+        scope (str): Object name of the widget.
+        style (str): Style to use. Default is 'qdarkstyle3'.
+        palette (BasePalette): Palette class used to render the stylesheet.
+                               Default is None, i.e. palette of `style`.
+        qt_api (str): Qt binding name to set QT_API environment variable.
+
+    Returns:
+        str: the stylesheet string.
+    """
+    if qt_api:
+        os.environ['QT_API'] = qt_api
+
+    from qtpy.QtCore import QFile
+    from qtpy import QT_VERSION
+    from qrainbowstyle.utils.qss import scope_stylesheet
+
+    style_dir = _get_style_dir(style)
+
+    if palette is None:
+        import qrainbowstyle.palette
+        palette = getattr(qrainbowstyle.palette, _get_manifest()["styles"][style_dir]["palette"])
+
+    _register_shared_resources()
+    root = _register_scoped_resources(style_dir)
+
+    stylesheet = _render_stylesheet(palette)
+    stylesheet += _apply_stylesheet_patches(palette, QT_VERSION)
+
+    if _uses_svg_resources(style_dir):
+        stylesheet = _use_svg_resources(stylesheet, palette)
+
+    if root is not None:
+        def _replace_url(match):
+            path = "{}/{}".format(root, match.group(1))
+            # images shared by all styles are registered only at default root
+            if QFile.exists(":" + path):
+                return 'url(":{}")'.format(path)
+            return match.group(0)
+
+        stylesheet = RESOURCE_URL_PATTERN.sub(_replace_url, stylesheet)
+
+    _register_high_dpi_images(stylesheet, style_dir, active=False)
+
+    return scope_stylesheet(stylesheet, scope)
+
+
+def create_custom_theme(palette, qt_api=""):
+    """
+    Create stylesheet of any palette in memory, without building a style.
+
+    The stylesheet is rendered from the QSS template and images are svg images
+    recolored with the palette, registered from memory. Nothing is written to disk,
+    so themes can be designed interactively, e.g. by changing palette attributes
+    and applying the stylesheet again. Images of the last STYLESHEET_CACHE_SIZE
+    themes stay registered.
+
+    Args:
+        palette (BasePalette): palette class, e.g. subclass of palette of existing style.
+        qt_api (str): Qt binding name to set QT_API environment variable.
+
+    Returns:
+        str: the stylesheet string.
+    """
+    if qt_api:
+        os.environ['QT_API'] = qt_api
+
+    from qtpy.QtCore import QCoreApplication
+    from qtpy.QtGui import QColor, QPalette
+
+    stylesheet = _create_custom_stylesheet(palette)
+
+    _apply_application_patches(palette, QCoreApplication, QPalette, QColor)
+    _set_current_palette(palette)
+
+    return stylesheet
+
+
+def _create_custom_stylesheet(palette):
+    """Register images and render stylesheet of custom theme, without changing the app palette."""
+    from qtpy import QT_VERSION
+
+    key = palette.freeze().variables
+    if key in _custom_themes:
+        _custom_themes.move_to_end(key)
+        root, names, _ = _custom_themes[key]
+    else:
+        digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()[:16]
+        root = "qrainbowstyle_theme/{}_{}".format(palette.__name__, digest)
+        names, resources = _register_svg_images(palette, root)
+        _custom_themes[key] = (root, names, resources)
+
+        while len(_custom_themes) > max(STYLESHEET_CACHE_SIZE, 1):
+            _, (_, _, evicted) = _custom_themes.popitem(last=False)
+            _unregister_svg_images(evicted)
+
+    # images without svg source are taken from shared resources
+    _register_shared_resources()
+
+    stylesheet = _render_stylesheet(palette)
+    stylesheet += _apply_stylesheet_patches(palette, QT_VERSION)
+    return _replace_svg_urls(stylesheet, root, names)
+
+
+def _unload_resources():
+    """Unregister resources of all styles and forget imported style_rc modules."""
+    global _manifest
+
+    from qtpy.QtCore import QResource
+
+    sys.modules.pop("style_rc", None)
+    for name in [x for x in sys.modules if x.startswith("qrainbowstyle.styles.") and x.endswith(".style_rc")]:
+        # unregistering resources of inactive styles again is harmless
+        sys.modules.pop(name).qCleanupResources()
+
+    for style_dir, root in _scoped_resources.items():
+        if root is not None:
+            QResource.unregisterResource(os.path.join(STYLES_PATH, style_dir, RCC_FILE), root)
+    _scoped_resources.clear()
+
+    for _, _, resources in _svg_resources.values():
+        _unregister_svg_images(resources)
+    _svg_resources.clear()
+
+    for _, _, resources in _custom_themes.values():
+        _unregister_svg_images(resources)
+    _custom_themes.clear()
+
+    _unregister_high_dpi_images()
+
+    clearStylesheetCache()
+    _manifest = None
+    _style_names.clear()
+
+
+def reloadStyles():
+    """
+    Load styles again from disk, e.g. after they were rebuilt by scripts/process_qrc.py.
+
+    Resources of all styles, the QSS template and palette modules are reloaded,
+    so changes are visible without restarting the application. Palette classes
+    are replaced by new ones from the reloaded module.
+    """
+    import qrainbowstyle.colorsystem
+    import qrainbowstyle.palette
+
+    _unload_resources()
+    sys.modules.pop("qrainbowstyle.styles.{}.style_template".format(SHARED_RESOURCES_DIR), None)
+    importlib.invalidate_caches()
+
+    importlib.reload(qrainbowstyle.colorsystem)
+    importlib.reload(qrainbowstyle.palette)
+    _logger.info("Styles reloaded")
+
+
+def reloadStylesheet(style='qdarkstyle3', palette=None, qt_api=""):
+    """
+    Reload styles from disk and load the stylesheet, see reloadStyles.
+
+    Args:
+        style (str): Style to use. Default is 'qdarkstyle3'.
+        palette (BasePalette): Palette class used to render the stylesheet, replaced
+                               by class with the same name from reloaded palette module.
+                               Default is None, i.e. pre-compiled stylesheet of `style`.
+        qt_api (str): Qt binding name to set QT_API environment variable.
+
+    Returns:
+        str: the stylesheet string.
+    """
+    import qrainbowstyle.palette
+
+    reloadStyles()
+    if palette is not None:
+        palette = getattr(qrainbowstyle.palette, palette.__name__, palette)
+
+    return _load_stylesheet(qt_api=qt_api or 'pyqt5', style=style, palette=palette)
+
+
+def load_stylesheet(qt_api="", style='qdarkstyle3', palette=None):
     """
     Load the stylesheet. Takes care of importing the rc module.
 
@@ -433,6 +1423,11 @@ def load_stylesheet(qt_api="", style='qdarkstyle3'):
 
         style (str): Style to use. Default is 'darkblue'
 
+        palette (BasePalette): Palette class used to render the stylesheet
+                               at runtime. Icons are taken from `style`.
+                               Default is None, i.e. pre-compiled stylesheet
+                               of `style` is used.
+
     Returns:
         str: the stylesheet string.
     """
@@ -440,29 +1435,29 @@ def load_stylesheet(qt_api="", style='qdarkstyle3'):
     stylesheet = ""
 
     if qt_api:
-        stylesheet = _load_stylesheet(qt_api=qt_api, style=style)
+        stylesheet = _load_stylesheet(qt_api=qt_api, style=style, palette=palette)
 
     else:
-        stylesheet = _load_stylesheet(qt_api='pyqt5', style=style)
+        stylesheet = _load_stylesheet(qt_api='pyqt5', style=style, palette=palette)
 
     return stylesheet
 
 
-def load_stylesheet_pyside2(style='darkblue'):
+def load_stylesheet_pyside2(style='darkblue', palette=None):
     """
     Load the stylesheet for use in a PySide2 application.
 
     Returns:
         str: the stylesheet string.
     """
-    return _load_stylesheet(qt_api='pyside2', style=style)
+    return _load_stylesheet(qt_api='pyside2', style=style, palette=palette)
 
 
-def load_stylesheet_pyqt5(style='darkblue'):
+def load_stylesheet_pyqt5(style='darkblue', palette=None):
     """
     Load the stylesheet for use in a PyQt5 application.
 
     Returns:
         str: the stylesheet string.
     """
-    return _load_stylesheet(qt_api='pyqt5', style=style)
+    return _load_stylesheet(qt_api='pyqt5', style=style, palette=palette)
@@ -3,13 +3,186 @@
 """QRainbowStyle default palette."""
 
 # Standard library imports
+import re
+import weakref
 from collections import OrderedDict
+from types import MappingProxyType
 
 # package imports
 from qrainbowstyle.colorsystem import *
 
 
-class BasePalette:
+# Palette variables in order of appearance in _variables.scss
+VARIABLES = [
+    'COLOR_BACKGROUND_6',
+    'COLOR_BACKGROUND_5',
+    'COLOR_BACKGROUND_4',
+    'COLOR_BACKGROUND_2',
+    'COLOR_BACKGROUND_3',
+    'COLOR_BACKGROUND_1',
+    'COLOR_TEXT_1',
+    'COLOR_TEXT_2',
+    'COLOR_TEXT_3',
+    'COLOR_TEXT_4',
+    'COLOR_ACCENT_1',
+    'COLOR_ACCENT_2',
+    'COLOR_ACCENT_3',
+    'COLOR_ACCENT_4',
+    'OPACITY_TOOLTIP',
+    'SIZE_BORDER_RADIUS',
+    'BORDER_1',
+    'BORDER_2',
+    'BORDER_3',
+    'BORDER_SELECTION_3',
+    'BORDER_SELECTION_2',
+    'BORDER_SELECTION_1',
+    'TITLE_BAR_BACKGROUND_COLOR',
+    'TITLE_BAR_BUTTONS_HOVER_COLOR',
+    'TITLE_BAR_BUTTONS_DISABLED_COLOR',
+    'TITLE_BAR_TEXT_COLOR',
+    'PATH_RESOURCES',
+]
+
+
+# Reference to other variable in value, e.g. $COLOR_BACKGROUND_1 in borders
+REFERENCE_PATTERN = re.compile(r"\$([A-Z0-9_]+)")
+
+# Colors in #rrggbb or #rgb format
+HEX_COLOR_PATTERN = re.compile(r"#(?:[0-9a-fA-F]{6}|[0-9a-fA-F]{3})")
+
+# Frozen palettes of palette classes, class -> (generation, FrozenPalette)
+_frozen_palettes = weakref.WeakKeyDictionary()
+
+# Incremented on every change of a palette class, frozen palettes of older generations are rebuilt
+_generation = 0
+
+
+def _parse_rgba(value):
+    """Return (r, g, b, a) tuple of hex color, None if value is not a hex color."""
+    if not isinstance(value, str) or not HEX_COLOR_PATTERN.fullmatch(value):
+        return None
+    value = value[1:]
+    if len(value) == 3:
+        value = ''.join(x * 2 for x in value)
+    return int(value[0:2], 16), int(value[2:4], 16), int(value[4:6], 16), 255
+
+
+class FrozenPalette:
+    """Immutable snapshot of palette class, created by BasePalette.freeze().
+
+    Values are read once from the class. References to other variables,
+    e.g. in borders, are expanded and hex colors are parsed to RGBA tuples,
+    so roles are looked up in a dictionary without any processing. Values
+    are accessed as items or attributes, e.g. ``frozen['BORDER_1']`` or
+    ``frozen.BORDER_1``. Frozen palettes with equal values are equal.
+
+    Args:
+        palette (type): Palette class.
+    """
+
+    __slots__ = ('name', 'variables', '_values', '_rgba', '_qcolors', '_hash')
+
+    def __init__(self, palette):
+        raw = {name: getattr(palette, name) for name in dir(palette) if name.isupper()}
+
+        def _expand(value):
+            if not isinstance(value, str) or '$' not in value:
+                return value
+            return REFERENCE_PATTERN.sub(lambda match: str(raw.get(match.group(1), match.group(0))), value)
+
+        values = {name: _expand(value) for name, value in raw.items()}
+        rgba = {name: _parse_rgba(value) for name, value in values.items()}
+
+        set_slot = super(FrozenPalette, self).__setattr__
+        set_slot('name', palette.__name__)
+        # pairs of names and raw values, in order of BasePalette.to_dict
+        set_slot('variables', tuple((name, raw[name]) for name in VARIABLES if raw.get(name)))
+        set_slot('_values', MappingProxyType(values))
+        set_slot('_rgba', MappingProxyType({name: value for name, value in rgba.items() if value is not None}))
+        set_slot('_qcolors', None)
+        set_slot('_hash', hash(tuple(sorted(values.items()))))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("FrozenPalette is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("FrozenPalette is immutable")
+
+    def __getattr__(self, name):
+        # called only for names which are not slots
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            return self._values[name]
+        except KeyError:
+            raise AttributeError("Palette {} has no variable {}".format(self.name, name)) from None
+
+    def __getitem__(self, name):
+        return self._values[name]
+
+    def __contains__(self, name):
+        return name in self._values
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __eq__(self, other):
+        if not isinstance(other, FrozenPalette):
+            return NotImplemented
+        return self._hash == other._hash and self._values == other._values
+
+    def __hash__(self):
+        return self._hash
+
+    def __repr__(self):
+        return "<FrozenPalette {}>".format(self.name)
+
+    def values(self):
+        """Return read-only dictionary of variable name to value with expanded references."""
+        return self._values
+
+    def rgba(self, name=None):
+        """Return (r, g, b, a) tuple of color variable, or dictionary of all colors if name is None."""
+        if name is None:
+            return self._rgba
+        return self._rgba[name]
+
+    def qcolors(self):
+        """Return read-only dictionary of variable name to QColor, created on first call.
+
+        QColor objects are shared, copy them before modification.
+        """
+        if self._qcolors is None:
+            from qtpy.QtGui import QColor
+            qcolors = MappingProxyType({name: QColor(*value) for name, value in self._rgba.items()})
+            super(FrozenPalette, self).__setattr__('_qcolors', qcolors)
+        return self._qcolors
+
+    def qcolor(self, name):
+        """Return shared QColor of color variable, e.g. ``COLOR_ACCENT_4``."""
+        return self.qcolors()[name]
+
+
+class _PaletteType(type):
+    """Type of palette classes, changes of their variables invalidate frozen palettes."""
+
+    def __setattr__(cls, name, value):
+        global _generation
+
+        super(_PaletteType, cls).__setattr__(name, value)
+        _generation += 1
+
+    def __delattr__(cls, name):
+        global _generation
+
+        super(_PaletteType, cls).__delattr__(name)
+        _generation += 1
+
+
+class BasePalette(metaclass=_PaletteType):
     """Base class for palettes."""
 
     # Color
@@ -53,50 +226,22 @@ class BasePalette:
     # Paths
     PATH_RESOURCES = "':/qss_icons'"
 
+    @classmethod
+    def freeze(cls):
+        """Return FrozenPalette of the class, built once until a variable of any palette changes."""
+        cached = _frozen_palettes.get(cls)
+        if cached is None or cached[0] != _generation:
+            cached = (_generation, FrozenPalette(cls))
+            _frozen_palettes[cls] = cached
+        return cached[1]
+
     @classmethod
     def to_dict(cls, colors_only=False):
         """Convert variables to dictionary."""
-        order = [
-            'COLOR_BACKGROUND_6',
-            'COLOR_BACKGROUND_5',
-            'COLOR_BACKGROUND_4',
-            'COLOR_BACKGROUND_2',
-            'COLOR_BACKGROUND_3',
-            'COLOR_BACKGROUND_1',
-            'COLOR_TEXT_1',
-            'COLOR_TEXT_2',
-            'COLOR_TEXT_3',
-            'COLOR_TEXT_4',
-            'COLOR_ACCENT_1',
-            'COLOR_ACCENT_2',
-            'COLOR_ACCENT_3',
-            'COLOR_ACCENT_4',
-            'OPACITY_TOOLTIP',
-            'SIZE_BORDER_RADIUS',
-            'BORDER_1',
-            'BORDER_2',
-            'BORDER_3',
-            'BORDER_SELECTION_3',
-            'BORDER_SELECTION_2',
-            'BORDER_SELECTION_1',
-            'TITLE_BAR_BACKGROUND_COLOR',
-            'TITLE_BAR_BUTTONS_HOVER_COLOR',
-            'TITLE_BAR_BUTTONS_DISABLED_COLOR',
-            'TITLE_BAR_TEXT_COLOR',
-            'PATH_RESOURCES',
-        ]
-        dic = OrderedDict()
-        for var in order:
-            value = getattr(cls, var)
-
-            if colors_only:
-                if not var.startswith('COLOR'):
-                    value = None
-
-            if value:
-                dic[var] = value
-
-        return dic
+        variables = cls.freeze().variables
+        if colors_only:
+            return OrderedDict((name, value) for name, value in variables if name.startswith('COLOR'))
+        return OrderedDict(variables)
 
     @classmethod
     def color_palette(cls):
@@ -0,0 +1,3853 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
+#
+# WARNING! All changes made in this file will be lost!
+
+from qtpy import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x00\x75\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x00\x27\x49\x44\x41\x54\x78\x9c\xed\
+\xc1\x01\x0d\x00\x00\x00\xc2\xa0\xf7\x4f\x6d\x0e\x37\xa0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x77\x03\
+\x40\x40\x00\x01\x8f\xf2\xc9\x51\x00\x00\x00\x00\x49\x45\x4e\x44\
+\xae\x42\x60\x82\
+\x00\x00\x01\xf7\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x3c\x00\x00\x00\x3c\x08\x02\x00\x00\x00\xb5\x9e\x4e\x25\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x01\xa9\x49\x44\x41\x54\x68\x81\xed\
+\xd8\xcb\x4e\xc2\x40\x14\x80\xe1\x53\xd3\xc0\x5a\x9b\x48\x5c\x2b\
+\x50\xe0\x0d\x00\x1f\x00\xf0\x49\xd9\x91\x00\x3e\x80\xe0\x1b\x58\
+\x2e\xb2\xf7\x92\x94\x35\x90\x49\x70\x31\x09\x99\x4e\xe5\xd2\x39\
+\x87\x43\x8c\xe7\x5f\x0d\xa4\x65\x3e\x0a\x9d\x52\xbc\xcf\xeb\x7b\
+\xf8\x6b\x5d\x5d\x1a\xe0\x92\xa0\xb9\x12\x34\x57\x82\xe6\x4a\xd0\
+\x5c\x09\x9a\x2b\x41\x73\x25\x68\xae\x04\xcd\x95\xa0\xb9\x42\xa1\
+\xfd\xb0\x58\x58\x2e\xfc\xb0\x98\x61\x97\x4a\x29\xeb\x2e\xe9\x3c\
+\xcc\x8d\x6d\x61\xb9\xd0\x83\xb8\xde\x52\xd3\xf7\xa3\xdb\xfb\x95\
+\x52\x30\x1e\xea\xf1\xd7\xcd\x83\xf3\xbc\xa8\x23\x1d\x37\xda\x7a\
+\x10\xbc\x3e\x1f\x3d\x78\xa6\x38\xae\xb7\x30\xf3\xa2\xd0\x6a\x32\
+\x3f\xd1\x6d\x89\x4f\xf9\x58\x0e\x84\x3d\x11\x6d\x77\xa5\x94\xde\
+\x86\x56\x0c\x24\xab\x47\xc2\x3d\x1e\x5a\x6e\x72\x31\x50\x2d\x79\
+\xfb\xdc\xe7\x10\x03\x72\xf5\xb0\x4a\x10\x1b\x6d\x00\x30\x1f\xaa\
+\xc9\x9c\x6a\x22\x4a\x34\x24\xdd\xbb\x68\xc5\x40\x7e\x45\x34\xbf\
+\x27\x3a\x72\x31\x9c\xe5\x32\xee\x79\xf4\xaf\x99\x8c\x18\xed\x57\
+\xcb\xc1\x68\x60\x3e\x93\x5e\x4f\xf0\x51\xa2\x4d\x71\xdc\x68\xc7\
+\xcd\x8e\x1e\x93\xbb\xc9\xd0\x96\x58\x4d\xe6\x2a\x9a\x9d\xc9\x4d\
+\x83\xf6\x6b\xa1\x25\xd6\x63\xdb\x5d\x2d\x93\x4c\x47\x80\xf6\x6b\
+\x61\xf0\xd2\xd7\xe3\xf4\x5a\x91\x70\x8f\x06\x24\x6e\x2c\x3a\x21\
+\x6e\x76\x7e\x5d\xdd\x54\x34\x8b\x1f\x9f\xf4\x98\xc4\x8d\xbb\x09\
+\xb0\xc4\xd1\x6c\xdf\x96\xea\x6d\x4a\xe8\x76\xbf\x22\x7a\xf9\xdc\
+\xed\x47\xa4\xc7\x87\xc5\xbb\xcc\x37\xf9\x7d\x57\xdd\xae\x37\x6e\
+\x53\xbb\x1f\xe9\xed\x7a\xb3\xea\xf6\xe0\x64\x31\x18\xc7\x7b\xd5\
+\xed\x39\x8b\x01\xff\xdb\xc3\xcb\xe7\xb2\x4e\xef\xb0\x8b\x15\xf6\
+\x44\x74\x98\x1e\x29\x86\xff\xf8\x17\xc2\xa5\x12\x34\x57\x82\xe6\
+\x4a\xd0\x5c\x09\x9a\x2b\x41\x73\x25\x68\xae\x04\xcd\x95\xa0\xb9\
+\xfa\x01\x26\xb5\xd4\x27\xf4\xff\xbe\x6f\x00\x00\x00\x00\x49\x45\
+\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x08\xc2\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x08\x74\x49\x44\x41\x54\x78\x9c\xdd\
+\x9b\x5d\x6c\x14\xd7\x15\xc7\x7f\xe7\xce\xcc\xae\xd7\xe0\x35\x01\
+\x9c\x96\x2a\xfd\x90\xd2\xe0\x34\x94\x56\x88\x00\xa2\x55\xd3\x3e\
+\x24\x2f\x6d\x15\xd4\x17\x82\x4d\x5a\x20\x94\xa0\x4a\x8d\x4a\xfa\
+\x10\x14\x89\xc6\x76\x5a\xa9\x69\x1e\x8a\x2b\x5e\x4a\x2a\x95\x50\
+\x05\x4c\x2d\x45\xca\x43\x23\xf5\x23\x2f\xa4\xa4\x11\x10\xda\x54\
+\x10\xa7\xa0\xb4\x2a\x8a\x1a\x44\x62\xbe\xbc\xb6\xd7\xbb\x3b\x73\
+\x4f\x1f\x66\x67\x77\x6c\xd6\xbb\x36\x5e\x07\xef\xfe\x25\xcb\xf6\
+\xdc\xbb\xb3\xe7\xfb\x9e\x7b\xcf\xb9\xc2\x3c\x63\xf0\xe9\x35\x1d\
+\x85\x84\xfb\x35\x94\x55\x22\xd2\xa9\xb0\x52\xa0\x03\xa1\x0d\xa5\
+\x0d\x00\x21\x83\x92\x51\xf8\x48\xe0\x82\xaa\x9e\x47\x78\xc7\xcb\
+\xfb\x7f\xdd\xfc\xf3\x7f\x7c\x34\x9f\xf4\xc9\x7c\xbc\x74\xa0\x77\
+\xfd\xfd\xaa\x74\x21\xfa\x10\xc8\x17\xd1\x5b\xfc\x1e\x41\x41\xcf\
+\xa1\xf2\x17\x11\x06\xba\x7a\x4f\xbd\x55\x67\x52\xeb\x27\x80\x97\
+\x7a\x36\xa4\x8d\xea\x6e\x0c\x3b\x50\xbe\x30\xdd\x3c\xc7\x11\xc4\
+\x08\x46\x62\xdf\xae\x60\x15\xd4\x2a\x41\xa0\xd5\xa8\x7d\x17\xcb\
+\x21\x2b\x72\xf0\xd1\xbe\x93\x23\xf5\xa0\x7b\xce\x02\x18\xec\xd9\
+\xb8\x34\x10\xbb\x47\x55\x9f\x00\x96\xc4\xc7\x8c\x11\x3c\x4f\x70\
+\x3d\xc1\x75\x05\x63\x04\xa9\xf1\x8d\xaa\x60\xad\xe2\xfb\x8a\x5f\
+\x50\x0a\x05\xc5\xda\x9b\x84\x72\x5d\x44\x0e\x38\x6a\xfa\x37\xf7\
+\xbd\x79\x75\x2e\xf4\xdf\xb2\x00\x14\xe4\xe8\x33\xeb\x1f\x13\xc3\
+\x2f\x50\x96\x95\x5e\x68\x20\x99\x30\x24\x92\x06\xd7\xad\x8f\x81\
+\xf9\xbe\x92\xcf\x59\x72\x79\x8b\xda\x49\x43\xc3\x22\xb2\x77\x4b\
+\xef\xc9\x43\x02\x55\x4c\x67\x7a\xdc\x12\x85\xc7\xf6\xad\xbd\x5b\
+\x5d\xf7\xb0\xaa\x7e\x35\x7a\x66\x8c\xd0\x92\x32\x24\x93\x82\xd4\
+\x52\xf3\x2d\x42\x55\xc9\xe5\x94\x89\xac\x9d\x6a\x15\x27\x4c\x10\
+\x6c\xdf\xf2\xb3\x33\xff\x9e\xed\x3b\x67\x4d\xe9\xc0\x33\xeb\x1e\
+\x51\x91\x17\x80\x74\xf4\x86\xd6\x94\x43\x4b\x8b\x50\xd3\xbe\xeb\
+\x05\x55\x26\x26\x94\xf1\x6c\x10\xd7\xfb\x88\xa8\x3e\xde\xf5\xec\
+\xe9\xdf\xcf\xe6\x55\x33\xa6\x58\x41\x06\x7a\xd6\xed\x07\xf9\x51\
+\xf4\xcc\x4b\x18\x16\xb5\x3a\x18\x67\x36\x5f\x59\x3f\xd8\x00\xc6\
+\xc6\x03\x0a\xf9\xb8\x5f\xe8\xaf\xba\xfa\x4e\x3f\x39\x53\x97\x98\
+\x91\x00\x0e\x3e\xbe\xd6\x6b\x5b\x61\x7e\x07\xb2\x25\x7a\xd6\xda\
+\x6a\x68\x69\x71\xe6\x69\x21\x9d\x05\x14\x26\x72\x96\xf1\xb1\x20\
+\xfe\x74\x20\x73\x29\xd8\xb6\xfb\x85\x33\x85\x5a\x1f\xaf\x49\x7e\
+\xc8\xbc\xf3\x0a\xf0\x4d\x08\xad\xbc\x2d\xed\xd6\x2d\xc0\xd5\x0b\
+\xbe\xaf\x64\x46\x7c\x34\xd2\xbb\xf0\x6a\xe6\x83\xe0\x3b\xb5\x84\
+\x60\xaa\x0d\x2a\x48\xdb\x0a\xe7\x30\x45\xe6\x8d\x81\x74\xfb\xc2\
+\x63\x1e\xc0\x75\x85\x74\xbb\x8b\x89\x38\x52\xbe\xb5\x78\x85\xf3\
+\xa2\xd6\x50\x72\x55\xef\xed\xec\x59\xd7\x0f\xf2\x7d\x28\x32\x9f\
+\xf6\x70\x9c\x85\xc7\x7c\x04\x63\x84\x44\xc2\x21\x97\xb7\xa1\xf6\
+\x60\xf5\xb9\x6f\x7c\xaa\xfd\xe5\xe3\x1f\xfc\x69\xba\xcf\x4c\xcb\
+\x4d\x31\xda\x1f\x83\x70\x6d\x4f\xb7\xb9\x38\x0b\x50\xf3\x95\x10\
+\xf8\xca\x48\xc6\x2f\xe7\x0c\xa2\x8f\x74\xf7\x9e\x1e\xac\x34\xb7\
+\x22\x47\xc7\xf6\xad\xbd\xdb\x3a\xce\xdf\x81\x34\x02\xe9\x36\x07\
+\xd7\xab\xea\x2d\x0b\x0e\x7e\xc1\x32\x92\x29\x2d\x93\x23\x8a\x5d\
+\xb3\xb5\xef\xad\xff\x4c\x9d\x77\x13\x57\x0a\xa2\xae\x7b\x98\xe2\
+\x3a\x9f\x4a\x35\x1e\xf3\x00\xae\x67\x48\xa5\x4a\x1e\x9e\x16\xcc\
+\xe1\x4a\xf1\xe0\xa6\x18\x70\x6f\xef\x86\xc7\x54\xf5\x87\x00\x9e\
+\x27\x2c\x5a\x7c\x9b\x16\xf9\x3a\xc0\xf3\x04\xdf\x57\x6c\xe8\x0a\
+\x9f\x39\xf7\xf5\xbb\x2e\xbe\x7c\xfc\x7f\x6f\xc7\xe7\x4c\x92\xc8\
+\x60\xcf\xc6\xa5\xbe\x04\x17\x50\x96\x21\x42\x7b\xbb\xb3\xa0\x83\
+\xde\x4c\x60\x03\xe5\xfa\x8d\x80\xe2\xfa\x38\xac\xb9\xc4\xca\xad\
+\xcf\x9d\xb8\x16\x8d\x4f\xb2\xed\x40\xec\x9e\x68\x63\x93\x4a\x99\
+\x86\x67\x1e\xc0\x38\x42\x2a\x55\x62\x73\xb9\x24\x73\x7b\xe2\xe3\
+\x25\x0e\x5f\xea\xd9\x90\x36\xe8\x45\x60\x89\x31\xd0\xbe\xc4\x9d\
+\xb7\x4d\xcd\xc7\x0d\x55\xb8\x71\xbd\x10\xba\x82\x70\x2d\x3b\xee\
+\x7d\x76\xe7\xf3\x6f\x64\x20\x66\x01\x46\x75\x37\xc5\xfd\x7c\x4b\
+\x8b\x69\x1a\xe6\x21\xcc\x5e\x93\xc9\x22\xab\xca\x1d\xad\xad\xfe\
+\xee\x68\xac\xec\x02\x86\x1d\xe1\x64\x21\xd1\xd2\x78\x51\xbf\x16\
+\x92\x29\x53\xb2\x77\x55\xdd\x11\x3d\x37\x10\x9e\xe1\x45\xc7\x58\
+\x5e\x42\x30\x4d\xa4\xfd\x08\x46\x84\x44\xa2\xa4\xd8\xfb\x8e\xfc\
+\x64\xc3\x5a\x28\x0a\x40\x95\xae\x68\x24\x99\x68\x3e\xed\x47\x28\
+\xb9\x01\x20\x46\xbb\x21\x72\x01\xd1\x87\x20\xf4\x15\x2f\xd1\x7c\
+\xda\x8f\xe0\x79\x82\x94\x65\xf0\x20\x80\x0c\x3e\xbd\xa6\xc3\x4f\
+\x7a\x97\x51\xc4\x4b\x18\xda\xda\x1a\x37\xf1\x99\x09\x46\x33\x01\
+\xf9\xbc\x0d\x8f\xdc\x35\xb8\xd3\x14\x8b\x16\x02\xa1\x84\x9a\x1d\
+\x25\x1e\x15\x51\xcc\x03\x06\x65\x55\x34\xb8\x10\xf7\xf9\xf5\x46\
+\x7c\x47\x6b\x84\xfb\x8c\x88\x74\x96\x1e\x34\xb7\xf5\x03\xe0\x98\
+\xb2\x00\x54\x4d\xa7\x51\x58\x09\xe1\x81\x47\x33\x2e\x7f\x53\x21\
+\x86\xd2\xa9\x91\xa2\x9d\xae\x40\x47\x38\x50\x9b\xf9\x89\x89\x80\
+\xb3\xff\xbc\xcc\xd5\xab\x13\xdc\x62\x1d\x62\xde\x20\x22\x2c\x5f\
+\x9e\x62\xf5\x97\x3f\x81\x57\x63\xfb\x1e\x66\xb9\x8a\x11\x96\xbb\
+\xc5\x2a\x6d\x4d\xed\x07\xbe\xe5\x0f\xaf\x9c\xe7\xda\xf5\x5c\x1d\
+\xc9\xae\x2f\x2e\xfe\xf7\x06\xef\xbf\x9f\xe1\xe1\x4d\xf7\x54\x55\
+\xa8\x94\x32\x42\xda\x4c\xa9\x44\x5d\x43\xa3\x97\x2e\x8d\x2d\x68\
+\xe6\x23\x7c\x78\x79\x8c\x2b\x57\xb2\x55\xe7\xc4\x74\x9d\x9e\x71\
+\xda\x67\x1a\x28\x41\x34\xb5\xb6\xf1\xb1\x61\x83\x90\x01\xca\xe7\
+\xe9\xd3\xe0\x93\x2b\x16\xd3\xd1\xd1\x3a\x57\xda\xe6\x1d\x77\x7d\
+\xba\x8d\xa5\x77\xa4\xaa\xce\x89\xf1\x3a\xe2\xa2\x64\x80\x65\x5a\
+\xc3\x05\x8c\x11\xbe\xbd\xe9\xf3\xbc\x3b\x74\x85\xab\x57\xb2\x0b\
+\x2d\x06\x22\x46\x58\xde\x91\xa2\xf3\xde\x65\x35\xcb\x3d\xd1\x69\
+\xb1\x08\x19\xb7\xd8\x96\xf2\xb9\x29\x65\xe7\x8a\x70\x5d\x87\xd5\
+\x5f\xba\x73\xee\xd4\xde\x66\x44\xbc\x5a\x65\xd8\x08\xbc\x07\x60\
+\x6d\x6d\x37\x68\x06\x58\x0b\xb6\xc8\xa8\x20\xe7\x8d\xc2\x85\x68\
+\xb0\x6a\x7b\x4a\x93\xc0\x06\x65\x53\x17\xb1\xe7\x0d\xca\x3b\xd1\
+\x03\xbf\xd0\xfc\x02\x28\xf8\x65\x1e\xad\x32\x64\x02\x71\x8f\x87\
+\xdd\x58\xe0\xfb\x33\x08\x04\x0d\x8e\x92\x92\x05\x15\xec\xeb\xe6\
+\x7b\x7d\x7f\xfb\x30\xb2\x02\xbf\x66\x35\xbd\xc1\xa1\x5a\xb6\x00\
+\xe5\x6c\x77\xdf\x99\xe1\x28\xbd\xf9\x33\x84\xc1\xa1\xd0\xc4\x6e\
+\x90\x2f\x10\x5f\xbe\x5f\x83\xe2\x91\x98\x08\x03\xd1\xd3\x5c\xae\
+\x79\xdd\x20\x1f\xe3\x4d\xad\x1c\x85\xa2\x00\xc2\x0e\x4c\xf9\x17\
+\x40\x3e\x6f\xd1\x26\x5c\x0f\xd5\x86\xbc\x15\x31\xb4\xf5\xa7\x27\
+\xcf\x40\xbc\x2e\xa0\xfa\xdb\xf0\x37\x64\xb3\xcd\x27\x80\xec\x44\
+\xb9\x87\x48\x44\x0e\x45\x7f\x9b\xf2\x04\xef\xd7\x08\xd7\x00\x72\
+\xb9\x60\x6a\x43\x62\x43\xc3\x5a\x98\x98\x88\xf2\x5f\xae\x8d\x8f\
+\xbb\x07\xa3\xb1\x92\x00\x76\x3e\xff\x46\x06\xd5\x03\x10\x9a\x4b\
+\x76\xa2\x79\x24\x90\x8d\xf7\x13\xaa\x1e\x88\xea\x82\x30\xa5\x3a\
+\x9c\xa3\xb0\x1f\x18\x06\x98\xc8\x06\x04\x7e\xe3\xbb\x82\xef\x6b\
+\x3c\xb0\x0f\x6b\x2e\xd9\x1f\x1f\x9f\x24\x80\x1d\x7d\x6f\x5f\x17\
+\x91\xbd\xd1\xff\x63\x93\x7b\xef\x1a\x0e\xaa\x30\x36\x1a\xd7\xbe\
+\x3c\x15\xef\x0d\x80\x0a\x1b\xc7\xb0\x23\x74\xfd\x09\xe0\x2b\x10\
+\xb6\xc8\xa4\x5a\x1b\xe8\x34\x24\x86\xb1\xb1\x80\x5c\xd9\x95\x4f\
+\x74\xf5\x9d\x7a\x60\x6a\x07\xe9\x4d\x9c\x09\x68\x80\xb3\x0d\x18\
+\x81\x30\x7a\xe6\xf3\x8d\x17\x0f\xf2\x39\x1b\x67\x7e\x44\xb1\xdb\
+\x2a\xb5\xcf\x56\x54\xed\x77\xfb\xde\x7c\x0f\xd1\x5d\x00\x28\x8c\
+\x8e\x06\xf8\x0d\x14\x0f\x0a\x05\xcb\xe8\x68\xcc\x7d\x45\x77\x55\
+\xea\x10\x83\x2a\x9d\xa2\xdd\xbd\xa7\x07\x15\xf6\x03\xa0\x90\x19\
+\xf1\x09\xfc\x3a\x53\x3a\x0f\xf0\x7d\x65\x34\x13\x8f\x5d\xda\x3f\
+\x5d\x8f\x20\xd4\x38\x3c\x2a\x76\x88\x1f\x8d\x9a\xa4\xc5\xc0\xe2\
+\xc5\x4e\xcd\x73\xf7\xdb\x85\x42\x21\x64\x3e\xca\x64\x15\x8e\x76\
+\xf7\x9d\x7a\xb4\x5a\xe7\x78\x55\x4e\x04\xd4\x95\xb1\x6d\xc0\x1f\
+\x21\xcc\x0f\x32\x99\x80\x7c\x6e\xe1\xb9\x43\x2e\x67\x19\xcd\xf8\
+\xe5\x34\x5e\x78\x75\xf4\x52\xb0\xbd\x56\xdb\x7c\x4d\x55\x6e\xee\
+\x1d\xca\xbb\x32\xba\x09\xf4\x18\x50\x8c\x09\xfe\xd4\xf6\xf4\xdb\
+\x87\xe2\x52\x37\x36\x1a\x94\x8e\xf4\x14\x8e\xce\xa4\x53\x1c\x66\
+\x7f\x61\xe2\x97\x20\xa5\x36\x33\xc7\x15\x16\x2d\x72\x6e\x5b\x55\
+\xb9\xe0\x2b\xe3\xa3\x3e\xc1\x24\x5d\x68\x7f\x57\xdf\xe9\x1f\xd7\
+\xf5\xc2\x44\x1c\xc5\x26\xea\xdf\x40\xe9\xd2\x23\xc9\x84\xa1\xb5\
+\xd5\xcc\xa8\xbe\x58\x0f\x58\x0b\xe3\xe3\xc1\xa4\xed\x2d\x30\x82\
+\xe8\xae\x6a\x01\xaf\x12\x6e\x89\xe2\x23\xfb\x36\xdc\x23\xae\x1e\
+\x46\xd9\x58\x7a\x91\x40\x22\xe9\x90\x6a\x31\xf3\x56\x66\xb7\x81\
+\x92\xcd\xda\x4a\x67\x16\x27\x14\xbb\x6d\xba\xa5\xae\x1a\xe6\x74\
+\x6d\x6e\xa0\x77\xfd\x4e\xe0\xb9\xf8\xb5\x39\x00\xcf\x33\x24\x92\
+\x61\x57\xd6\x5c\x2b\xee\xaa\x90\xcf\x29\xb9\x7c\x31\x17\x99\x6c\
+\xd8\xc3\xa8\x3c\xd5\xf5\xec\xc9\x17\x3f\xd6\x6b\x73\x71\x0c\xf6\
+\x6c\x5c\x5a\xc0\x3e\x29\xe8\x13\x40\xfb\xd4\x71\xd7\x13\x3c\x57\
+\x70\xdd\xd0\x32\x6a\xb5\xdf\x06\x41\x78\x7b\x34\xf0\xc3\x84\xa6\
+\x62\x02\x26\x5c\x43\xf5\x80\xe6\x92\xfd\x53\x73\xfb\xd9\xa2\x6e\
+\x4e\x3b\xb8\x77\x6d\xbb\xdf\x62\x7e\x80\xc8\x76\x94\xce\xe9\xe6\
+\x89\x44\x3f\x32\xe9\xea\xac\xaa\xa2\x5a\xb3\x38\x33\x24\x22\x87\
+\xc6\xc7\xdd\x83\xf1\x2d\xed\x5c\x30\x2f\x51\xeb\x48\xef\xfd\xeb\
+\x45\xa5\x0b\xe4\x41\x84\x55\x73\xba\x3c\xad\x9c\x05\x5e\x53\x2b\
+\x47\xa3\x63\xac\x7a\x62\xde\xc3\x76\xa5\xeb\xf3\x46\x58\xae\x61\
+\x5f\x42\xba\x38\x6d\x44\x84\x8c\x55\x86\x05\x39\x2f\x62\xcf\x5b\
+\x65\x48\xb0\xaf\x77\xf7\x9d\x19\x9e\x4f\xfa\xfe\x0f\x46\x11\x80\
+\x15\xf8\x02\x8c\x0e\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
+\x82\
+\x00\x00\x09\x50\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x09\x02\x49\x44\x41\x54\x78\x9c\xd5\
+\x9b\x5d\x6c\x1c\xd5\x15\xc7\x7f\xe7\xce\xec\x87\x37\xd8\x8e\x8d\
+\x43\x08\x54\x2a\x69\x21\x11\xb4\x41\xa2\x0e\x05\xc4\x47\x9d\x04\
+\x44\x69\x9f\xaa\x56\x82\xa0\x4a\x81\xa8\x90\xa7\xb6\x51\x1f\x8a\
+\xfa\x91\x58\x0e\x88\x0a\xb5\x6a\x2d\x21\x55\x4a\xa5\x2a\x50\xa9\
+\x89\xda\xbe\x54\x02\x54\x21\x20\x4e\x43\x50\x45\x13\xd3\x87\x7c\
+\x20\x47\xa5\xb4\x45\x85\x42\xdc\xd8\xb1\xe3\x5d\xef\xce\xcc\x3d\
+\x7d\x98\xd9\xf5\xd8\xb1\xf7\x73\xd6\x71\xfe\x2f\xab\xb9\x7b\xf7\
+\xde\x73\xfe\x7b\xe7\xdc\x73\xcf\x39\x57\x68\x33\xee\x7d\xf6\xb6\
+\x35\x6e\xe0\xde\x0b\xf6\x73\xc0\x46\x51\xd9\x00\xba\x06\xa4\x13\
+\xe8\x8c\xba\x4d\x83\x4e\x83\x9c\x53\xd1\xb3\xc0\x18\x98\xd3\xbe\
+\xe3\xbf\xf9\xe6\x0f\xff\x76\xae\x9d\xf2\x49\x3b\x06\x1d\x78\xe6\
+\x8b\x9b\xc5\xda\xed\x02\x0f\x00\x9f\x6f\x61\x1e\x05\x4e\x29\xbc\
+\xa6\xc6\x1c\x3a\xf2\xe3\xbf\x9e\x48\x4e\xca\x10\x89\x11\xf0\xd0\
+\xe0\x1d\x5d\xb3\x6e\xb0\x4b\x94\xc7\x81\x9b\x97\x9c\xd0\x08\x18\
+\x13\x4e\x2c\xd1\xf4\xaa\x28\x80\xb5\xa8\xd5\x6a\xd3\xbc\xab\xc2\
+\x81\xac\xef\xec\xff\xd3\xd0\xdb\x53\x49\xc8\xdd\x32\x01\x0f\x0e\
+\xde\xd5\xeb\x1b\x7f\xb7\x8a\x7e\x1b\x58\x3d\x7f\x74\xc1\xa4\x1c\
+\x9c\x94\x83\xa4\x1c\xc4\x35\x88\x54\x9f\x52\x55\x51\xdf\xa2\x5e\
+\x40\xe0\x05\x58\x2f\x00\xbd\x84\x94\x49\x51\x79\xde\xb5\xee\xf0\
+\xab\x43\x7f\x39\xdf\x8a\xfc\xcd\x13\xa0\xc8\xb6\x7d\x9b\x77\xaa\
+\xf0\x1c\x70\x75\x7c\x48\x27\xe3\xe2\x64\x5d\x4c\xda\x6d\x45\xb6\
+\x0a\x6c\xc9\x27\x98\xf5\x09\x8a\x3e\xe1\x5b\x51\xc1\xb8\xc2\x53\
+\x23\x7b\x4e\x1c\x40\xa8\xba\x74\x96\x42\x53\x04\x6c\x7d\xba\xff\
+\xb3\xa8\xbc\x08\xdc\x3d\x37\x92\xe0\x76\xa4\x70\x72\xe9\x9a\xff\
+\x72\xb3\x50\x55\x82\x7c\x09\xbf\xe0\xcd\x5b\x15\xaa\x1c\x13\xa3\
+\x8f\x1d\xde\x33\xfa\x5e\xa3\x63\x36\x2c\xe9\xb6\xa1\xdb\x1f\x56\
+\xd1\x5f\x01\x5d\xe5\x36\x27\x97\xc6\x6d\xa3\xe2\x0b\xa1\xaa\xf8\
+\xf9\x12\x41\xbe\x14\x6f\x9e\x12\x95\x27\xdf\x18\x3c\xfe\xbb\x46\
+\xc6\x72\xea\x9f\x15\xd9\x6a\xfa\x87\x11\x7e\x06\x64\x00\x8c\xeb\
+\x90\xee\xce\xe1\x64\x53\xcb\xa6\x3c\x80\x88\xe0\xa4\x5d\x9c\x4c\
+\x2a\xb4\x17\xa1\xe1\xcc\x20\x7c\x63\xfd\xc0\xba\x9e\xf7\x47\x3e\
+\x7a\x95\xa1\x3a\xc7\xaa\xa7\x53\xff\xfe\xfe\x54\xf7\xc7\xf2\x1b\
+\xe0\x91\x72\x9b\x9b\xcb\xe0\xae\x4a\x37\x21\x7e\xf2\xf0\x2f\x16\
+\xf1\x0b\xb1\xd5\x20\x1c\xba\x70\x8d\xee\x18\xdd\x35\xea\xd5\xfa\
+\x6d\x4d\x02\x22\xe5\xff\x08\x7c\x25\xfc\x85\x90\xee\xca\x26\x66\
+\xe0\x92\x82\x2d\xfa\x94\xa6\x67\x2b\xb6\x41\xe0\x95\xc9\xb5\xfa\
+\xb5\x5a\x24\x98\xaa\xa3\x2a\xd2\xfd\x89\xbc\x48\xa4\xbc\x88\x90\
+\x5e\xdd\xb1\xe2\x94\x07\x30\x19\x97\x74\x77\x47\xe5\x55\x54\xf8\
+\x6a\xf7\xc7\xe6\x05\xb4\xfa\x9f\x5c\xd5\x06\x6c\x35\xfd\xc3\x20\
+\xdf\x82\xb2\xf2\x39\x8c\x5b\xbf\xd9\x58\x6e\x88\x63\x70\xd2\x2e\
+\xb6\xe8\x97\x9b\x36\xad\x3f\x7a\x5d\xf7\xfb\x23\x1f\xbe\xba\xd4\
+\x6f\x96\xd4\x66\xdb\xd0\xed\x0f\x47\x06\x2f\x5c\xf6\xab\x3b\x56\
+\xb4\xf2\x65\x88\x09\x9d\xaf\x60\x8e\x84\x3b\x6f\xd8\x72\xfd\xbb\
+\xff\x1c\xf9\xf0\xf4\xa2\xfd\x17\x6b\x8c\xf6\xf9\x77\x88\xb6\xba\
+\x74\xf7\xca\x5c\xf6\xd5\x60\x8b\x3e\xa5\xa9\x42\xf9\x71\x4a\x02\
+\x6e\x7b\x63\xe8\xc4\x3f\x16\xf6\xbb\xd4\x06\x28\x12\x39\x39\x5d\
+\x00\x6e\x47\xfa\x8a\x53\x1e\x42\x9b\xe0\x76\x54\x76\xa9\x2e\x6b\
+\x78\x71\x31\x7b\x70\x49\xc3\x96\x7d\x9b\x77\x0a\xfc\x1a\xa2\x7d\
+\xbe\x27\xd7\xb4\x10\xf9\xf3\x79\xa6\xff\x9b\xc8\x99\x05\x00\x71\
+\x1d\x56\xf5\xe6\xc8\xf5\xe6\xc2\x43\x55\x1d\x28\x4d\xe4\xb1\x7e\
+\x10\x3e\xa8\xec\x3c\x3c\x78\xfc\xc0\xbc\x31\xe3\x0f\x0f\x0e\xde\
+\xd5\xeb\x39\xde\x59\x22\xdf\x3e\xd3\xb3\x0a\x71\xab\x6f\x14\xd5\
+\x60\x03\xcb\xd9\xd7\xcf\x32\xf1\xaf\x96\xce\x2b\x97\x20\xdb\x95\
+\xe5\xc6\x81\x9b\xe8\xbc\xb6\xb3\x66\x5f\xf5\x03\x8a\x13\xf9\xf2\
+\xe3\x78\x29\x55\xdc\x70\xec\x07\x27\x27\xca\x0d\xf3\xb4\xf3\x8d\
+\xbf\x9b\x48\x79\x27\x97\x6e\x49\x79\x00\xe3\x18\x36\xdc\xbf\x81\
+\x9e\x4f\xf7\xb6\x34\xce\x42\xcc\x4e\xcd\x72\xfa\xa5\x53\xcc\xfc\
+\x6f\xa6\x66\x5f\x71\x9d\xf8\xab\xd0\x97\xf2\xd2\xbb\xe3\xdf\x57\
+\xcc\xfa\x43\x83\x77\x74\xf9\xc6\x1e\x02\xb2\x88\xcc\xdb\x53\x5b\
+\x81\x18\xa1\x77\x7d\x2f\xf9\xf3\x79\x66\x2f\x14\x6a\xff\xa0\x01\
+\xcc\x8c\xcf\xb0\xf6\xe6\xb5\xb5\x65\x48\x39\x04\x85\xd0\x1f\x12\
+\xcc\xad\xd7\x7d\x79\xfd\x2f\x3f\x78\xfd\x83\x12\xc4\x56\xc0\xac\
+\x1b\xec\x22\x3a\xcf\xbb\x1d\xc9\xfa\xf6\xed\x5a\x09\x17\xcf\x5d\
+\xc4\x9b\xdb\xee\x96\x84\x88\xc4\x56\x81\xf6\x64\x8a\xa5\x5d\x15\
+\xd9\x2a\x9d\xc2\x48\x0e\x20\x38\xb9\xe4\x7d\xfc\x76\x91\x50\x38\
+\x9f\xaf\xdd\x09\x70\x72\x29\xe6\x4c\x9e\x7d\xbc\x22\x17\x84\x31\
+\x3c\xa2\x30\x96\x93\x71\xdb\x76\xb2\x6b\x07\x09\x35\x42\x68\x15\
+\x88\x08\x26\x53\x7e\xe3\xe5\x96\x2d\xfb\xbe\xd0\x0f\x11\x01\x62\
+\xed\xf6\x72\x47\x27\xdb\xde\x3d\xbf\x5d\x2b\xa1\x1e\xb8\x99\x54\
+\x5c\x92\x47\xa1\x4c\x40\x18\xbd\x0d\x63\x78\x0d\x38\x3d\xa5\x7c\
+\x09\x2f\x5f\xf3\xc4\x79\x09\x2e\x17\x09\x26\xe3\x56\x02\xb1\x22\
+\xdc\x0f\x60\xee\x7d\xf6\xb6\x35\x84\xa1\x6b\x4c\xaa\x31\x5f\xdf\
+\x2b\x78\x9c\x7e\xf9\xd4\x15\x45\x82\x53\xd6\x51\xd9\x34\x30\xd8\
+\xdf\x67\xc2\xa4\x45\x68\x1d\x9c\x06\x09\x00\x28\x4c\x16\xae\x28\
+\x12\x4c\xba\xa2\xa3\x88\x6b\xee\x33\x51\xc6\x26\x6c\x69\x82\x00\
+\xb8\xb2\x48\x88\x9f\x68\x45\xed\x2d\x06\xd8\x18\x17\xa6\x59\x5c\
+\x31\x24\xcc\xf3\x6e\x65\xa3\x09\x73\x75\xe5\x8c\x4d\x6b\xdb\x5f\
+\x12\x24\xf4\xb6\x99\x04\x11\x89\x1f\xa4\x36\x9a\x30\x51\x09\x98\
+\xd6\xfc\xfe\x32\x2a\x24\x14\x9a\x23\xe1\xa6\x65\x20\xa1\xac\xab\
+\x42\x9f\x89\xb2\xb4\x89\x66\x49\x0b\x93\x05\x4e\xbf\xb4\x72\x49\
+\x90\xb9\xcf\x4e\x43\x39\x45\x9d\xb0\xf7\xb7\xa2\x49\x98\xd3\xb5\
+\x2b\x99\x75\xbf\x04\x56\x34\x09\xe5\x79\x80\x69\x60\xb1\x0c\x6c\
+\x22\x58\x91\x24\xcc\xe9\x3a\x65\xc2\xca\x0c\xd0\xe6\x92\xab\x75\
+\x21\x11\x12\x6e\x48\xf0\x00\x35\xf7\x39\x6d\x40\xc2\x12\x94\x3a\
+\x4f\x55\xcd\xa2\x65\x12\xb6\x25\x48\x82\xb5\x00\x08\x8c\x9b\xa8\
+\x26\x07\xb5\x8a\xb6\xe9\x35\x28\x63\x25\x90\xa0\xaa\xf1\x23\xf4\
+\x98\x01\xc6\x2a\xdf\xfa\xb6\xa5\xc1\xeb\xc1\x65\x27\x61\x9e\x8e\
+\x3a\x66\xc0\x54\x32\x26\x95\xf0\x71\x9b\x71\x39\x49\x88\xeb\xa8\
+\x62\xce\x18\xdf\xf1\xdf\x24\xb2\x0b\xb6\xb4\x3c\x04\xc0\xe5\x23\
+\x21\xa6\xa3\xaa\x6f\x8f\x9a\xa8\x0e\xef\x14\x80\xf5\x6a\x07\x18\
+\x93\x44\x12\x24\xe4\x1a\x4c\xdc\x04\x5e\x44\x80\x70\xf2\xc8\xd0\
+\xe8\xb8\x01\x50\x78\x0d\xc2\xed\x31\xa8\x23\xca\x9a\x24\x5a\x25\
+\x21\x95\x4b\xd5\xee\x18\xc1\x16\xfd\x8a\x0f\xa0\xca\xeb\x10\x85\
+\xc4\xd4\x98\x43\x73\x9d\x1a\x17\xa4\x55\x54\x48\x68\xe2\x14\xd9\
+\x08\xfc\x79\xba\xd9\x83\x10\x11\x10\x55\x60\xbe\x0b\x10\x94\x82\
+\xba\x23\xad\xa6\xc5\xe3\x73\x1c\xad\x1c\xa5\xeb\x81\xaa\x62\x8b\
+\xe5\xf7\x5f\xcf\x8c\xec\x7d\x67\x14\x62\x79\x01\x15\x0e\x44\x3d\
+\x17\x56\x5f\x2d\x89\x6c\x77\x47\x4b\x41\x94\x85\x68\x27\x09\x41\
+\xde\x63\xce\x07\x34\x95\x04\x69\x45\xfa\xac\xef\xec\x07\x26\x01\
+\xfc\x59\xaf\x2e\xcf\x50\x8c\xb0\xfa\x53\xab\x6b\xf6\x6b\x04\xed\
+\x20\x41\x55\x63\x45\x54\x32\x51\xcc\xa4\xf7\x97\xbf\xab\x04\xc8\
+\xfe\xfe\xe7\xff\x14\x3f\x33\x70\xfd\x2a\x84\x2f\x95\xdb\xea\x09\
+\x91\x77\x5d\xdb\xc5\xb9\xb1\x4f\xb0\x41\x72\x4e\x94\x3f\xeb\x33\
+\xf1\xef\x09\xae\x5e\xdf\xd7\x54\xa0\x76\x21\x82\x99\x52\x58\x72\
+\x0b\x28\xfa\xd3\xa3\x3f\x7a\xbb\x52\x32\x33\x6f\xfd\xba\xd6\x1d\
+\x06\xc6\x01\xfc\x42\x09\xad\xc3\x33\x4c\x5f\x95\x66\xd3\xd7\x6f\
+\xa5\x6b\x5d\x57\xcd\xbe\x8d\x20\xa9\x95\xa0\x7e\x10\x2f\xa1\x1b\
+\xf7\x52\xa5\xe1\xf8\xf7\x35\x0a\x24\x0c\xe9\x9e\x55\x75\x4f\x56\
+\xca\x97\x98\x19\x9f\x99\xdb\x6b\x13\x40\x47\x57\x86\x55\x6b\x6a\
+\xd7\x01\x2c\x29\x53\x23\x05\x12\x61\x27\x64\xcb\xbe\xcd\x47\x45\
+\xb8\x07\xc2\x12\x19\xf7\xaa\x4c\xd3\x02\x5c\x4e\xc4\x0b\x28\x55\
+\x39\x36\xb2\xf7\xc4\x7d\x0b\x8b\xaa\x2f\x35\xe1\x82\x8a\xd1\xc7\
+\x80\x29\x08\x5f\x85\xe5\x76\x8e\x92\x80\x2d\xfa\xf1\xa5\x3f\x65\
+\x2c\x3b\x16\xab\x28\x5f\x74\x0f\x3b\xbc\x67\xf4\x3d\x51\x79\xb2\
+\xfc\xec\x4f\x15\xd0\x04\x97\x75\xbb\x61\xbd\x20\xac\x1a\x8d\xa0\
+\xc8\x13\x8b\x55\x88\x41\x95\x3a\xc1\xf7\x8f\x7c\x78\x7a\xfd\xc0\
+\xba\x1e\x44\xee\x84\x90\x51\x93\x76\xeb\x2e\x4e\xba\x5c\x50\xdf\
+\xe2\x5d\x28\xc4\xc3\x5e\xc3\x23\x7b\x4f\xfc\x7c\xa9\xfe\x35\xae\
+\x6f\x20\x5b\x9f\xd9\xfc\x5b\x94\xed\x10\x26\x15\x52\xdd\x1d\x0d\
+\x27\x51\x97\x0b\xd6\x0f\xf0\x26\x0b\xb1\xc0\x8e\x1c\x3c\xbc\xe7\
+\xf8\x37\xab\x5d\xa6\xa8\xee\xc6\x09\x7a\xe1\x1a\xdd\x21\xf0\x0a\
+\x84\x0e\x85\x37\x99\xc7\x96\x56\x9e\x4d\xb0\x45\x9f\x52\x4c\x79\
+\x81\x57\x2e\xac\xb5\x8f\xd5\xba\x49\x52\xf3\xaf\xfc\xe8\xe5\x8f\
+\x6c\xef\x23\xeb\xfe\x90\xcd\xcb\x8d\xc0\x26\x08\x4f\x8c\xaa\xe0\
+\xac\x90\x02\x4a\x6f\xa6\x88\x7f\xb1\x18\x6b\x91\x83\x17\xd6\xea\
+\xf6\x44\xca\xe5\x2b\x50\x64\xeb\xbe\xfe\x5f\x20\xf2\xdd\xca\x8f\
+\x5d\x87\x74\x67\xb6\xe5\x72\xba\x66\xa1\x7e\x80\x37\x5d\x5c\x18\
+\xc9\x1a\x3e\xbc\xe7\xc4\xf7\xea\xbd\x43\x94\xc8\x95\x19\xb7\x23\
+\xbc\x32\xd3\x6a\x72\xb5\x5e\xa8\x2a\xc1\x4c\x69\xfe\x25\x09\x98\
+\x52\xe4\x89\x91\xbd\xc7\x7f\xdf\xc8\x58\xc9\x5f\x9a\xea\x48\xb7\
+\x6d\xa7\x08\x2f\x4d\x79\xa1\xe2\x0b\x2e\x4d\x19\xcb\x8e\xa5\xb6\
+\xba\x6a\x68\xe9\xda\xdc\x96\xa7\x37\x3f\x2e\xf0\x1c\xd0\x37\x37\
+\xa2\xe0\xa4\x1d\x4c\x36\x95\x98\x8d\xb0\x45\x1f\xbf\xe8\x45\xe7\
+\xf9\xf9\xd7\xe6\x50\xf9\xfe\xe1\xbd\xc7\x5f\x58\xd6\x6b\x73\x71\
+\xdc\xf3\x93\x4d\x3d\x29\x2f\xbd\x5b\x90\xef\xb0\xc8\xc5\x49\x27\
+\xe5\x60\xd2\x4e\x58\x99\x51\xe7\xc5\x49\x7c\x8b\xf5\x03\x6c\x29\
+\xc0\x7a\xfe\x22\x59\x3b\x99\x50\xec\xf3\x5e\xaa\x34\x1c\xaf\xfb\
+\x6d\x06\x89\xad\xd5\xbb\x9f\xbb\xbb\x33\xac\xc0\xd4\x9d\xb4\xed\
+\xea\xac\x9e\x01\x73\xa0\x98\x49\xef\x7f\xeb\xa9\xb7\xa6\x93\x90\
+\xbb\x2d\x2f\x6b\x58\x84\x68\x1e\x15\xe1\x7e\x94\x4d\x2d\xcc\xa3\
+\x08\x27\xc3\x00\xa6\x3d\x58\x0e\x63\x25\x89\xb6\x9b\xed\x81\xc1\
+\xfe\x3e\x71\xcd\x7d\xa2\xf6\x16\x90\x8d\xc0\x46\x85\x3e\x09\xeb\
+\x12\xca\x3b\xc9\x94\xc2\xb4\x84\xb1\x88\x31\xd0\x31\x15\x73\x46\
+\x7d\x7b\xf4\xc8\xd0\xe8\x78\x3b\xe5\xfb\x3f\x5d\xb8\x2c\x98\xdf\
+\x18\x52\x49\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x03\xaf\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x03\x61\x49\x44\x41\x54\x58\x85\xc5\
+\x97\x3d\x4f\x1c\x57\x14\x86\x9f\x73\xef\xec\xec\x87\xd9\x85\x44\
+\x2c\x8a\x37\x44\x02\x29\x69\x6c\xa7\x4c\x5c\x39\x5a\x22\x45\x96\
+\x91\x1d\x25\x05\x45\xfe\x46\x5a\x0a\xb0\x14\x5a\x7e\x86\x5d\xd0\
+\x20\xd9\xc2\xa2\xb1\x51\x68\x82\x5c\xc6\x76\xe3\x02\x2b\x41\x0b\
+\x02\x14\x9b\x1d\x7b\x97\xf9\xb8\xf7\xa4\xe0\x43\x98\xc4\xd9\x35\
+\x59\xd6\xaf\x34\xcd\xd5\x68\x9e\x67\xe6\x6a\xae\xce\x2b\x74\x99\
+\x27\x53\x53\xe1\xe0\x9b\x9d\x6f\xd5\xc8\x4d\x94\xcb\x40\xed\xf0\
+\x02\x68\x00\x0d\x84\xa7\xe2\xf5\xfe\xde\x85\xea\xc3\x2b\x0b\x0b\
+\x49\x37\xcf\x95\x4e\x37\xfc\xf1\xfd\x77\x35\x71\xd9\x8c\x87\x9f\
+\x04\xca\x36\x0c\x31\xf9\x10\xb1\x16\x31\x16\x00\xf5\x0e\x75\x0e\
+\x1f\x27\xb8\x24\x41\x21\x32\x70\xd7\x65\xd9\xec\xd8\xf2\xea\xe6\
+\x99\x04\xd6\xeb\xf5\x82\x1d\x60\x1a\x95\x9f\xc5\xda\x52\x6e\xb0\
+\x82\x2d\x16\x31\x41\xf0\x9f\xc2\x3e\xcb\x70\xed\x36\xe9\x5e\x13\
+\x75\xae\x85\xe8\xbc\x7b\xcd\xdc\xf8\xca\xca\x7e\xd7\x02\xeb\x93\
+\xf5\x4f\xac\xc8\x22\x62\xae\xe6\x06\x2b\x84\x95\x32\x48\xc7\x8f\
+\xf5\x76\x54\x49\x9a\x11\xe9\x5e\x13\xd4\xaf\x39\xd5\x1f\xc6\x97\
+\x56\xb6\x3a\x0a\xfc\x39\xf9\xcd\x97\x2a\x76\x49\x82\x60\xb4\x30\
+\x52\xc5\xe4\x72\xef\x07\x3e\x15\x9f\xa6\xec\x6f\xef\xa0\x59\xb6\
+\x21\xea\x26\x3f\x5b\xfa\xf5\xf7\x77\x0a\xbc\xb8\x7e\xed\xa2\x09\
+\x82\xc7\x36\x9f\xff\x34\x3f\x52\x45\x8c\xf9\x5f\xf0\xa3\xa8\xf7\
+\xc4\xdb\x3b\xb8\x38\xde\x70\xaa\x5f\x9d\xfc\x12\xc7\x84\xf5\x7a\
+\xbd\x60\x82\x60\x51\x82\xa0\xa7\x70\x00\x31\x86\xfc\x48\x15\x09\
+\x82\x51\x2b\xb2\xb8\x5e\xaf\x17\xfe\x21\x60\x07\x98\x46\xcc\xd7\
+\x85\x1e\xc3\x4f\x4a\x14\x46\xaa\x20\xe6\xaa\x1d\x60\xfa\x78\x1d\
+\x0e\x7e\x35\x5c\xf6\x3c\x37\x34\x54\x0a\x07\x2b\x3d\x87\x9f\x4c\
+\xda\x6c\x92\xbc\x7c\xd5\xf2\x59\xf6\xf9\xd8\xf2\xea\xa6\x01\x10\
+\x97\xcd\x88\xb5\xa5\xb0\x52\x3e\x57\x38\x40\xae\x5c\x46\xac\x2d\
+\x99\x20\x98\x01\x90\xe7\x37\x6e\xe4\xf3\x66\x7f\x37\xfc\xf8\xa3\
+\x81\x5c\xf9\xfc\x05\x00\xd2\x28\x22\xfe\xeb\x65\x14\x95\x86\x87\
+\x4d\x41\xda\x13\xc0\x80\x2d\x16\xfb\x02\x07\xb0\xc5\x22\x02\xe5\
+\x4a\x6b\x77\xc2\xa8\x91\x9b\x36\x0c\x3b\x9e\x70\xbd\x8c\x09\x02\
+\x4c\x18\x82\x70\xcb\xa0\x5c\x36\xf9\xb0\x6f\xf0\xa3\xd8\x7c\x88\
+\xaa\x5e\x32\x40\x4d\xac\xed\xbb\x80\x58\x0b\x22\xb5\x03\x01\xf3\
+\x01\x04\x8c\x05\xa5\xd6\xfb\x13\xe7\x3d\x63\x80\x86\x7a\xd7\x77\
+\xb0\x7a\x07\x42\xe3\x40\xc0\x7d\x00\x01\xe7\x40\xb5\x61\x10\x9e\
+\xfa\xb8\xab\xe9\xa9\xa7\x71\x71\x82\x88\x3c\x33\xe2\xf5\xbe\x4b\
+\x12\x7c\x96\xf5\x0d\xee\xb3\x0c\x9f\x24\xa0\xdc\x33\x7b\x17\xaa\
+\x0f\x15\x22\xd7\x6e\xf7\x4d\xc0\xb5\xdb\x28\x44\xcd\xd2\xf0\x23\
+\x73\x65\x61\x21\x31\x70\xf7\x60\x74\xd2\xf3\xa7\xab\x92\xee\x35\
+\x11\xb8\x73\xc8\x06\x97\x65\xb3\xea\x5c\x2b\x69\x46\xe7\xce\x4f\
+\xa3\x08\x75\xae\xe5\xb3\xec\x36\x1c\x0e\x24\x63\xcb\xab\x9b\x88\
+\xce\xa7\x7b\x4d\x7c\x9a\x9e\x1b\xdc\xa7\x29\xc9\xab\x26\x88\xce\
+\x1f\x8d\xeb\xc7\x07\x91\x7b\xcd\x1c\xea\xd7\xf6\xb7\x77\x50\xef\
+\x7b\x0e\x57\xef\x89\x77\x76\x40\xfd\x5a\xec\x8a\xbf\x1c\xad\xbf\
+\x35\x94\x1e\x8e\xe3\x8f\x6d\x3e\x3f\xda\xf7\xa1\x14\x60\x7c\x69\
+\x65\x4b\xd4\x4d\xba\x38\xde\x68\x6f\x6e\xf5\x64\x3b\x7c\x9a\xb2\
+\xbf\xb5\x85\x8b\xe3\x0d\x51\x37\x79\xba\x1b\x74\x2c\x26\xe1\x50\
+\x85\x5c\xf9\x6c\xc5\x24\x8d\xa2\x83\x3d\xc7\xff\xe6\xbc\xfe\xd8\
+\x55\x31\x39\x96\xe8\x4d\x35\x7b\x03\xcc\xc7\xbe\x30\xf7\xc5\x83\
+\x07\xf1\xbf\xdd\xdf\xf1\xb5\x5e\x5c\xbf\x76\xd1\x06\xc1\xec\x51\
+\x39\x35\x61\x88\x7d\x47\x39\x75\x71\x82\x3f\x2c\xa7\x02\x77\x7c\
+\x96\xdd\x3e\x73\x39\x3d\x9d\x27\x53\x53\x61\xa5\xb5\x3b\x81\x70\
+\x4b\x55\x2f\x21\x52\x43\x0f\xeb\xb9\xd0\x40\xb5\x21\x22\xcf\x50\
+\xee\x35\x4b\xc3\x8f\xba\xad\xe7\x7f\x03\x1e\x5f\xb1\x31\x89\xfe\
+\x1c\x35\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x08\x77\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x08\x29\x49\x44\x41\x54\x78\x9c\xe5\
+\x9b\xcb\x6f\xd4\xd7\x15\xc7\x3f\xf7\xfe\xe6\xe5\x79\x78\x6c\x8f\
+\xb1\x13\x70\x9b\xaa\xa1\x19\xd5\x99\x29\x58\xae\x94\x45\x13\x56\
+\x64\xd3\x2e\x2a\x0a\x22\x85\x22\x01\x51\x13\x56\x69\x69\x17\xc9\
+\xdf\x90\x55\x1d\xb1\x72\x37\x84\x2a\x81\xc6\x09\x49\x23\x95\x45\
+\x95\xac\x48\x36\x91\xea\xa6\xc4\x83\x23\xf3\xa8\xd2\x0a\x08\x36\
+\xb6\x87\x79\x79\xde\xbf\xd3\xc5\xcc\x6f\xfc\xf3\x1b\xdb\xf3\xf0\
+\x90\xef\xee\x3e\xe6\xf7\x3b\xe7\xcc\xef\x9e\x7b\xce\xb9\xdf\xab\
+\x68\x30\x86\xc6\x86\x76\x15\x95\xf9\x82\x82\x67\xd1\x84\x11\x9e\
+\x01\x76\x81\x04\x40\x05\x2a\xb3\x24\x05\x2a\x05\x3c\x40\x71\x03\
+\x93\x29\x81\xeb\x4e\xd1\x9f\x7d\x79\xf4\xcb\x07\x8d\x94\x4f\x35\
+\xe2\xa1\x91\x0f\x86\x7e\xaa\x30\x8f\x01\x2f\x02\x91\x6d\xbc\x47\
+\x80\x18\xf0\x89\xa0\x2f\xc5\x8e\x7c\xf9\xcf\x7a\xc9\x68\xa1\x6e\
+\x06\xd8\xfb\xce\x73\x9d\x5e\x4f\xfe\x8c\x60\x9e\x06\xf5\xe3\xb5\
+\xe6\x39\xb4\x81\xd3\x70\x60\x28\x85\xa1\x34\x00\x65\x31\x29\x8b\
+\x50\x2c\x97\x28\x99\xe5\x75\xde\x22\x5f\x2b\xf4\xf9\x85\x9c\x7b\
+\xf4\xd6\x89\x2f\x92\xf5\x90\x7b\xdb\x06\x18\x1c\x1b\xec\x31\x0c\
+\xe7\x59\x84\xd7\x80\x2e\xfb\x98\xa1\x35\x01\x57\x07\x01\x97\x17\
+\x9f\xd3\x83\xc7\xe1\xc6\xa1\xf5\xba\xcf\x2b\x99\x26\xb9\x52\x9e\
+\x4c\x31\x47\xaa\xb0\x40\xaa\x90\xa5\x6c\x9a\xcb\xa7\x3d\x44\x71\
+\xae\x5c\x2e\x8e\x4c\x1e\x9d\x9c\xdf\x8e\xfc\x5b\x37\x80\xa0\x22\
+\x1f\xfe\xe4\x65\x25\xbc\x09\x2a\x64\x75\x6b\x14\xc1\x0e\x1f\x21\
+\x4f\x90\xa0\xc7\xb7\x6d\x0b\x0b\x90\xc8\x65\x98\xcb\x25\x48\x64\
+\x33\x98\xc8\xe2\x98\x62\x16\xe1\x8d\xd8\xe1\x6b\xe7\x51\xb6\x81\
+\x4d\x60\x4b\xf2\x45\x3e\x8a\x3c\xad\xcb\xc6\x05\x81\x9f\x59\x7d\
+\x86\xd6\xf4\x75\x74\xd1\xef\xef\xc6\xa1\x8d\xad\x3c\x76\x43\x94\
+\xcc\x32\xd3\xe9\x38\x33\xd9\x87\x4b\xbe\x0a\x51\x7c\x8e\x2e\x9f\
+\x8a\x1d\x8a\xdd\xde\xec\x33\x37\x6d\x80\xc8\xe5\x7d\x2f\x29\xe1\
+\xcf\x40\xa7\xf5\x80\x3e\x5f\x37\xbb\x03\xa1\xda\x9a\x6e\x34\xca\
+\x62\x72\x2f\x35\xc7\x4c\x26\x6e\xff\xdb\x93\xa2\x78\x35\x76\xf8\
+\xda\x7b\x9b\x79\xd6\xa3\x1b\x40\x50\x91\xcb\xfb\xff\xa4\x90\xdf\
+\x5b\x5d\x3e\x67\x07\x3f\x08\xf6\xd1\xe1\x74\x6f\xe6\x9d\x75\x43\
+\xb6\x98\xe7\x9b\xc4\x0c\x99\x62\xd6\x2e\xe6\x5b\xb1\xc3\xff\xfe\
+\xc3\xa3\x2e\x89\x47\x32\xc0\xf0\xe8\xb0\x33\xdf\x5b\xfa\x8b\x12\
+\x7e\x6d\xf5\x3d\xe9\xef\x61\x77\xa0\xb7\x31\xfb\xe8\x26\x20\xc0\
+\xdd\xd4\x2c\xf7\xd3\x76\x5f\xa8\x2e\xb9\xe6\x8c\x93\xe3\x67\xc6\
+\x8b\x1b\xfd\x7e\x43\xf9\x87\x47\x87\x9d\x85\x50\xf1\x6f\xa0\x7e\
+\x0e\xa0\x95\xe6\x87\x5d\x4f\xd2\xe5\xf1\x6d\x5d\xea\x06\x20\x91\
+\x4f\x73\x3b\x7e\x1f\x53\xaa\xbe\x41\xb8\xe2\x9a\x77\x1c\xda\xc8\
+\x08\xeb\x2f\x5a\x41\x15\x42\xe5\x0b\x96\xf2\x0e\xad\x09\xf7\x0c\
+\xec\x38\xe5\x01\x82\x6e\x3f\xe1\xd0\xc0\xe2\x36\xab\xf8\x45\x21\
+\x54\x7c\x1b\x59\xff\x4f\x5e\xd7\x5d\x47\xa2\xfb\x47\x14\xf2\x5b\
+\xa8\x2a\x1f\xfa\x3e\xde\x16\xad\xf7\x47\x81\xcb\x70\x10\xf4\xf8\
+\x89\xe7\x92\x98\x22\x80\x8a\xf6\x4f\xf6\x07\x67\xde\x9f\xfe\xc7\
+\x5a\xbf\x59\xd3\x3a\x55\x6f\xff\x57\xa8\x7c\xf6\xe1\x9e\x01\x7c\
+\x2e\x4f\x03\xc4\xae\x3f\x32\xc5\x1c\x53\x73\x77\x6a\xcb\x41\xe0\
+\xa5\xd8\x91\x6b\x63\xab\xcd\x5d\xd5\x00\x91\x8f\x22\x4f\xab\xb2\
+\xf1\x2f\xaa\x5b\xdd\xde\xee\x3d\x3b\xf2\xb3\x5f\x0f\x89\x7c\x9a\
+\x9b\xf3\xf7\xac\x66\x12\xcc\xa1\x89\x23\x13\xff\x59\x3e\x6f\xa5\
+\x0f\x10\x94\x2e\x1b\x17\xa8\x2a\xff\x84\xbf\xa7\xed\x94\x87\x8a\
+\x4f\x78\xc2\xdf\x63\x35\x3b\x45\xe9\x0b\xab\xf9\x83\x15\x06\x88\
+\x5c\xde\x77\xda\x8a\xf0\x7c\xce\x0e\xf6\x04\x7a\x1b\x2b\x69\x03\
+\xb1\x27\xd0\x8b\xcf\xd9\x01\x80\x12\x9e\x8f\x7e\xb0\xef\xd4\xf2\
+\x39\x4b\x2c\x32\x38\x36\xd8\x63\x68\xc7\x0d\x50\x21\x05\x0c\xf6\
+\x3e\xd5\xb2\x20\xa7\x5e\xc8\x16\xf3\x5c\x9f\xfd\x2f\x50\xc9\x1d\
+\x54\xce\x7c\x66\xe2\x37\x13\x71\x6b\x7c\xc9\x17\x60\x18\xce\xb3\
+\x56\x62\xd3\xe7\xeb\x6e\x7b\xe5\x01\x3a\x9c\x6e\xfa\x7d\xdd\x00\
+\x28\xa1\x17\xb7\x3e\x6b\x1f\xaf\x19\x60\xef\x3b\xcf\x75\x56\x53\
+\x5a\x0c\xad\xd9\x1d\x08\xf1\xb8\x60\x77\x20\x84\xb1\x18\x1f\xbc\
+\x16\xfe\x38\x1c\xb0\xc6\x6a\x06\xf0\x7a\xf2\x67\xa8\xe6\xf3\x7d\
+\x1d\x5d\x4d\x4b\x6c\x9a\x01\x43\x69\xfa\xbc\xd5\x52\x85\xd0\xed\
+\x2c\xb8\xcf\x58\x63\x35\x2d\x2b\x95\x9c\x4a\x3e\xdf\xef\xef\x6e\
+\xb6\x8c\x0d\x47\xbf\xaf\x1b\x5d\x75\x79\x4a\xa9\xd3\x56\xbf\x86\
+\x4a\x0d\xcf\x2a\x63\x05\x3b\x7c\x0d\xcb\xe7\x5b\x09\x87\x36\x08\
+\x7a\xfc\x56\x73\x30\x3a\x16\x1d\x86\xaa\x01\xaa\x05\x4c\x00\x42\
+\x9e\x60\xf3\xa5\x6b\x12\x7a\xbd\x81\xc5\x86\xd6\xc7\x61\x71\x09\
+\xbc\x08\x15\xe7\x17\x6c\xc3\xa0\xe7\x51\xd1\xe9\xf2\x2d\x3a\x43\
+\xd4\x41\x00\x35\x34\x36\xb4\xab\xa4\xcd\x69\x40\x75\x79\x7c\xec\
+\xed\xde\xd3\x3a\x09\x9b\x80\x5b\xf3\x77\x79\x98\xcf\x00\x88\xab\
+\xe0\xe8\xd3\x45\x65\xbe\x40\x35\x20\x0a\xb8\xbc\x2d\x15\xae\x19\
+\xf0\xbb\x6b\x3a\xaa\xbc\xb3\x74\x40\x2b\x78\xd6\xea\xf1\x39\xdb\
+\x23\xdb\xdb\x0e\xfc\x36\x1d\x95\x66\x50\xa3\x09\x5b\x1d\x1e\x87\
+\xab\x25\x42\x35\x13\x1e\x87\x2d\xba\x15\xc2\xba\x7a\x56\x87\x43\
+\x1b\x8f\xe5\xf6\xb7\x1c\x0e\xad\xed\x7a\x86\x35\xb0\x0b\xc0\x69\
+\x38\x5a\x26\x54\xb3\x61\xd3\xb5\x57\x57\x4e\x69\xc1\x50\xad\xae\
+\xef\x36\x0f\x96\xae\xa2\x08\x68\xeb\x88\xfa\x71\x8a\xfd\x37\x82\
+\xa5\xab\x12\x3a\xbf\x3b\x5a\xaf\x01\x5d\x21\x27\x54\x8e\x9b\xbe\
+\x2b\xb0\x74\x15\x45\x52\x57\x99\x19\x94\x65\x4b\x87\xab\x6d\x09\
+\x4b\x57\x25\xa4\x34\xf0\x00\xa0\x58\x2e\xb5\x52\xa6\xa6\xc2\xa6\
+\xeb\xac\x46\x71\x03\x2a\x47\xcf\xa5\x95\x44\x84\xc7\x0e\x25\xd3\
+\xb4\xb3\x50\xa6\x34\x26\x53\x56\x2b\x57\xca\xb7\x46\xaa\x26\x62\
+\x89\x8e\x8a\x29\x2d\x70\xdd\x6a\x67\x8a\xb9\x56\xc8\xd4\x54\xa4\
+\x6d\x3a\x8a\xc9\xa4\x76\x8a\xfe\x8c\xca\x29\x33\xa9\xc2\x42\xab\
+\xe4\x6a\x1a\xd2\xf9\x9a\x8e\xe2\x2e\x3a\xae\xea\x2a\x0f\x2f\x06\
+\x90\x2a\x64\xb7\x46\xb4\x69\x13\x88\x08\xa9\x1a\x99\x42\x4d\x8c\
+\x1f\x1f\x9f\xb5\x02\xa1\x4f\x00\xca\xa6\x49\x22\x97\x69\x8d\x74\
+\x4d\x40\xb2\x90\xb1\x71\x8b\xe4\x53\xa8\x96\xc4\x04\x7d\xc9\x9a\
+\x34\x97\x4b\xb4\x40\xb4\xe6\x60\x76\x21\xb5\xd8\x30\xcd\x8b\x50\
+\x35\x40\x85\x81\x29\x5f\x03\x24\xb2\x99\x0d\xc8\x8a\xed\x89\x92\
+\x59\x26\x91\x4b\x5b\xcd\xc9\x89\xa3\x13\xe3\x60\x3b\x17\x50\xe8\
+\xf3\x00\x26\xc2\x74\x3a\xbe\xf2\x09\x6d\x8e\xe9\x4c\xbc\xc6\x31\
+\x14\x91\xf3\x56\x7f\xcd\x00\x0b\x39\xf7\x28\xf0\x10\xa8\xf0\xf0\
+\x1e\xa3\xdc\xa0\x2c\x26\x33\x0b\x0f\x2b\x0d\x45\xbc\xe8\xca\x8f\
+\x5a\x63\x35\x03\xdc\x3a\xf1\x45\x12\xc5\x39\xa8\x38\xc3\x7b\xa9\
+\xb9\x66\xcb\xd9\x30\xdc\x4b\xcd\x2d\x3a\x3f\xe1\xdc\xd4\x2f\xa7\
+\x6a\xce\x60\x49\x3a\x5c\x2e\x17\x47\x44\x31\x0b\x30\x93\x89\x93\
+\x2d\xb6\x7f\x64\x98\x2d\xe6\x99\xce\x54\x96\xb4\x28\x66\xc9\x9b\
+\x23\xf6\xf1\x25\x06\x98\x3c\x3a\x39\x8f\xf0\x06\x54\x22\xa3\x6f\
+\x12\x33\x6d\x1d\x17\x58\x3a\x58\x50\x26\xaf\xdb\xb9\x01\xb0\x1a\
+\x47\x48\x50\x91\x0f\xf7\x5d\x55\xc2\xf3\x50\xa1\xc8\x0c\xb4\x29\
+\x4b\xe4\x8e\x8d\x40\x29\x8a\xcf\x63\xbf\xba\x76\x60\x39\x83\x74\
+\x65\x45\x48\x21\xe8\xf2\x29\x20\x09\x70\x3f\x3d\x4f\x22\x9f\x5e\
+\x31\x6d\xa7\x23\x91\x4f\xdb\xd9\xa3\x49\x25\xe6\xc9\xd5\xe8\xb3\
+\xab\x96\xc4\x62\x87\x62\xb7\x45\xf1\xaa\xd5\xbe\x1d\xbf\x4f\xa6\
+\xd0\x3e\x89\x52\xa6\x98\xe3\x76\xfc\x7e\xad\x2d\xf0\xca\x6a\x0c\
+\x31\x58\x87\x29\x1a\x3b\x7c\xed\x3d\x41\xbd\x05\x60\x8a\xc9\xcd\
+\xf8\x1d\xb2\xa5\x42\xdd\x85\xad\x37\xb2\xa5\x02\x37\xe7\xef\xd8\
+\x28\xb3\x32\xb2\x16\x47\x10\x36\xe2\x0a\x0b\x2a\x7a\x79\xff\xbb\
+\x20\xc7\xa0\x72\xa8\xf0\xa3\x9e\x81\x1d\x7b\x84\x96\x29\x66\xb9\
+\x39\x7f\xd7\x56\xd8\x91\x8b\x13\x87\xbf\x3a\xb1\x1e\x73\x7c\xfd\
+\xaa\xb0\x42\x5c\x73\xc6\x49\x84\x2b\x50\xa9\xa6\x4c\xcd\xdd\xd9\
+\x91\x3e\x21\x91\x4f\x33\x35\x67\x53\x5e\xb8\xe2\x9a\x73\x9e\xda\
+\x88\x36\xbf\xe1\x59\xd8\xb7\x7f\xff\xd6\xfc\xde\xc1\x81\xf7\xcb\
+\x5e\xd9\x0b\x44\x05\x61\x3e\x9b\xc2\x44\x08\xb8\xbd\x3b\x83\x2e\
+\x9f\x7c\xc0\xff\x92\x0f\x90\x9a\xae\x72\xd1\x35\xef\x3c\x56\x17\
+\xba\xbc\xed\x4d\x6d\x71\x61\x02\x91\x91\x89\x23\x5f\xfd\xb1\xae\
+\x17\x26\xec\xd8\xd1\x57\x66\xe0\x95\xf5\x1c\xde\x6a\xa8\xef\xa5\
+\x29\x6f\x17\xfd\xbe\x06\x5f\x9a\xca\xc4\x99\x59\x58\x79\x69\x4a\
+\x89\x79\x72\xad\xad\x6e\x3d\x6c\xef\xda\xdc\xe5\x7d\xa7\x51\xbc\
+\xa9\x84\x5a\xa8\xa8\x51\x04\x3d\x7e\x7a\xbd\x01\x3a\x5d\x3e\xd4\
+\x36\x0f\x5d\x45\x84\x64\x21\xc3\xec\x42\x8a\x44\x2e\xbd\xe2\xda\
+\x9c\x32\x79\x7d\xe2\xc8\xb5\xb7\x9b\x7a\x6d\xce\x8e\xe8\xbb\xd1\
+\xee\x2a\xfd\xf4\x77\xac\x76\x71\xd2\xd9\x81\xdf\xed\xc5\xbf\xc9\
+\x8b\x93\xe9\x62\x8e\x74\xbe\x7a\x71\x72\x79\x6a\xae\x88\x23\x9c\
+\x23\x6f\x8e\x2c\x8f\xed\x37\x8b\xba\x39\xf1\xf0\xc7\xe1\x80\xb3\
+\xe0\x3e\xa3\x14\x2f\x37\xee\xea\x2c\x93\x22\x72\xbe\xe8\xca\x8f\
+\xda\x53\xda\xed\xa0\x21\xbb\x58\x74\x2c\x3a\x5c\xe1\xe1\xa9\x83\
+\x20\xd1\x6d\xbc\x47\x40\x4d\x80\x7c\x8a\x69\x5e\xb4\xca\x58\xf5\
+\x44\xc3\xb7\xf1\xe1\x8b\xc3\xbd\x79\x67\xe9\x80\xd2\x0c\x22\x84\
+\x81\x30\xd0\x2b\x8a\x80\x92\xca\x4e\x22\x8a\xa4\x12\x52\xc0\x2c\
+\x30\x85\x62\x4a\x4c\x26\xdd\x45\xc7\xd5\xf1\xe3\xe3\xb3\x8d\x94\
+\xef\xff\xbc\x26\x65\x25\x50\xc5\xc0\x3a\x00\x00\x00\x00\x49\x45\
+\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x09\xe0\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x09\x92\x49\x44\x41\x54\x78\x9c\xd5\
+\x9b\xdb\x6f\x5c\xd5\x15\xc6\x7f\xeb\xcc\x8c\x67\x86\x78\xc6\x0e\
+\xc4\x97\x40\xed\x04\xaa\x92\x36\x84\x2a\xc8\xa8\x12\x09\x21\x17\
+\x51\x51\xc7\x08\xa9\xed\x43\x00\x55\x4a\x88\x04\xa8\x12\x69\xa1\
+\x0f\xad\xfa\x27\xf0\xd0\x62\x14\x5e\x52\xa9\x0a\xa9\xd4\x40\x5a\
+\x09\x55\xc8\x26\x42\x40\x62\x12\x08\x52\x95\xa0\x08\x42\x68\x40\
+\x84\x5c\x28\x89\xc7\x6e\x62\xcf\x38\xcc\xe5\xcc\x9c\xd5\x87\x73\
+\xf1\x8c\x67\x3c\x17\xcf\x19\x63\x3e\x69\x1e\xf6\x39\xfb\xac\xbd\
+\xd6\x37\xfb\xb6\xd6\x5e\x5b\x68\x31\xae\x0c\x6e\xea\xca\x1b\xc1\
+\x4d\x0a\x77\x29\xac\x11\xd5\x3b\x11\xe9\x02\x62\xce\x0f\x20\x05\
+\xa4\x50\x9d\x50\x91\xcf\x04\xce\x09\x7c\x12\xb4\xf2\xc7\x57\x1e\
+\x3e\x3e\xd1\x4a\xfd\xa4\x15\x42\x2f\x6d\xdf\x72\x2f\xc8\x63\x88\
+\xfc\x14\x74\x5d\x13\xed\x28\xc8\x19\x54\xdf\x02\x7d\xa5\xff\x8d\
+\xb1\x93\x7e\xea\x09\x3e\x12\xf0\xf9\xe0\x60\x3c\x22\x99\xa7\x55\
+\xe4\x09\xd0\x1f\xcd\xdb\xa0\x61\x20\x81\x00\x62\x18\x20\x4e\xf3\
+\xaa\xa8\x65\xa1\x85\x02\x6a\x59\xd5\xd4\xfd\x54\x54\xf7\x67\x34\
+\xb2\xef\x07\x87\x0f\x27\xfd\xd0\xbb\x69\x02\x2e\x3f\xf4\xd0\xcd\
+\x1a\xcc\x3d\x0b\xec\x01\x3a\x4b\x84\x1b\x42\x20\x12\xc1\x88\x44\
+\x30\x42\x6d\x18\x6d\x21\xdb\xf0\x2a\x50\xcb\xc2\xca\x99\x58\x66\
+\x0e\x2b\x93\xa1\x90\xc9\xa0\x96\xce\xad\x36\x05\xec\x95\x7c\xdb\
+\x70\xdf\x9b\x6f\x5e\x6b\x46\xff\x05\x13\xa0\x20\x5f\x0d\x6d\xd9\
+\xad\xc8\xf3\xc0\x2d\x9e\x40\x11\x02\xd1\x28\x81\x65\xcb\x08\x46\
+\xa3\xcd\x53\xac\x90\x4f\xa7\x29\xdc\xb8\x41\x21\x9d\x46\xb5\x84\
+\x8c\x49\xe0\x0f\x7d\xa3\x47\xf7\x0b\x94\xb1\x54\x0f\x16\xa4\xde\
+\xa5\xc1\x6d\xdf\xc7\xd0\x03\xc0\x46\x4f\x90\x21\x04\xdb\x63\x84\
+\xe2\x31\x24\x10\x58\x88\xd8\x9a\xd0\x42\x01\x33\x99\x22\x3f\x93\
+\x9a\xdb\x2b\xde\xc3\x92\x5d\xfd\x87\x8f\x7c\xd1\xa8\xcc\x86\x09\
+\xb8\xf4\xf0\x96\x1d\xa8\xfc\x05\x88\xbb\x12\x42\xed\x31\x42\x9d\
+\x1d\x35\xbb\xb7\x5f\x50\xcb\xc2\x9c\x9a\xc6\x9c\x49\x15\xff\xef\
+\x49\x44\x9f\xea\x1f\x19\x3b\xd4\x88\xac\xba\x09\x50\x90\xaf\xb6\
+\x6f\x7b\x41\x45\x7f\xeb\x3e\x33\xc2\x61\xc2\x37\x2f\xc7\x68\x6b\
+\x6b\xa4\x4d\xdf\x60\xe5\x72\x64\xaf\x5d\xc7\xca\x66\xbd\x67\xa2\
+\xf2\xe2\xf7\xde\x38\xf2\x5c\xbd\x43\xa2\x2e\x02\x4e\x0e\x0c\x84\
+\xba\x7b\x3b\xfe\x06\xfa\xa8\xfb\xac\xad\x23\x4e\xa8\xa3\xb3\x45\
+\x0b\x69\x03\x50\x30\xa7\xa6\xc8\x25\x4b\x16\x85\x57\x12\x57\x93\
+\x3b\xef\x3d\x75\xca\xac\xf5\x79\x4d\xf5\x4f\x0e\x0c\x84\xba\x7a\
+\xe3\xff\x12\xd8\x0e\x80\x21\x84\x6f\x59\x41\xf0\xa6\xe8\x82\x75\
+\x6e\x05\xf2\xe9\x34\xd9\xc9\x49\x70\xe6\x06\x81\xd1\xf1\xab\xc9\
+\x9f\xd7\x22\xa1\xea\xa0\x55\x90\xee\xde\xf8\x01\xd7\x78\x31\x0c\
+\xa2\x3d\x3d\x4b\xce\x78\x80\x60\x34\x4a\xb4\xbb\xc7\x9b\x87\x14\
+\x86\xba\x57\xc6\x5f\xd6\x1a\x7f\x72\x55\x02\xbe\xda\xbe\xed\x05\
+\xe0\x31\xb0\x8d\x8f\xf4\xf6\x7c\x6b\xe3\xbd\x1e\x18\xe1\x36\x22\
+\xbd\xb3\x24\xa0\x3c\x7e\x79\x68\xcb\x9f\xab\x7d\x33\x2f\x3b\xce\
+\x6c\xff\xaa\x2d\x59\x88\xf6\x2c\x6d\xe3\x8b\x61\x65\x73\xa4\x13\
+\xe3\xde\x70\x50\x65\xc7\xaa\x37\x8e\xfe\xa3\x52\xdd\x8a\x04\x38\
+\xeb\xfc\x87\x38\x4b\x5d\xb8\xab\x6b\x49\x76\xfb\x6a\xc8\xa7\xd3\
+\x64\x13\x9e\x1f\x95\x54\x8c\x7b\x56\x8d\xbe\x73\x7e\x6e\xbd\xb2\
+\x21\xa0\x20\xce\x26\x27\x0e\xd0\x16\x8f\x7f\xe7\x8c\x07\x7b\x4e\
+\x68\x8b\xc7\xdd\x62\x5c\xb0\x0e\x54\x9a\x0f\xca\x08\xb8\x3c\xb4\
+\xf5\x09\x9c\x1d\x9e\x11\x0e\x13\xea\xec\x9c\x5b\xe5\x3b\x83\x50\
+\x67\x27\x46\x38\xec\x16\xef\xbf\xfc\xf0\xb6\x5d\x73\xeb\x94\x30\
+\xe2\x38\x36\x9f\x01\xb7\x20\x10\xed\xed\xad\x39\xee\xf3\x96\xc5\
+\xeb\x1f\x7d\xc2\xbf\x2f\x5e\xa6\xbd\x2d\xcc\x2f\xd6\xaf\x63\xed\
+\xca\x1e\x9f\x4c\x28\xc5\x99\xaf\xaf\xf2\xea\xc9\xd3\xcc\xe4\xb2\
+\xdc\x77\xfb\x6a\x7e\x79\xcf\xdd\x04\x6b\xec\x3e\x2d\xd3\x24\xfd\
+\xf5\x15\xb7\x38\xa9\x98\x77\xae\x1a\x7d\xef\xba\xfb\xa0\x64\xd3\
+\xfe\xdc\x0f\xfb\xff\x08\xfc\x0c\x20\x14\x8b\x11\x6c\x6f\xaf\xa9\
+\xd4\x3f\x3f\xfc\x88\xd7\x4e\x7f\xcc\x74\x3a\xc3\xc4\xcc\x0c\xc7\
+\xbf\xf8\x92\x95\x1d\x31\xfa\x96\xfb\xdb\x73\x4e\x9c\xbf\xc0\x9f\
+\xde\x39\xc6\xb5\x6f\xbe\xe1\x46\x36\xc7\x7f\xc6\x13\xa8\xc2\xba\
+\x5b\x7b\xab\x7e\x27\x81\x00\xa8\x85\x95\xcd\x01\xdc\x04\x81\xec\
+\xf0\xe7\x17\xc6\xdc\xf7\x1e\x7d\x9f\x0f\x0e\xc6\xb1\x5d\x5a\xc4\
+\x10\x42\x9d\x1d\x75\x29\xf6\xc1\x97\x17\x4a\xca\xaa\xca\x4b\xef\
+\x9e\xe0\xc4\xf9\x0b\x15\xeb\x2f\x04\x27\xce\x5f\xe0\xa5\x77\x4f\
+\xcc\xf5\x04\xcb\xda\x9e\x0f\xa1\x8e\x0e\xc4\xb0\x3b\xbb\xc0\x9e\
+\x89\x47\x36\xba\x91\xa8\x59\x02\x22\x92\x79\x1a\xc7\x9f\x0f\xb6\
+\xc7\xea\x76\x6c\xda\xdb\xc2\x65\xcf\xfc\x24\x61\x3e\xe3\x01\x62\
+\xe1\xf2\xb6\x2b\x41\x0c\x83\x50\xcc\xb3\x79\x79\xba\x10\x7e\xda\
+\x2d\x78\x56\xda\x91\x1c\xdb\x9f\x0f\xc5\x63\xd4\x8b\x47\xef\x5d\
+\x8f\x48\xf9\x6a\xea\x07\x09\xd5\x8c\x17\x11\x76\x0c\xac\xaf\x5b\
+\x56\x30\x16\x2b\xd2\x53\x9f\x70\x9f\x1b\xe0\xc6\xf0\xec\x30\x56\
+\x20\x1a\x6d\xc8\x9f\x5f\x77\x6b\x2f\xcf\x6c\xde\xe0\x3b\x09\xb5\
+\x8c\x7f\x66\xf3\x86\x9a\xe3\xbf\xe4\x9b\x40\x80\x40\xd4\x5b\xce\
+\xd7\x5e\x1c\xda\x3a\x00\x5e\x0f\x90\xc7\xdc\x37\x81\x65\xcb\x1a\
+\x56\x76\xc3\x1d\xab\x7d\x25\xa1\x1e\xe3\x37\xdc\xb1\xba\x61\x3d\
+\x03\xed\xb3\xb6\x89\xf2\x38\xb8\x04\x88\xfc\x14\x9c\xa8\x4e\x74\
+\x61\x9b\x1e\xbf\x48\x68\x95\xf1\x00\x81\x48\xc4\x9b\x0c\x81\x07\
+\x01\xe4\xca\xe0\xa6\x2e\xd3\x08\x8e\x03\x12\xbc\x29\x4a\xb8\xab\
+\x6b\x41\xc2\x5d\x34\x63\x40\x2b\x8d\x77\x91\x4d\x4c\x90\x4f\xa7\
+\x01\x34\x20\xda\x6d\xe4\x8d\xe0\x26\x9c\x0d\x91\x11\x89\x34\x25\
+\x1c\x16\xde\x13\x16\xc3\x78\x00\x23\xe2\xad\x1c\x62\xa9\x3c\x60\
+\x28\xdc\xe5\xbd\x0c\xf9\xe3\xed\x35\x4a\xc2\x62\x19\x0f\x14\x6f\
+\x8d\x51\x95\xb5\x41\x85\x35\xae\x9a\x46\x5b\xc8\x97\x46\x00\x4f\
+\xe1\x4a\x86\xb9\x24\xb8\x58\x2c\xe3\x01\x8c\xd0\xac\x8d\x2a\xac\
+\x09\x3a\x67\x75\xf6\x89\x8d\xcf\x51\xdd\x5a\x24\xec\x7d\xf7\x7d\
+\xa7\x50\xfe\x6d\x2b\x8c\x07\x3c\x3b\xd5\xb2\x10\xb5\xd6\x18\xce\
+\x41\x65\xcb\x62\xf9\xd5\x86\x03\xca\xa2\x1a\xef\xc9\x77\x6d\x15\
+\x59\x61\xe0\x9c\xd0\xb6\x32\xa6\x5f\x95\x84\xb9\xca\xb5\xd8\x78\
+\x28\xb1\x35\xe6\x11\x40\x1d\xca\x35\x03\x97\x84\xaa\x21\x4a\xa1\
+\xe5\xc6\xdb\xed\x78\x4a\xc4\x17\xe7\x28\x67\x09\xc3\xc0\x4e\x4e\
+\x80\x0a\xb3\xb0\x9f\x70\x97\xba\xaa\xe7\x35\x8a\xef\xae\x74\xe5\
+\x76\x3c\x25\x92\x1e\x01\xd5\xcf\xe5\x9b\x43\xb5\x75\xbe\x5c\x37\
+\xff\xe3\x09\x65\x6d\xcc\xda\x9a\x32\x50\x9d\x00\xfb\xe4\xb5\x15\
+\xa8\x6a\xbc\x50\x71\x4e\x68\x35\x09\x9e\xad\xaa\x93\x86\x8a\x7c\
+\x06\x36\x2b\x7e\xf7\x82\x5a\x3b\xbc\x3d\x9b\x37\xb2\x67\xf3\xc6\
+\x96\xc5\x13\x2a\xa1\xd8\x4e\x15\xe3\x5c\x50\xe0\x9c\xfb\xd2\xca\
+\x99\x04\x22\xf5\x45\x59\x6a\xa1\xd1\xed\x6d\xad\x1d\xa3\x5f\x2b\
+\x83\x65\xce\x1e\x15\x8a\x72\xce\x10\xf8\x64\xf6\x65\xce\x97\x46\
+\x1a\x35\xde\xef\x78\x42\x35\x94\x1c\xa5\x8b\x9e\x35\x82\x56\xfe\
+\x38\xce\xdc\x6c\x65\x32\x4d\x37\xb0\x50\xc7\x66\xb1\x48\xb0\x32\
+\x1e\x01\x6a\x88\x1e\x33\xec\x3c\x3c\x39\x03\x50\xc8\x64\x16\x98\
+\x69\x63\xa3\x59\xaf\xae\xd5\x24\xa8\x2a\x85\xac\xf3\x27\x2b\x1f\
+\xdf\x36\x32\x36\xe9\x9c\x25\xeb\x5b\x00\x6a\xa9\x1b\x2c\x68\x18\
+\x7e\xb9\xb4\xad\x24\x61\x4e\xc6\xd9\xdb\xe0\xc5\x04\xf5\x15\xaf\
+\xd2\x8d\x1b\x0d\x0b\xf6\xdb\x9f\x6f\x15\x09\x85\x99\x59\xdb\x54\
+\x38\x08\x0e\x01\x76\x06\xa6\x7c\x0a\xd8\xa9\x68\x0d\xec\x09\xce\
+\x5e\x19\x6f\x89\x3f\x5f\x0f\x09\x67\xbe\xbe\x5a\xb7\x3c\x2d\x14\
+\x28\xcc\xf6\xee\xb3\xab\x46\x8f\x9e\x82\xa2\x73\x01\x51\xdd\xef\
+\x0a\x37\x93\xa9\xba\x05\xbf\x76\xfa\x4c\xcb\x82\x19\xb5\x48\x38\
+\x74\xea\x74\xdd\xb2\xf2\xa9\x54\x91\x9e\xb2\xdf\x7d\xee\x11\x90\
+\xd1\xc8\x3e\xec\x0c\x4c\x27\x0f\xaf\xbe\x4d\xd1\x4c\x2e\x5b\xf6\
+\xcc\x4f\x97\xb6\x1a\x09\xa9\x6c\x79\xdb\x95\xa0\x96\x85\x99\xf2\
+\xfe\xd4\xeb\xd1\x40\x76\x9f\x5b\xf0\x08\x70\x72\x6f\xf7\xda\x1f\
+\x28\xe6\xd4\x74\x5d\xc2\x7f\xb2\xaa\xaf\xa4\xdc\x0a\x7f\x7e\x3e\
+\x12\xee\xbb\xbd\xbe\x36\xcc\xe9\x69\x6f\xf2\x53\xd8\xdb\xf5\xfa\
+\xfb\x1e\x1b\xc1\xe2\x8a\x92\x6f\x1b\xd6\x60\xee\xd7\xc0\x0a\x73\
+\x26\x45\xb0\x7d\x59\xcd\xe3\xf1\x47\x7e\x7c\x17\x66\xc1\xe2\x83\
+\x2f\x2f\x10\x0b\x87\xd9\x31\xb0\xbe\xa1\x13\x9b\x7a\xb1\xe1\x8e\
+\xd5\xc4\x23\x11\x0e\x9d\x3a\x4d\x2a\x3b\x7b\x3c\x5e\x0b\x96\x69\
+\x16\x0f\xe9\x49\x30\x87\x8b\xdf\x97\xf5\xab\x4b\x43\x5b\x77\x03\
+\x7f\x05\x3b\x82\x1a\xed\xe9\xf9\xf6\x73\x01\x17\x0a\x85\xf4\xf8\
+\xf8\xec\xee\x4f\x64\x77\xff\xc8\x91\xfd\xc5\x55\xca\x4c\x53\x90\
+\xcb\x43\x5b\x8f\x01\xf7\x83\x9d\x22\x13\xf2\xf9\xac\x7f\xb1\x60\
+\x5e\x2f\x49\xa0\x7c\xaf\x6f\xf4\xe8\x03\x73\x33\x48\xcb\x22\x42\
+\x02\x8a\x25\xbb\x80\x24\x40\x2e\x99\x5c\xf0\xe6\xe8\xdb\x44\x3e\
+\x9d\x2e\x36\x3e\xa9\x18\x3b\x2b\xa5\xcf\x56\x0c\x89\xf5\x1f\x3e\
+\xf2\x05\xa2\x4f\xb9\xe5\xec\xe4\x24\x56\xce\x1f\x47\x69\x31\x60\
+\x65\x73\x76\xd6\xa8\x03\x55\x9e\xac\x94\x21\x06\x55\x12\x25\xfb\
+\x47\xc6\x0e\x89\xca\x8b\xb6\x44\x25\x33\x9e\x28\x71\x25\x97\x2a\
+\x2c\xd3\x24\x93\x48\x78\x39\x82\xa0\xc3\xf3\xe5\x08\x42\x8d\xe9\
+\xcd\x99\x0f\xfe\x4e\x71\xb6\x68\x77\x37\x46\x78\x69\x26\x4c\x5a\
+\xd9\x2c\x99\xc4\xc4\xec\x1e\x46\x38\xd8\x37\x72\xf4\x57\xd5\x32\
+\xc7\xab\x46\x85\x05\x34\x71\x35\xb9\x53\x60\x14\xec\x0d\x45\x3a\
+\x31\xbe\x24\xe7\x84\x7c\x3a\x4d\x3a\x91\xf0\x8c\x17\x18\x4d\x5c\
+\x49\xee\xaa\x95\x36\xdf\x40\xba\x7c\xfc\x00\x4e\x4f\x00\x67\x75\
+\xe8\x5c\x1a\xe9\xf2\xb9\xa9\x29\xcc\xe2\x74\x79\xe1\x60\xe2\x4a\
+\x72\x97\x2f\xe9\xf2\x45\xed\x2c\xbd\x0b\x13\xa6\x49\xf6\x7f\xd7\
+\x4a\xa2\x3c\xa0\xc3\x7d\xa3\x63\xbf\xf3\xf5\xc2\x44\x31\x2a\x5e\
+\x99\x89\xc5\x9c\x54\xb4\x45\xbc\x32\x33\x3d\x6d\xef\xef\x8b\xae\
+\xcc\xa8\xf2\x64\xb5\x09\xaf\x12\x7c\xbd\x34\x15\x8a\xc5\xec\x6c\
+\xac\x16\x5e\x9a\xca\xa7\x52\x98\xa9\xf2\x4b\x53\x8a\xb1\x73\xbe\
+\xa5\xae\x1a\x9a\xba\x36\xe7\xe4\x15\x3f\x0f\xac\xf0\x04\xba\xd7\
+\xe6\xda\x97\xd9\x39\x39\x4d\x9e\x39\xaa\x2a\x85\x4c\x86\xc2\xcc\
+\x3c\xd7\xe6\x44\x7e\xdf\x37\x72\xe4\xe5\x45\xbd\x36\x57\x8c\x8b\
+\x43\xf7\x2f\x87\xd0\xb3\x02\xbf\xa1\xd2\xc5\xc9\x70\x04\x23\x12\
+\xc6\x08\x87\x31\x42\x75\x5e\x9c\x34\x4d\xac\x6c\x16\x2b\x93\x25\
+\x9f\xc9\x82\x96\xb9\xe6\xd7\x15\xf6\x82\x39\x5c\x9c\xf7\xbb\x10\
+\xf8\x36\x87\x4f\x3c\xb2\x31\xe6\x64\x60\xee\x6e\xdd\xd5\x59\xce\
+\x82\xec\x8f\x06\xb2\xfb\x8a\x5d\xda\x66\xd0\x92\x45\xec\xe2\xd0\
+\xd6\x01\x27\x0f\xef\x41\x84\xbb\x9b\x68\x47\x51\x3e\x06\xde\x56\
+\xe1\xa0\x1b\xc6\xf2\x13\x2d\x5f\xc5\xff\xfb\xf0\x96\x15\x96\xca\
+\x03\xaa\xb2\x56\x85\x35\xa2\xd6\x1a\x44\x56\x60\xe7\x25\xb8\x37\
+\x1a\x92\xd8\xd7\xe7\x27\x55\x8c\x73\xa2\x9c\x13\xd1\xb3\x86\xe8\
+\xb1\xdb\x46\xc6\x26\xe7\x97\xde\x3c\xfe\x0f\x87\x87\x1b\xc4\x1a\
+\xce\x92\xc2\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x00\x75\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x00\x27\x49\x44\x41\x54\x78\x9c\xed\
+\xc1\x01\x0d\x00\x00\x00\xc2\xa0\xf7\x4f\x6d\x0e\x37\xa0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x77\x03\
+\x40\x40\x00\x01\x8f\xf2\xc9\x51\x00\x00\x00\x00\x49\x45\x4e\x44\
+\xae\x42\x60\x82\
+\x00\x00\x00\x68\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x00\x1a\x49\x44\x41\x54\x58\x85\xed\
+\xc1\x01\x01\x00\x00\x00\x82\x20\xff\xaf\x6e\x48\x40\x01\x00\x00\
+\x00\xef\x06\x10\x20\x00\x01\x47\x01\xa0\x88\x00\x00\x00\x00\x49\
+\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x04\xe8\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x04\x9a\x49\x44\x41\x54\x58\x85\xc5\
+\x97\xd9\x76\xe2\x46\x10\x86\xbf\x66\x11\x12\x60\x50\x9c\xc4\x9e\
+\xf1\x24\x39\x59\xde\xff\x9d\x72\x31\x9e\x49\x1c\xcf\x18\x6c\x23\
+\x19\x24\xa8\x5c\xd4\xdf\xa8\x91\x71\x72\x97\xd4\x39\x1c\x89\x56\
+\xd7\xf6\xd7\xd6\x0d\x58\x09\x16\xf8\xcf\xc9\x02\x58\x19\xa4\x7c\
+\x09\xac\x21\x58\xf7\x91\x4b\x20\x1a\x96\x25\xef\x93\x44\x4a\x5c\
+\xb3\x64\x6d\x9b\xac\xed\xf4\x7e\x00\x1e\x7a\xf2\x97\xc0\x3a\xf4\
+\x16\x0e\xc0\x05\x30\x00\xaa\x44\x59\x90\x11\x13\xd8\x0d\x21\x8c\
+\x81\x71\xcf\xa5\x16\xac\x81\xac\x95\x11\x51\xb9\x01\x0d\x90\x4b\
+\xfe\x23\x30\x3c\x75\xd8\xf7\x2d\xc0\x7e\x11\x34\x63\xb0\x99\xd6\
+\x33\xb0\xf7\xf0\x50\x82\xe5\x60\x13\xb0\x82\x57\x64\x85\xbe\x4d\
+\xb5\xf7\xca\x79\xc1\xd7\x2c\x93\xec\x5f\xc1\x2e\xfa\x10\x02\xf6\
+\x01\xf8\x24\x24\x0c\x78\x01\x0a\xd8\xbd\x87\xec\xa3\xbc\x00\x58\
+\xc8\x8b\x73\x94\x7e\x9b\xc0\xee\x06\xb2\x5b\x21\x92\x4b\xdf\x1a\
+\xb8\x81\x70\x0b\x30\x92\xf2\x80\xc3\x3e\x96\xf2\x1b\xe0\xde\x19\
+\xb2\xfb\x44\xf9\x04\x0f\x91\x71\x1a\xf7\xe8\xcc\x4c\xca\xf4\xcb\
+\xbe\xc2\xa6\x80\xd9\x18\x78\x07\x7c\x94\x8e\x41\x0f\x01\xfb\x4e\
+\xff\x2b\x08\x15\xd8\xb5\xbe\xfd\x09\xcc\x1d\x8d\xd5\x0c\x4a\x5c\
+\x70\xa8\xcf\x03\x60\x73\xa0\xc5\xf3\xa5\xd2\xf3\x80\x27\xf4\x0e\
+\x78\xc2\xe3\xff\x0d\xb0\x82\xb0\x19\x25\xdc\x63\x29\xcf\xe5\xdd\
+\x1a\xb8\x92\xc5\x39\x94\x4f\x82\x71\x02\x66\x1d\x0f\x24\x08\xe5\
+\xc0\xb3\x94\x95\x42\x38\x03\xee\xf0\xf0\x64\x10\x9e\x12\x07\x3b\
+\x28\xdc\x52\x9b\xc0\xcb\xb5\x18\x83\xa0\x5c\x48\x68\xa4\x39\x1e\
+\x86\xb9\xf8\x07\xfa\x1f\xd7\x22\x6d\xc4\xbb\x93\xac\x00\xdb\xf7\
+\x4a\xcc\x63\xee\xc5\x10\xbc\x73\x41\x15\x30\xfd\x8c\xc7\xb2\x96\
+\xf5\x23\xc1\x56\x43\x75\x09\xd3\xb5\x23\x75\x8e\x6c\x21\x99\x35\
+\x30\x95\x03\x53\xba\xd2\x1b\x49\xf6\x1c\x0f\xc1\x97\x14\x81\x09\
+\xb4\x2f\x49\x6d\x16\x8a\xb5\xe1\x96\x5d\xc3\x74\xe5\x48\xbd\x49\
+\xb1\xce\xbf\x17\x8f\x09\x89\x58\xb6\x2d\x3c\x36\x78\xe8\xfa\x21\
+\x68\x4a\x58\x3c\x74\xc6\x30\x54\x3e\xe4\x78\xd2\xfc\x25\xc1\x85\
+\xfa\x41\xee\x49\x67\xb3\xee\x3f\x05\x9e\x37\x5f\x61\x73\x29\xde\
+\x3c\x91\x09\x2c\x9e\x49\x42\x15\x0d\xc8\xbc\x8b\x91\x0b\xc6\x52\
+\x1e\xb4\x62\x5c\xe1\x89\xf6\x20\x48\x73\x3d\x83\xa0\x9d\xba\x0c\
+\xa6\xae\x9c\x06\x66\x0f\xda\xd7\xe2\x3d\xe5\x12\xef\x31\x43\x68\
+\x4c\xfb\x63\x1f\x20\x40\x50\xd7\x0a\x8f\xde\xb9\x82\x32\xdb\x0c\
+\x82\xfa\xbb\x35\x12\x36\x06\xee\x7b\xbd\xfd\xca\x8d\x8e\x7c\xb4\
+\x60\x7b\x7f\x86\x1d\xd8\x33\x5e\x86\x03\xba\x24\x3f\xa9\x82\x61\
+\x52\xdf\x49\x93\xa9\xd3\x3d\xda\xc7\xbd\x7b\x63\xe9\x30\xbb\x4b\
+\x1c\x8a\x94\x4e\x59\xc9\x0c\x55\xe7\x6c\xc7\x30\x82\xf1\x21\xf1\
+\x86\xe4\xbd\x4d\x84\x8c\x80\xc6\x3d\xb7\x35\xea\x4c\x78\x46\x5b\
+\xd2\x1f\x52\x4a\x1d\x78\x35\x3d\x07\xc9\x73\x7f\x86\xb9\x4f\x87\
+\x9e\xc0\x3e\x9d\x6b\xcf\x96\xbc\xbf\xda\x17\x85\xed\xa0\x51\x57\
+\x0b\xd6\x6d\x0e\x06\xf5\xb0\x67\xc0\x30\x81\x7d\xa5\xdf\x32\x99\
+\x27\x7d\x83\x4f\x46\x6e\xdf\x98\x94\xa1\x55\x29\xf5\xac\x2d\xfa\
+\x75\xdf\xe2\x09\xa7\x79\x1e\x62\xdb\xbe\xa6\x3b\x03\x44\x0a\xaf\
+\xdf\xad\x00\x3b\xee\x8b\x39\x60\xca\x70\x53\x19\xce\x34\x58\xc0\
+\x4b\xb3\x94\xe2\x02\x6f\xb9\x6a\x36\x96\x42\xdc\x00\xdf\x4a\xb8\
+\x49\xb6\x0e\x21\x16\x3b\x20\x32\x76\x1f\xf9\xa2\x01\x3b\x08\x43\
+\x95\xdb\xd6\x0f\x24\x34\xfe\xdf\xc0\x33\x7f\x23\x21\x9f\xff\x61\
+\x1a\xee\x38\x9e\x76\xd6\x25\x2c\xef\x3a\x07\x79\xc0\x4b\x38\xee\
+\xd9\xc1\x49\x08\xc6\x75\xe2\xf5\x16\x35\x0a\x51\x05\x2f\x3f\xc9\
+\xf3\x73\x99\x7e\xb4\x40\x1e\x7e\x80\xe5\x53\xb7\xbc\x2a\xa4\x1c\
+\x37\x6c\xbc\x89\x5f\x06\x09\xe3\x06\xea\xb2\x63\xa2\xf6\x86\x14\
+\x0f\x1a\xf9\x2d\x3e\xdd\xfa\x67\xc1\x94\x22\xd4\x7f\xe0\xed\x36\
+\xf8\xb3\x4c\x86\x57\x36\x93\x31\x27\x21\xd8\xfb\xe6\xe2\x19\xec\
+\x86\x6e\xe0\x14\xf8\x49\xe6\x77\x3c\x9e\x7b\xa0\x74\xa4\xea\x41\
+\x97\xa0\xf5\x50\x02\xd5\x21\x8f\x7b\x7f\xc6\xbb\x9f\x8e\x77\x2c\
+\xa1\xb8\x95\xcc\x6d\x6a\x00\x6e\x40\x78\x06\x1b\xd0\xc5\x7c\x24\
+\x6f\x0e\x10\x36\x60\x2d\xf0\x0c\xe1\xe5\x3c\x00\x36\x77\x19\xa0\
+\x83\xeb\x67\x7c\x96\x6c\x24\x73\xe5\xf9\xd3\x45\x31\x0d\x41\xe3\
+\x93\x2d\x3c\x42\x7d\xe1\x9e\xb2\x96\xf5\x5b\xe5\xc7\x71\x8c\xbe\
+\x4d\x36\x56\xe8\x1a\x3c\xd1\xd6\xc0\x25\x54\x33\x47\xc3\x66\x5a\
+\x3f\x09\xc1\x57\xe0\x07\xdf\x6c\x4b\x60\x06\x2f\x41\x93\x74\x42\
+\x67\xb2\x0e\x97\x55\x05\x85\xd1\x75\xcf\xd8\xac\x0a\x3c\xdb\x77\
+\x38\xf3\xc2\x8d\xaf\xa7\x30\x9d\xe3\x13\x76\xe3\x8e\x87\x4d\x62\
+\x40\x30\xb0\x03\x5e\xeb\x01\xf8\x04\x45\x34\x86\x0e\x56\xf0\x30\
+\x4c\x75\xf4\x36\x21\x18\xe2\x1c\x59\x38\x82\xc7\xbd\x17\x6e\xcc\
+\xf4\x8b\x64\xc5\xd9\x72\xee\x50\x63\x17\xba\x34\xf4\x2f\x26\x0b\
+\xa8\x7e\xec\x2e\x23\xff\x76\x31\x01\xe7\xad\x3e\x74\x65\x7d\x72\
+\x31\xf9\xed\xcc\xc5\xe4\xd8\xdb\xf7\x82\x6d\x20\x2b\x33\x1c\xfe\
+\x81\x7f\x6f\x32\x79\x30\x84\x71\x7a\xf7\xcb\x75\x30\x6e\x7d\xd4\
+\x8e\x6a\xbc\x67\xec\xc5\xdb\xd0\x0d\xa6\x35\xc9\xd5\xec\x8d\xcb\
+\x69\xf4\xe2\x98\x70\xc3\xe4\x7d\xa2\xf7\x09\x6c\x35\x3b\x26\x95\
+\x94\x18\xdd\xe5\x54\x06\xb9\xb0\x18\xf3\x9e\xc3\x6b\xf8\x9f\xaf\
+\xe7\x7f\x03\x88\x7c\xd3\x3b\xed\x32\x4f\xdf\x00\x00\x00\x00\x49\
+\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x08\x85\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x08\x37\x49\x44\x41\x54\x78\x9c\xdd\
+\x9b\xdf\x6f\x14\xd7\x15\xc7\x3f\x67\x76\x66\xf6\x87\xf1\x62\x1b\
+\x9b\x26\xa2\x98\x4a\x6d\xe2\x02\xad\xa2\x8a\x48\x51\x14\x70\xa3\
+\x2a\x51\xa4\xf6\xa1\x4a\x1e\xc0\x36\x48\x40\xa4\x84\xa7\xb6\xb4\
+\x0f\xc9\xdf\xd0\x97\xc6\x11\x4f\xf4\x85\x50\x05\x0c\x3c\xb5\x0f\
+\xf4\x25\x51\x44\x0d\x55\x14\x89\xf4\x21\x3f\x48\x4c\x94\x4a\x36\
+\xaa\x50\x62\x83\xd7\xbb\xec\x7a\x77\x7e\x9d\x3e\xec\xcc\x7a\xbc\
+\xb6\x77\x6d\xbc\x0b\xb6\xbf\xd2\x4a\x3b\xf7\xce\xcc\x3d\xe7\x3b\
+\xf7\x9e\x7b\xee\xbd\xe7\x08\x6d\xc6\xdd\x2b\x87\xfa\x2a\x81\x1c\
+\x42\x75\xbf\xa8\x0c\x20\x3c\x0d\xf4\x01\x9d\xe1\x0f\xa0\x10\xfe\
+\xa6\x51\x6e\xab\xe8\x04\x22\x5f\x26\x0d\xbd\xfe\xe4\xe1\xeb\xd3\
+\xed\x94\x4f\xda\xf1\xd2\xa9\xb1\x17\x9f\x0d\xd4\x1f\x16\x43\x5e\
+\x46\xf9\xd9\x3a\xda\x51\x84\x2f\x34\xd0\x0f\x0c\x49\x8c\xf5\x0f\
+\x5f\xbb\xd9\x4a\x39\xa1\x85\x04\x7c\xf3\xfe\x73\x59\xcb\xb4\x4f\
+\x89\xca\x49\x60\xef\x8a\x0d\x1a\x82\x61\x18\x18\x22\x88\x54\x9b\
+\x57\x55\x02\x55\x82\x20\x40\x03\x6d\xd4\xcc\x57\x2a\x7a\xce\xf5\
+\x9c\xb3\x4f\x1d\xfb\x24\xdf\x0a\xb9\xd7\x4d\xc0\x9d\x2b\xcf\xf7\
+\xa8\x6f\x9f\x56\xd1\xdf\xa1\x74\xc5\xeb\x0c\x11\x4c\xdb\xc2\xb6\
+\x4d\x4c\x2b\x81\x99\x30\x11\xa3\x71\x93\x1a\x28\x9e\xef\xe1\xb9\
+\x3e\x8e\xe3\xe1\x39\x2e\x81\xd6\x91\x22\xe4\x44\xe5\x8c\x24\x9c\
+\xd1\xdd\x87\x3f\xbe\xbf\x1e\xf9\x1f\x9a\x00\x55\x64\xf2\xd2\xe0\
+\xeb\x02\x7f\x06\x76\xc4\x5f\x68\x27\x6d\x52\x69\x1b\x3b\x69\xaf\
+\x47\xb6\x1a\x9c\x8a\x43\x79\xde\xc1\xa9\x38\xd4\x51\x31\xa3\xf0\
+\xf6\x9e\xa1\xf1\x73\x22\xf5\x55\xab\xc3\x43\x11\x30\x75\xe9\x57\
+\x3f\x56\xf5\xce\x03\x2f\x44\x65\x86\x08\xa9\x4c\x8a\x4c\x26\x89\
+\x18\xc6\xc3\xbc\xb6\x29\x34\x08\x28\x95\x2a\x94\x4b\xe5\xba\x5e\
+\xa1\x37\x44\xac\x13\xfd\x43\x1f\x7d\xbb\xd6\x77\xae\x99\x80\xa9\
+\xb1\xc1\x23\x0a\x7f\x05\xb2\x51\x59\x3a\x93\xa2\xa3\x23\xdd\xb4\
+\x7b\xb7\x0a\x1a\x28\xc5\xe2\x3c\xf3\xa5\x72\xbc\x38\x2f\xf0\x66\
+\xff\xf0\xf8\xe5\xb5\xbc\x6b\xd5\x12\xab\x22\x53\x63\x83\xef\x20\
+\xfc\x21\x2a\xb3\x2c\x93\xce\xce\x0e\x12\x56\x62\x2d\x6d\xb6\x0c\
+\xbe\xeb\x53\x28\x14\x71\x5d\x6f\xa1\x50\x79\xb7\x7f\x78\xfc\x8f\
+\xab\x1d\x12\xab\x22\xe0\xe6\xd9\x03\x56\x6f\xe7\xb6\xbf\x89\xe8\
+\x50\x54\x96\xc9\xa4\xe9\xe8\x4c\xaf\x55\xe6\xb6\xa0\xf8\xa0\x44\
+\xa9\xb8\xd0\x1b\x14\x1d\x9b\xc9\x97\x8e\x3f\x7b\xea\x53\xb7\xd9\
+\xb3\x4d\x09\xb8\x79\xf6\x80\xd5\xb7\xbd\xe3\xef\x28\xbf\x06\x10\
+\x81\xec\xf6\x6d\x2d\x33\x70\xad\x82\x53\x71\xc9\xcf\x15\x88\x99\
+\x86\xab\xd3\xf9\xe2\xab\xcd\x48\x68\x68\xad\x54\x91\xde\x6c\xe6\
+\x7c\x4d\x79\x43\xe8\xea\xce\x6e\x38\xe5\x01\xec\xa4\x45\x57\x77\
+\x36\x6e\x87\x7e\xb3\x33\xdb\xf1\x9e\x6a\xe3\x8f\xdc\x90\x80\xa9\
+\xb1\xc1\x77\x04\x19\x86\x50\xf9\x9e\x2c\xa6\x65\xb6\x46\xe2\x36\
+\xc0\xb4\x4c\xba\x7a\x16\x48\x50\x18\x99\xba\x3c\xf8\x97\x46\xcf\
+\xac\xc8\x4e\x68\xed\x2f\x41\xb5\xdb\x77\x75\x6f\x6c\xe5\xe3\xf0\
+\x5c\x8f\xdc\x6c\x7e\x61\x38\x28\x47\xf6\x8c\x8c\x5f\x59\xee\xde\
+\x65\x09\x08\xe7\xf9\xff\x10\x4e\x75\xdb\xbb\x36\xde\x98\x6f\x06\
+\xa7\xe2\x32\x97\x2b\x44\x97\x79\x82\xe0\x17\x7b\x8e\xde\xf8\x6f\
+\xfd\x7d\x4b\x86\x80\x2a\x12\x3a\x39\x59\x80\x4c\x47\x6a\xd3\x29\
+\x0f\x55\x9b\x90\xe9\x48\x45\x97\x59\x0c\x39\xbf\x9c\x3d\x58\x42\
+\xc0\xe4\xa5\xc1\x93\x84\x1e\x9e\x65\x99\x74\x6c\xcb\xb4\x55\xd0\
+\x76\xa2\x63\x5b\x06\xab\x36\x6c\xe5\xe0\x9d\xcb\xbf\x3c\x51\x7f\
+\xcf\x22\x46\xee\x5c\x79\xbe\x27\xf0\xad\xdb\x84\xbe\x7d\x4f\xcf\
+\xf6\xc7\xe6\xe4\xb4\x0a\xbe\xe7\x73\xff\xde\x5c\x74\x39\x43\x10\
+\x3c\xbd\xe7\xe8\x8d\xd9\xa8\x60\x51\x0f\x50\xdf\x3e\x4d\xa8\x7c\
+\x3a\x93\xda\xf4\xca\x03\x24\xcc\x04\xe9\x4c\x6d\x28\xf4\x22\x72\
+\x3a\x5e\x5f\xeb\x01\xdf\xbc\xff\x5c\xd6\x36\x93\x93\x28\x5d\x86\
+\x08\x3d\xbd\x5d\x8f\xcc\xb7\x6f\x37\x34\x50\xee\xcf\xe4\xa2\x05\
+\xd4\xec\x7c\xc6\xdf\xf3\xd3\xdf\xfe\xbb\x00\xb1\x1e\x60\x99\xf6\
+\xa9\x68\x3d\x9f\xca\xa4\xb6\x8c\xf2\x50\xf5\x61\x52\xe9\x5a\x2f\
+\xe8\x4e\x95\x12\xa7\xa2\x8b\x1a\x01\xe1\x4e\x0e\x02\x64\x32\xc9\
+\x47\x2a\xe0\xa3\x40\xa6\x23\x59\xeb\xee\xa2\x9c\x8c\xca\x0d\xa8\
+\xee\xe1\x11\x6e\x63\xd9\x49\xbb\x6d\xeb\xf9\xc7\x09\x31\x0c\xec\
+\x54\x38\x9d\x0b\xfb\x26\x2f\x1c\x3c\x00\x21\x01\x81\xfa\xc3\xd1\
+\x8d\xa9\xf4\xe6\x9b\xf3\x57\x8b\x54\x6a\xa1\x67\xab\xc8\x08\x84\
+\x04\x88\x21\x2f\x43\x75\x57\x67\x33\x3a\x3d\xab\x85\x65\x9b\x18\
+\xe1\x46\x2c\x22\x2f\x01\xc8\xdd\x2b\x87\xfa\x1c\x5f\xbe\x03\xc4\
+\x4e\xda\x6c\xef\xda\xf6\x18\x45\x6c\x3f\xe6\x72\x0f\x70\x2a\x0e\
+\x80\x9a\x6a\xec\x34\x2a\x81\x1c\x22\x9c\x0e\x6d\x7b\x73\x2c\x76\
+\xd6\x83\x05\xcf\x10\x71\x8d\x60\xd0\x40\x75\x7f\x54\x62\x6e\x01\
+\xc7\xa7\x19\xac\xf8\x8a\x56\xd9\x67\x88\xca\x40\x74\x6d\x9a\x5b\
+\x9f\x80\xb8\x8e\x82\x0c\x18\xe1\x59\x1d\x62\x08\x22\x5b\x6f\xfa\
+\xab\x87\x18\x12\x73\xf2\x74\xc0\xa4\x7a\x50\x89\xb1\x8a\xb9\xdf\
+\x71\x7c\x3e\xfb\xec\x3b\xee\xdd\x2f\x51\x7f\x58\xb3\x11\xd0\xd3\
+\x9d\xe6\x99\x67\x7e\x40\x32\xd9\xd8\x96\x19\x86\x81\x1f\xf8\x00\
+\xbd\x26\xe1\x09\x6d\x6d\x7a\x58\x01\xaa\xca\xd5\x7f\xde\x66\x7a\
+\xba\xd4\x22\x71\x5b\x8f\xa9\xa9\x39\x26\xa7\x72\xbc\xf6\xea\x5e\
+\x12\x89\x95\x3f\xa8\x21\x82\x5f\xfd\xdb\x69\x10\x12\x20\x4d\x08\
+\xb8\x77\x6f\x7e\x43\x2b\x1f\x61\x76\xb6\xcc\xdd\xbb\x0f\x1a\xde\
+\x13\xd3\x35\xbb\xea\x41\xbf\x99\xd6\x46\x6b\x59\xc8\x19\x54\x03\
+\x13\xd0\x26\x83\xba\x7b\x47\x9a\x1f\xee\xca\x36\xbc\x67\x23\xa0\
+\xaf\xaf\x83\x27\x9e\x68\xec\xcc\xc5\x74\xcd\x9b\x54\x09\xd8\xb1\
+\xe4\x08\xba\x0e\x82\xf0\xca\x2b\x3f\xe1\xeb\x89\x69\xee\xcd\xcc\
+\x2f\x3d\xb2\x7e\xcc\x10\xa0\xbb\x27\xcd\xde\xbd\x7d\x24\x9a\xf4\
+\x80\x98\xec\x05\x13\x98\x06\x7e\x14\x04\x41\xd3\x46\x12\x09\x61\
+\xff\xbe\x9d\xeb\x14\xf5\xf1\x23\xa6\xeb\x8c\x81\x72\x1b\xaa\xbb\
+\x26\x4d\xa2\x33\xb6\x04\x16\xeb\x29\x13\x86\x8a\x4e\x44\x95\x9e\
+\xef\xad\xf0\xd8\xd6\x81\xe7\xf9\xb5\xff\x8a\x4e\x18\x88\x7c\x59\
+\xab\x74\xfd\x65\x1f\xda\x4a\x58\x74\x94\x2e\xdc\x32\x92\x86\x5e\
+\x87\xea\x59\xba\xe3\x6c\xfd\x1e\x10\x23\x40\xad\xc0\x18\x37\x9e\
+\x3c\x7c\x7d\x1a\xe1\x0b\x00\xcf\x69\x7a\x9c\xbe\xa9\xa1\xaa\x35\
+\x1d\x15\x3e\xdf\x35\x72\x6d\xc6\x00\xd0\x40\x3f\x80\xea\xf4\x10\
+\x6e\x16\x6c\x49\xb8\x8e\xb7\x30\x05\xaa\x7e\x08\xe1\x96\x98\x21\
+\x89\xb1\xe8\xa6\xf2\xfc\xd6\x25\xa0\x5c\xae\xd4\xfe\x8b\xea\x45\
+\x08\x09\x08\x23\x30\xbf\x82\x6a\x48\x9a\xae\xc2\x27\xd8\x6c\xd0\
+\x20\xc0\x29\x87\x1f\x57\xb9\xb5\xe7\xe8\x8d\x4f\x21\x76\x2e\xa0\
+\xa2\xe7\xaa\x75\x50\x2a\x55\x96\x79\xc5\xe6\x46\xa9\x58\xa9\x45\
+\x4d\xa9\x70\x2e\x2a\xaf\x11\xe0\x7a\xce\x59\x84\x1c\x40\xb9\x54\
+\xde\x52\x4e\x91\x06\x4a\x79\xbe\x16\x44\x35\x5b\xce\xf8\x67\xa3\
+\x8b\x1a\x01\x4f\x1d\xfb\x24\x2f\x2a\x67\xa0\x6a\x0c\x8b\xc5\xf9\
+\x47\x2b\x65\x1b\x51\x2c\xce\xc7\x8d\xdf\x99\xe8\x5c\x10\xea\x4e\
+\x87\x25\xe1\x8c\x02\x33\x00\xf3\xa5\x32\xfe\x16\x70\x8c\x7c\xcf\
+\x8f\x07\x54\xce\xa0\x3a\x1a\xaf\x5f\x44\xc0\xee\xc3\x1f\xdf\x57\
+\x78\x3b\xba\x2e\x14\x8a\xed\x97\xb0\xcd\x28\xe4\x17\x74\x10\x91\
+\xb7\xe2\xb1\x01\xb0\x4c\x8c\x90\x2a\x32\x75\xe9\xd0\x38\xc8\x41\
+\xa8\x86\xc8\x6c\xd6\x28\x91\xc5\x01\x94\x7a\xa3\x7f\xe8\xfa\x60\
+\x7d\x04\xe9\x92\x1d\x21\x11\x54\xc4\x3a\x01\xe4\x01\x4a\xc5\x32\
+\x4e\x65\xf3\x79\x88\x4e\xc5\x8d\x47\x8f\xe6\x09\xf4\xf8\x72\xe1\
+\xb3\xcb\x6e\x89\xf5\x0f\x7d\xf4\xad\xc0\x9b\xb5\xa7\xe7\x0a\x78\
+\xee\xe6\x59\x27\x78\xae\x47\x7e\xae\xb0\x50\xa0\xbc\xb1\x5c\x84\
+\x18\x34\x08\x94\xec\x1f\x1e\xbf\x8c\xf2\x2e\x80\x2a\xe4\x72\x05\
+\x3c\x7f\xe3\x1b\x45\xcf\xf7\xc9\xe5\x62\x21\xb3\xc2\xe8\x4a\x31\
+\x82\xd5\xea\x06\xa8\x26\x45\x1c\xba\xb0\x28\x5a\xb4\xab\x73\xc3\
+\x06\x4c\xba\xae\xc7\x5c\xae\x50\xf3\x61\x04\x2e\xee\x1e\x1a\x3f\
+\xd6\x28\x72\xbc\xe1\xae\xb0\x08\x3a\x93\x2f\x1d\x07\xae\x42\xd5\
+\xa1\xc8\xcd\xe6\x37\xa4\x4d\x70\x2a\x2e\x73\xb3\xf9\xb8\x03\x77\
+\xf5\xfb\x7c\xf1\x44\xb3\xb0\xf9\xd5\x87\xcb\x67\x33\xe7\xa3\x9e\
+\x00\x1b\x6b\x76\xa8\x0f\x97\x17\xb8\xf8\x7d\xbe\x78\xa2\x25\xe1\
+\xf2\x11\x36\x64\xc2\x84\xe7\x53\xc8\x17\xeb\x77\x79\x46\xfb\x8f\
+\x8c\xff\xa9\xa5\x09\x13\x71\x6c\xe4\x94\x19\x94\x37\x1a\x19\xbc\
+\xe5\xd0\xda\xa4\xa9\x74\xaa\x1a\x8d\xd5\xce\xa4\xa9\x62\x85\xf2\
+\xfc\xd2\xa4\x29\x02\x3d\xbe\xd2\x54\xd7\x08\xeb\x4d\x9b\x3b\x19\
+\xa6\xcd\xf5\xc6\x5f\x68\xa7\x6c\x52\xa9\x24\x96\x6d\x36\x3d\x73\
+\x6c\xde\x8e\xe2\x3a\x1e\xe5\x72\x05\xa7\xbc\x34\x6d\x4e\x44\xde\
+\xda\x7d\xe4\x5f\xef\x3d\xd2\xb4\xb9\x38\x26\x2f\x1c\xec\x46\xe4\
+\x34\x86\xfc\x7e\xa5\xc4\x49\xcb\x32\xb1\x2c\x13\xd3\x4c\xac\x2e\
+\x71\xd2\xf3\x71\x5d\x0f\xd7\x5d\x21\x71\x12\x66\x51\x3d\x83\xea\
+\x68\xbd\x6f\xbf\x56\xb4\x6c\xd0\x7e\xfd\x8f\x17\x3a\x53\xa5\xc4\
+\x29\x81\xd7\x69\x57\xea\xac\x72\x4b\x85\x73\xe5\x8c\x7f\x36\xbe\
+\xa4\x5d\x0f\xda\x62\xb5\x26\x2f\x1c\x3c\xa0\x22\x23\x88\xbc\x24\
+\xf0\xf3\x75\xb4\xa3\x0a\x9f\xa3\xfa\xa1\xa8\x5e\x8c\xb6\xb1\x5a\
+\x89\xb6\x9b\xed\xff\x5d\x7c\xb1\xd7\x35\x82\x41\x94\x7d\x82\x0c\
+\x80\x0e\x50\xb5\x19\x9d\x2c\xcc\x24\x79\xaa\x87\xb4\x33\x20\x13\
+\x8a\x4e\x20\xdc\xb2\x02\x63\x7c\xd7\xc8\xb5\x99\x76\xca\xf7\x7f\
+\xf4\x10\x88\x49\xb5\xbc\x39\x96\x00\x00\x00\x00\x49\x45\x4e\x44\
+\xae\x42\x60\x82\
+\x00\x00\x04\x87\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x04\x39\x49\x44\x41\x54\x58\x85\xbd\
+\x97\xcf\x6f\x13\x57\x10\xc7\xbf\x33\x6f\x77\x6d\x6f\x48\x42\x68\
+\x8a\x8a\x41\xaa\x54\x42\x55\x05\xf5\xd0\xa6\x34\x27\x90\x41\xe5\
+\xd0\x08\xa4\xf4\xc0\xa1\xbd\xf6\xde\x03\x97\x1e\x52\x88\x43\xc9\
+\xa1\x97\x1e\xfa\x37\x54\x70\xe0\x82\x04\x6a\x2f\x51\xb0\x44\x0f\
+\x45\x11\xa7\x96\xa8\xa2\x05\xb5\x52\x64\x10\x8a\x08\xc1\x78\x6d\
+\xef\xee\x9b\xe9\xc1\x4e\x1a\xff\x5c\x1b\x48\x47\xb2\xb4\x7e\x3b\
+\xfb\xe6\x33\xa3\xf7\xe6\x07\xa1\x4f\x39\x97\x9f\xf4\x9e\x9a\xa1\
+\x53\x22\x7a\x06\x84\xa3\x04\x64\x51\xff\x01\x40\x51\x81\x22\x14\
+\xf7\x98\xe9\xe6\x3e\x5b\x5e\xbe\x96\x5f\x0d\xfb\xd9\x97\x92\x14\
+\x4e\xe7\x3f\xc8\x0a\x9b\x79\x05\x3e\x07\x30\x4c\x0e\x83\x1d\x03\
+\x32\x04\x62\x06\x00\xa8\x08\xd4\x2a\x24\xb6\xd0\x58\x00\xa0\x44\
+\xc0\xd5\xd0\x68\xfe\xf6\xdc\xdd\x47\x2f\x05\x90\x9b\xcf\xa5\xd9\
+\x94\xe7\x00\x3d\x4f\x4c\xbe\x93\xf1\xc0\x69\x67\xdb\x68\x37\x51\
+\x11\x48\x35\x46\x5c\x09\xa1\xa2\x01\x40\xdf\x8b\x1d\x5a\x2c\x2c\
+\x14\xaa\x7d\x03\xe4\xf2\xc7\xde\x62\xd6\xeb\x44\x98\x36\xbe\x07\
+\xe3\xa7\x92\x43\xd5\x0a\x02\xc0\x06\x35\xd8\x20\x84\x2a\xee\x88\
+\xd0\x6c\x21\xbf\xf2\x38\x11\xe0\x93\x4b\x53\xef\x0b\xe8\x27\x32\
+\x7c\xc8\x1d\xc9\x80\x9d\xde\x1e\x27\x82\x58\x41\xb8\x59\x81\x5a\
+\x59\x63\xe8\xcc\xd2\xc5\xbb\xbf\x75\x05\x38\xbe\x38\x75\xc0\xb5\
+\x58\x21\xd7\x39\x98\x1a\xc9\x00\x3c\xa8\xdf\x5d\x44\x14\xb5\xe7\
+\x15\x68\x64\xd7\x44\xe8\xd8\xce\x48\x6c\xbb\x97\x9b\xcf\xa5\xdd\
+\x98\xae\x93\x31\x07\xbd\xd1\xd7\x68\x1c\x00\x98\x90\x1a\xc9\x80\
+\x0c\x1f\x62\xd6\xeb\xb9\xf9\x5c\x7a\xeb\x95\xb3\xad\x63\xca\x73\
+\x44\xf8\xd8\x1d\xc9\x80\xa8\xb3\x71\x89\x2c\x82\x67\x95\x64\x83\
+\x04\x64\x46\xd3\x30\xae\xf3\xdf\x1a\x13\xbc\xd1\x0c\xc2\x8d\xf2\
+\x74\xfd\x70\xe3\x42\x43\xb5\x7e\xd5\x2c\x9b\x3f\x9d\x21\xcf\x77\
+\xfc\x54\xd7\x7d\x55\x15\x0f\x6f\x3f\xc0\x93\x3f\x9e\x24\x33\x18\
+\xc6\xc4\x89\xc3\x18\x3f\xf2\x66\xd3\x7a\x1c\x84\x88\xcb\xb5\x20\
+\x32\x3a\x71\x7b\xee\xee\x23\x06\x00\x61\x33\x4f\x4c\xbe\xe9\x61\
+\x1c\x00\x88\x08\xef\x1c\x3f\x8c\xfd\xef\xed\x4f\x04\x50\x2b\x78\
+\xf0\xcb\x43\xa8\x68\xd3\xba\xf1\x3d\x10\xb3\xef\xc4\x34\x0f\x00\
+\xf4\xe9\x0f\x13\xa9\xda\xb3\xbd\xeb\xee\x50\x6a\x8f\xf1\xbd\xc4\
+\x8d\x81\xc1\x22\xf1\xe1\x17\x53\x48\xed\x69\x76\xcc\x06\x21\xa2\
+\x72\xad\xf4\x86\x04\xe3\x1c\x6e\x8e\x9d\x04\xb0\x87\xd3\x4e\xdb\
+\xc7\x62\x05\x62\xa5\x6d\x7d\x90\x48\x40\xdb\x97\x38\xe5\x02\xc0\
+\xf0\x3a\xa5\x4f\xb2\x88\x9e\x21\x87\x3b\x66\x38\x1b\x5a\xdc\x5f\
+\xba\xff\xea\x10\xad\xdf\x1a\x6a\xe4\x17\x3e\xcb\x20\x1c\x65\xc7\
+\x74\x55\xde\xf8\xe7\xe9\xee\x40\x38\x06\x44\x98\x64\x02\xb2\x64\
+\x7a\xdf\xf9\xdd\x80\x68\x44\x3c\xcb\x00\xb2\x49\x05\x66\x37\x20\
+\x1a\x4e\x67\x07\x4a\xf4\xbb\x11\x09\x06\x50\x54\x69\xdf\x70\xb7\
+\x21\xd4\x2a\x00\x14\x59\x81\x62\xe3\xcf\xff\x0a\xd1\x70\xba\xc8\
+\x50\xdc\xd3\xd8\x0e\x04\xf0\x3a\x20\x34\xb6\x50\xc5\x2a\x33\xd3\
+\x4d\x89\x05\x83\x46\xa1\x5f\x08\xd7\x77\xdb\x8d\x5b\x85\xc4\x02\
+\x40\x6e\xf0\x3e\x5b\x5e\x06\x50\x92\x30\xea\x80\xf9\xea\x10\x6c\
+\xda\xcf\xb9\xd4\x22\x00\x28\x8d\x6b\xf5\x16\x5f\xcb\xaf\x86\x04\
+\x5c\x8d\x83\x08\xd0\x66\x8b\x4e\xc6\x81\xdb\x21\x45\x0f\x02\xd1\
+\x2a\x0a\x20\xae\x44\x50\xc5\x95\x6b\xf9\xd5\x90\x01\x20\x34\x9a\
+\x57\x91\xc0\x56\x9a\xa3\x40\x44\x38\x9c\x3b\xd2\x5c\xd7\x5f\x11\
+\xc2\x06\x21\x54\x24\x88\x1d\x5d\x00\x76\xb4\x64\xa7\x2e\x1d\xfb\
+\x16\x84\x6f\x52\x63\x3e\xa8\x25\x6c\x62\x05\xb5\x52\xad\xad\xb4\
+\x76\x92\xd4\xb0\xd7\x15\x58\xad\x20\xdc\x28\x43\x95\x2e\x2f\x5f\
+\x5c\xb9\x00\xec\xe8\x88\xc4\x0e\x2d\xb2\x79\x71\x3a\xdc\xac\x4c\
+\x7b\x63\x7e\x53\x57\xc4\x86\x91\xd9\x9b\x49\x34\xde\x53\x44\xeb\
+\xcd\xa9\xe2\x4e\x6a\xef\xc6\xe5\xed\xbd\xb7\x1e\x0a\x0b\x85\xaa\
+\x08\xcd\xaa\x95\xb5\x68\xb3\x02\xd5\xc1\x6f\x45\x2f\xe3\xb5\xe7\
+\xf5\xce\x58\x84\x66\x7f\xfe\xea\xaf\x5a\x1b\x00\x00\x14\xf2\x2b\
+\x8f\x19\x3a\x23\x91\x5d\x0b\x37\xca\xd0\x3e\x0e\x55\x92\xa8\x15\
+\xd4\x9e\x05\xd0\xc8\xae\x31\x74\xa6\x75\x36\xe8\x39\x98\x80\x68\
+\xda\xf1\x3d\x38\x19\x17\xe8\xd2\xa8\x76\x35\x8c\xfa\x81\xb3\x41\
+\x0d\x10\xfa\xd5\x2a\x3e\xeb\x34\x98\x74\x6c\x04\xfe\x2e\x14\x5f\
+\xbc\x7d\xe2\xdd\x1f\x89\x22\x48\x14\x7f\x64\xab\xb1\x4b\xa8\x97\
+\x50\x4a\x68\xd7\xd5\x2a\xa4\x1a\x21\x7a\x5e\x85\x84\x71\x99\x94\
+\xbe\xf3\xc6\x36\xbe\x5c\xfa\xfa\xf7\xcd\x4e\xfa\x89\x6e\x1d\x5f\
+\x9c\x3a\xe0\x59\xca\x6f\x0d\xa7\xec\x70\xbd\x99\x60\xde\x2a\xa9\
+\x50\xab\xf5\x01\x35\xb6\x8d\x0c\x87\x92\x2a\xae\xc4\x8e\x2e\xbc\
+\xf4\x70\xda\x2a\xe7\xf2\x93\xde\x3a\xa5\x4f\x02\x7c\x96\x08\x93\
+\x68\x19\xcf\x01\x14\x55\xb1\x0a\xc8\x8d\x71\xad\xde\xea\x77\x3c\
+\xff\x17\x78\xc4\x4e\x5d\x07\x82\x80\x4d\x00\x00\x00\x00\x49\x45\
+\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x00\x75\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x00\x27\x49\x44\x41\x54\x78\x9c\xed\
+\xc1\x01\x0d\x00\x00\x00\xc2\xa0\xf7\x4f\x6d\x0e\x37\xa0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x77\x03\
+\x40\x40\x00\x01\x8f\xf2\xc9\x51\x00\x00\x00\x00\x49\x45\x4e\x44\
+\xae\x42\x60\x82\
+\x00\x00\x0c\xd6\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x0c\x88\x49\x44\x41\x54\x78\x9c\xe5\
+\x9b\x5b\x6f\x5b\xc7\x11\x80\xbf\x25\x45\x8a\x94\x28\x89\x92\xad\
+\xbb\x64\xc9\x4e\x9a\xc2\x41\xe0\x26\x45\xd1\xa0\x48\x0a\xf4\xa9\
+\x7d\xe9\x7b\x81\x16\xfd\xa3\x7d\x2a\x50\xb4\x0f\x41\x90\x36\x4e\
+\x52\x20\x69\x92\xc6\x96\x6c\xc9\x37\x5d\x48\x49\xa4\x2e\xe4\xf4\
+\x61\xf6\x1c\xee\xd9\x33\x87\xa4\xe4\xf4\xc9\x03\x10\x24\x77\xf7\
+\xcc\xce\xcc\xee\xce\x6d\xe7\x00\xb2\x05\xe2\x78\xe3\x40\x9c\xf2\
+\x9e\xfe\x78\x93\x84\x90\xe3\xf9\x4d\x12\x42\x96\x57\x97\xed\xe0\
+\x0e\xf0\x18\x9c\x14\x3c\xdc\x00\x6e\x19\x1d\x25\x60\x32\x8b\x2f\
+\x6d\xaf\x0d\xa1\x66\x12\x10\xe0\x62\xc8\x98\x73\xa0\x67\xb4\x77\
+\x81\xbe\xd1\xfe\x12\xdc\xa9\x8d\x2a\xcf\xa3\x1b\x35\x00\x64\x1b\
+\xb8\xed\x09\x3d\x01\x5e\xf8\x89\xa7\x80\x39\xdf\x2e\xc0\x59\xd0\
+\x3e\xeb\xdb\xfa\xbe\x1d\x8f\xa3\x0a\x34\x81\x8a\xef\x3f\xf7\x34\
+\x54\xfd\xf7\x25\x70\x04\x97\xa7\x50\x39\xf2\x6d\x53\xa8\x20\x9d\
+\x9f\xff\xc4\xff\x9f\xf2\x6d\x0e\x68\x01\xa7\xbe\x7d\x29\xe8\x7b\
+\x01\xee\x71\x31\x6f\x85\x52\x92\x2d\x90\x09\x90\x8f\x40\x56\x8d\
+\x31\x6b\x20\x0b\x46\xfb\x06\xc8\xbc\xff\x3d\x05\x72\x0f\xe4\xae\
+\xff\xcc\x80\xdc\x01\x19\xb2\x23\xa4\xee\xc7\x2c\xa8\xe0\xe5\xae\
+\xc7\x31\xe1\xfb\xe7\x40\x36\xf3\x47\x55\x9a\x05\xed\x1b\x20\xbf\
+\x06\x29\x5f\xf3\x88\xcb\x04\xc8\x9f\xf5\xc1\x5c\xdf\x36\x48\xc5\
+\x68\x7f\xdb\x3f\xb7\xe2\x27\x5b\x8e\xf0\xdd\x1b\x73\x72\x3c\xe3\
+\x25\xff\xdb\x79\x46\xb6\xa0\x75\x4b\xdb\xe5\x2d\x83\xd9\x32\xc8\
+\x4f\x8c\xf6\x09\x90\x3f\xda\xbc\x14\x13\xf0\x91\x7f\x30\x92\x9a\
+\xac\x17\x30\x7f\xc7\x7f\xb6\xed\x15\x96\xed\x6b\x4c\x4e\x60\xa2\
+\xe2\xf6\x59\x15\x4e\x7b\x49\xe7\xcb\xf5\x97\xb3\xcf\xa5\xbb\xb9\
+\x02\xf2\xab\x71\x27\xdf\x1e\x6c\xfb\x50\x63\xca\x14\xc8\x6d\x63\
+\xfc\x2a\xc8\x07\xba\x7d\x4d\x7c\xf3\x5e\x79\x5e\x13\x64\x56\xb7\
+\xbc\xd9\x37\x07\xf2\x00\x64\xd1\xe8\x6b\xfa\x67\x23\xcb\x26\x9b\
+\xfa\xc9\x82\x71\x26\xe4\x17\xe0\x3e\x0d\xfe\x27\xca\xa3\x07\xec\
+\x01\x21\xa3\xab\x70\x79\x0b\x2a\x5f\x0e\xe1\x64\x0d\x78\x5a\xd0\
+\x97\xda\xe1\x1b\x3c\x0b\xf0\x00\xba\x4f\xa0\xf6\x2a\x68\xeb\x28\
+\x5d\x94\xc9\x29\xbc\x98\x37\x98\x30\x90\xc6\xc4\x34\x50\xe6\x1f\
+\xa0\x5a\xbd\xed\xc7\x6c\x01\x2f\x54\xa1\x0f\x05\xf1\xc4\x2c\xf9\
+\xff\x89\xe9\x4a\x34\x78\xd8\x46\xd0\xf6\xc2\xa0\x25\x86\x17\x20\
+\x82\x32\xbc\xe7\x9f\x5d\x02\x7e\x06\x7c\x0e\xcc\xa0\x16\x22\x81\
+\x9c\xd9\x8c\x04\x20\x0d\xd4\xcc\x24\xff\x37\x80\x36\xb8\x5d\x3f\
+\x51\x05\x35\x5d\x9b\xc0\xd7\xe0\xae\xf4\x7c\xb9\x13\x72\x20\xce\
+\x8f\x9b\x42\x7d\x81\x6f\x47\x98\x9f\xf8\xd9\x45\x60\x1a\x35\xa9\
+\x7b\xf6\xb3\xd2\x86\xfa\x0b\xd4\x9f\x58\x01\x7e\x00\x16\x80\xcf\
+\x80\xe7\x80\xb7\x3c\xec\xf8\xe7\x7b\xaa\xdb\xdc\x55\xd1\xc4\x5b\
+\x03\xf3\x26\x5b\x59\xcd\x29\x1b\x5e\x0f\x7c\x1c\x29\x46\xcb\x4c\
+\x2e\xa1\xa6\x72\x46\x3f\x37\x05\x59\xf5\xca\x78\x3d\x6b\x55\xd2\
+\xfe\x99\x81\x7e\x91\x09\x90\xdf\x78\x2b\x11\xb6\x07\x8a\x51\xee\
+\xaa\x8e\x18\x40\xc9\x98\xb5\xaf\x13\xb2\x0b\xae\x17\x8d\x5d\x03\
+\xfe\x0e\xdc\x09\x84\x10\xac\xcc\x61\x53\x19\xe7\x10\xdc\x53\xdf\
+\x37\xe6\xaa\x9b\xe0\x9f\x75\x4f\x80\x03\xc5\x7d\xd8\xcc\xf7\x8b\
+\x03\xd6\x81\xbf\x01\xf7\xb2\x73\xba\x9e\xf2\x22\xeb\x18\x47\xc0\
+\x12\xc0\x14\x70\x16\x31\x0f\x7a\xe6\xbf\xf3\x5b\xe9\x31\x59\x21\
+\xa0\x1a\xb9\xd9\x57\xc6\xdd\xe5\xf8\x3c\x8e\x0b\xee\x52\x71\x37\
+\xfb\xd1\x6e\x08\x3d\xbc\x1e\xf0\x04\x3d\x7a\xe1\x90\x1e\xea\x29\
+\x4e\xc7\x58\x2d\x25\x38\xe7\x57\x2f\x00\xd9\x46\x95\x4c\x29\x30\
+\x77\x07\xc0\x7d\xe0\xd2\x9b\xab\x57\xe8\xee\x09\x4d\x9e\x9f\xd0\
+\xdc\x04\x25\xe8\xfa\xe3\x56\x3b\xc4\xf6\xf7\xa7\x81\x2e\x48\x78\
+\x66\xfb\x3a\x56\xee\x03\x47\xe8\xca\x7f\xad\x63\x05\xa0\x03\x9d\
+\x13\xa8\x2f\x92\xd1\x67\xee\x08\xe4\xa7\xf1\x04\x63\x58\x01\x79\
+\x0b\x2e\x2a\x50\x9d\x46\x15\xd3\x29\x83\xad\xbd\x0b\xfc\x0e\xf8\
+\x4b\x01\x03\x01\x74\xe6\xa1\x9e\x04\x3f\x3e\x4e\xa8\x1d\xf9\xce\
+\x79\xd4\x52\xf8\x1d\xd5\x39\x87\xfa\xe1\x10\x64\x5d\xd4\x3c\xfe\
+\x06\xf8\x24\xa0\xd9\x2b\xcf\x7a\x0d\xb8\x0d\x72\x1e\x2d\x66\x6e\
+\x25\x62\x01\xc4\xd1\xe1\x5d\x60\x1a\x26\x1f\xaa\x12\x74\xfb\xd9\
+\xe1\xb2\x0e\xfc\x03\x0d\x70\x8c\x20\x43\x80\xee\x6d\xa8\x4d\x40\
+\xfd\x25\xb8\x4e\x01\x43\x47\xd9\xbf\x52\x07\x16\xe0\xa2\x06\xd5\
+\x93\xbc\xd6\x4e\x7d\x93\xbf\x02\x6b\xe0\xf6\x82\xce\x36\xc8\x09\
+\xba\x63\xdf\xf6\x9e\x6b\x42\x5b\x9f\xe8\xd8\xc7\x3a\xa0\x0a\x9c\
+\xfb\x09\xee\xa1\xab\xf2\x85\x4d\xb3\x2c\xa1\xdb\xbe\x87\xad\x13\
+\xa6\x81\x55\xa8\xb5\x55\x89\x15\x32\x6f\x80\xeb\xe8\x33\xd5\xb6\
+\x32\x18\x1e\xab\x30\xaa\xa3\x87\xfa\x02\x2b\x05\x88\xbe\xf1\x63\
+\xee\xf9\xe7\x3a\x64\x1d\xb9\x22\x2b\xc0\x06\xf0\x0c\xf5\x01\x8c\
+\x03\x7c\xd8\x04\xba\xe0\xba\x9e\xe0\x48\x31\x1e\xcd\x43\xbb\x86\
+\xae\xc2\xf9\x58\x3c\xdb\x70\x01\x3c\x85\xf6\x24\x1c\x2f\x60\x87\
+\xb4\x5d\xe0\x4c\xe7\x8c\xc1\x9d\xa1\x8b\xfa\x83\xe7\x29\xc7\x8b\
+\x25\x80\x06\xea\x3d\x2d\xe6\xb7\x7c\x02\xcd\x29\x70\xad\x6c\x5b\
+\x22\x84\xcb\xf7\x61\xae\x07\xb3\xaf\xcc\x47\x6f\x04\xb3\xaf\x60\
+\xf6\x52\x71\x5b\x47\xcd\xb5\x60\xae\x20\x16\x61\x07\x35\xdf\x2d\
+\xd4\xc2\x65\xc0\x12\xc0\x34\xaa\x3d\x0b\x94\x9a\x2c\xa3\x6e\xaa\
+\x01\xc7\x4d\xa8\x7c\x0f\xcc\x33\x7e\xec\x3d\x06\x88\x03\x16\xa0\
+\xf2\x9d\xce\x61\xc2\x73\xdb\x59\x72\x97\x40\x19\xdc\x31\xba\xb8\
+\x19\xb0\x04\x20\xa8\x69\xd9\x29\x20\x64\xc2\xb6\xf3\x32\x05\xa5\
+\x64\x22\x7f\x1c\xac\x60\xeb\xda\x10\x6e\xfb\x16\x94\x4a\x5e\xbf\
+\xc4\xc3\xae\x94\x36\xb1\x78\x3a\xd4\x23\x34\xda\x0a\x94\x07\x83\
+\x4c\xbf\x7d\x13\xd5\xb2\xe1\x2a\xcc\x82\x74\x81\x15\x98\xd9\x0f\
+\xfa\x5a\xc0\xbb\xc0\x13\xd2\x8c\x4e\x06\x92\xd4\x19\xa8\x4f\x61\
+\xe5\x05\xe7\xd0\x40\xe7\x07\xfd\x2d\xa0\x3b\x73\x03\xe4\x19\x03\
+\x3f\x23\xc1\x7f\xa6\x7d\x1c\x64\xd1\xb8\x63\xef\x0e\x27\x81\x59\
+\x0a\x31\x61\x35\x72\x49\x48\x99\x47\x83\x8d\x65\x4f\x64\x84\x9c\
+\x1e\x74\x66\xa1\x7e\x00\xc4\x41\xc6\x23\x4f\xd0\xd7\xc1\xe4\x2b\
+\x40\x1f\x3a\x67\x50\xdf\x05\x1c\x74\x6f\x41\x2d\xc9\x2f\x3e\xf3\
+\xdf\xce\xcf\xf9\x05\x9a\x2b\x0c\xe1\x15\x74\x66\xa0\x9e\x08\x2d\
+\x9c\xb7\x89\x2a\xbe\xbe\xee\x86\x54\x57\x25\x79\xcb\x4c\xc2\xc6\
+\x5a\x99\x45\xe0\x4b\x90\xaa\x27\xe0\x25\xb8\x43\x34\xd3\x73\x96\
+\x8f\xfc\xa4\x01\xf5\x32\xb8\xe7\x79\x54\x82\x67\x7e\x01\x38\x46\
+\x57\xec\x1b\x63\x77\xb5\xfd\xf8\x32\xba\xe2\x07\x9e\x8e\xff\x68\
+\x5f\x2e\x7a\x3b\xf1\xa6\xcf\x67\x7f\x43\x9a\x64\x1f\x15\x98\x17\
+\x9a\x6c\x02\x4f\xe0\xa4\x03\x8d\x29\xb2\xe1\xb1\xa9\x03\x4a\xa8\
+\x04\x6f\x83\xdb\x09\xec\xf7\x2d\x6c\xe5\x37\x0d\x47\x05\x69\x68\
+\xa5\x00\xcd\xf4\x6e\x01\x4f\x87\x87\xc4\xa9\x2f\x7f\x1f\x0d\x67\
+\x87\x05\x52\x27\x18\xbe\xbd\x5f\x08\x9f\xb9\x72\x27\xa8\xb7\xba\
+\x01\x8d\x03\xf4\x48\x65\xa0\x48\x09\x2e\xe5\xe3\x01\x28\x20\xbe\
+\x01\xf3\x47\x46\x7b\x02\x65\x25\xb4\xf2\x90\x9c\xb3\x94\x9b\x3a\
+\x51\x78\x9f\x61\xdf\x3f\x84\xb4\x14\x08\x20\x37\x4e\x7c\x6a\x7c\
+\xcd\xea\xb5\x04\xb0\x00\x58\xf6\xdf\xba\x84\x18\x07\x56\x18\x24\
+\x34\x0c\x8f\x31\x81\x9c\x93\xf3\x12\x2e\x8c\xd4\x7b\x06\x8a\x84\
+\x69\xd1\xfa\x0a\x43\x60\x05\x47\xe0\x5a\xe1\xec\x28\xc1\xf4\x07\
+\x3b\xa7\x30\x94\x36\x3c\x3c\xd7\x85\xea\xa8\x7c\xdb\x35\x72\x0d\
+\xee\x0c\x55\xe6\x19\x88\x05\x30\x41\x71\x54\x77\x13\x9b\x5e\x83\
+\x6e\x64\xde\x62\x21\x0c\xbd\xb1\xb9\xa9\x1f\x51\xf4\x5c\xae\x3d\
+\xb6\x02\xcb\x70\x65\x69\xf3\xc0\x3f\xc8\xb4\x97\xec\xf6\x14\x9a\
+\x50\x7b\x66\xd0\x21\x20\x8f\xd1\x24\x0b\xc0\xa3\x02\xfd\x32\x62\
+\x85\xbb\x7d\x8d\x34\x73\xd0\xc3\xce\xd6\x8e\x8a\x05\x7a\x15\x98\
+\xb8\xce\xf6\x4f\xec\x75\x11\xf4\x47\xf4\xbf\x26\xd4\x1c\xc5\x47\
+\x70\xac\x79\x23\x01\x94\x9f\xa1\xf6\x37\xc6\xd5\xb3\x11\x8e\xcc\
+\xf2\x1e\x90\x9a\xa4\x10\xd2\x6d\xff\xc8\x7f\x46\x58\x87\x42\x28\
+\x12\x40\x19\xdb\xb3\xcc\xcd\x11\xeb\x80\x2e\x51\xbc\x1c\x40\x11\
+\xb3\xc3\x08\xbf\xca\xcf\x11\x9f\xf9\x51\xd6\x61\x28\x14\x8d\x1f\
+\x5b\x39\xc6\x02\x48\x72\xe7\x39\x6d\x79\x03\x22\x12\xe8\x93\xde\
+\x27\x16\x29\x3c\x4b\x08\x32\x43\xea\xe9\xdd\x78\xee\x00\xc4\xe7\
+\x17\xb3\x60\x99\xc1\x23\x06\xb7\x38\x3f\x06\x3c\x07\x56\x46\x68\
+\x7b\x22\x21\x94\x50\xaf\xcd\xb8\x70\xc9\xc0\x98\xbe\x49\x12\x4e\
+\xe7\x05\x6a\x09\xc0\x01\xfb\xe4\x2f\x12\x8b\xa4\x7d\x00\x6d\x43\
+\x6f\x64\xe0\x25\xf0\x21\x23\x8b\x13\x9c\xa0\x61\xf8\x47\x0c\xbf\
+\x13\xc4\x67\x80\x8e\x8b\x10\x0d\x7e\x8a\x43\xad\xcd\x2e\x63\xe8\
+\x00\x00\xf1\x8e\xd0\x53\x15\x42\x7a\xb3\x73\x80\x79\x1b\xcb\x25\
+\x34\xaa\x43\x28\x4d\xee\xeb\xfe\x05\x6c\x6a\xde\xa0\x08\x64\x8e\
+\xc1\xe5\xcb\xa6\x45\xf0\x00\xe6\x26\x31\xd3\x6d\xed\x45\xd2\x88\
+\x55\x9a\x68\x6e\xe3\x91\xc7\x35\x32\x1f\x00\x9a\xe7\x9f\x04\x77\
+\x0e\xec\x28\x12\xd9\x40\xad\xc3\xbc\x8f\xbd\x43\x44\x4b\xc0\x19\
+\xc8\x3b\x44\x91\x16\x9a\x81\x59\x43\xa3\xba\x26\x70\x01\x17\x5b\
+\x5e\xc7\x58\x4e\xcf\x29\x1a\x19\x2e\xe9\x58\x1e\x00\xff\x06\x89\
+\x4d\x73\x92\xd9\x49\xf2\x01\xc9\xff\x24\x84\xee\x78\xfc\x7b\x7a\
+\xaf\x09\x3e\x83\x9d\xf3\x49\x62\x01\x74\x7c\xdb\x32\x7a\x1e\xd1\
+\x0b\x05\x8e\x3c\xbd\x02\xec\x67\xb7\xb1\xa0\xb9\x43\x59\xcf\xe6\
+\x10\xd3\x73\xf7\x4f\x70\xed\x60\x8e\x82\x3c\xa3\x05\x02\x9a\x38\
+\xd9\x8d\xe6\x5c\xd3\x60\x2d\x61\x3c\x09\x87\xc5\xa1\xbb\xfa\x38\
+\xdb\x0e\x0c\x0a\xb6\x32\xd9\xe9\xf8\x08\x84\x57\xd7\x16\xec\xa1\
+\xc1\x8d\x05\xcf\xc8\x14\x56\xe0\x6f\x65\x5f\xfb\x6e\x30\xb6\x0e\
+\x2b\x14\xe6\x24\x93\xc0\xcb\x84\xe4\x3a\x3e\xa3\x38\x8b\x94\xe0\
+\x85\x6d\x0a\x5d\x5f\x89\xb2\xea\x6d\xdc\x15\xd0\xf2\x67\x30\xc9\
+\xdb\xbf\x0e\xf3\x09\x04\x42\x68\xdd\x46\x13\x24\x56\x4e\xb2\x1c\
+\xd0\x18\xf7\x2d\xa3\xd6\x68\x2c\x25\xd8\x46\xed\xa5\x19\x3f\xfb\
+\x6d\x6e\x64\x5f\x01\x38\x83\xc6\x32\x9c\x9c\x8d\xe1\x25\x5e\x03\
+\x9c\x28\xce\x99\x15\x06\x65\x77\x31\x2c\x53\x7c\xbc\x92\x1a\x85\
+\x9c\x59\xb5\x04\x70\x86\x2a\x97\x72\x41\x86\x15\x38\xee\x90\xbb\
+\xf7\x4f\xb7\xfd\x57\xd0\x38\xd3\x73\xfa\x63\x81\xac\x2a\x4e\xbe\
+\xc2\xf4\x18\xa5\x01\xad\xae\x2d\x74\x99\x83\xb3\x2e\xca\x53\x4e\
+\x78\x45\xf9\x80\xc4\x66\xbe\x6d\x13\xd4\x3c\x54\x84\xc9\x31\xc9\
+\xb9\xb7\xa7\xe8\x96\x5b\x85\x4e\x41\xa1\xd3\x38\x70\x3e\xab\x38\
+\x92\xea\x4f\xd3\x6d\x9e\x04\x66\x61\x2e\x4e\xd6\x26\xb0\x02\x53\
+\xd3\x01\x4f\x19\x88\x05\x70\x41\x9a\x34\x70\xde\x74\xc9\xba\x8d\
+\xd7\xed\x2b\x72\x4a\xd8\xee\xed\x15\xb0\x07\xf5\x4b\x55\x5c\xb2\
+\x38\x9e\xaf\x2f\xce\x8f\x5d\x81\x49\x8f\x23\x3c\xf3\xa1\x10\x28\
+\x01\xab\x76\xfa\x0e\xd4\x34\x5f\x54\xc0\x7d\xeb\x1b\xea\x44\x56\
+\x20\x36\x83\xf1\x95\xd3\x27\x68\x39\x1a\xc0\x32\x5a\x27\xd4\x0f\
+\xc6\x5d\x02\xbf\x45\xaf\xc7\x97\x0d\x9d\x97\xa4\xa0\x4e\xd1\xf8\
+\xfc\x3d\x2f\x84\x61\x89\x0f\x21\xad\x35\xa0\x81\xba\xd1\x56\x4d\
+\xcf\x25\xf0\x7b\xe0\x53\x06\x97\xa3\x89\x19\x4c\xca\x6b\x27\xf5\
+\x66\x3b\x85\x12\xc3\xdd\x67\xd9\x42\x0b\x0f\xc2\xb6\x86\xf7\x08\
+\x37\xa2\xf6\xa4\x0e\x6f\xcd\x7f\x1b\x56\x43\x1a\xdc\xa8\x46\x30\
+\x7d\x7e\x05\xf3\x52\x45\xaa\x68\x09\xed\x1c\xc8\xbb\xb6\x4e\x90\
+\xf7\xf3\xd6\x4a\x3e\x64\x8c\x1a\xa1\x43\x90\x20\x23\xeb\x4e\xe0\
+\xa4\xab\xf5\x80\x29\xa2\xf0\x8a\xba\x0f\xee\x11\xea\x25\xbe\x06\
+\xb3\xe3\x82\xcc\xa0\x29\xfb\xef\xd1\xcc\xcf\x0e\x79\xc5\xb8\x81\
+\xa6\xe0\xc3\x0b\x9e\xe4\x6e\x22\x03\x96\x00\xba\x40\x95\x4c\x49\
+\xec\xcc\x0b\xa8\x4c\x7a\xc9\x16\x85\xb4\xfb\xd0\xaa\xaa\xce\xb8\
+\x56\x5d\xee\x98\x20\x65\xc5\xdd\xaa\x90\xaf\xfa\x08\x14\x63\x7b\
+\x11\xba\x1d\x32\x1a\x5f\x2a\xa8\x6e\xcb\xd5\x28\x58\xb1\x40\x09\
+\xdc\x9e\x6e\x79\x79\x16\x28\xa0\xa7\xa8\x46\xee\x01\xff\x0d\x98\
+\x0f\x24\x3f\x77\xe0\x05\x94\x84\xbf\xa1\x0b\x7c\x13\x48\xbc\xbf\
+\x55\x94\xd1\xa7\x30\x27\x51\xbf\x04\x39\xc6\xfb\xd0\x68\x91\xb9\
+\xbe\x93\x8a\xd2\xe3\x76\x40\xee\x1a\xcc\x66\xe0\x25\x69\x2e\xc0\
+\xed\xa2\x75\x36\xc9\xd6\x17\x54\xf1\x54\xc8\x66\x8d\x22\x1c\x4e\
+\x54\x80\xec\xa3\xb5\x3f\xf7\xc6\x08\x97\x0d\x68\xdd\x46\x9d\x9b\
+\x25\xe0\xb9\xee\xb0\x9c\x9d\x9f\x26\x5d\xd5\xe3\x26\xba\xea\x65\
+\x54\x79\x76\xd0\xda\xe6\x25\x65\x1e\xd0\xcb\xd8\x8c\x33\x14\xed\
+\x00\x77\x9a\x0d\x57\xdd\x1e\x5a\xc3\xbf\x81\x46\x66\x9f\xa3\x42\
+\x78\x00\xe7\x27\x50\x3d\x52\x22\x0b\xcd\x5b\x5f\xe7\x68\x24\x15\
+\x9b\x49\x1b\x80\x83\x0b\xbf\xbb\xaa\xc9\x0b\x14\x21\x1c\x7b\x66\
+\xbc\xa9\x33\x1d\xcb\x65\xc5\x2f\x4b\x1e\x6f\x12\x23\x7c\x00\x3c\
+\x04\x0e\xc0\xbd\x0c\xc6\x97\xe3\x7b\x46\xeb\x08\xc4\xcc\x74\x3d\
+\x21\x0f\xd1\x82\x45\xd0\x2b\xef\x65\xdf\xbe\x1f\xb4\x1b\x20\x62\
+\xf7\x8b\x83\xea\xa4\x67\xb0\x53\xe0\xc5\xad\x8f\xc0\x7d\x05\x4c\
+\xc1\xd1\xf7\xd9\xeb\x39\x71\x9e\xb6\xf8\xcc\x8f\x93\x42\x93\x3b\
+\x03\xe7\x27\x53\x2e\x5f\xcf\x5a\x07\xf0\x66\xe8\x7d\xec\x44\x49\
+\x32\xe6\xff\x50\x2e\x0f\xba\x00\xf2\xf3\xbc\xf9\x95\xa6\x5a\x8a\
+\x5c\xb9\xfc\x1d\xcc\xb2\x5e\x1b\xf9\xc7\xd8\x2f\x4c\xac\x92\x7b\
+\x61\x42\x1c\xfa\x82\x85\xf1\x02\x43\x3a\x66\x7b\xcc\x89\x43\x9c\
+\x05\xcf\x88\x43\xdf\x18\xf9\xa5\xd1\x57\xce\xfa\x2b\xa9\x10\xaa\
+\x8c\xff\xc2\x44\x8a\xe8\x4f\x05\x4e\xc8\x46\x5e\x08\x00\xf2\x1e\
+\xfa\xca\x4a\xee\xa5\x04\x5e\xeb\x95\x99\xb4\xad\xe4\x9d\x9f\xb7\
+\x40\xde\x31\x9c\x9f\xb2\xa5\xe5\x3d\xf3\x7f\xc8\xe3\x2b\x9e\x3c\
+\x91\x5a\x59\xa5\x16\x7b\x80\xe0\x77\x82\x71\x7d\x2d\x1b\x7e\x6b\
+\xde\xd3\x4f\x2b\x74\x9e\x2a\x8c\x7e\x69\x6a\xca\x8f\x09\x04\x2f\
+\x2b\x0c\x5e\xbe\x2a\x7a\x39\x6a\x1e\x33\x66\x91\x2d\xcf\x43\x29\
+\xbf\x9b\x15\x62\x44\x86\x93\x23\x9b\xa8\xb6\xf5\x35\xba\xb4\xfc\
+\xef\x1a\x6a\xe6\x1c\x7a\x01\x72\xc1\xe0\xb5\xb9\x19\x40\xa0\x37\
+\x0d\xe5\xc4\x29\x4a\x4a\x64\x7b\xc1\xff\xe4\xf6\x26\x79\x6d\x2e\
+\x28\x97\x4d\xe9\xeb\xfa\x71\x0e\x35\x61\xa7\xfe\xf7\x24\xaa\xc4\
+\x7d\x01\x06\x1d\x54\xa1\xce\x06\x78\xf6\x06\x4e\x93\xed\xc0\x8d\
+\xb8\xa2\x8e\x41\x26\x30\x4a\xcd\x3c\x9e\x3a\x79\x2d\x1b\xbf\x38\
+\x59\x42\xaf\xca\x92\x23\x54\x65\xe0\x5f\xe0\x99\x38\x24\x6b\xf3\
+\xac\x17\x27\x85\x41\xe2\x33\x06\xa3\xb4\x36\x7d\xac\x88\xc7\x37\
+\xf7\xd5\x59\xab\xe1\x0d\x80\x0c\xcf\x6f\x1a\xf3\x09\xa8\x10\xfe\
+\x07\xb4\x0a\xfd\x7e\xcf\x22\x5b\xc2\x00\x00\x00\x00\x49\x45\x4e\
+\x44\xae\x42\x60\x82\
+\x00\x00\x01\xb6\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x5a\x00\x00\x00\x3c\x08\x02\x00\x00\x00\x69\x67\x3a\x12\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x01\x68\x49\x44\x41\x54\x68\x81\xed\
+\xd8\xb1\x6d\xc2\x40\x14\x87\xf1\x23\xb2\xe8\x13\x0a\x0f\x40\x2c\
+\x79\x03\x24\xc4\x02\x34\x59\x20\x83\xb2\x01\x33\x20\xe1\x01\x92\
+\x02\x67\x01\x8a\x14\x27\x2c\x3e\x5b\xc0\x21\x71\xef\x5d\xf1\xff\
+\x2a\x17\x9c\x64\xfd\x74\xf6\x3d\x3c\xfb\x79\x5f\x06\x75\xe9\xcd\
+\xfb\x06\xca\x4a\x1c\x48\x1c\x48\x1c\x48\x1c\x48\x1c\x48\x1c\x48\
+\x1c\x48\x1c\x48\x1c\x48\x1c\x48\x1c\x48\x1c\x48\x1c\x48\x1c\x48\
+\x1c\x48\x1c\x48\x1c\x48\x1c\xc8\x88\x63\xbe\x59\xd5\x7d\x57\xb5\
+\x4d\xfa\x92\xaa\x6d\xea\xbe\x9b\x6f\x56\xf9\xee\x6a\xda\xcc\xe6\
+\xd3\x71\xdd\x77\xf1\xe2\xb4\xde\x9e\x0f\xc7\x87\xbf\xaf\xda\x66\
+\xb1\xdf\xc5\xeb\xdf\x8f\xcf\x8c\x77\xc6\x8c\x76\xc7\x69\xbd\x8d\
+\x17\x8b\xfd\xee\xe1\x1e\xb9\xb6\x18\x16\xda\x64\xc4\x71\x3e\x1c\
+\x13\x45\x46\x16\x29\x5b\xe9\x85\xd9\xbd\x4a\x53\x44\x7c\x2d\x82\
+\xf1\xc9\x72\x5f\xc4\xdd\x22\xd8\x1f\xb4\xb7\x44\x4a\xb0\x08\x66\
+\x27\xcb\xa8\xe9\xcb\xb2\x04\x8b\xe0\xc5\x11\x28\x32\xe4\x6b\x11\
+\x1c\xa7\xd2\xeb\xa7\x26\xe6\x6e\x11\x34\xa4\x8f\x72\xe3\x98\x3e\
+\x2c\x29\x13\x5a\xee\x7c\x38\x46\xaf\xd2\xa7\x66\xd6\xac\x39\x70\
+\x4c\xcf\xd4\xf4\x99\x35\x77\xd6\x1c\xb7\xe6\x8b\x42\x44\x4c\x39\
+\xee\xcf\x5a\x25\x88\xd8\x71\xa4\xcc\x9d\xee\x22\x46\x1c\xe9\x33\
+\xb8\xaf\x88\x3e\xff\x20\xa3\xdd\xf1\xf7\xf5\x1d\x9e\x99\x3b\x87\
+\x3d\x12\x17\x9a\xe5\xf6\x9f\xa5\xcc\x34\xa4\x23\x71\x20\x71\x20\
+\x71\x20\x71\x20\x71\x20\x71\x20\x71\x20\x71\x20\x71\x20\x71\x20\
+\x71\x20\x71\x20\x71\x20\x71\x20\x71\x20\x71\x20\x71\x20\x71\xa0\
+\x7f\xf3\xfa\xbe\x23\xaa\xa7\x3c\xd5\x00\x00\x00\x00\x49\x45\x4e\
+\x44\xae\x42\x60\x82\
+\x00\x00\x0c\xd6\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x0c\x88\x49\x44\x41\x54\x78\x9c\xe5\
+\x9b\x5b\x6f\x5b\xc7\x11\x80\xbf\x25\x45\x8a\x94\x28\x89\x92\xad\
+\xbb\x64\xc9\x4e\x9a\xc2\x41\xe0\x26\x45\xd1\xa0\x48\x0a\xf4\xa9\
+\x7d\xe9\x7b\x81\x16\xfd\xa3\x7d\x2a\x50\xb4\x0f\x41\x90\x36\x4e\
+\x52\x20\x69\x92\xc6\x96\x6c\xc9\x37\x5d\x48\x49\xa4\x2e\xe4\xf4\
+\x61\xf6\x1c\xee\xd9\x33\x87\xa4\xe4\xf4\xc9\x03\x10\x24\x77\xf7\
+\xcc\xce\xcc\xee\xce\x6d\xe7\x00\xb2\x05\xe2\x78\xe3\x40\x9c\xf2\
+\x9e\xfe\x78\x93\x84\x90\xe3\xf9\x4d\x12\x42\x96\x57\x97\xed\xe0\
+\x0e\xf0\x18\x9c\x14\x3c\xdc\x00\x6e\x19\x1d\x25\x60\x32\x8b\x2f\
+\x6d\xaf\x0d\xa1\x66\x12\x10\xe0\x62\xc8\x98\x73\xa0\x67\xb4\x77\
+\x81\xbe\xd1\xfe\x12\xdc\xa9\x8d\x2a\xcf\xa3\x1b\x35\x00\x64\x1b\
+\xb8\xed\x09\x3d\x01\x5e\xf8\x89\xa7\x80\x39\xdf\x2e\xc0\x59\xd0\
+\x3e\xeb\xdb\xfa\xbe\x1d\x8f\xa3\x0a\x34\x81\x8a\xef\x3f\xf7\x34\
+\x54\xfd\xf7\x25\x70\x04\x97\xa7\x50\x39\xf2\x6d\x53\xa8\x20\x9d\
+\x9f\xff\xc4\xff\x9f\xf2\x6d\x0e\x68\x01\xa7\xbe\x7d\x29\xe8\x7b\
+\x01\xee\x71\x31\x6f\x85\x52\x92\x2d\x90\x09\x90\x8f\x40\x56\x8d\
+\x31\x6b\x20\x0b\x46\xfb\x06\xc8\xbc\xff\x3d\x05\x72\x0f\xe4\xae\
+\xff\xcc\x80\xdc\x01\x19\xb2\x23\xa4\xee\xc7\x2c\xa8\xe0\xe5\xae\
+\xc7\x31\xe1\xfb\xe7\x40\x36\xf3\x47\x55\x9a\x05\xed\x1b\x20\xbf\
+\x06\x29\x5f\xf3\x88\xcb\x04\xc8\x9f\xf5\xc1\x5c\xdf\x36\x48\xc5\
+\x68\x7f\xdb\x3f\xb7\xe2\x27\x5b\x8e\xf0\xdd\x1b\x73\x72\x3c\xe3\
+\x25\xff\xdb\x79\x46\xb6\xa0\x75\x4b\xdb\xe5\x2d\x83\xd9\x32\xc8\
+\x4f\x8c\xf6\x09\x90\x3f\xda\xbc\x14\x13\xf0\x91\x7f\x30\x92\x9a\
+\xac\x17\x30\x7f\xc7\x7f\xb6\xed\x15\x96\xed\x6b\x4c\x4e\x60\xa2\
+\xe2\xf6\x59\x15\x4e\x7b\x49\xe7\xcb\xf5\x97\xb3\xcf\xa5\xbb\xb9\
+\x02\xf2\xab\x71\x27\xdf\x1e\x6c\xfb\x50\x63\xca\x14\xc8\x6d\x63\
+\xfc\x2a\xc8\x07\xba\x7d\x4d\x7c\xf3\x5e\x79\x5e\x13\x64\x56\xb7\
+\xbc\xd9\x37\x07\xf2\x00\x64\xd1\xe8\x6b\xfa\x67\x23\xcb\x26\x9b\
+\xfa\xc9\x82\x71\x26\xe4\x17\xe0\x3e\x0d\xfe\x27\xca\xa3\x07\xec\
+\x01\x21\xa3\xab\x70\x79\x0b\x2a\x5f\x0e\xe1\x64\x0d\x78\x5a\xd0\
+\x97\xda\xe1\x1b\x3c\x0b\xf0\x00\xba\x4f\xa0\xf6\x2a\x68\xeb\x28\
+\x5d\x94\xc9\x29\xbc\x98\x37\x98\x30\x90\xc6\xc4\x34\x50\xe6\x1f\
+\xa0\x5a\xbd\xed\xc7\x6c\x01\x2f\x54\xa1\x0f\x05\xf1\xc4\x2c\xf9\
+\xff\x89\xe9\x4a\x34\x78\xd8\x46\xd0\xf6\xc2\xa0\x25\x86\x17\x20\
+\x82\x32\xbc\xe7\x9f\x5d\x02\x7e\x06\x7c\x0e\xcc\xa0\x16\x22\x81\
+\x9c\xd9\x8c\x04\x20\x0d\xd4\xcc\x24\xff\x37\x80\x36\xb8\x5d\x3f\
+\x51\x05\x35\x5d\x9b\xc0\xd7\xe0\xae\xf4\x7c\xb9\x13\x72\x20\xce\
+\x8f\x9b\x42\x7d\x81\x6f\x47\x98\x9f\xf8\xd9\x45\x60\x1a\x35\xa9\
+\x7b\xf6\xb3\xd2\x86\xfa\x0b\xd4\x9f\x58\x01\x7e\x00\x16\x80\xcf\
+\x80\xe7\x80\xb7\x3c\xec\xf8\xe7\x7b\xaa\xdb\xdc\x55\xd1\xc4\x5b\
+\x03\xf3\x26\x5b\x59\xcd\x29\x1b\x5e\x0f\x7c\x1c\x29\x46\xcb\x4c\
+\x2e\xa1\xa6\x72\x46\x3f\x37\x05\x59\xf5\xca\x78\x3d\x6b\x55\xd2\
+\xfe\x99\x81\x7e\x91\x09\x90\xdf\x78\x2b\x11\xb6\x07\x8a\x51\xee\
+\xaa\x8e\x18\x40\xc9\x98\xb5\xaf\x13\xb2\x0b\xae\x17\x8d\x5d\x03\
+\xfe\x0e\xdc\x09\x84\x10\xac\xcc\x61\x53\x19\xe7\x10\xdc\x53\xdf\
+\x37\xe6\xaa\x9b\xe0\x9f\x75\x4f\x80\x03\xc5\x7d\xd8\xcc\xf7\x8b\
+\x03\xd6\x81\xbf\x01\xf7\xb2\x73\xba\x9e\xf2\x22\xeb\x18\x47\xc0\
+\x12\xc0\x14\x70\x16\x31\x0f\x7a\xe6\xbf\xf3\x5b\xe9\x31\x59\x21\
+\xa0\x1a\xb9\xd9\x57\xc6\xdd\xe5\xf8\x3c\x8e\x0b\xee\x52\x71\x37\
+\xfb\xd1\x6e\x08\x3d\xbc\x1e\xf0\x04\x3d\x7a\xe1\x90\x1e\xea\x29\
+\x4e\xc7\x58\x2d\x25\x38\xe7\x57\x2f\x00\xd9\x46\x95\x4c\x29\x30\
+\x77\x07\xc0\x7d\xe0\xd2\x9b\xab\x57\xe8\xee\x09\x4d\x9e\x9f\xd0\
+\xdc\x04\x25\xe8\xfa\xe3\x56\x3b\xc4\xf6\xf7\xa7\x81\x2e\x48\x78\
+\x66\xfb\x3a\x56\xee\x03\x47\xe8\xca\x7f\xad\x63\x05\xa0\x03\x9d\
+\x13\xa8\x2f\x92\xd1\x67\xee\x08\xe4\xa7\xf1\x04\x63\x58\x01\x79\
+\x0b\x2e\x2a\x50\x9d\x46\x15\xd3\x29\x83\xad\xbd\x0b\xfc\x0e\xf8\
+\x4b\x01\x03\x01\x74\xe6\xa1\x9e\x04\x3f\x3e\x4e\xa8\x1d\xf9\xce\
+\x79\xd4\x52\xf8\x1d\xd5\x39\x87\xfa\xe1\x10\x64\x5d\xd4\x3c\xfe\
+\x06\xf8\x24\xa0\xd9\x2b\xcf\x7a\x0d\xb8\x0d\x72\x1e\x2d\x66\x6e\
+\x25\x62\x01\xc4\xd1\xe1\x5d\x60\x1a\x26\x1f\xaa\x12\x74\xfb\xd9\
+\xe1\xb2\x0e\xfc\x03\x0d\x70\x8c\x20\x43\x80\xee\x6d\xa8\x4d\x40\
+\xfd\x25\xb8\x4e\x01\x43\x47\xd9\xbf\x52\x07\x16\xe0\xa2\x06\xd5\
+\x93\xbc\xd6\x4e\x7d\x93\xbf\x02\x6b\xe0\xf6\x82\xce\x36\xc8\x09\
+\xba\x63\xdf\xf6\x9e\x6b\x42\x5b\x9f\xe8\xd8\xc7\x3a\xa0\x0a\x9c\
+\xfb\x09\xee\xa1\xab\xf2\x85\x4d\xb3\x2c\xa1\xdb\xbe\x87\xad\x13\
+\xa6\x81\x55\xa8\xb5\x55\x89\x15\x32\x6f\x80\xeb\xe8\x33\xd5\xb6\
+\x32\x18\x1e\xab\x30\xaa\xa3\x87\xfa\x02\x2b\x05\x88\xbe\xf1\x63\
+\xee\xf9\xe7\x3a\x64\x1d\xb9\x22\x2b\xc0\x06\xf0\x0c\xf5\x01\x8c\
+\x03\x7c\xd8\x04\xba\xe0\xba\x9e\xe0\x48\x31\x1e\xcd\x43\xbb\x86\
+\xae\xc2\xf9\x58\x3c\xdb\x70\x01\x3c\x85\xf6\x24\x1c\x2f\x60\x87\
+\xb4\x5d\xe0\x4c\xe7\x8c\xc1\x9d\xa1\x8b\xfa\x83\xe7\x29\xc7\x8b\
+\x25\x80\x06\xea\x3d\x2d\xe6\xb7\x7c\x02\xcd\x29\x70\xad\x6c\x5b\
+\x22\x84\xcb\xf7\x61\xae\x07\xb3\xaf\xcc\x47\x6f\x04\xb3\xaf\x60\
+\xf6\x52\x71\x5b\x47\xcd\xb5\x60\xae\x20\x16\x61\x07\x35\xdf\x2d\
+\xd4\xc2\x65\xc0\x12\xc0\x34\xaa\x3d\x0b\x94\x9a\x2c\xa3\x6e\xaa\
+\x01\xc7\x4d\xa8\x7c\x0f\xcc\x33\x7e\xec\x3d\x06\x88\x03\x16\xa0\
+\xf2\x9d\xce\x61\xc2\x73\xdb\x59\x72\x97\x40\x19\xdc\x31\xba\xb8\
+\x19\xb0\x04\x20\xa8\x69\xd9\x29\x20\x64\xc2\xb6\xf3\x32\x05\xa5\
+\x64\x22\x7f\x1c\xac\x60\xeb\xda\x10\x6e\xfb\x16\x94\x4a\x5e\xbf\
+\xc4\xc3\xae\x94\x36\xb1\x78\x3a\xd4\x23\x34\xda\x0a\x94\x07\x83\
+\x4c\xbf\x7d\x13\xd5\xb2\xe1\x2a\xcc\x82\x74\x81\x15\x98\xd9\x0f\
+\xfa\x5a\xc0\xbb\xc0\x13\xd2\x8c\x4e\x06\x92\xd4\x19\xa8\x4f\x61\
+\xe5\x05\xe7\xd0\x40\xe7\x07\xfd\x2d\xa0\x3b\x73\x03\xe4\x19\x03\
+\x3f\x23\xc1\x7f\xa6\x7d\x1c\x64\xd1\xb8\x63\xef\x0e\x27\x81\x59\
+\x0a\x31\x61\x35\x72\x49\x48\x99\x47\x83\x8d\x65\x4f\x64\x84\x9c\
+\x1e\x74\x66\xa1\x7e\x00\xc4\x41\xc6\x23\x4f\xd0\xd7\xc1\xe4\x2b\
+\x40\x1f\x3a\x67\x50\xdf\x05\x1c\x74\x6f\x41\x2d\xc9\x2f\x3e\xf3\
+\xdf\xce\xcf\xf9\x05\x9a\x2b\x0c\xe1\x15\x74\x66\xa0\x9e\x08\x2d\
+\x9c\xb7\x89\x2a\xbe\xbe\xee\x86\x54\x57\x25\x79\xcb\x4c\xc2\xc6\
+\x5a\x99\x45\xe0\x4b\x90\xaa\x27\xe0\x25\xb8\x43\x34\xd3\x73\x96\
+\x8f\xfc\xa4\x01\xf5\x32\xb8\xe7\x79\x54\x82\x67\x7e\x01\x38\x46\
+\x57\xec\x1b\x63\x77\xb5\xfd\xf8\x32\xba\xe2\x07\x9e\x8e\xff\x68\
+\x5f\x2e\x7a\x3b\xf1\xa6\xcf\x67\x7f\x43\x9a\x64\x1f\x15\x98\x17\
+\x9a\x6c\x02\x4f\xe0\xa4\x03\x8d\x29\xb2\xe1\xb1\xa9\x03\x4a\xa8\
+\x04\x6f\x83\xdb\x09\xec\xf7\x2d\x6c\xe5\x37\x0d\x47\x05\x69\x68\
+\xa5\x00\xcd\xf4\x6e\x01\x4f\x87\x87\xc4\xa9\x2f\x7f\x1f\x0d\x67\
+\x87\x05\x52\x27\x18\xbe\xbd\x5f\x08\x9f\xb9\x72\x27\xa8\xb7\xba\
+\x01\x8d\x03\xf4\x48\x65\xa0\x48\x09\x2e\xe5\xe3\x01\x28\x20\xbe\
+\x01\xf3\x47\x46\x7b\x02\x65\x25\xb4\xf2\x90\x9c\xb3\x94\x9b\x3a\
+\x51\x78\x9f\x61\xdf\x3f\x84\xb4\x14\x08\x20\x37\x4e\x7c\x6a\x7c\
+\xcd\xea\xb5\x04\xb0\x00\x58\xf6\xdf\xba\x84\x18\x07\x56\x18\x24\
+\x34\x0c\x8f\x31\x81\x9c\x93\xf3\x12\x2e\x8c\xd4\x7b\x06\x8a\x84\
+\x69\xd1\xfa\x0a\x43\x60\x05\x47\xe0\x5a\xe1\xec\x28\xc1\xf4\x07\
+\x3b\xa7\x30\x94\x36\x3c\x3c\xd7\x85\xea\xa8\x7c\xdb\x35\x72\x0d\
+\xee\x0c\x55\xe6\x19\x88\x05\x30\x41\x71\x54\x77\x13\x9b\x5e\x83\
+\x6e\x64\xde\x62\x21\x0c\xbd\xb1\xb9\xa9\x1f\x51\xf4\x5c\xae\x3d\
+\xb6\x02\xcb\x70\x65\x69\xf3\xc0\x3f\xc8\xb4\x97\xec\xf6\x14\x9a\
+\x50\x7b\x66\xd0\x21\x20\x8f\xd1\x24\x0b\xc0\xa3\x02\xfd\x32\x62\
+\x85\xbb\x7d\x8d\x34\x73\xd0\xc3\xce\xd6\x8e\x8a\x05\x7a\x15\x98\
+\xb8\xce\xf6\x4f\xec\x75\x11\xf4\x47\xf4\xbf\x26\xd4\x1c\xc5\x47\
+\x70\xac\x79\x23\x01\x94\x9f\xa1\xf6\x37\xc6\xd5\xb3\x11\x8e\xcc\
+\xf2\x1e\x90\x9a\xa4\x10\xd2\x6d\xff\xc8\x7f\x46\x58\x87\x42\x28\
+\x12\x40\x19\xdb\xb3\xcc\xcd\x11\xeb\x80\x2e\x51\xbc\x1c\x40\x11\
+\xb3\xc3\x08\xbf\xca\xcf\x11\x9f\xf9\x51\xd6\x61\x28\x14\x8d\x1f\
+\x5b\x39\xc6\x02\x48\x72\xe7\x39\x6d\x79\x03\x22\x12\xe8\x93\xde\
+\x27\x16\x29\x3c\x4b\x08\x32\x43\xea\xe9\xdd\x78\xee\x00\xc4\xe7\
+\x17\xb3\x60\x99\xc1\x23\x06\xb7\x38\x3f\x06\x3c\x07\x56\x46\x68\
+\x7b\x22\x21\x94\x50\xaf\xcd\xb8\x70\xc9\xc0\x98\xbe\x49\x12\x4e\
+\xe7\x05\x6a\x09\xc0\x01\xfb\xe4\x2f\x12\x8b\xa4\x7d\x00\x6d\x43\
+\x6f\x64\xe0\x25\xf0\x21\x23\x8b\x13\x9c\xa0\x61\xf8\x47\x0c\xbf\
+\x13\xc4\x67\x80\x8e\x8b\x10\x0d\x7e\x8a\x43\xad\xcd\x2e\x63\xe8\
+\x00\x00\xf1\x8e\xd0\x53\x15\x42\x7a\xb3\x73\x80\x79\x1b\xcb\x25\
+\x34\xaa\x43\x28\x4d\xee\xeb\xfe\x05\x6c\x6a\xde\xa0\x08\x64\x8e\
+\xc1\xe5\xcb\xa6\x45\xf0\x00\xe6\x26\x31\xd3\x6d\xed\x45\xd2\x88\
+\x55\x9a\x68\x6e\xe3\x91\xc7\x35\x32\x1f\x00\x9a\xe7\x9f\x04\x77\
+\x0e\xec\x28\x12\xd9\x40\xad\xc3\xbc\x8f\xbd\x43\x44\x4b\xc0\x19\
+\xc8\x3b\x44\x91\x16\x9a\x81\x59\x43\xa3\xba\x26\x70\x01\x17\x5b\
+\x5e\xc7\x58\x4e\xcf\x29\x1a\x19\x2e\xe9\x58\x1e\x00\xff\x06\x89\
+\x4d\x73\x92\xd9\x49\xf2\x01\xc9\xff\x24\x84\xee\x78\xfc\x7b\x7a\
+\xaf\x09\x3e\x83\x9d\xf3\x49\x62\x01\x74\x7c\xdb\x32\x7a\x1e\xd1\
+\x0b\x05\x8e\x3c\xbd\x02\xec\x67\xb7\xb1\xa0\xb9\x43\x59\xcf\xe6\
+\x10\xd3\x73\xf7\x4f\x70\xed\x60\x8e\x82\x3c\xa3\x05\x02\x9a\x38\
+\xd9\x8d\xe6\x5c\xd3\x60\x2d\x61\x3c\x09\x87\xc5\xa1\xbb\xfa\x38\
+\xdb\x0e\x0c\x0a\xb6\x32\xd9\xe9\xf8\x08\x84\x57\xd7\x16\xec\xa1\
+\xc1\x8d\x05\xcf\xc8\x14\x56\xe0\x6f\x65\x5f\xfb\x6e\x30\xb6\x0e\
+\x2b\x14\xe6\x24\x93\xc0\xcb\x84\xe4\x3a\x3e\xa3\x38\x8b\x94\xe0\
+\x85\x6d\x0a\x5d\x5f\x89\xb2\xea\x6d\xdc\x15\xd0\xf2\x67\x30\xc9\
+\xdb\xbf\x0e\xf3\x09\x04\x42\x68\xdd\x46\x13\x24\x56\x4e\xb2\x1c\
+\xd0\x18\xf7\x2d\xa3\xd6\x68\x2c\x25\xd8\x46\xed\xa5\x19\x3f\xfb\
+\x6d\x6e\x64\x5f\x01\x38\x83\xc6\x32\x9c\x9c\x8d\xe1\x25\x5e\x03\
+\x9c\x28\xce\x99\x15\x06\x65\x77\x31\x2c\x53\x7c\xbc\x92\x1a\x85\
+\x9c\x59\xb5\x04\x70\x86\x2a\x97\x72\x41\x86\x15\x38\xee\x90\xbb\
+\xf7\x4f\xb7\xfd\x57\xd0\x38\xd3\x73\xfa\x63\x81\xac\x2a\x4e\xbe\
+\xc2\xf4\x18\xa5\x01\xad\xae\x2d\x74\x99\x83\xb3\x2e\xca\x53\x4e\
+\x78\x45\xf9\x80\xc4\x66\xbe\x6d\x13\xd4\x3c\x54\x84\xc9\x31\xc9\
+\xb9\xb7\xa7\xe8\x96\x5b\x85\x4e\x41\xa1\xd3\x38\x70\x3e\xab\x38\
+\x92\xea\x4f\xd3\x6d\x9e\x04\x66\x61\x2e\x4e\xd6\x26\xb0\x02\x53\
+\xd3\x01\x4f\x19\x88\x05\x70\x41\x9a\x34\x70\xde\x74\xc9\xba\x8d\
+\xd7\xed\x2b\x72\x4a\xd8\xee\xed\x15\xb0\x07\xf5\x4b\x55\x5c\xb2\
+\x38\x9e\xaf\x2f\xce\x8f\x5d\x81\x49\x8f\x23\x3c\xf3\xa1\x10\x28\
+\x01\xab\x76\xfa\x0e\xd4\x34\x5f\x54\xc0\x7d\xeb\x1b\xea\x44\x56\
+\x20\x36\x83\xf1\x95\xd3\x27\x68\x39\x1a\xc0\x32\x5a\x27\xd4\x0f\
+\xc6\x5d\x02\xbf\x45\xaf\xc7\x97\x0d\x9d\x97\xa4\xa0\x4e\xd1\xf8\
+\xfc\x3d\x2f\x84\x61\x89\x0f\x21\xad\x35\xa0\x81\xba\xd1\x56\x4d\
+\xcf\x25\xf0\x7b\xe0\x53\x06\x97\xa3\x89\x19\x4c\xca\x6b\x27\xf5\
+\x66\x3b\x85\x12\xc3\xdd\x67\xd9\x42\x0b\x0f\xc2\xb6\x86\xf7\x08\
+\x37\xa2\xf6\xa4\x0e\x6f\xcd\x7f\x1b\x56\x43\x1a\xdc\xa8\x46\x30\
+\x7d\x7e\x05\xf3\x52\x45\xaa\x68\x09\xed\x1c\xc8\xbb\xb6\x4e\x90\
+\xf7\xf3\xd6\x4a\x3e\x64\x8c\x1a\xa1\x43\x90\x20\x23\xeb\x4e\xe0\
+\xa4\xab\xf5\x80\x29\xa2\xf0\x8a\xba\x0f\xee\x11\xea\x25\xbe\x06\
+\xb3\xe3\x82\xcc\xa0\x29\xfb\xef\xd1\xcc\xcf\x0e\x79\xc5\xb8\x81\
+\xa6\xe0\xc3\x0b\x9e\xe4\x6e\x22\x03\x96\x00\xba\x40\x95\x4c\x49\
+\xec\xcc\x0b\xa8\x4c\x7a\xc9\x16\x85\xb4\xfb\xd0\xaa\xaa\xce\xb8\
+\x56\x5d\xee\x98\x20\x65\xc5\xdd\xaa\x90\xaf\xfa\x08\x14\x63\x7b\
+\x11\xba\x1d\x32\x1a\x5f\x2a\xa8\x6e\xcb\xd5\x28\x58\xb1\x40\x09\
+\xdc\x9e\x6e\x79\x79\x16\x28\xa0\xa7\xa8\x46\xee\x01\xff\x0d\x98\
+\x0f\x24\x3f\x77\xe0\x05\x94\x84\xbf\xa1\x0b\x7c\x13\x48\xbc\xbf\
+\x55\x94\xd1\xa7\x30\x27\x51\xbf\x04\x39\xc6\xfb\xd0\x68\x91\xb9\
+\xbe\x93\x8a\xd2\xe3\x76\x40\xee\x1a\xcc\x66\xe0\x25\x69\x2e\xc0\
+\xed\xa2\x75\x36\xc9\xd6\x17\x54\xf1\x54\xc8\x66\x8d\x22\x1c\x4e\
+\x54\x80\xec\xa3\xb5\x3f\xf7\xc6\x08\x97\x0d\x68\xdd\x46\x9d\x9b\
+\x25\xe0\xb9\xee\xb0\x9c\x9d\x9f\x26\x5d\xd5\xe3\x26\xba\xea\x65\
+\x54\x79\x76\xd0\xda\xe6\x25\x65\x1e\xd0\xcb\xd8\x8c\x33\x14\xed\
+\x00\x77\x9a\x0d\x57\xdd\x1e\x5a\xc3\xbf\x81\x46\x66\x9f\xa3\x42\
+\x78\x00\xe7\x27\x50\x3d\x52\x22\x0b\xcd\x5b\x5f\xe7\x68\x24\x15\
+\x9b\x49\x1b\x80\x83\x0b\xbf\xbb\xaa\xc9\x0b\x14\x21\x1c\x7b\x66\
+\xbc\xa9\x33\x1d\xcb\x65\xc5\x2f\x4b\x1e\x6f\x12\x23\x7c\x00\x3c\
+\x04\x0e\xc0\xbd\x0c\xc6\x97\xe3\x7b\x46\xeb\x08\xc4\xcc\x74\x3d\
+\x21\x0f\xd1\x82\x45\xd0\x2b\xef\x65\xdf\xbe\x1f\xb4\x1b\x20\x62\
+\xf7\x8b\x83\xea\xa4\x67\xb0\x53\xe0\xc5\xad\x8f\xc0\x7d\x05\x4c\
+\xc1\xd1\xf7\xd9\xeb\x39\x71\x9e\xb6\xf8\xcc\x8f\x93\x42\x93\x3b\
+\x03\xe7\x27\x53\x2e\x5f\xcf\x5a\x07\xf0\x66\xe8\x7d\xec\x44\x49\
+\x32\xe6\xff\x50\x2e\x0f\xba\x00\xf2\xf3\xbc\xf9\x95\xa6\x5a\x8a\
+\x5c\xb9\xfc\x1d\xcc\xb2\x5e\x1b\xf9\xc7\xd8\x2f\x4c\xac\x92\x7b\
+\x61\x42\x1c\xfa\x82\x85\xf1\x02\x43\x3a\x66\x7b\xcc\x89\x43\x9c\
+\x05\xcf\x88\x43\xdf\x18\xf9\xa5\xd1\x57\xce\xfa\x2b\xa9\x10\xaa\
+\x8c\xff\xc2\x44\x8a\xe8\x4f\x05\x4e\xc8\x46\x5e\x08\x00\xf2\x1e\
+\xfa\xca\x4a\xee\xa5\x04\x5e\xeb\x95\x99\xb4\xad\xe4\x9d\x9f\xb7\
+\x40\xde\x31\x9c\x9f\xb2\xa5\xe5\x3d\xf3\x7f\xc8\xe3\x2b\x9e\x3c\
+\x91\x5a\x59\xa5\x16\x7b\x80\xe0\x77\x82\x71\x7d\x2d\x1b\x7e\x6b\
+\xde\xd3\x4f\x2b\x74\x9e\x2a\x8c\x7e\x69\x6a\xca\x8f\x09\x04\x2f\
+\x2b\x0c\x5e\xbe\x2a\x7a\x39\x6a\x1e\x33\x66\x91\x2d\xcf\x43\x29\
+\xbf\x9b\x15\x62\x44\x86\x93\x23\x9b\xa8\xb6\xf5\x35\xba\xb4\xfc\
+\xef\x1a\x6a\xe6\x1c\x7a\x01\x72\xc1\xe0\xb5\xb9\x19\x40\xa0\x37\
+\x0d\xe5\xc4\x29\x4a\x4a\x64\x7b\xc1\xff\xe4\xf6\x26\x79\x6d\x2e\
+\x28\x97\x4d\xe9\xeb\xfa\x71\x0e\x35\x61\xa7\xfe\xf7\x24\xaa\xc4\
+\x7d\x01\x06\x1d\x54\xa1\xce\x06\x78\xf6\x06\x4e\x93\xed\xc0\x8d\
+\xb8\xa2\x8e\x41\x26\x30\x4a\xcd\x3c\x9e\x3a\x79\x2d\x1b\xbf\x38\
+\x59\x42\xaf\xca\x92\x23\x54\x65\xe0\x5f\xe0\x99\x38\x24\x6b\xf3\
+\xac\x17\x27\x85\x41\xe2\x33\x06\xa3\xb4\x36\x7d\xac\x88\xc7\x37\
+\xf7\xd5\x59\xab\xe1\x0d\x80\x0c\xcf\x6f\x1a\xf3\x09\xa8\x10\xfe\
+\x07\xb4\x0a\xfd\x7e\xcf\x22\x5b\xc2\x00\x00\x00\x00\x49\x45\x4e\
+\x44\xae\x42\x60\x82\
+\x00\x00\x07\xf4\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x07\xa6\x49\x44\x41\x54\x78\x9c\xe5\
+\x9b\xcf\x6f\x1b\xc7\x15\xc7\x3f\x6f\xb8\xbb\xa4\x28\x8b\x96\x55\
+\x39\x40\x10\x58\x3a\x14\x89\x5a\xa7\x3d\x14\x0e\x10\x04\xb1\xd4\
+\xa0\x48\x2e\xed\xa1\xe8\xc5\x96\x64\x03\x96\x03\x24\x3e\xb5\x75\
+\x7b\x48\xfe\x86\x5e\x1a\x05\x3e\xa9\x17\xc7\x45\x6c\xd9\x3e\xb5\
+\x07\x9f\x12\x04\xae\xec\x22\x08\xe0\xf4\x92\xc4\xa9\x1c\xa4\x80\
+\x64\x04\x41\x63\xd5\xa2\xc8\x90\x22\xf7\xd7\xeb\x81\xbb\xd4\x8a\
+\x92\x28\xc9\x22\x65\x89\xfe\x02\x04\x34\x33\xbb\xb3\xef\x7d\x35\
+\xf3\xe6\xcd\xcc\x7b\x42\x9b\xf1\xed\xf5\xe1\xc3\xd5\x50\x86\x51\
+\x7d\x5e\x54\x86\x10\x9e\x03\x0e\x03\x3d\xd1\x0f\xa0\x18\xfd\x1e\
+\xa0\xdc\x53\xd1\x59\x44\xbe\x48\x1b\xbd\xf5\xf4\x89\x5b\x0f\xda\
+\x29\x9f\xb4\xa3\xd3\xf9\xe9\x57\x5e\x08\x35\x18\x13\x23\xaf\xa1\
+\xfc\x64\x07\xdf\x51\x84\xcf\x35\xd4\x0f\x8c\xa4\xa6\x07\xc6\x6e\
+\xde\x69\xa5\x9c\xd0\x42\x02\xbe\x7a\xff\xc5\x9c\x6d\x39\xe7\x44\
+\xe5\x2c\xf0\xe3\x0d\x3f\x68\x04\x63\x0c\x46\x04\x91\xda\xe7\x55\
+\x95\x50\x95\x30\x0c\xd1\x50\x9b\x7d\xe6\x4b\x15\xbd\xe8\xf9\xee\
+\xd4\xb3\xa7\x3f\x29\xb4\x42\xee\x1d\x13\x70\xff\xfa\x4b\x7d\x1a\
+\x38\xe7\x55\xf4\xb7\x28\xbd\xc9\x36\x23\x82\xe5\xd8\x38\x8e\x85\
+\x65\xa7\xb0\x52\x16\x62\x9a\x7f\x52\x43\xc5\x0f\x7c\x7c\x2f\xc0\
+\x75\x7d\x7c\xd7\x23\xd4\x06\x52\x84\xbc\xa8\x5c\x90\x94\x3b\x79\
+\xe4\xc4\xc7\x0f\x77\x22\xff\x23\x13\xa0\x8a\xcc\x5d\x1d\x79\x5d\
+\xe0\x4f\xc0\x0f\x92\x1d\x3a\x69\x87\x4c\x97\x83\x93\x76\x76\x22\
+\x5b\x1d\x6e\xd5\xa5\xb2\xec\xe2\x56\x5d\x1a\xa8\x58\x50\x78\x7b\
+\x70\x74\xe6\xa2\x48\x63\xd3\xd6\xf0\x48\x04\xcc\x5f\xfd\xc5\x0f\
+\x55\xfd\x4b\xc0\xcb\x71\x9d\x11\x21\x93\xcd\x90\xcd\xa6\x11\x63\
+\x1e\xa5\xdb\x4d\xa1\x61\x48\xb9\x5c\xa5\x52\xae\x34\x8c\x0a\xbd\
+\x2d\x62\x4f\x0c\x8c\x7e\xf4\xf5\x76\xfb\xdc\x36\x01\xf3\xd3\x23\
+\x27\x15\xfe\x02\xe4\xe2\xba\xae\x6c\x86\xee\xee\xae\x4d\x87\x77\
+\xab\xa0\xa1\x52\x2a\x2d\xb3\x5c\xae\x24\xab\x0b\x02\x6f\x0e\x8c\
+\xcd\x5c\xdb\x4e\x5f\x5b\x96\x58\x15\x99\x9f\x1e\x79\x07\xe1\xf7\
+\x71\x9d\x6d\x5b\xf4\xf4\x74\x93\xb2\x53\xdb\xf9\x66\xcb\x10\x78\
+\x01\xc5\x62\x09\xcf\xf3\x57\x2a\x95\x77\x07\xc6\x66\xfe\xb0\xd5\
+\x29\xb1\x25\x02\xee\x4c\x1d\xb3\xfb\x7b\x0e\xfc\x55\x44\x47\xe3\
+\xba\x6c\xb6\x8b\xee\x9e\xae\xed\xca\xdc\x16\x94\xbe\x2f\x53\x2e\
+\xad\x8c\x06\x45\xa7\x17\x0a\xe5\x33\x2f\x9c\xfb\xd4\xdb\xec\xdd\
+\x4d\x09\xb8\x33\x75\xcc\x3e\x7c\xb0\xfb\x6f\x28\xbf\x04\x10\x81\
+\xdc\xc1\x03\x2d\x33\x70\xad\x82\x5b\xf5\x28\x2c\x15\x49\x98\x86\
+\x1b\x0f\x0a\xa5\xdf\x6c\x46\x42\x53\x6b\xa5\x8a\xf4\xe7\xb2\x97\
+\xea\xca\x1b\xa1\xf7\x50\x6e\xcf\x29\x0f\xe0\xa4\x6d\x7a\x0f\xe5\
+\x92\x76\xe8\x57\x4f\xe5\xba\xdf\x53\x6d\xfe\x4f\x6e\x4a\xc0\xfc\
+\xf4\xc8\x3b\x82\x8c\x41\xa4\x7c\x5f\x0e\xcb\xb6\x5a\x23\x71\x1b\
+\x60\xd9\x16\xbd\x7d\x2b\x24\x28\x8c\xcf\x5f\x1b\xf9\x73\xb3\x77\
+\x36\x64\x27\xb2\xf6\x57\xa1\x36\xec\x7b\x0f\xed\x6d\xe5\x93\xf0\
+\x3d\x9f\xfc\x62\x61\x65\x3a\x28\x27\x07\xc7\x67\xae\xaf\xf7\xec\
+\xba\x04\x44\xeb\xfc\xbf\x88\x96\xba\x83\xbd\x7b\x6f\xce\x6f\x06\
+\xb7\xea\xb1\x94\x2f\xc6\xc5\x02\x61\xf8\xb3\xc1\x53\xb7\xff\xd3\
+\xf8\xdc\x9a\x29\xa0\x8a\x44\x4e\x4e\x0e\x20\xdb\x9d\xd9\x77\xca\
+\x43\xcd\x26\x64\xbb\x33\x71\x31\x87\x91\x4b\xeb\xd9\x83\x35\x04\
+\xcc\x5d\x1d\x39\x4b\xe4\xe1\xd9\xb6\x45\xf7\x81\x6c\x5b\x05\x6d\
+\x27\xba\x0f\x64\xb1\xeb\xd3\x56\x8e\xdf\xbf\xf6\xf3\x89\xc6\x67\
+\x56\x31\x72\xff\xfa\x4b\x7d\x61\x60\xdf\x23\xf2\xed\xfb\xfa\x0e\
+\x3e\x36\x27\xa7\x55\x08\xfc\x80\x87\xff\x5b\x8a\x8b\x0b\x84\xe1\
+\x73\x83\xa7\x6e\x2f\xc6\x15\xab\x46\x80\x06\xce\x79\x22\xe5\xbb\
+\xb2\x99\x7d\xaf\x3c\x40\xca\x4a\xd1\x95\xad\x4f\x85\x7e\x44\xce\
+\x27\xdb\xeb\x23\xe0\xab\xf7\x5f\xcc\x39\x56\x7a\x0e\xa5\xd7\x88\
+\xd0\xd7\xdf\xbb\x6b\xbe\x7d\xbb\xa1\xa1\xf2\x70\x21\x1f\x6f\xa0\
+\x16\x97\xb3\xc1\xe0\x8f\x7e\xfd\xcf\x22\x24\x46\x80\x6d\x39\xe7\
+\xe2\xfd\x7c\x26\x9b\xe9\x18\xe5\xa1\xe6\xc3\x64\xba\xea\xa3\xe0\
+\x50\xa6\x9c\x3a\x17\x17\xea\x04\x44\x27\x39\x08\x90\xcd\xa6\x77\
+\x55\xc0\xdd\x40\xb6\x3b\x5d\x1f\xee\xa2\x9c\x8d\xeb\x0d\xd4\xce\
+\xf0\x88\x8e\xb1\x9c\xb4\xd3\xb6\xfd\xfc\xe3\x84\x18\x83\x93\x89\
+\x96\x73\xe1\xe8\xdc\xe5\xe3\xc7\x20\x22\x20\xd4\x60\x2c\x7e\x30\
+\xd3\xb5\xff\xd6\xfc\xad\x22\x93\x59\x19\xd9\x2a\x32\x0e\x11\x01\
+\x62\xe4\x35\xa8\x9d\xea\xec\x47\xa7\x67\xab\xb0\x1d\x0b\x13\x1d\
+\xc4\x22\xf2\x2a\x80\x7c\x7b\x7d\xf8\xb0\x1b\xc8\x7f\x01\x71\xd2\
+\x0e\x07\x7b\x0f\x3c\x46\x11\xdb\x8f\xa5\xfc\xf7\xb8\x55\x17\x40\
+\x2d\x35\x4f\x99\x6a\x28\xc3\x44\xcb\xa1\xe3\xec\x8f\xcd\xce\x4e\
+\xb0\xe2\x19\x22\x9e\x09\x47\x0c\xaa\xcf\xc7\x35\x56\x07\x38\x3e\
+\x9b\xc1\x4e\xee\x68\x95\xa3\x46\x54\x86\xe2\xb2\x65\x75\x3e\x01\
+\x49\x1d\x05\x19\x32\xd1\x5d\x1d\x62\x04\x91\xce\x5b\xfe\x1a\x21\
+\x46\x12\x4e\x9e\x0e\x19\x6a\x17\x95\x98\x0e\x5c\xfb\x37\x42\x42\
+\xd7\x7e\x43\x74\x43\x5b\x5f\x1e\x9e\x00\x24\x74\xed\xa9\x13\x20\
+\x4f\x10\x01\x09\x5d\x73\x4f\xce\xb8\xdf\x00\x86\x5a\x60\x02\xda\
+\x78\x03\xdb\xc1\x48\xe8\x5a\xa8\x13\xb0\xe6\x0a\xba\x83\x91\xd0\
+\xb5\x68\x80\x07\x00\x61\x18\x3e\x36\x81\x76\x1b\x09\x5d\x17\x0c\
+\xca\x3d\xa8\x9d\x9a\x6c\x12\x9d\xd1\x11\x58\xad\xa7\xcc\x1a\x15\
+\x9d\x8d\x1b\xfd\xc0\xdf\xe0\xb5\xce\x81\xef\x07\xf5\xbf\x15\x9d\
+\x35\x88\x7c\x51\x6f\xf4\x82\x75\x5f\xea\x24\xac\xba\x4a\x17\xee\
+\x9a\xb4\xd1\x5b\x50\xbb\x4b\x77\xdd\xce\x1f\x01\x09\x02\xd4\x0e\
+\xcd\x8c\x79\xfa\xc4\xad\x07\x08\x9f\x03\xf8\xee\xa6\xd7\xe9\xfb\
+\x1a\xaa\x5a\xd7\x51\xe1\xb3\x67\xc6\x6f\x2e\x18\x00\x0d\xf5\x03\
+\xa8\x2d\x0f\xd1\x61\x41\x47\xc2\x73\xfd\x95\x25\x50\xf5\x43\x88\
+\x8e\xc4\x8c\xa4\xa6\xe3\x87\x2a\xcb\x9d\x4b\x40\xa5\x52\xad\xff\
+\x2d\xaa\x57\x20\x22\x20\x8a\xc0\xfc\x12\x6a\x21\x69\xda\x81\x3e\
+\x81\x86\x21\x6e\x25\xfa\xe7\x2a\x77\x07\x4f\xdd\xfe\x14\x12\xf7\
+\x02\x2a\x7a\xb1\xd6\x06\xe5\x72\x75\x9d\x2e\xf6\x37\xca\xa5\x6a\
+\x3d\x6a\x4a\x85\x8b\x71\x7d\x9d\x00\xcf\x77\xa7\x10\xf2\x00\x95\
+\x72\xa5\xa3\x9c\x22\x0d\x95\xca\x72\x3d\x88\x6a\xb1\x92\x0d\xa6\
+\xe2\x42\x9d\x80\x67\x4f\x7f\x52\x10\x95\x0b\x50\x33\x86\xa5\xd2\
+\xf2\xee\x4a\xd9\x46\x94\x4a\xcb\x49\xe3\x77\x21\xbe\x17\x84\x86\
+\xdb\x61\x49\xb9\x93\xc0\x02\xc0\x72\xb9\x42\xd0\x01\x8e\x51\xe0\
+\x07\xc9\x80\xca\x05\x54\x27\x93\xed\xab\x08\x38\x72\xe2\xe3\x87\
+\x0a\x6f\xc7\xe5\x62\xb1\xd4\x7e\x09\xdb\x8c\x62\x61\x45\x07\x11\
+\x79\x2b\x19\x1b\x00\xeb\xc4\x08\xa9\x22\xf3\x57\x87\x67\x40\x8e\
+\x43\x2d\x44\x66\xbf\x46\x89\xac\x0e\xa0\xd4\xdb\x03\xa3\xb7\x46\
+\x1a\x23\x48\xd7\x9c\x08\x89\xa0\x22\xf6\x04\x50\x00\x28\x97\x2a\
+\xb8\xd5\xfd\xe7\x21\xba\x55\x2f\x19\x3d\x5a\x20\xd4\x33\xeb\x85\
+\xcf\xae\x7b\x24\x36\x30\xfa\xd1\xd7\x02\x6f\xd6\xdf\x5e\x2a\xe2\
+\x7b\xfb\x67\x9f\xe0\x7b\x3e\x85\xa5\xe2\x4a\x85\xf2\xc6\x7a\x11\
+\x62\xd0\x24\x50\x72\x60\x6c\xe6\x1a\xca\xbb\x00\xaa\x90\xcf\x17\
+\xf1\x83\xbd\x6f\x14\xfd\x20\x20\x9f\x4f\x84\xcc\x0a\x93\x1b\xc5\
+\x08\xd6\x9a\x9b\xa0\x96\x14\x31\x7c\x79\x55\xb4\x68\x6f\xcf\x9e\
+\x0d\x98\xf4\x3c\x9f\xa5\x7c\xb1\xee\xc3\x08\x5c\x39\x32\x3a\x73\
+\xba\x59\xe4\x78\xd3\x53\x61\x11\x74\xa1\x50\x3e\x03\xdc\x80\x9a\
+\x43\x91\x5f\x2c\xec\x49\x9b\xe0\x56\x3d\x96\x16\x0b\x49\x07\xee\
+\xc6\x77\x85\xd2\xc4\x66\x61\xf3\x5b\x0f\x97\xcf\x65\x2f\xc5\x23\
+\x01\xf6\xd6\xea\xd0\x18\x2e\x2f\x70\xe5\xbb\x42\x69\xa2\x25\xe1\
+\xf2\x31\xf6\x64\xc2\x84\x1f\x50\x2c\x94\x1a\x4f\x79\x26\x07\x4e\
+\xce\xfc\xb1\xa5\x09\x13\x49\xec\xe5\x94\x19\x94\x37\x9a\x19\xbc\
+\xf5\xd0\xda\xa4\xa9\xae\x4c\x2d\x1a\xab\x9d\x49\x53\xa5\x2a\x95\
+\xe5\xb5\x49\x53\x84\x7a\x66\xa3\xa5\xae\x19\x76\x9a\x36\x77\x36\
+\x4a\x9b\xeb\x4f\x76\xe8\x64\x1c\x32\x99\x34\xb6\x63\xed\xf8\xce\
+\x51\x55\xf1\x5c\x9f\x4a\xa5\x8a\x5b\x59\x9b\x36\x27\x22\x6f\x1d\
+\x39\xf9\x8f\xf7\x76\x35\x6d\x2e\x89\xb9\xcb\xc7\x0f\x21\x72\x1e\
+\x23\xbf\xdb\x28\x71\xd2\xb6\x2d\x6c\xdb\xc2\xb2\x52\x5b\x4b\x9c\
+\xf4\x03\x3c\xcf\xc7\xf3\x36\x48\x9c\x84\x45\x54\x2f\xa0\x3a\xd9\
+\xe8\xdb\x6f\x17\x2d\x9b\xb4\xff\xfe\xfb\xcb\x3d\x99\x72\xea\x9c\
+\xc0\xeb\xb4\x2b\x75\x56\xb9\xab\xc2\xc5\x4a\x36\x98\x4a\x6e\x69\
+\x77\x82\xb6\x58\xad\xb9\xcb\xc7\x8f\xa9\xc8\x38\x22\xaf\x0a\xfc\
+\x74\x07\xdf\x51\x85\xcf\x50\xfd\x50\x54\xaf\xc4\xc7\x58\xad\x44\
+\xdb\xcd\xf6\x37\x57\x5e\xe9\xf7\x4c\x38\x82\x72\x54\x90\x21\xd0\
+\x21\x6a\x36\xa3\x87\x95\x95\xa4\x40\xed\x92\x76\x01\x64\x56\xd1\
+\x59\x84\xbb\x76\x68\x66\x9e\x19\xbf\xb9\xd0\x4e\xf9\xfe\x0f\xcd\
+\x6c\x54\x88\xb3\x0f\xe3\x2c\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
+\x42\x60\x82\
+\x00\x00\x00\xeb\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x1e\x00\x00\x00\x1e\x08\x02\x00\x00\x00\xb4\x52\x39\xf5\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x00\x9d\x49\x44\x41\x54\x48\x89\x63\
+\x7c\x21\xa8\xcc\x40\x1b\xc0\x44\x23\x73\x47\x8d\x1e\x35\x7a\x88\
+\x1a\xcd\x44\x40\x2f\x01\x69\xe1\x53\xbb\xb0\x4b\xb0\xb1\x09\x1f\
+\xde\x82\x5f\x2f\x23\xc1\x8c\x2e\xfe\xee\xce\x4b\x21\x15\x34\x73\
+\xc5\x5f\x5c\x43\x17\xc4\x00\x84\x03\xe4\xa5\x90\x8a\xf8\xbb\x3b\
+\xa4\x9a\x4b\x94\xd1\x28\xa6\x13\x6d\x2e\x03\x31\x01\x02\x07\x10\
+\xd3\x89\x34\x97\x81\x84\x14\xc2\xc6\x46\xac\x4a\xd2\x8c\x86\x85\
+\x03\x7a\xb8\x53\x6a\x34\x6a\xf8\x12\x6f\x3a\x21\xa3\x59\x58\x30\
+\xe3\x8d\x48\xd3\x09\x18\x2d\x7a\xe5\x08\xd6\x78\x7b\x29\xa4\x22\
+\x7a\xed\x18\x7e\xbd\x24\xa4\x10\x52\xc1\xe0\x2c\x9e\x46\x8d\x1e\
+\x35\x7a\xd0\x1a\x0d\x00\x88\xa1\x34\x7e\xdc\x24\xf9\x33\x00\x00\
+\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x03\x89\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x03\x3b\x49\x44\x41\x54\x58\x85\xc5\
+\x97\xb1\x4f\x1c\x47\x14\xc6\x7f\xef\xcd\xec\xde\x01\x46\x34\x29\
+\xe2\x8b\x9b\x93\x42\x83\x37\x54\x97\x50\x93\xd2\xb2\x25\x52\xe6\
+\xdf\x48\x4b\x01\x96\x42\xcb\x9f\x61\xb7\x48\xb6\x52\xda\x6d\x50\
+\x10\x05\x39\xd3\x50\x5c\x73\x3a\x5c\xa4\x39\x9d\x7c\xb9\xdb\x9d\
+\x9d\x97\x82\x5b\x44\xb0\xcd\x5d\x08\x9c\x3f\x69\xa5\xdd\xd5\x68\
+\xbe\x6f\xde\xcc\x3c\x7d\x9f\x30\x23\xda\xed\x76\x5a\x96\xe5\x8f\
+\x66\xf2\x54\xe1\xb1\x41\x83\x8b\x07\xa0\x27\xd0\x8b\xf0\x4e\xc4\
+\x5e\x3b\xe7\xde\x64\x59\x96\xcf\x32\xaf\x4c\x1b\x70\x7c\x7c\xdc\
+\x50\xf5\x3b\x02\x3f\x03\xcb\x65\x2c\xb1\x68\x98\x45\xa2\x19\x00\
+\x2a\x82\x88\x22\x2a\x38\x75\x00\x03\x83\x97\x21\xf8\xdd\x56\x6b\
+\xed\xfc\x56\x02\x3a\x9d\x4e\xbd\xdf\x1f\x6c\x0b\xfc\x62\x66\x8b\
+\x45\x91\x13\xca\x12\xb0\xa9\x6b\xf2\xce\x91\x24\x29\x22\x32\x34\
+\xd8\x5f\x59\x59\xde\x6b\x36\x9b\xa3\x99\x05\xb4\xdb\xed\xaf\xcb\
+\x10\x0f\xcc\x6c\x23\x84\x82\x22\x14\x53\x48\x3f\x8d\xc4\x27\x78\
+\x9f\x20\x22\x87\xce\xeb\x56\x96\x65\xef\xa7\x0a\x38\x39\x39\xf9\
+\xce\x22\xbf\x45\x8b\x8f\xf2\x7c\x4c\x8c\xf1\x56\xe4\x15\x54\x94\
+\x34\xad\xa1\xaa\x5d\x51\x9e\xac\xaf\xaf\xff\xf9\x59\x01\x47\x47\
+\xa7\x0f\x13\x1f\xfe\x88\x31\x7e\x33\x1a\x8f\x98\x5e\xee\xd9\x51\
+\xaf\xd5\x51\x75\x5d\xe7\xf5\xfb\xab\x95\xd0\xea\xa5\xd3\xe9\xd4\
+\x13\x5f\x1e\x44\xbb\x7b\x72\x80\xd1\x78\x44\x8c\xf1\x51\x19\xe2\
+\x41\xa7\xd3\xa9\x7f\x24\xa0\xdf\x1f\x6c\x9b\xc5\x1f\xf2\x7c\x7c\
+\xe7\xe4\x15\xf2\x62\x8c\x99\x6d\xf4\xfb\x83\xed\xea\x9f\xc0\xc5\
+\x55\x73\xea\xcf\xf2\x22\x5f\x0c\xb7\x3c\x70\xb3\xc2\xfb\x84\x34\
+\x49\x87\x45\xf0\xdf\xb6\x5a\x6b\xe7\x0a\xa0\xea\x77\xa2\xc5\xc5\
+\xb2\x0c\xf7\x4a\x0e\x50\x96\x81\x68\x71\x31\xf5\x61\x07\x40\xce\
+\xce\xce\x6a\xc3\x0f\x7f\xff\x95\x17\xe3\x07\x21\xdc\xbf\x00\x00\
+\xef\x3d\x69\x52\x1b\x38\xaf\x5f\xe9\x70\x38\xdc\x04\x1e\x94\x65\
+\x39\x17\x72\x80\x58\x46\x80\xe5\x10\xc2\xa6\x9a\xc9\xd3\x18\x23\
+\x66\xf7\x73\xf0\x3e\x29\xc0\xe2\xa4\xbf\xe8\x33\x55\x78\x1c\xe3\
+\xfc\x56\x7f\x29\x22\x96\x08\xb6\xa6\x06\x8d\x79\xae\xfe\x52\x80\
+\x19\x20\x0d\x05\x1a\xf3\xa7\x87\x49\xaf\x69\xe8\x95\x8f\x2f\xc0\
+\x7f\xd1\x09\x7b\x22\x7a\xe3\xd8\xfb\x80\xa8\x02\xf4\x54\xa0\x27\
+\x32\xd5\x97\xdc\xbd\x00\x11\xc0\x7a\x1a\xe1\x9d\x7e\x81\x0a\xa8\
+\x28\x86\x9c\xaa\x88\xbd\x56\x55\xe6\x59\x05\x55\x45\x55\x81\xf8\
+\x4a\x9d\x73\x6f\x80\x81\x77\x7e\x6e\x02\x2a\xdf\xe8\xbd\x7f\xab\
+\x59\x96\xe5\x06\x2f\xbd\x4f\xe6\x26\xc0\xfb\x04\x81\x17\x59\x96\
+\xe5\x0a\x10\x82\xdf\x15\x91\x61\x32\x07\x11\x13\x8f\x38\xcc\x83\
+\x7f\x0e\x13\x43\xd2\x6a\xad\x9d\x1b\xec\x27\x49\x3a\xd9\x9b\xfb\
+\x81\xaa\x92\x26\x29\x06\xfb\x95\x5d\xbf\x64\x5b\x59\x59\xde\x03\
+\x0e\x6b\x69\xfd\xb3\x13\xfc\x1f\x88\x08\x93\xb9\x0f\x97\x96\x16\
+\x7e\xbd\x14\x55\xbd\x34\x9b\xcd\x91\xf3\xba\x25\x22\xdd\x7a\x6d\
+\xe1\x4e\x6f\x45\x45\x2e\x22\x5d\xe7\x75\x6b\x75\x75\x75\xfc\x91\
+\x00\x80\x2c\xcb\xde\x8b\xf2\x44\x55\xbb\xb5\x5a\x9d\xbb\xe8\x0f\
+\xaa\x8e\x5a\xad\x7e\x69\xcb\xaf\x67\x83\x1b\x83\x09\xb0\x51\x84\
+\x82\x10\x8a\xff\xec\x17\x44\x04\xef\x13\x26\x07\xfb\x77\xe7\xf5\
+\xa7\x99\x82\x49\x85\xeb\xd1\x2c\x94\x05\x65\x28\x89\x76\x73\x50\
+\x51\x51\x9c\x77\x78\x97\x20\x22\x1f\x04\xf6\x17\x96\x16\xf6\xae\
+\x96\x7d\x26\x01\x15\x8e\x8e\x4e\x1f\x7a\x1f\x76\xab\x70\x5a\xb9\
+\x19\x33\x83\xaa\x2a\x22\x88\xc8\x45\x87\xbb\xd8\xb6\x81\xc0\x8b\
+\x3c\xf8\xe7\xb7\x0e\xa7\xd7\xd1\x6e\xb7\xd3\x10\xc2\x26\xe8\x33\
+\xc1\xd6\x40\xfe\x15\xcf\xc1\x7a\x86\x9c\x42\x7c\xe5\xbd\x7f\x3b\
+\x6b\x3c\xff\x07\x99\x49\x6c\xdf\xdb\x6b\xff\x88\x00\x00\x00\x00\
+\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x0a\x53\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x0a\x05\x49\x44\x41\x54\x78\x9c\xd5\
+\x9b\xfb\x8f\x55\xd5\x15\xc7\x3f\xeb\x3c\xee\xbd\xf3\x16\x04\x89\
+\x55\x29\x88\x82\x2f\x6c\x2c\xb5\x16\x11\x03\x5a\xa3\xf6\x91\xd8\
+\x47\x62\x41\x03\x03\x3e\x48\x9a\xda\xda\xfe\xd0\xa6\xfd\x0f\xfc\
+\xa9\x18\x1a\x13\x1a\x95\x47\x15\xb5\x4d\x5a\xd2\x68\x8c\x51\x07\
+\x22\x08\xa2\xc5\x62\x41\xc8\xf8\xc6\x52\xa9\x32\x16\x18\x66\xee\
+\xe3\x3c\xf6\xea\x0f\xf7\x9c\x3b\x77\x66\xee\xdc\x7b\x67\xe6\x9c\
+\x11\xbf\xc9\x64\xee\x3e\x7b\x9f\xbd\xf7\xfa\x9e\xfd\x58\x6b\xed\
+\xb5\x85\x94\xf1\xf8\xd2\xa5\x33\x1d\xc7\x5f\xaa\xc8\x95\x82\x2c\
+\x40\x74\xbe\xc2\x4c\xa0\x23\xfa\x03\x38\x03\x9c\x11\x38\x81\xca\
+\x3b\x8a\xf6\x0a\xfa\x76\x10\xb8\xbb\xd6\xee\xda\x75\x22\xcd\xfe\
+\x49\x1a\x95\x6e\x5d\xb6\xe4\x1b\x2a\xba\x42\x44\x6f\x51\xb8\x6a\
+\x12\xed\xa8\xc0\x21\x55\x79\x51\x54\x9e\x5a\xb5\xf3\xd5\x7f\x24\
+\xd9\x4f\x48\x90\x80\x27\x6e\xbf\xae\x33\x2c\x5a\xeb\x10\xd6\x00\
+\x97\x8f\x55\xce\xb6\x2c\xc4\xb2\x10\x40\xa4\xdc\xbc\xaa\xa2\x80\
+\x1a\x43\x68\x4c\xbd\x66\x8e\xa0\x6c\xb2\x73\x66\xe3\xdd\xcf\xef\
+\xeb\x4f\xa2\xdf\x93\x26\xe0\xd1\x5b\x17\x4f\x77\x03\x1e\x44\x79\
+\x00\x38\xa7\x3a\xcf\x12\xc1\x71\x5c\x1c\xc7\xc6\xb6\x1c\x6c\xcb\
+\x6a\xdc\xa2\x42\x68\x0c\xa1\x09\x08\x82\x90\x20\xf0\x31\xaa\x23\
+\x4b\x9d\x42\xd8\xe0\x3b\xac\xbf\xf7\x85\xbd\xff\x9b\x4c\xff\x27\
+\x4c\x80\x82\xfc\xe9\xe6\xc5\x6b\x55\x79\x08\x38\xb7\x52\xa1\x08\
+\x19\x37\x83\x1b\x09\x9e\x04\x82\x20\xc4\x0f\x7c\x3c\xdf\x43\x87\
+\x91\x21\x7d\xa8\xfe\x66\xd5\x8e\xbd\x9b\x04\x46\xb1\xd4\x0c\x26\
+\x44\xc0\xe6\x9b\xae\x9f\x27\xe8\x16\x60\x49\xa5\x22\x4b\xc8\x65\
+\xb2\x64\x32\x19\x24\x9d\xa5\x05\x45\xf1\x3c\x8f\xa2\x57\x42\x4d\
+\x95\xbc\x2a\xbb\x55\xe8\xee\xee\xd9\xf3\xfe\x78\xeb\x1c\x77\x4f\
+\xb7\xdc\xfc\xad\x3b\x51\xf9\x23\xd0\x59\xae\x40\xc8\x66\xb3\x64\
+\xb3\xd9\x94\xc4\x1e\x0d\x05\x4a\xa5\x12\xa5\x52\x09\x1d\xfa\xf0\
+\xfd\x88\xde\xbf\xfa\xe5\xd7\x9e\x19\x4f\x5d\x4d\xf7\x59\x41\xb6\
+\xde\xb4\xf8\xf7\xc0\x2f\xe2\x67\xae\xe3\xd2\x92\xcb\x61\x59\xd6\
+\x78\xda\x4c\x0c\xc6\x18\x0a\xc5\x22\x7e\xe0\x57\x3f\x7e\x78\x55\
+\xcf\xde\x5f\x36\x3b\x25\x9a\x22\x60\xe3\xa2\x45\x6e\xb6\xcb\xdd\
+\x2a\xc8\x4f\xe2\x67\x2d\xb9\x16\xb2\x99\xcc\xf8\x7a\x9c\x12\x8a\
+\x5e\x89\x62\xb1\x58\xfd\xe8\xa9\xe2\x69\x6f\xf5\xba\xfd\xfb\xfd\
+\xb1\xde\x89\xd1\x90\x80\x8d\x8b\x16\xb9\xb9\x2e\x77\x3b\xc8\x77\
+\xa0\xbc\xc8\xb5\xb5\xb6\xe2\xd8\xce\xc4\x7b\x9c\x02\x82\x30\x60\
+\x30\x9f\xaf\x2c\x92\x22\x3c\x57\x38\xe5\xfd\xa0\x11\x09\x75\xc7\
+\xae\x82\xe4\xba\x32\x5b\x2a\xc2\x5b\x16\x1d\x6d\x6d\x67\x9d\xf0\
+\x00\x8e\xed\xd0\xd1\xd6\x86\x44\xd3\x51\x95\xef\xe6\xba\x32\x9b\
+\xb5\xc1\x47\xae\xbb\x4f\x5d\x7c\xd3\xe2\xf5\xc0\xbd\x10\x09\xdf\
+\xda\x86\x65\x25\xb3\xb5\xa5\x01\x11\x8b\x8c\xe3\xe2\xfb\x41\xbc\
+\x38\x2e\x3c\x30\xf7\xa2\xae\xed\x1f\x1e\x7b\x61\xcc\x77\xc6\xca\
+\x88\x56\xfb\xa7\xcb\x15\x0b\xed\x6d\xed\x65\x45\xe6\x4b\x80\xd0\
+\x18\x06\x06\x07\x2a\xd3\x41\x55\xef\xec\xde\xf1\xda\x9f\x6b\x95\
+\xad\x49\x40\xb4\xcf\xbf\x49\xb4\xd5\xb5\xb7\xb6\xe1\x38\x67\xdf\
+\xb0\xaf\x87\x20\x08\x18\xc8\x0f\xc6\xc9\xfe\x40\xec\x6b\xee\x79\
+\x79\xf7\x07\x23\xcb\x8d\xfa\xa4\x0a\x12\x29\x39\x9d\x00\xb9\x5c\
+\xee\x4b\x27\x3c\x80\xe3\x38\xb4\x64\xb3\x71\xb2\xd3\x31\x66\x4b\
+\xad\xf5\x60\xd4\x84\xbe\x78\xf9\xe2\xb5\x08\x3f\x03\x70\x6c\x9b\
+\xd6\x96\x16\x52\x32\x1a\x53\x87\xe3\xd8\x04\x41\x50\xb6\x25\x84\
+\xd9\x07\xe6\xce\x3e\xba\xfd\xc3\x7f\x1f\xa8\x2e\x33\x4c\xb2\x47\
+\x6f\x5d\x3c\xdd\xf5\x79\x07\x38\x57\x80\xf6\xf6\x8e\x86\xf3\xde\
+\x0b\x43\xb6\x1f\x79\x8f\xb7\xfe\xfb\x19\x9d\xd9\x0c\x3f\xbe\x72\
+\x01\xf3\xa6\x9f\x53\xf7\x9d\x89\xe2\xc8\x89\xcf\xf9\xdb\x91\x77\
+\x19\xf4\x7c\xae\xbd\xf0\x7c\xbe\x3f\x7f\x1e\xb6\x55\xff\xe3\x18\
+\x13\x72\x66\x60\x20\xd2\x8a\xa4\xcf\xf1\xac\xf9\x77\xed\xde\x7d\
+\x32\xce\x1f\x36\x02\x7e\x34\xe7\xa2\xdf\x02\xb7\x01\xe4\xb2\x59\
+\x32\xae\xdb\xb0\x53\xcf\x1c\xea\xa5\xe7\x83\xa3\xe4\x7d\x9f\x93\
+\x85\x22\xfb\x8e\x1d\xe7\xab\xe7\x74\x71\x5e\x7b\xeb\xf8\x25\xac\
+\x83\x37\x8e\x1d\xe7\x91\x37\x0e\x70\xaa\x50\x24\xef\xfb\xbc\xfb\
+\xf9\x49\x54\xe0\xb2\x19\xd3\xeb\xbe\x27\x52\xfe\x80\x41\x18\x02\
+\xb4\x86\x96\x96\xb6\x7f\x74\x6c\x67\x9c\x5f\xf9\xbc\x4f\xdc\x7e\
+\x5d\x67\x64\xd2\x22\x52\xd6\xef\x9b\xc1\xeb\xc7\x8e\x0f\x4b\x07\
+\xc6\xf0\xc8\xeb\xff\xe4\xd0\xa7\x7d\x4d\xbd\xdf\x0c\xde\x38\x76\
+\x9c\x47\xdf\x3c\x38\xc2\x12\x2c\x3f\x6f\x06\xb9\x4c\xae\xe2\x7b\
+\x10\xe1\x81\xc7\x96\x2c\x89\x3d\x51\x43\x04\x84\x45\x6b\x1d\x91\
+\x3d\x9f\xcd\x64\x9b\xb6\xe8\x3a\xb2\xa3\x47\x49\x92\x24\x8c\x25\
+\x3c\x40\x7b\xb3\xaa\xb8\x94\x65\x8a\x30\xcd\xce\x9a\x75\x71\xc2\
+\xaa\x2a\xb4\xa6\xfc\x4f\xc6\xa5\xe3\xdf\x71\xd9\xa5\x35\x9f\x27\
+\x41\x42\x3d\xe1\x45\x84\x3b\x2e\xbf\xa4\xe9\xba\xb2\xc3\xcd\xf4\
+\x35\xf1\x0f\x1b\xca\x3e\x3c\x44\x7f\x07\x90\x71\x5d\x32\x6e\xf3\
+\x04\x7c\xa5\xb3\x9d\x8e\x6c\x86\x83\x35\x04\x35\xaa\xec\xff\xe4\
+\xd3\x09\xad\x09\x8d\x84\xbf\xf7\xeb\x0b\xf9\xda\xf9\xe7\x35\x5d\
+\x9f\x88\x60\x4c\x48\x68\x0c\x02\x33\xef\x98\x73\xc1\xb3\xdb\x3f\
+\xfa\xcf\x71\x0b\x40\x45\x57\xc4\x05\xc7\x23\x7c\x8c\x65\x73\x67\
+\xb3\xf2\xea\xda\x6e\xc0\x89\x8c\x84\x66\x84\xbf\xf6\xc2\xf3\xc7\
+\xdd\x4f\xb7\x4a\x36\xc1\x5e\x09\xd1\x14\x10\xd1\x5b\xe2\xca\x27\
+\xea\xc6\x4a\x8a\x84\xb4\x84\x07\x70\x1d\xbb\xb2\x18\x22\xfa\x6d\
+\x00\x79\x7c\xe9\xd2\x99\xb6\x1b\x7c\x0a\x88\xeb\xb8\xb4\xb5\x4e\
+\x6e\xfb\xda\xf9\xe1\xc7\x6c\xfb\xd7\x91\x9a\x79\x8e\x65\xf1\xd3\
+\x6f\x5e\xc3\x55\xb3\x66\xd4\xcc\x4f\x53\xf8\x18\x83\xf9\x7c\xec\
+\x40\x51\xd7\x78\xe7\x59\x8e\xe3\x2f\x25\x52\x88\x92\x70\x62\x4e\
+\x74\x24\x4c\x85\xf0\x40\xb5\x29\x2f\x81\xb8\x37\x5a\x8a\x5c\x19\
+\x3f\xb1\xad\x64\x74\xfe\xf1\x92\x30\x55\xc2\x03\xd8\xf6\xd0\x47\
+\x36\x62\x5d\x61\xff\x70\xee\xec\xfb\x11\xae\x06\x68\xc9\x0d\x29\
+\x0c\x93\xc5\x9c\x69\x5d\x4d\xed\x0e\x47\x4f\x9d\x9e\x32\xe1\xe3\
+\x3a\x4b\x5e\xa9\xfc\x1b\xfd\xc4\x41\x74\x7e\x9c\x91\x94\xf0\x31\
+\x96\xcd\x9d\x0d\x50\x73\x4d\x08\x8c\xe1\x0f\xfb\xde\xac\x75\xe8\
+\x51\xe9\x68\xd2\xc2\xc7\xf5\x8a\x08\xaa\x8a\x20\x0b\xac\xe8\xa0\
+\x12\xab\x81\x51\x31\x51\xd4\x9b\x0e\x53\x2d\x7c\x0c\x4b\x2a\x6e\
+\xb3\x19\x16\xd1\x09\x6d\x6c\x34\xa4\x81\x7a\x24\x8c\x44\xda\xc2\
+\x97\x1b\xa9\x34\xd6\x31\x44\x40\x7a\xcd\x01\xcd\x93\x90\xba\xf0\
+\x94\xcf\x2c\xcb\xd0\xce\x29\x75\xf2\xb5\xb9\x6e\x5d\xa2\x2d\x11\
+\x5a\x9a\x30\xc1\x27\x8b\xea\x89\x67\x51\x0e\x4e\x18\x73\x3e\x26\
+\x85\xca\x56\x57\xa7\x8c\x51\x4d\xdc\x94\xae\x89\x8a\xac\xd2\x5f\
+\x21\x60\x62\x67\xab\xcd\xa1\xde\x3e\x3f\x12\x69\xf8\x13\x46\xa2\
+\x72\x9e\xa8\x7a\xc6\x12\x38\x01\x60\xb4\x6e\x60\xc2\x84\x51\x57\
+\xc9\x19\xe3\x9d\xb4\x49\x30\xa6\x72\x7a\xd4\x67\xa1\xf2\x0e\x44\
+\x51\x1a\x09\x4f\x83\x86\x1a\xde\xa2\xab\x13\xb5\x22\x9b\x41\xb5\
+\x9c\x8a\xf6\x5a\x8a\xf6\xc6\x99\xa1\x09\x13\x6b\xa8\x59\xf5\x36\
+\x69\x53\xba\x11\xc2\x70\x48\x46\xc5\xea\xb5\x04\x7d\xbb\xd2\x60\
+\x98\x0c\x01\xe3\xd5\xed\xa7\x92\x84\x6a\x02\x2c\x35\x87\xad\x20\
+\x70\x77\x11\x2d\x81\x41\x10\x4c\xba\x81\x89\x1a\x36\x53\x45\x42\
+\x10\x56\x64\x54\x47\xfd\x57\xac\xb5\xbb\x76\x9d\x10\x38\x04\x10\
+\x06\xe1\xa4\x36\x83\xc9\x5a\x75\x69\x93\xa0\x94\xe3\x8d\x22\x1c\
+\x5c\xb9\x73\x7f\x5f\xd9\x25\xa6\xf2\x62\xb9\x80\xe2\xfb\x13\x1b\
+\x05\x49\x99\xb4\x69\x92\x10\x04\x7e\xd5\x16\x28\x2f\x41\xec\x12\
+\x53\x79\x2a\x2e\xe4\xfb\xde\xb8\x2b\x4e\xda\x9e\x4f\x8b\x84\x92\
+\x37\x14\x2b\xa1\x84\xdb\x20\x22\x20\x8a\xc0\x3c\x02\xe0\x87\xfe\
+\xb8\x74\x82\xb7\x3f\xeb\x4b\xc5\x9e\x6f\x86\x84\xa3\xa7\x4e\x37\
+\x5d\x9f\x51\x43\x10\xc5\x12\x29\x1c\xee\xde\xb1\x6f\x3f\x54\x9f\
+\x0b\x28\x9b\xe2\xdc\x52\xa9\xf9\x51\xb0\xfd\xc8\x7b\xa9\x39\x33\
+\x1a\x91\xf0\xf7\xde\xe6\xa3\xe2\x4a\xa5\x52\x75\x72\x53\xfc\xa3\
+\x42\x80\x9d\x33\x1b\x81\x53\x00\x9e\x37\x32\x20\x71\x6c\x14\xfc\
+\xd1\x21\x38\x49\x9a\xb4\xf5\x48\x18\x28\x35\x8c\x81\x02\xca\xca\
+\x4f\x69\xa8\x9f\x27\xc3\x92\xb5\x31\x4e\x54\x08\xb8\xfb\xf9\x7d\
+\xfd\x08\x1b\xa0\xbc\x18\x16\x4b\x45\x9a\xc1\x48\x21\xd3\xb0\xe7\
+\xc7\x22\xe1\xda\x0b\x66\x35\xf5\x7e\xa1\x54\xac\x18\x40\xaa\x6c\
+\xb8\xe7\xd5\x57\xcf\xc4\x79\xc3\xdc\xc0\xdf\x9b\x7f\xd1\x5b\xb6\
+\x91\x7b\x80\xd6\x30\x0c\x71\x1d\xa7\x61\x0c\xe0\xa5\xd3\xa7\xa1\
+\x02\xa7\x8a\x25\x66\xb5\xb7\xd1\x7d\xcd\x55\xe3\x3a\xb1\x69\x16\
+\x73\xa6\x75\x71\x61\x57\x07\x9f\x0d\xe6\xc9\x39\x0e\xb7\xce\x9b\
+\xc3\x2d\x97\xcc\x69\xe8\xc6\x0b\x82\x90\x42\xb1\x10\xa5\xa4\xcf\
+\xf5\xed\xbb\xfe\xfa\xf1\xc7\x95\xaf\x3b\xea\xed\x2d\xe5\x00\x89\
+\xc7\x00\x6c\xcb\xa6\xbd\xad\x9d\x84\x5d\x85\x53\x06\x55\x18\x18\
+\x1c\xa8\xa8\xf8\x8a\xac\xed\xee\xd9\xb3\xa9\xba\xcc\x28\xd1\x14\
+\x64\xeb\xf2\xeb\x5f\x41\xf4\x06\x80\x4c\x26\x43\x6b\xae\x65\x4a\
+\x3a\x9c\x34\xf2\xc5\x02\x9e\x17\x2d\xe8\x2a\xbb\x57\xed\xd8\x73\
+\xe3\xc8\x08\xd2\x51\xe3\x5b\x40\x55\xe8\x06\xfa\xa1\xbc\x20\x7a\
+\x35\x16\xba\xb3\x1d\x9e\xef\x0f\x09\x0f\xfd\x81\x65\xad\xae\x15\
+\x3e\x5b\x73\x82\x77\xf7\xec\x79\x1f\xd1\xfb\xe3\x74\xbe\x50\xa8\
+\xd6\xa1\xcf\x7a\x04\x61\x40\xbe\x50\xa8\xa4\x55\xf5\xbe\x5a\x11\
+\x62\x50\x27\x52\x34\x8a\xba\x7e\x38\xaa\x82\x81\xfc\x20\xe1\x97\
+\x80\x84\x30\x8c\xc3\xe3\x62\x9b\x9f\xf5\x63\xc5\x08\x42\x03\x67\
+\x70\x14\x21\xfe\x24\xb0\x22\x2e\xdd\xde\x72\xf6\xc6\x0c\xfa\x41\
+\x40\x3e\x9f\xaf\x0e\xa1\xdf\xb6\xaa\x67\xef\xdd\xf5\x22\xc7\xeb\
+\xee\x71\x02\x5a\x3c\xed\xad\x16\xe1\x39\x00\x14\x06\x0a\x83\x78\
+\x13\xb0\x17\xd2\x86\xe7\x7b\x0c\x16\x06\x2b\xc2\x8b\xf0\x5c\xf1\
+\xb4\xd7\xdd\x28\x6c\xbe\xe1\x71\xf0\xb3\xc7\x8f\x9b\xdb\xa6\xcf\
+\xfa\x8b\x93\xb3\x2f\x01\x16\x42\x99\x69\x63\x14\xd7\x71\xf8\xc2\
+\xf7\x48\x55\xf2\xa5\x22\xc5\xe1\xaa\xee\xb6\xe2\x69\x6f\x45\x22\
+\xe1\xf2\x95\x76\x6a\x5c\x98\xb0\x2c\x9b\xd6\x96\xdc\x17\x16\x3d\
+\x5e\x5e\xec\x8a\x18\x53\xed\xe6\x62\xfd\xea\x9e\xbd\xbf\x4a\xf4\
+\xc2\x44\x35\x46\x5e\x99\x81\x72\x5c\x51\x4b\x36\x57\x09\x55\x4f\
+\x1b\x6a\x0c\x85\x52\x71\xe4\xf6\xdc\xaf\xaa\xf7\xd5\x5b\xf0\x6a\
+\x21\xb1\x4b\x53\x20\x64\x5c\x97\x5c\x36\x9b\xda\x15\x1a\x63\x0c\
+\xc5\x52\x29\x12\x7c\xf8\xa5\xa9\xc0\xb2\x56\x8f\xb5\xd5\xd5\xc3\
+\xa4\xae\xcd\x6d\x5d\xbe\x78\x0d\x22\x0f\x81\x0e\x8b\x79\x71\x6c\
+\x87\x4c\x26\x83\xeb\x3a\x93\xbe\x41\x16\x7b\xa9\x3c\xcf\xab\xa1\
+\x8b\x48\x9f\xc2\xaf\x57\xf7\xec\xd9\x3c\xa5\xd7\xe6\xaa\xf1\xe4\
+\x0d\x37\x4c\xf3\xdd\xf0\x41\x11\x7e\xce\x88\x8b\x93\x00\xb6\xed\
+\xe0\x38\x36\x8e\x6d\x63\x5b\x76\xc3\xd1\x61\x8c\x21\x34\x21\x41\
+\x18\x12\x04\xe1\x58\xba\xc7\x49\x55\x36\xb8\xbe\xbd\xbe\x3a\xee\
+\x77\x22\x48\x6c\x09\x7f\x6c\xc9\x92\x0e\x3b\x6b\xd6\x09\xac\xa5\
+\xce\xd5\x59\x04\x2c\x04\x44\x2a\xa7\xb4\x46\x15\x54\x31\x68\xdd\
+\xef\xa8\x70\x18\xd8\x14\x96\xac\x8d\xd5\x26\xed\x64\x90\xca\x1e\
+\xb6\x79\xf9\x75\x8b\x04\x7b\x65\x14\x8a\xb6\x70\x12\xed\x28\x70\
+\x10\x95\x97\x94\x70\x5b\xec\xc6\x4a\x12\xa9\x6f\xe2\xdb\x96\x2d\
+\x9a\x11\x88\x7b\xa3\x11\xeb\x0a\xc1\x2c\x10\x64\x81\x2a\x33\x10\
+\xe9\x00\x8d\x76\x12\xe9\x47\xf5\x8c\x08\x7d\x8a\xf6\x2a\x56\xaf\
+\xa5\xe6\xb0\xa3\xfe\x2b\x2b\x77\xee\x4f\xf5\xa8\xf8\xff\x74\x86\
+\x30\x9a\x46\x1f\x03\x31\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
+\x60\x82\
+\x00\x00\x01\x11\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x2d\x00\x00\x00\x1e\x08\x02\x00\x00\x00\x37\x96\x00\xce\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x00\xc3\x49\x44\x41\x54\x48\x89\xed\
+\xd6\xb1\x0e\x82\x30\x10\x80\xe1\xab\xda\xc1\x94\x45\x96\x3e\x80\
+\xbe\x5c\xd7\xe2\xc8\xe8\xaa\xab\xef\xc3\xc2\x4b\xf4\x01\x74\xe9\
+\xa4\x0b\x13\x43\x95\x70\xd4\x85\x6b\x90\x0e\xf7\x6f\x34\x69\xf8\
+\x52\x7a\x09\xe2\x71\x38\x42\x06\x6d\xd6\x06\x7c\x62\x07\x8e\x1d\
+\x38\x76\xe0\xd8\x81\xa3\x38\xb4\x77\x45\x5d\xc5\xeb\x45\x5d\x69\
+\xef\x68\x8e\xed\x79\x5f\xce\xdd\x23\xa4\x54\xd6\x08\x29\xbb\xa6\
+\x1d\x23\x94\x35\xef\xdb\x7d\xbc\xb8\xac\xa3\x6b\xda\x09\x65\x40\
+\xbc\x2e\x57\x02\x02\x00\x76\xb4\x6d\xe1\x7d\xca\x9a\xf0\x98\x88\
+\xa0\x3b\x26\x94\x44\x04\xe4\x33\x2f\xf4\xf3\x18\xee\x04\x7c\x4f\
+\x65\x85\xef\x12\x5f\xcc\x44\x0a\x65\x5e\x62\x44\x3c\x41\x73\x13\
+\x84\xff\x42\xed\xdd\xcf\x8b\x19\x7c\xcf\xf2\xf4\x27\xc7\x12\xe5\
+\x32\x2f\xec\xc0\xb1\x03\xc7\x0e\x1c\x3b\x70\x3d\xd2\x80\x54\xca\
+\x90\x4d\x63\x20\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\
+\x00\x00\x08\x04\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x07\xb6\x49\x44\x41\x54\x78\x9c\xe5\
+\x9b\xcb\x6f\x54\xf7\x15\xc7\x3f\xe7\x37\x73\xe7\x11\x98\xb1\x09\
+\xb6\x71\x44\x0d\x8b\xaa\x58\x25\xed\xa2\x72\x76\x01\x04\x28\x51\
+\x64\x8c\x2a\x75\x95\x12\x55\xc2\x44\x4a\x58\xb5\xa5\x5d\x24\x7f\
+\x43\x36\x8d\x23\x56\x74\x43\xa8\x54\x68\xba\xaa\x2a\x1b\x14\x25\
+\x05\x0b\xe8\x0e\xba\x49\x42\x64\xa2\x54\xe2\x55\x60\x3c\xc1\xf6\
+\x0c\x68\xee\xcc\x9d\xb9\xa7\x8b\xfb\xf0\xf5\x6b\xfc\x9c\xb1\xc7\
+\xfe\x4a\xb3\xb8\xf7\x77\xe7\x77\xcf\x39\xf7\xf7\x38\xbf\x73\xbe\
+\x47\x68\x30\x1e\xf7\x1f\xec\xac\x9a\xf8\x41\x85\x57\x15\x7a\x45\
+\x75\x1f\x22\x9d\x40\xc6\xff\x01\x14\x81\x22\xaa\xe3\x2a\x72\x57\
+\x60\x4c\xe0\x9b\xb8\x5b\xbd\xf1\xca\x95\x1b\xe3\x8d\x94\x4f\x1a\
+\xd1\xe9\xfd\x63\x87\x5f\x03\x39\x81\xc8\x9b\xa0\x3f\x5b\xc5\x7b\
+\x14\xe4\x6b\x54\xbf\x00\xbd\xb4\xe7\xf2\xe8\xad\xb5\x94\x13\xd6\
+\xd0\x00\xdf\xf5\xf7\x67\x53\x62\x9f\x56\x91\x53\xa0\x3f\x5d\xf0\
+\x85\xc6\x20\xb1\x18\x62\x0c\x88\xff\x7a\x55\xd4\x75\xd1\x5a\x0d\
+\x75\xdd\x7a\xe2\x7e\x2b\xaa\xe7\x6d\x4d\x9d\xfb\xc9\x95\x2b\x85\
+\xb5\x90\x7b\xd5\x06\x78\xf0\xd6\x5b\x2f\x6b\xbc\x72\x06\xf8\x2d\
+\xd0\x3e\xa3\x73\x23\xc4\x52\x29\x4c\x2a\x85\xb1\x12\x98\x84\xe5\
+\x29\x5e\x07\xea\xba\xb8\x15\x07\xd7\xa9\xe0\xda\x36\x35\xdb\x46\
+\x5d\x9d\xfd\xd8\x24\x70\x56\xaa\x89\xa1\x9e\xcf\x3f\x7f\xb6\x1a\
+\xf9\x57\x6c\x00\x05\x79\x38\x70\xf8\x5d\x45\x3e\x02\x76\x86\x1d\
+\x8a\x10\x4b\xa7\x89\x6d\xdb\x46\x3c\x9d\x5e\xbd\x89\x15\xaa\xa5\
+\x12\xb5\x17\x2f\xa8\x95\x4a\xa8\xce\x30\x46\x1e\xf8\xb0\x67\xe4\
+\xda\x79\x81\x39\x56\x5a\x0a\x56\x24\xde\xfd\xfe\xa3\x3f\xc6\xe8\
+\x05\xe0\xf5\xb0\x23\x23\xc4\xb7\x67\xb0\xb2\x19\x24\x16\x5b\x49\
+\xb7\x8b\x42\x6b\x35\x9c\x42\x91\xea\xf3\xe2\xec\x51\x71\x13\x57\
+\x06\xf7\x5c\xb9\xfa\xfd\x72\xfb\x5c\xb6\x01\xee\x1f\x3f\xfc\x36\
+\x2a\x7f\x06\xb2\x41\x0f\xd6\xf6\x0c\x56\x7b\xdb\xa2\xc3\x7b\xad\
+\xa0\xae\x8b\x33\x39\x85\xf3\xbc\x18\xfd\xee\x05\x44\xdf\xdf\x33\
+\x3c\xfa\xd9\x72\xfa\x5a\xb2\x01\x14\xe4\xe1\xb1\xa3\x1f\xab\xe8\
+\xef\x83\x7b\x26\x99\x24\xf9\xf2\x0e\x4c\x22\xb1\x9c\x77\xae\x19\
+\xdc\x4a\x85\xf2\xb3\x09\xdc\x72\x39\xbc\x27\x2a\x9f\xfc\xe8\xf2\
+\xd5\x3f\x2c\x75\x4a\x2c\xc9\x00\xb7\xfa\xfa\xac\xae\xee\xb6\xbf\
+\x80\xfe\x3a\xb8\x97\x68\xcb\x62\xb5\xb5\x37\x68\x23\x5d\x06\x14\
+\x9c\xc9\x49\x2a\x85\x19\x9b\xc2\xa5\xdc\x93\xc2\xc9\xd7\x6e\xdf\
+\x76\x16\xfb\xfb\xa2\xe2\xdf\xea\xeb\xb3\x3a\xbb\xb3\xff\x10\x38\
+\x06\x80\x11\x92\x3b\x3b\x88\xbf\x94\x5e\xb1\xcc\x8d\x40\xb5\x54\
+\xa2\x9c\xcf\x83\xbf\x36\x08\x8c\x3c\x7d\x52\xf8\xd5\x62\x46\xa8\
+\x3b\x69\x15\xa4\xab\x3b\x7b\x21\x50\x5e\x8c\x21\xbd\x6b\xd7\x86\
+\x53\x1e\x20\x9e\x4e\x93\xee\xda\x15\xae\x43\x0a\x03\x5d\xaf\x64\
+\x3f\xd5\x45\x3e\x72\x5d\x03\x3c\x3c\x76\xf4\x63\xe0\x04\x78\xca\
+\xa7\xba\x77\xad\xdb\x7c\x5f\x0a\x4c\x32\x41\xaa\x7b\xda\x08\x28\
+\xef\x3c\x18\x38\xfc\xa7\x7a\xff\x59\xd0\x3a\xfe\x6a\xff\x37\xaf\
+\x67\x21\xbd\x6b\x63\x2b\x1f\x85\x5b\xae\x50\xca\x3d\x0d\xa7\x83\
+\x2a\x6f\xef\xbd\x7c\xed\xef\xf3\x3d\x3b\xaf\x01\xfc\x7d\xfe\x3f\
+\xf8\x5b\x5d\xb2\xb3\x73\x43\x0e\xfb\x7a\xa8\x96\x4a\x94\x73\xe1\
+\x39\xaa\xa0\x98\x5f\xec\x1d\xf9\xd7\x7f\x67\x3f\x37\x67\x0a\x28\
+\x88\xef\xe4\x64\x01\x12\xd9\x6c\xcb\x29\x0f\xde\x9a\x90\xc8\x66\
+\x83\xcb\xac\xe0\x5e\x98\x6f\x3d\x98\x63\x80\x07\x03\x47\x4e\xe1\
+\x7b\x78\x26\x99\xc4\x6a\x6f\x9f\xfd\x48\xcb\xc0\x6a\x6f\xc7\x24\
+\x93\xc1\xe5\x81\x07\xc7\x8f\x0e\xce\x7e\x66\x86\x45\xfc\x83\xcd\
+\x5d\x60\x27\x02\xe9\xee\xee\x96\x99\xf7\x0b\xc1\x75\x1c\x4a\xff\
+\x7b\x1c\x5c\xe6\x15\x67\xdf\xde\x91\x9b\x13\xc1\x8d\x19\x23\xc0\
+\x3f\xd5\xed\x04\xcf\xbd\x6d\x75\xe5\x01\x8c\x65\x61\x65\x83\xb8\
+\x0b\x1d\x60\x9d\x89\xb6\x87\x23\xe0\xbb\xfe\xfe\x6c\xd2\xd8\xf7\
+\x80\x76\x31\x42\x7a\xf7\xee\xa6\xf9\xf6\x8d\x86\xba\x2e\xa5\x47\
+\x8f\x82\x03\xd4\x44\x3a\x56\xd9\xdb\xf9\xcf\x7f\x17\x21\x32\x02\
+\x52\x62\x9f\xc6\x3f\xcf\xc7\xb7\x67\x36\x8d\xf2\xe0\xf9\x30\x56\
+\x26\x1c\x05\x3b\x4a\xb5\xe4\xe9\xe0\x22\xd4\xd2\x8b\xe4\x78\xe7\
+\xf9\xc8\x90\xd9\x34\x88\x67\x32\x48\x10\x81\x42\x4f\x05\xf7\x0d\
+\x04\x31\x3c\x2f\x8c\x15\x4b\xa7\x1b\x76\x9e\x5f\x4f\x48\x2c\x46\
+\x2c\x1d\x6e\xe7\xfb\xef\x0d\x1c\xe9\x83\x70\x04\xc8\x89\xa0\x25\
+\xb6\x6d\x5b\xb3\x65\x6b\x1a\x62\xdb\xa7\x75\x13\xe5\x1d\x08\x0c\
+\x20\xf2\x26\xf8\x51\x9d\x74\xeb\x39\x3d\x4b\x45\x2c\x95\x42\x4c\
+\xb8\xee\xbf\x01\x20\x8f\xfb\x0f\x76\x3a\x26\xfe\x14\x90\xf8\x4b\
+\x69\x92\x9d\x9d\xeb\x26\x60\x33\x50\xce\x8d\x53\x2d\x95\x00\x34\
+\x26\xda\x65\xaa\x26\x7e\x10\x7f\x3b\x34\xa9\xd4\xba\x0a\xd7\x0c\
+\x98\x54\xe8\x19\x8a\xab\x72\xc8\x28\xbc\x1a\x36\x5a\xad\xef\xf8\
+\x2c\x86\x88\x6b\x8c\xaa\xec\x37\x0a\xbd\x61\x63\xc2\x5a\x17\xa1\
+\x9a\x09\x63\x4d\xeb\xa8\x42\xaf\x11\xd5\x7d\xe0\x67\x6c\x36\x91\
+\xf3\xb3\x10\xa2\x7a\x8a\xba\xbd\xc6\x4f\x54\x6e\xca\xbd\x7f\x21\
+\x84\xba\x8a\x74\x18\xfc\x0c\xed\x56\xf8\xfa\x01\x22\xba\x66\x42\
+\x03\x84\x89\xca\xad\x80\x69\x5d\xb3\x5b\xe7\xb3\x2f\x00\x83\x47\
+\x4e\x00\x5d\x51\x6e\xb1\x35\x31\xad\x6b\x21\x34\x40\xfd\xbc\xfc\
+\xe6\x42\x44\xd7\xa2\x41\x75\x1c\xbc\xcc\xeb\x56\x41\xa8\xab\x6a\
+\xde\xa8\xc8\x5d\xf0\xac\xb2\x15\x46\x41\x54\x4f\x15\x33\x66\x04\
+\xc6\x82\x46\xb7\xb2\x68\x2e\xb1\xe5\xe1\x3a\xd3\x3a\x8a\x32\x66\
+\x04\xbe\x99\x6e\xac\xac\x8b\x50\xcd\xc4\x8c\x54\xba\xe8\x1d\x13\
+\x77\xab\x37\xf0\x73\xe9\xae\x6d\xaf\x97\x5c\x4d\x83\x6b\x87\x06\
+\x50\x23\x7a\xdd\x78\x3c\x3c\xf9\x1a\xa0\x66\xdb\x2b\x64\xda\xb4\
+\x06\x54\x95\x5a\xd9\xff\xc8\xca\x57\xbb\x87\x47\xf3\x7e\x2e\x59\
+\xbf\x00\x50\x57\x83\x60\xc1\xa6\xc4\x2c\xc6\xd9\x97\x10\xc6\x04\
+\xf5\x52\xf8\xd0\x8b\x17\xcd\x96\xab\x69\xa8\x3d\x9f\xd6\x4d\x85\
+\x8b\xe0\x1b\xc0\x63\x60\xca\xb7\x80\x47\x45\xdb\x84\x3e\x81\xd6\
+\x6a\xd4\xa6\x47\xf7\x9d\xbd\x23\xd7\x6e\x43\x24\x2f\x20\xaa\xe7\
+\xc1\x9b\x27\x4e\xa1\xd8\x7c\x09\x1b\x8c\x6a\xb1\x18\xe1\x18\xca\
+\xf9\xe0\x7e\x68\x00\x5b\x53\xe7\xf0\x18\x98\x3e\x0f\x6f\xf3\x38\
+\x45\xea\xba\x38\xc5\xf0\xa3\x4e\xa4\x63\xe5\x73\xc1\x45\x68\x00\
+\x9f\x7b\x7b\xd6\xfb\x83\xe2\x4c\x4e\x35\x55\xc8\x46\xc2\x99\x9a\
+\x0a\x17\x3f\x85\xb3\x41\x5e\x10\x66\x65\x87\xa5\x9a\x18\xc2\xa3\
+\x9f\xe2\x3c\x2f\xe2\x56\x5a\xdf\x31\x72\x1d\x27\x3a\xa5\xf3\xe0\
+\x0c\x45\xdb\x67\x18\xc0\x27\x1e\x7f\x08\x80\x42\xf9\xd9\x44\x6b\
+\xfb\x05\x0a\xe5\x1f\x22\x5c\x6a\x91\x0f\xa2\xdc\x00\x98\x87\x32\
+\xa2\x20\x0f\x06\x8e\x5c\x07\x0e\x80\x47\x91\xb1\x76\xb4\x26\x4b\
+\xc4\x99\x98\x41\xa0\xbc\xd9\x33\x72\xed\xd0\x6c\x06\xe9\x9c\x88\
+\x90\x80\xe2\xca\x20\x50\x00\xa8\x14\x0a\x2d\xe9\x1c\x55\x4b\xa5\
+\xa8\xf2\x05\xc5\x9c\x9c\x8f\x3e\x3b\x6f\x48\x6c\xcf\x95\xab\xdf\
+\x23\xfa\x7e\x70\x5d\xce\xe7\x5b\x6a\x3d\x70\xcb\x15\x8f\x35\xea\
+\x43\x95\xf7\xe6\x63\x88\x41\x1d\xa2\xe4\x9e\xe1\xd1\xcf\x44\xe5\
+\x13\xaf\x47\xc5\x7e\x9a\x9b\x71\x94\xdc\xa8\x70\x1d\x07\x3b\x97\
+\x0b\x39\x82\xa0\x43\x0b\x71\x04\x61\x11\x1a\xa9\xbf\x1e\xfc\x95\
+\x28\x5b\xb4\xab\x0b\x93\xdc\x98\x29\x34\xb7\x5c\xc6\xce\x8d\x4f\
+\xfb\x30\xc2\xc5\x9e\xe1\x6b\xbf\xa9\xc7\x1c\xaf\x1b\x15\x16\xd0\
+\xdc\x93\xc2\x49\x81\x11\xf0\xb9\x36\xb9\xa7\x1b\x72\x4d\xa8\x96\
+\x4a\x94\x72\xb9\x50\x79\x81\x91\xdc\xe3\xc2\xe0\x62\xb4\xf9\x65\
+\xd0\xe5\xb3\x17\xf0\x47\x02\xf8\xbb\x43\xfb\xc6\xa0\xcb\x57\x26\
+\x27\x71\xa2\x74\x79\xe1\x62\xee\x71\x61\x70\x4d\xe8\xf2\x91\xf7\
+\x6c\xbc\x82\x09\xc7\xa1\xfc\xc3\xb3\x19\x51\x1e\xd0\xa1\x9e\x91\
+\xd1\x3f\xae\x69\xc1\x44\x14\xf3\x96\xcc\x64\x32\x58\x6d\x4d\x2e\
+\x99\x99\x9a\xf2\xfc\xfb\x48\xc9\x8c\x2a\xef\xd5\x5b\xf0\xe6\xc3\
+\x9a\x16\x4d\x59\x99\x8c\xc7\xc6\x6a\x60\xd1\x54\xb5\x58\xc4\x29\
+\xce\x2d\x9a\x52\xcc\xc9\x85\xb6\xba\x7a\x58\x55\xd9\x9c\xcf\x2b\
+\xfe\x08\xe8\x08\x3b\x0c\xca\xe6\xb6\x6f\xf3\x38\x39\xab\xcc\x39\
+\xaa\x2a\x35\xdb\xa6\xf6\x7c\x81\xb2\x39\x91\x0f\x7a\x86\xaf\x7e\
+\xda\xd4\xb2\xb9\x28\xee\x0d\x1c\xd8\x01\xd6\x19\x81\xdf\x31\x5f\
+\xe1\x64\x32\x85\x49\x25\x31\xc9\x24\xc6\x5a\x62\xe1\xa4\xe3\xe0\
+\x96\xcb\xb8\x76\x99\xaa\x5d\x06\x9d\x73\x34\x9f\x50\x38\x0b\xce\
+\xd0\x6c\xdf\x7e\xb9\x58\xb3\x35\x7c\xfc\x97\xaf\x67\x7c\x06\xe6\
+\xbb\x8d\x2b\x9d\xe5\x0e\xc8\xf9\x74\xac\x7c\x2e\x7a\xa4\x5d\x0d\
+\x1a\xb2\x89\xdd\x1b\x38\xd2\xe7\xf3\xf0\xde\x40\xf8\xf9\x2a\xde\
+\xa3\x28\x5f\x01\x5f\xaa\x70\x31\x08\x63\xad\x25\x1a\xbe\x8b\x3f\
+\x3a\x7e\xb8\xc3\x55\x39\xa4\x2a\xfb\x55\xe8\x15\x75\x7b\x11\xe9\
+\xc0\xe3\x25\x04\x15\x0d\x05\xbc\xf2\xf9\xbc\x8a\x19\x13\x65\x4c\
+\x44\xef\x18\xd1\xeb\xbb\x87\x47\xf3\x0b\xf7\xbe\x7a\xfc\x1f\x0c\
+\xc3\x48\x0d\x6d\x4f\x1d\x9b\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
+\x42\x60\x82\
+\x00\x00\x00\x68\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x00\x1a\x49\x44\x41\x54\x58\x85\xed\
+\xc1\x01\x01\x00\x00\x00\x82\x20\xff\xaf\x6e\x48\x40\x01\x00\x00\
+\x00\xef\x06\x10\x20\x00\x01\x47\x01\xa0\x88\x00\x00\x00\x00\x49\
+\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x04\x25\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x03\xd7\x49\x44\x41\x54\x58\x85\xbd\
+\x97\xcf\x6f\x54\x55\x14\xc7\x3f\xe7\xde\xf7\x86\xe9\x74\x46\x03\
+\x51\x68\x0b\x4b\x74\x51\x02\x2e\x10\xf0\xc7\xa6\xb8\x24\x68\xea\
+\xa6\x89\x46\x16\xc4\xb5\x1b\x97\x12\xed\x54\x91\x44\x17\xb8\xf0\
+\x0f\x60\x01\x42\xc2\xc6\x26\x18\x96\x42\xe2\x42\x11\x09\x0b\xa5\
+\x1b\x5d\x96\x29\x26\x4a\x80\x37\xcc\x7b\x33\xef\xdd\x73\x5c\x4c\
+\x5b\xdb\xa1\xd0\x02\x33\x7c\x93\x97\x97\xdc\x7b\xdf\xfb\x7e\xcf\
+\x39\xf7\xdc\x7b\x8e\xb0\x41\x9c\xaf\x8f\x97\x0a\x1b\x7e\xcb\xe0\
+\xb0\xc0\x2e\x90\x31\x60\x6c\x71\xba\x01\xd6\x30\xb8\x21\xf0\x43\
+\x24\xf7\x7f\x9c\xaa\xcf\x75\x36\xf2\x5f\x59\x6f\xc1\xb9\xfa\x9b\
+\x63\x58\x67\xda\x90\xf7\x10\x6a\x51\x24\x44\x91\xe0\x44\x70\xae\
+\xbb\x46\x15\xd4\x8c\xa2\xe8\x3e\x18\x89\x60\xe7\x8a\x5c\xeb\x47\
+\x4e\x5c\x5b\x78\x22\x01\xa7\xa6\x27\xca\x25\xd2\x63\x60\x1f\x7b\
+\x47\x65\x68\xc8\x11\x97\x1c\xce\x3d\x5a\xb3\xaa\x91\x77\x94\x34\
+\x55\x82\xd2\x02\x39\xd9\x61\xe8\xcb\xa3\x33\x97\xb3\x0d\x0b\x38\
+\x5f\xdf\x37\x52\x20\xb3\x0e\x39\x50\xae\x38\xca\x65\xf7\x48\xd2\
+\x87\x21\xcb\x94\xac\xa5\x28\x76\x25\xc2\x26\xa7\xea\x57\x6f\xad\
+\x2b\xe0\xcc\xa7\xaf\xef\x76\x2e\x5c\xf4\x9e\x1d\xb5\x5a\x84\xf3\
+\xeb\x46\xe9\x91\x08\x01\x9a\x49\x41\x08\x36\xaf\xea\x0f\x7d\xf0\
+\xc5\xcf\xbf\x3f\x54\xc0\xe9\x4f\xf6\x8e\xfa\xd8\x5f\x8d\x63\xd9\
+\x5e\xad\x45\xc8\xd3\x71\x2f\xc3\x14\x9a\xcd\x82\x3c\xb7\xf9\x48\
+\x6c\xdf\x4a\x4f\x2c\xfb\xf6\xd4\xf4\x44\xd9\xc7\xd1\xac\xf7\xf4\
+\x95\x1c\x40\x1c\x54\xab\x11\xde\xcb\x8e\x02\x99\x3d\x35\x3d\x51\
+\x7e\x40\x40\x89\xf4\x98\x38\xdb\x5f\xeb\x33\xf9\x4a\x11\xb5\x9a\
+\xc7\x21\x07\xba\x9b\x7b\x71\x1c\xba\xa9\xa6\x96\xff\x39\x3c\xec\
+\x2b\x4f\xba\xe1\x36\x8a\x2c\x0d\xdc\x6f\x69\x4b\xf3\xb0\xf3\xc8\
+\x89\x6b\x0b\x5d\x36\xeb\x4c\x7b\x27\x95\xf2\xa6\x01\x98\xde\x83\
+\x72\xd9\xe1\x9d\x54\x7c\xec\xa7\x01\xe4\xe2\x47\x3b\x37\xdd\xd9\
+\xb2\xe5\x9f\x4a\xc5\x57\xcb\x43\x83\xb5\x7e\x09\x59\xaa\xb4\x5a\
+\x21\x89\xa4\xf9\x82\xbb\xb3\x65\xf3\x41\xa0\x5a\x2a\x0d\xde\xfa\
+\x25\x94\xba\x9e\xae\xe5\x5a\x3d\xe8\x0c\x0e\x47\x91\x3c\x75\xbe\
+\x3f\x0e\x9c\x13\x7c\x24\x20\xf6\xb6\x13\xd8\xe5\xa3\x67\x47\xbe\
+\x84\x28\x12\x44\x64\x3c\x02\x19\xf3\xbd\xa1\x37\xb8\x79\x33\xa1\
+\x9d\x15\x7d\x21\x1b\xaa\xc4\x8c\x8e\x56\x57\x1d\x7b\x8b\x57\xca\
+\x58\x04\x8c\x49\x4f\xe2\x5f\xbf\xfe\x37\xbf\xfd\xda\xe8\x0b\xf9\
+\x12\x5e\x7b\x63\x3b\xbb\xf7\x6c\xfd\x5f\x80\x17\x30\xc6\xba\xb6\
+\xf7\x44\xc0\x0d\x20\x19\xa4\xf7\x16\xb5\xee\x2b\x02\x1a\xaa\xbc\
+\xbc\x72\x6e\xcf\x2b\xdb\xd8\x36\x32\x4c\x96\xf6\x27\x04\x95\x4a\
+\xcc\x8b\x5b\x87\x57\x8d\xa9\x02\x42\x23\x02\x6b\x58\xb0\x55\x02\
+\x44\x60\x64\xa4\xda\x17\xf2\x87\xc1\xd4\x00\x1a\xce\xe0\x46\x1e\
+\x6c\xa0\x64\x6b\x21\x0f\x8a\x99\xcd\x39\x4c\x2e\x84\xc2\xba\x2e\
+\x79\x46\xd0\x60\x84\x02\x30\xb9\xe0\x62\xd7\xbc\x04\x24\x9d\xf6\
+\xb3\x53\xd0\xe9\x18\x40\x12\xbb\xe6\x25\x37\x55\x9f\xeb\x18\x7c\
+\x97\x66\x61\x79\x67\x0e\x12\x66\x46\x9a\x29\xc0\xd9\xa9\xfa\x5c\
+\xc7\x01\x68\x1e\x3e\x57\xa5\x95\x66\x61\xe0\x02\xb2\x54\x51\xb5\
+\x56\xc8\xc3\x0c\x2c\x16\x24\x47\x4e\x5c\x5b\x10\xe1\x9b\x2c\x55\
+\xc2\x00\x37\x64\x28\x20\xcb\x0c\x90\x93\x4b\xe5\xfa\xf2\x91\xd3\
+\xb6\xca\x71\x83\x2b\x49\x12\xb0\x01\x68\x30\x35\x92\x24\xc7\xb0\
+\x2b\x9b\x6f\xff\x7b\x7c\x69\x7c\x59\xc0\xd1\x99\xcb\x59\x84\x4d\
+\x6a\xb0\xf9\xe4\x5e\xd1\xd7\xac\x50\x85\x24\x09\xa8\x32\x1f\x61\
+\x93\x87\xbe\xfd\xab\xfd\x80\x00\x80\xa9\xfa\xd5\x5b\xaa\xfe\x50\
+\x51\xd8\x7c\x72\xb7\x20\x14\x4f\xef\x8a\x22\x18\xf7\xee\x16\x14\
+\x45\xb7\x2c\xef\xed\x0d\xd6\xbc\x87\xbb\xe5\x79\x34\x2b\xc2\xfe\
+\xf2\x90\x50\x2e\xfb\xc7\x2e\x54\xcd\x20\x4d\x95\x2c\x0b\x88\xf1\
+\x8b\x17\x7b\x77\xad\xc6\xc4\xaf\xf5\xf1\xf7\x3f\x2d\x34\x0f\x4f\
+\xbc\x74\xc6\x4b\x2e\x79\x6e\xaf\x76\xda\x1a\x83\x20\x8e\x75\x5b\
+\xb3\x10\xa0\xdd\x56\x9a\xcd\x40\x91\xeb\x7d\x11\xf9\xea\xf9\xdb\
+\xb7\x3f\x9c\xfc\xfa\x8f\xbb\x6b\xad\x5f\xd7\xae\xd3\x9f\xec\x1d\
+\x75\xb1\xff\x4c\xe0\x7d\xe0\x39\xe7\x85\x38\x5a\x2d\x46\xd5\x30\
+\x85\xa2\x50\x42\x37\x93\x13\xe0\x6c\xc8\xc3\xcc\x13\x37\xa7\xbd\
+\x38\x5f\x1f\x2f\xe5\x5a\x3d\x28\x22\xef\x80\x8e\xaf\x68\xcf\x0d\
+\xa1\x01\x34\xcc\x6c\x0e\x93\x0b\xb1\x6b\x5e\xda\x68\x7b\xfe\x1f\
+\x08\x90\xb9\xb0\x8c\xaa\x59\xa2\x00\x00\x00\x00\x49\x45\x4e\x44\
+\xae\x42\x60\x82\
+\x00\x00\x0c\xd6\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x0c\x88\x49\x44\x41\x54\x78\x9c\xe5\
+\x9b\x5b\x6f\x5b\xc7\x11\x80\xbf\x25\x45\x8a\x94\x28\x89\x92\xad\
+\xbb\x64\xc9\x4e\x9a\xc2\x41\xe0\x26\x45\xd1\xa0\x48\x0a\xf4\xa9\
+\x7d\xe9\x7b\x81\x16\xfd\xa3\x7d\x2a\x50\xb4\x0f\x41\x90\x36\x4e\
+\x52\x20\x69\x92\xc6\x96\x6c\xc9\x37\x5d\x48\x49\xa4\x2e\xe4\xf4\
+\x61\xf6\x1c\xee\xd9\x33\x87\xa4\xe4\xf4\xc9\x03\x10\x24\x77\xf7\
+\xcc\xce\xcc\xee\xce\x6d\xe7\x00\xb2\x05\xe2\x78\xe3\x40\x9c\xf2\
+\x9e\xfe\x78\x93\x84\x90\xe3\xf9\x4d\x12\x42\x96\x57\x97\xed\xe0\
+\x0e\xf0\x18\x9c\x14\x3c\xdc\x00\x6e\x19\x1d\x25\x60\x32\x8b\x2f\
+\x6d\xaf\x0d\xa1\x66\x12\x10\xe0\x62\xc8\x98\x73\xa0\x67\xb4\x77\
+\x81\xbe\xd1\xfe\x12\xdc\xa9\x8d\x2a\xcf\xa3\x1b\x35\x00\x64\x1b\
+\xb8\xed\x09\x3d\x01\x5e\xf8\x89\xa7\x80\x39\xdf\x2e\xc0\x59\xd0\
+\x3e\xeb\xdb\xfa\xbe\x1d\x8f\xa3\x0a\x34\x81\x8a\xef\x3f\xf7\x34\
+\x54\xfd\xf7\x25\x70\x04\x97\xa7\x50\x39\xf2\x6d\x53\xa8\x20\x9d\
+\x9f\xff\xc4\xff\x9f\xf2\x6d\x0e\x68\x01\xa7\xbe\x7d\x29\xe8\x7b\
+\x01\xee\x71\x31\x6f\x85\x52\x92\x2d\x90\x09\x90\x8f\x40\x56\x8d\
+\x31\x6b\x20\x0b\x46\xfb\x06\xc8\xbc\xff\x3d\x05\x72\x0f\xe4\xae\
+\xff\xcc\x80\xdc\x01\x19\xb2\x23\xa4\xee\xc7\x2c\xa8\xe0\xe5\xae\
+\xc7\x31\xe1\xfb\xe7\x40\x36\xf3\x47\x55\x9a\x05\xed\x1b\x20\xbf\
+\x06\x29\x5f\xf3\x88\xcb\x04\xc8\x9f\xf5\xc1\x5c\xdf\x36\x48\xc5\
+\x68\x7f\xdb\x3f\xb7\xe2\x27\x5b\x8e\xf0\xdd\x1b\x73\x72\x3c\xe3\
+\x25\xff\xdb\x79\x46\xb6\xa0\x75\x4b\xdb\xe5\x2d\x83\xd9\x32\xc8\
+\x4f\x8c\xf6\x09\x90\x3f\xda\xbc\x14\x13\xf0\x91\x7f\x30\x92\x9a\
+\xac\x17\x30\x7f\xc7\x7f\xb6\xed\x15\x96\xed\x6b\x4c\x4e\x60\xa2\
+\xe2\xf6\x59\x15\x4e\x7b\x49\xe7\xcb\xf5\x97\xb3\xcf\xa5\xbb\xb9\
+\x02\xf2\xab\x71\x27\xdf\x1e\x6c\xfb\x50\x63\xca\x14\xc8\x6d\x63\
+\xfc\x2a\xc8\x07\xba\x7d\x4d\x7c\xf3\x5e\x79\x5e\x13\x64\x56\xb7\
+\xbc\xd9\x37\x07\xf2\x00\x64\xd1\xe8\x6b\xfa\x67\x23\xcb\x26\x9b\
+\xfa\xc9\x82\x71\x26\xe4\x17\xe0\x3e\x0d\xfe\x27\xca\xa3\x07\xec\
+\x01\x21\xa3\xab\x70\x79\x0b\x2a\x5f\x0e\xe1\x64\x0d\x78\x5a\xd0\
+\x97\xda\xe1\x1b\x3c\x0b\xf0\x00\xba\x4f\xa0\xf6\x2a\x68\xeb\x28\
+\x5d\x94\xc9\x29\xbc\x98\x37\x98\x30\x90\xc6\xc4\x34\x50\xe6\x1f\
+\xa0\x5a\xbd\xed\xc7\x6c\x01\x2f\x54\xa1\x0f\x05\xf1\xc4\x2c\xf9\
+\xff\x89\xe9\x4a\x34\x78\xd8\x46\xd0\xf6\xc2\xa0\x25\x86\x17\x20\
+\x82\x32\xbc\xe7\x9f\x5d\x02\x7e\x06\x7c\x0e\xcc\xa0\x16\x22\x81\
+\x9c\xd9\x8c\x04\x20\x0d\xd4\xcc\x24\xff\x37\x80\x36\xb8\x5d\x3f\
+\x51\x05\x35\x5d\x9b\xc0\xd7\xe0\xae\xf4\x7c\xb9\x13\x72\x20\xce\
+\x8f\x9b\x42\x7d\x81\x6f\x47\x98\x9f\xf8\xd9\x45\x60\x1a\x35\xa9\
+\x7b\xf6\xb3\xd2\x86\xfa\x0b\xd4\x9f\x58\x01\x7e\x00\x16\x80\xcf\
+\x80\xe7\x80\xb7\x3c\xec\xf8\xe7\x7b\xaa\xdb\xdc\x55\xd1\xc4\x5b\
+\x03\xf3\x26\x5b\x59\xcd\x29\x1b\x5e\x0f\x7c\x1c\x29\x46\xcb\x4c\
+\x2e\xa1\xa6\x72\x46\x3f\x37\x05\x59\xf5\xca\x78\x3d\x6b\x55\xd2\
+\xfe\x99\x81\x7e\x91\x09\x90\xdf\x78\x2b\x11\xb6\x07\x8a\x51\xee\
+\xaa\x8e\x18\x40\xc9\x98\xb5\xaf\x13\xb2\x0b\xae\x17\x8d\x5d\x03\
+\xfe\x0e\xdc\x09\x84\x10\xac\xcc\x61\x53\x19\xe7\x10\xdc\x53\xdf\
+\x37\xe6\xaa\x9b\xe0\x9f\x75\x4f\x80\x03\xc5\x7d\xd8\xcc\xf7\x8b\
+\x03\xd6\x81\xbf\x01\xf7\xb2\x73\xba\x9e\xf2\x22\xeb\x18\x47\xc0\
+\x12\xc0\x14\x70\x16\x31\x0f\x7a\xe6\xbf\xf3\x5b\xe9\x31\x59\x21\
+\xa0\x1a\xb9\xd9\x57\xc6\xdd\xe5\xf8\x3c\x8e\x0b\xee\x52\x71\x37\
+\xfb\xd1\x6e\x08\x3d\xbc\x1e\xf0\x04\x3d\x7a\xe1\x90\x1e\xea\x29\
+\x4e\xc7\x58\x2d\x25\x38\xe7\x57\x2f\x00\xd9\x46\x95\x4c\x29\x30\
+\x77\x07\xc0\x7d\xe0\xd2\x9b\xab\x57\xe8\xee\x09\x4d\x9e\x9f\xd0\
+\xdc\x04\x25\xe8\xfa\xe3\x56\x3b\xc4\xf6\xf7\xa7\x81\x2e\x48\x78\
+\x66\xfb\x3a\x56\xee\x03\x47\xe8\xca\x7f\xad\x63\x05\xa0\x03\x9d\
+\x13\xa8\x2f\x92\xd1\x67\xee\x08\xe4\xa7\xf1\x04\x63\x58\x01\x79\
+\x0b\x2e\x2a\x50\x9d\x46\x15\xd3\x29\x83\xad\xbd\x0b\xfc\x0e\xf8\
+\x4b\x01\x03\x01\x74\xe6\xa1\x9e\x04\x3f\x3e\x4e\xa8\x1d\xf9\xce\
+\x79\xd4\x52\xf8\x1d\xd5\x39\x87\xfa\xe1\x10\x64\x5d\xd4\x3c\xfe\
+\x06\xf8\x24\xa0\xd9\x2b\xcf\x7a\x0d\xb8\x0d\x72\x1e\x2d\x66\x6e\
+\x25\x62\x01\xc4\xd1\xe1\x5d\x60\x1a\x26\x1f\xaa\x12\x74\xfb\xd9\
+\xe1\xb2\x0e\xfc\x03\x0d\x70\x8c\x20\x43\x80\xee\x6d\xa8\x4d\x40\
+\xfd\x25\xb8\x4e\x01\x43\x47\xd9\xbf\x52\x07\x16\xe0\xa2\x06\xd5\
+\x93\xbc\xd6\x4e\x7d\x93\xbf\x02\x6b\xe0\xf6\x82\xce\x36\xc8\x09\
+\xba\x63\xdf\xf6\x9e\x6b\x42\x5b\x9f\xe8\xd8\xc7\x3a\xa0\x0a\x9c\
+\xfb\x09\xee\xa1\xab\xf2\x85\x4d\xb3\x2c\xa1\xdb\xbe\x87\xad\x13\
+\xa6\x81\x55\xa8\xb5\x55\x89\x15\x32\x6f\x80\xeb\xe8\x33\xd5\xb6\
+\x32\x18\x1e\xab\x30\xaa\xa3\x87\xfa\x02\x2b\x05\x88\xbe\xf1\x63\
+\xee\xf9\xe7\x3a\x64\x1d\xb9\x22\x2b\xc0\x06\xf0\x0c\xf5\x01\x8c\
+\x03\x7c\xd8\x04\xba\xe0\xba\x9e\xe0\x48\x31\x1e\xcd\x43\xbb\x86\
+\xae\xc2\xf9\x58\x3c\xdb\x70\x01\x3c\x85\xf6\x24\x1c\x2f\x60\x87\
+\xb4\x5d\xe0\x4c\xe7\x8c\xc1\x9d\xa1\x8b\xfa\x83\xe7\x29\xc7\x8b\
+\x25\x80\x06\xea\x3d\x2d\xe6\xb7\x7c\x02\xcd\x29\x70\xad\x6c\x5b\
+\x22\x84\xcb\xf7\x61\xae\x07\xb3\xaf\xcc\x47\x6f\x04\xb3\xaf\x60\
+\xf6\x52\x71\x5b\x47\xcd\xb5\x60\xae\x20\x16\x61\x07\x35\xdf\x2d\
+\xd4\xc2\x65\xc0\x12\xc0\x34\xaa\x3d\x0b\x94\x9a\x2c\xa3\x6e\xaa\
+\x01\xc7\x4d\xa8\x7c\x0f\xcc\x33\x7e\xec\x3d\x06\x88\x03\x16\xa0\
+\xf2\x9d\xce\x61\xc2\x73\xdb\x59\x72\x97\x40\x19\xdc\x31\xba\xb8\
+\x19\xb0\x04\x20\xa8\x69\xd9\x29\x20\x64\xc2\xb6\xf3\x32\x05\xa5\
+\x64\x22\x7f\x1c\xac\x60\xeb\xda\x10\x6e\xfb\x16\x94\x4a\x5e\xbf\
+\xc4\xc3\xae\x94\x36\xb1\x78\x3a\xd4\x23\x34\xda\x0a\x94\x07\x83\
+\x4c\xbf\x7d\x13\xd5\xb2\xe1\x2a\xcc\x82\x74\x81\x15\x98\xd9\x0f\
+\xfa\x5a\xc0\xbb\xc0\x13\xd2\x8c\x4e\x06\x92\xd4\x19\xa8\x4f\x61\
+\xe5\x05\xe7\xd0\x40\xe7\x07\xfd\x2d\xa0\x3b\x73\x03\xe4\x19\x03\
+\x3f\x23\xc1\x7f\xa6\x7d\x1c\x64\xd1\xb8\x63\xef\x0e\x27\x81\x59\
+\x0a\x31\x61\x35\x72\x49\x48\x99\x47\x83\x8d\x65\x4f\x64\x84\x9c\
+\x1e\x74\x66\xa1\x7e\x00\xc4\x41\xc6\x23\x4f\xd0\xd7\xc1\xe4\x2b\
+\x40\x1f\x3a\x67\x50\xdf\x05\x1c\x74\x6f\x41\x2d\xc9\x2f\x3e\xf3\
+\xdf\xce\xcf\xf9\x05\x9a\x2b\x0c\xe1\x15\x74\x66\xa0\x9e\x08\x2d\
+\x9c\xb7\x89\x2a\xbe\xbe\xee\x86\x54\x57\x25\x79\xcb\x4c\xc2\xc6\
+\x5a\x99\x45\xe0\x4b\x90\xaa\x27\xe0\x25\xb8\x43\x34\xd3\x73\x96\
+\x8f\xfc\xa4\x01\xf5\x32\xb8\xe7\x79\x54\x82\x67\x7e\x01\x38\x46\
+\x57\xec\x1b\x63\x77\xb5\xfd\xf8\x32\xba\xe2\x07\x9e\x8e\xff\x68\
+\x5f\x2e\x7a\x3b\xf1\xa6\xcf\x67\x7f\x43\x9a\x64\x1f\x15\x98\x17\
+\x9a\x6c\x02\x4f\xe0\xa4\x03\x8d\x29\xb2\xe1\xb1\xa9\x03\x4a\xa8\
+\x04\x6f\x83\xdb\x09\xec\xf7\x2d\x6c\xe5\x37\x0d\x47\x05\x69\x68\
+\xa5\x00\xcd\xf4\x6e\x01\x4f\x87\x87\xc4\xa9\x2f\x7f\x1f\x0d\x67\
+\x87\x05\x52\x27\x18\xbe\xbd\x5f\x08\x9f\xb9\x72\x27\xa8\xb7\xba\
+\x01\x8d\x03\xf4\x48\x65\xa0\x48\x09\x2e\xe5\xe3\x01\x28\x20\xbe\
+\x01\xf3\x47\x46\x7b\x02\x65\x25\xb4\xf2\x90\x9c\xb3\x94\x9b\x3a\
+\x51\x78\x9f\x61\xdf\x3f\x84\xb4\x14\x08\x20\x37\x4e\x7c\x6a\x7c\
+\xcd\xea\xb5\x04\xb0\x00\x58\xf6\xdf\xba\x84\x18\x07\x56\x18\x24\
+\x34\x0c\x8f\x31\x81\x9c\x93\xf3\x12\x2e\x8c\xd4\x7b\x06\x8a\x84\
+\x69\xd1\xfa\x0a\x43\x60\x05\x47\xe0\x5a\xe1\xec\x28\xc1\xf4\x07\
+\x3b\xa7\x30\x94\x36\x3c\x3c\xd7\x85\xea\xa8\x7c\xdb\x35\x72\x0d\
+\xee\x0c\x55\xe6\x19\x88\x05\x30\x41\x71\x54\x77\x13\x9b\x5e\x83\
+\x6e\x64\xde\x62\x21\x0c\xbd\xb1\xb9\xa9\x1f\x51\xf4\x5c\xae\x3d\
+\xb6\x02\xcb\x70\x65\x69\xf3\xc0\x3f\xc8\xb4\x97\xec\xf6\x14\x9a\
+\x50\x7b\x66\xd0\x21\x20\x8f\xd1\x24\x0b\xc0\xa3\x02\xfd\x32\x62\
+\x85\xbb\x7d\x8d\x34\x73\xd0\xc3\xce\xd6\x8e\x8a\x05\x7a\x15\x98\
+\xb8\xce\xf6\x4f\xec\x75\x11\xf4\x47\xf4\xbf\x26\xd4\x1c\xc5\x47\
+\x70\xac\x79\x23\x01\x94\x9f\xa1\xf6\x37\xc6\xd5\xb3\x11\x8e\xcc\
+\xf2\x1e\x90\x9a\xa4\x10\xd2\x6d\xff\xc8\x7f\x46\x58\x87\x42\x28\
+\x12\x40\x19\xdb\xb3\xcc\xcd\x11\xeb\x80\x2e\x51\xbc\x1c\x40\x11\
+\xb3\xc3\x08\xbf\xca\xcf\x11\x9f\xf9\x51\xd6\x61\x28\x14\x8d\x1f\
+\x5b\x39\xc6\x02\x48\x72\xe7\x39\x6d\x79\x03\x22\x12\xe8\x93\xde\
+\x27\x16\x29\x3c\x4b\x08\x32\x43\xea\xe9\xdd\x78\xee\x00\xc4\xe7\
+\x17\xb3\x60\x99\xc1\x23\x06\xb7\x38\x3f\x06\x3c\x07\x56\x46\x68\
+\x7b\x22\x21\x94\x50\xaf\xcd\xb8\x70\xc9\xc0\x98\xbe\x49\x12\x4e\
+\xe7\x05\x6a\x09\xc0\x01\xfb\xe4\x2f\x12\x8b\xa4\x7d\x00\x6d\x43\
+\x6f\x64\xe0\x25\xf0\x21\x23\x8b\x13\x9c\xa0\x61\xf8\x47\x0c\xbf\
+\x13\xc4\x67\x80\x8e\x8b\x10\x0d\x7e\x8a\x43\xad\xcd\x2e\x63\xe8\
+\x00\x00\xf1\x8e\xd0\x53\x15\x42\x7a\xb3\x73\x80\x79\x1b\xcb\x25\
+\x34\xaa\x43\x28\x4d\xee\xeb\xfe\x05\x6c\x6a\xde\xa0\x08\x64\x8e\
+\xc1\xe5\xcb\xa6\x45\xf0\x00\xe6\x26\x31\xd3\x6d\xed\x45\xd2\x88\
+\x55\x9a\x68\x6e\xe3\x91\xc7\x35\x32\x1f\x00\x9a\xe7\x9f\x04\x77\
+\x0e\xec\x28\x12\xd9\x40\xad\xc3\xbc\x8f\xbd\x43\x44\x4b\xc0\x19\
+\xc8\x3b\x44\x91\x16\x9a\x81\x59\x43\xa3\xba\x26\x70\x01\x17\x5b\
+\x5e\xc7\x58\x4e\xcf\x29\x1a\x19\x2e\xe9\x58\x1e\x00\xff\x06\x89\
+\x4d\x73\x92\xd9\x49\xf2\x01\xc9\xff\x24\x84\xee\x78\xfc\x7b\x7a\
+\xaf\x09\x3e\x83\x9d\xf3\x49\x62\x01\x74\x7c\xdb\x32\x7a\x1e\xd1\
+\x0b\x05\x8e\x3c\xbd\x02\xec\x67\xb7\xb1\xa0\xb9\x43\x59\xcf\xe6\
+\x10\xd3\x73\xf7\x4f\x70\xed\x60\x8e\x82\x3c\xa3\x05\x02\x9a\x38\
+\xd9\x8d\xe6\x5c\xd3\x60\x2d\x61\x3c\x09\x87\xc5\xa1\xbb\xfa\x38\
+\xdb\x0e\x0c\x0a\xb6\x32\xd9\xe9\xf8\x08\x84\x57\xd7\x16\xec\xa1\
+\xc1\x8d\x05\xcf\xc8\x14\x56\xe0\x6f\x65\x5f\xfb\x6e\x30\xb6\x0e\
+\x2b\x14\xe6\x24\x93\xc0\xcb\x84\xe4\x3a\x3e\xa3\x38\x8b\x94\xe0\
+\x85\x6d\x0a\x5d\x5f\x89\xb2\xea\x6d\xdc\x15\xd0\xf2\x67\x30\xc9\
+\xdb\xbf\x0e\xf3\x09\x04\x42\x68\xdd\x46\x13\x24\x56\x4e\xb2\x1c\
+\xd0\x18\xf7\x2d\xa3\xd6\x68\x2c\x25\xd8\x46\xed\xa5\x19\x3f\xfb\
+\x6d\x6e\x64\x5f\x01\x38\x83\xc6\x32\x9c\x9c\x8d\xe1\x25\x5e\x03\
+\x9c\x28\xce\x99\x15\x06\x65\x77\x31\x2c\x53\x7c\xbc\x92\x1a\x85\
+\x9c\x59\xb5\x04\x70\x86\x2a\x97\x72\x41\x86\x15\x38\xee\x90\xbb\
+\xf7\x4f\xb7\xfd\x57\xd0\x38\xd3\x73\xfa\x63\x81\xac\x2a\x4e\xbe\
+\xc2\xf4\x18\xa5\x01\xad\xae\x2d\x74\x99\x83\xb3\x2e\xca\x53\x4e\
+\x78\x45\xf9\x80\xc4\x66\xbe\x6d\x13\xd4\x3c\x54\x84\xc9\x31\xc9\
+\xb9\xb7\xa7\xe8\x96\x5b\x85\x4e\x41\xa1\xd3\x38\x70\x3e\xab\x38\
+\x92\xea\x4f\xd3\x6d\x9e\x04\x66\x61\x2e\x4e\xd6\x26\xb0\x02\x53\
+\xd3\x01\x4f\x19\x88\x05\x70\x41\x9a\x34\x70\xde\x74\xc9\xba\x8d\
+\xd7\xed\x2b\x72\x4a\xd8\xee\xed\x15\xb0\x07\xf5\x4b\x55\x5c\xb2\
+\x38\x9e\xaf\x2f\xce\x8f\x5d\x81\x49\x8f\x23\x3c\xf3\xa1\x10\x28\
+\x01\xab\x76\xfa\x0e\xd4\x34\x5f\x54\xc0\x7d\xeb\x1b\xea\x44\x56\
+\x20\x36\x83\xf1\x95\xd3\x27\x68\x39\x1a\xc0\x32\x5a\x27\xd4\x0f\
+\xc6\x5d\x02\xbf\x45\xaf\xc7\x97\x0d\x9d\x97\xa4\xa0\x4e\xd1\xf8\
+\xfc\x3d\x2f\x84\x61\x89\x0f\x21\xad\x35\xa0\x81\xba\xd1\x56\x4d\
+\xcf\x25\xf0\x7b\xe0\x53\x06\x97\xa3\x89\x19\x4c\xca\x6b\x27\xf5\
+\x66\x3b\x85\x12\xc3\xdd\x67\xd9\x42\x0b\x0f\xc2\xb6\x86\xf7\x08\
+\x37\xa2\xf6\xa4\x0e\x6f\xcd\x7f\x1b\x56\x43\x1a\xdc\xa8\x46\x30\
+\x7d\x7e\x05\xf3\x52\x45\xaa\x68\x09\xed\x1c\xc8\xbb\xb6\x4e\x90\
+\xf7\xf3\xd6\x4a\x3e\x64\x8c\x1a\xa1\x43\x90\x20\x23\xeb\x4e\xe0\
+\xa4\xab\xf5\x80\x29\xa2\xf0\x8a\xba\x0f\xee\x11\xea\x25\xbe\x06\
+\xb3\xe3\x82\xcc\xa0\x29\xfb\xef\xd1\xcc\xcf\x0e\x79\xc5\xb8\x81\
+\xa6\xe0\xc3\x0b\x9e\xe4\x6e\x22\x03\x96\x00\xba\x40\x95\x4c\x49\
+\xec\xcc\x0b\xa8\x4c\x7a\xc9\x16\x85\xb4\xfb\xd0\xaa\xaa\xce\xb8\
+\x56\x5d\xee\x98\x20\x65\xc5\xdd\xaa\x90\xaf\xfa\x08\x14\x63\x7b\
+\x11\xba\x1d\x32\x1a\x5f\x2a\xa8\x6e\xcb\xd5\x28\x58\xb1\x40\x09\
+\xdc\x9e\x6e\x79\x79\x16\x28\xa0\xa7\xa8\x46\xee\x01\xff\x0d\x98\
+\x0f\x24\x3f\x77\xe0\x05\x94\x84\xbf\xa1\x0b\x7c\x13\x48\xbc\xbf\
+\x55\x94\xd1\xa7\x30\x27\x51\xbf\x04\x39\xc6\xfb\xd0\x68\x91\xb9\
+\xbe\x93\x8a\xd2\xe3\x76\x40\xee\x1a\xcc\x66\xe0\x25\x69\x2e\xc0\
+\xed\xa2\x75\x36\xc9\xd6\x17\x54\xf1\x54\xc8\x66\x8d\x22\x1c\x4e\
+\x54\x80\xec\xa3\xb5\x3f\xf7\xc6\x08\x97\x0d\x68\xdd\x46\x9d\x9b\
+\x25\xe0\xb9\xee\xb0\x9c\x9d\x9f\x26\x5d\xd5\xe3\x26\xba\xea\x65\
+\x54\x79\x76\xd0\xda\xe6\x25\x65\x1e\xd0\xcb\xd8\x8c\x33\x14\xed\
+\x00\x77\x9a\x0d\x57\xdd\x1e\x5a\xc3\xbf\x81\x46\x66\x9f\xa3\x42\
+\x78\x00\xe7\x27\x50\x3d\x52\x22\x0b\xcd\x5b\x5f\xe7\x68\x24\x15\
+\x9b\x49\x1b\x80\x83\x0b\xbf\xbb\xaa\xc9\x0b\x14\x21\x1c\x7b\x66\
+\xbc\xa9\x33\x1d\xcb\x65\xc5\x2f\x4b\x1e\x6f\x12\x23\x7c\x00\x3c\
+\x04\x0e\xc0\xbd\x0c\xc6\x97\xe3\x7b\x46\xeb\x08\xc4\xcc\x74\x3d\
+\x21\x0f\xd1\x82\x45\xd0\x2b\xef\x65\xdf\xbe\x1f\xb4\x1b\x20\x62\
+\xf7\x8b\x83\xea\xa4\x67\xb0\x53\xe0\xc5\xad\x8f\xc0\x7d\x05\x4c\
+\xc1\xd1\xf7\xd9\xeb\x39\x71\x9e\xb6\xf8\xcc\x8f\x93\x42\x93\x3b\
+\x03\xe7\x27\x53\x2e\x5f\xcf\x5a\x07\xf0\x66\xe8\x7d\xec\x44\x49\
+\x32\xe6\xff\x50\x2e\x0f\xba\x00\xf2\xf3\xbc\xf9\x95\xa6\x5a\x8a\
+\x5c\xb9\xfc\x1d\xcc\xb2\x5e\x1b\xf9\xc7\xd8\x2f\x4c\xac\x92\x7b\
+\x61\x42\x1c\xfa\x82\x85\xf1\x02\x43\x3a\x66\x7b\xcc\x89\x43\x9c\
+\x05\xcf\x88\x43\xdf\x18\xf9\xa5\xd1\x57\xce\xfa\x2b\xa9\x10\xaa\
+\x8c\xff\xc2\x44\x8a\xe8\x4f\x05\x4e\xc8\x46\x5e\x08\x00\xf2\x1e\
+\xfa\xca\x4a\xee\xa5\x04\x5e\xeb\x95\x99\xb4\xad\xe4\x9d\x9f\xb7\
+\x40\xde\x31\x9c\x9f\xb2\xa5\xe5\x3d\xf3\x7f\xc8\xe3\x2b\x9e\x3c\
+\x91\x5a\x59\xa5\x16\x7b\x80\xe0\x77\x82\x71\x7d\x2d\x1b\x7e\x6b\
+\xde\xd3\x4f\x2b\x74\x9e\x2a\x8c\x7e\x69\x6a\xca\x8f\x09\x04\x2f\
+\x2b\x0c\x5e\xbe\x2a\x7a\x39\x6a\x1e\x33\x66\x91\x2d\xcf\x43\x29\
+\xbf\x9b\x15\x62\x44\x86\x93\x23\x9b\xa8\xb6\xf5\x35\xba\xb4\xfc\
+\xef\x1a\x6a\xe6\x1c\x7a\x01\x72\xc1\xe0\xb5\xb9\x19\x40\xa0\x37\
+\x0d\xe5\xc4\x29\x4a\x4a\x64\x7b\xc1\xff\xe4\xf6\x26\x79\x6d\x2e\
+\x28\x97\x4d\xe9\xeb\xfa\x71\x0e\x35\x61\xa7\xfe\xf7\x24\xaa\xc4\
+\x7d\x01\x06\x1d\x54\xa1\xce\x06\x78\xf6\x06\x4e\x93\xed\xc0\x8d\
+\xb8\xa2\x8e\x41\x26\x30\x4a\xcd\x3c\x9e\x3a\x79\x2d\x1b\xbf\x38\
+\x59\x42\xaf\xca\x92\x23\x54\x65\xe0\x5f\xe0\x99\x38\x24\x6b\xf3\
+\xac\x17\x27\x85\x41\xe2\x33\x06\xa3\xb4\x36\x7d\xac\x88\xc7\x37\
+\xf7\xd5\x59\xab\xe1\x0d\x80\x0c\xcf\x6f\x1a\xf3\x09\xa8\x10\xfe\
+\x07\xb4\x0a\xfd\x7e\xcf\x22\x5b\xc2\x00\x00\x00\x00\x49\x45\x4e\
+\x44\xae\x42\x60\x82\
+\x00\x00\x04\x9f\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x04\x51\x49\x44\x41\x54\x58\x85\xbd\
+\x97\xdd\x6b\x54\x47\x18\x87\x9f\x99\xf3\xb1\xc7\xfd\x68\x5c\x49\
+\xdb\x75\x23\xed\x8a\x5b\x8b\x2b\xa1\x48\x3f\xbc\x28\xa5\x58\xe8\
+\x45\x83\x42\x4a\x69\xa0\xde\x49\xff\x83\xde\x5a\x51\xa9\x5e\xf4\
+\xa6\xff\x82\x37\x45\x21\x52\xb0\x28\x5e\x15\xbd\x69\xa1\x52\xbc\
+\x28\xc1\x8d\x92\x08\xa9\xae\x9b\xad\xa6\x59\x93\xfd\x3e\x67\xce\
+\x4c\x2f\xba\xab\x66\x37\x9b\x5d\x8d\xe9\x0f\x0e\x0c\xe7\xcc\x99\
+\xf7\x99\x39\x67\xe6\x7d\x7f\x82\x21\x95\x9b\xce\xb9\xb6\x6d\x7f\
+\x62\xb4\x38\x0c\xec\x07\xd2\xed\x0b\xa0\xd8\xbe\x6e\x09\x69\xae\
+\x28\xa5\xae\xe5\xa7\xf2\xfe\x30\xe3\x8a\x41\x1d\x0e\xfc\x7c\x20\
+\xad\x02\x7d\x12\xf8\x0a\x48\x44\x9d\x08\x31\xd7\xc3\x11\x36\xae\
+\x65\x03\xe0\x87\x8a\xc0\x28\x6a\x7e\x93\x7a\xd0\x02\xa8\x00\x17\
+\x94\xb0\x4f\xcd\x7e\x71\x73\xf1\x85\x00\x32\xe7\x32\x5e\x22\x3e\
+\x72\x1c\xc1\x37\x8e\x65\x47\x53\xb1\x24\xdb\xbd\x04\x91\x76\xd0\
+\x7e\x6a\x85\x8a\xc7\xcd\x0a\xa5\x5a\x99\x20\x54\x75\x0c\x3f\x54\
+\xaa\x2b\x67\x17\x8e\x2d\x34\x87\x06\xc8\x4d\xe7\x52\x96\x74\x2e\
+\x59\x42\x1e\x4c\xc5\x77\x90\x8a\x25\x11\x62\xe0\x62\xad\x91\x31\
+\x86\x52\xad\x4c\xa9\xba\x4c\x68\xf4\x8d\x50\x07\x93\xf9\xa9\x7c\
+\x69\x20\xc0\xf8\xf4\xf8\x38\x52\x5e\xf5\x6c\x67\x57\x36\x39\x86\
+\x67\xbb\xcf\x15\xb8\x5b\x0d\xe5\x73\xb7\xfc\x80\xa6\x0a\x0a\x68\
+\x3d\x31\x33\x35\x33\xd3\x17\x60\xdf\x4f\xef\xee\xb4\x8d\xfa\x23\
+\xee\x6e\x1b\xcb\x26\xd3\xd8\xd2\xda\x54\xf0\x8e\x94\x0e\x99\x2f\
+\x17\xa9\xfa\x8d\x42\xa8\x83\xf7\x9f\x5d\x09\xd9\x69\x64\xce\x65\
+\x3c\x0b\x75\xc9\xb3\x9d\xb1\xb7\x5e\x62\x70\x00\x5b\x5a\x64\x93\
+\x69\x3c\xdb\xd9\x65\x49\xe7\x52\xe6\x5c\xc6\x7b\xf2\xac\xd3\x48\
+\xc4\x47\x8e\x5b\xc8\x0f\xb2\xc9\x31\xac\x3e\xc1\x75\x10\xd2\x58\
+\x69\x0c\x15\xd4\x7b\xc5\xc3\x72\x9f\xfe\xb0\xb6\xb4\xd8\x93\x1c\
+\xe3\xf6\xd2\xbd\x83\x89\xf8\xc8\x71\xe0\x04\xb4\x3f\x41\x7b\xab\
+\xcd\x8d\x25\x46\xa3\x3b\xe3\x3b\xfa\x0e\x6a\x8c\x61\xe1\xb7\x79\
+\x1e\xde\xe9\xf9\x97\x7a\x24\x2d\xc9\xee\x8f\xf6\x32\xba\xe7\xd5\
+\x35\xf7\x17\x6b\xcb\x3c\x58\x5d\xaa\x2b\x61\x67\x67\xbf\xb8\xb9\
+\x28\x01\x54\xa0\x4f\x76\xb6\xda\x46\x12\x42\x90\xf9\x30\xcb\x6b\
+\x6f\xa7\x06\x02\xe8\x50\xb3\xf0\xeb\x1c\x46\xeb\x35\xf7\x53\xd1\
+\x24\x8e\xb4\xa3\x36\xea\x24\x80\xcc\x5e\xcd\x46\x80\xa3\xc3\x6e\
+\xb5\xe7\x81\x08\x55\x88\x5f\x0f\x7a\xde\x4f\xc5\x93\x60\x38\x9a\
+\x9b\xce\xb9\x32\xda\x8c\x1e\x02\xe2\xdb\xbd\x44\xef\x2c\xb4\x41\
+\x6b\xb3\x29\x08\x4c\xef\xfb\x49\x2f\x0e\x90\x70\xa4\x73\x48\x1a\
+\x2d\x0e\x47\x9d\xc8\xba\x27\x5c\xd8\x0c\x98\xfb\x65\x76\xf3\x10\
+\x5d\x72\x2d\x87\xa8\x13\x41\xc3\x11\x09\xec\x8f\xb9\x5e\xdf\xce\
+\x8f\xef\xff\xb3\x25\x10\x31\xd7\x43\x40\x4e\x02\x69\x47\x6c\x7c\
+\xbe\x6f\x05\x84\x23\x6d\x0c\xa4\x25\x90\x76\x07\x24\x98\xad\x80\
+\x70\xa5\x0d\x6d\x80\xa1\xb5\x15\x2b\x21\x81\xa2\x1f\xaa\xff\x1d\
+\xc2\xd7\x0a\xa0\x28\x81\x62\x60\x86\x07\x78\x59\x10\x81\x56\x88\
+\x36\xc0\xad\x5a\x6b\xdd\x5a\x61\x4b\x21\x6a\x7e\x13\x03\x79\x29\
+\xa4\xb9\x52\x57\x2d\x5a\x61\xd0\xb7\xf3\x66\x20\xdc\x68\xa4\xe7\
+\x99\x1f\x06\xd4\x83\x16\x12\x2e\x4b\xa5\xd4\x35\xa0\x52\x6e\x56\
+\x7b\x23\x0c\x51\x04\x0d\x82\x10\x56\xef\x20\xed\x58\x95\x40\x07\
+\xd7\x65\xbb\x7a\xbd\xf0\x77\xb5\x8c\xee\x3a\x36\x6d\xcf\xc1\x89\
+\x38\x9b\x82\xe8\x96\x31\x86\x52\xb5\x0c\x82\xf3\xf9\xa9\xbc\xff\
+\x5f\x36\x14\xf6\xa9\x40\xab\xfa\xc3\xda\x72\xcf\x0c\x76\x7f\xbc\
+\x77\x4d\x5e\xdf\x2c\x44\xa9\x5e\x26\xd0\xaa\xae\xb0\x4f\xc3\x33\
+\x8b\x3c\x7e\xf1\x9d\xef\x2c\x29\xbf\xdd\x37\xfa\x46\x4f\x1d\xa8\
+\xb5\xa1\xb5\xda\xc0\xac\x93\x58\xba\x15\x89\x45\xfa\x02\x37\x94\
+\xcf\xed\xa5\x7b\x84\x5a\x9f\x99\xf9\xf2\xcf\x13\xf0\x4c\x45\x54\
+\xa9\xae\x9c\x4d\x24\x46\x3e\x9d\x5b\x7e\x70\x70\xdf\xe8\x9b\xd8\
+\xf2\xe9\x19\x25\xa5\x60\xdb\xf6\xe8\xc0\xe0\x1b\x49\xe9\x90\xf9\
+\xe5\x22\xa1\xd1\x37\x1a\xb1\xda\x99\x27\x63\x77\x1a\x0b\xc7\x16\
+\x9a\xa1\x0e\x26\x5b\x61\x50\x98\x2f\x17\x50\x5d\x85\xc4\xa6\x83\
+\x97\x8b\xb4\x42\xbf\x10\xea\x60\x72\x7e\x62\xbe\xd5\x03\x00\x90\
+\x9f\xca\x97\xd0\x7a\xa2\xea\x37\x0b\xb3\x4b\x7f\xd1\x54\x43\xb9\
+\xab\x0d\xd5\x50\x3e\xb3\x4b\xf7\xa9\xfa\x8d\x02\x5a\x4f\x74\x7b\
+\x83\xa1\x8c\xc9\xeb\xb1\x24\xf2\x45\x8c\x49\xbd\x4c\xa9\xb2\x4c\
+\x68\xf4\xef\xa1\x0e\x3e\x5f\xcf\x98\xac\x5b\xfe\x3e\xba\xf8\xa8\
+\x1a\xfd\x6c\xdb\x8f\x8e\x13\xa1\xe2\xd7\xdf\x5b\xaa\xaf\x3a\x42\
+\x80\x6b\xd9\x7d\x2b\xe6\x8e\xfc\x30\x60\xa9\xb1\xca\xdd\xf2\x22\
+\x8f\x9b\xd5\x9a\x11\xe6\xfb\x46\xb4\xf6\xf5\x9d\xc9\x3b\x2b\xeb\
+\xf5\x1f\x38\xad\xb6\x59\x39\x45\xb7\x39\x95\x76\x27\xa5\xe2\x6b\
+\x45\xa0\xbb\xcc\xa9\xe0\xbc\xc2\x3e\xfd\xc2\xe6\xb4\x5b\xb9\xe9\
+\x9c\xeb\x48\xe7\x90\x86\x23\x02\x72\xa6\xcb\x9e\x0b\x28\x1a\xc8\
+\x4b\xb8\x1c\xe8\xe0\xfa\xb0\xf6\xfc\x5f\xd9\x43\x4d\x92\xa7\x32\
+\x15\x82\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x04\x01\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x03\xb3\x49\x44\x41\x54\x58\x85\xbd\
+\x57\xbf\x4f\x1c\x47\x14\xfe\xde\x9b\xd9\x63\x77\xb9\xe3\x90\x1c\
+\x23\x7c\x10\x09\xa4\x24\x05\x90\x22\x91\x13\x17\x51\x22\x48\x17\
+\x64\x4b\x49\x83\x14\x29\x14\xf9\x17\xd2\x52\x80\xa5\xd0\xf2\x2f\
+\x50\x24\x32\x12\x15\x92\x2d\xa7\xb3\x51\x68\x8c\xdc\xc5\x36\x8d\
+\x0b\xa2\x04\x1d\x16\x32\x32\xdc\x8f\xdd\xe5\x76\x66\x5e\x0a\xe0\
+\x04\x67\xe2\x3b\xf0\xc2\xd7\xed\xd3\xcc\x7c\xdf\x7b\xb3\xfb\xf6\
+\x7d\x84\x0e\xf1\x7c\x79\x24\x57\x34\x7d\xdf\x0a\xb9\xdb\x80\x8c\
+\x3a\x50\x89\x80\x12\x00\x08\x50\x66\x48\x19\xa0\x17\x24\xfc\x60\
+\x5f\xef\x3c\x1a\x9b\xda\x68\x74\x72\x2e\xb5\x5b\xf0\xcf\xd2\x57\
+\x25\x81\x9a\x85\xe0\x47\x10\x0a\xda\x53\xd0\x9e\x06\x33\x43\x11\
+\x03\x00\xac\x38\x38\xe7\x60\x52\x03\x93\x5a\x40\x50\x05\x61\x49\
+\x8c\xcc\x0d\x4d\xaf\x6d\x5f\x48\xc0\xe6\xe2\xb8\xaf\x7c\x37\x23\
+\xc0\x2f\xcc\x14\x86\xdd\x01\x72\x5d\x39\x28\xc5\xef\x14\x6c\xad\
+\x43\xe3\xa0\x81\xa8\x1e\xc3\x39\x89\x08\x58\xb0\x09\xcf\x0f\xff\
+\xbc\x9a\x74\x2c\x60\x73\x79\xbc\x9f\xac\x5b\x51\x44\xb7\x82\xbc\
+\x8f\x20\xf0\x41\xd4\xb6\x58\xa7\x20\x22\x88\xe3\x04\x71\x2d\x81\
+\x15\x59\x17\xc5\xdf\x0f\x4f\xad\xbe\x6a\x2b\xe0\xdf\xdf\xbf\xf9\
+\xd4\x29\x3c\x54\x8a\x07\x7b\x7a\x0b\xd0\x5a\x9d\x8b\xb8\x15\xc6\
+\x58\x54\xf6\xaa\xb0\xd6\x6d\xb1\xc5\xe4\x87\x3f\xfd\xf9\xec\x7f\
+\x05\xfc\xfd\xdb\xd7\x37\x48\xd3\x53\x2f\xa7\x07\x8a\xbd\x79\x10\
+\xbd\xbb\xdc\x9d\x42\xc4\x61\x7f\xaf\x86\xb4\x61\xb6\x9c\xe2\x2f\
+\x4e\x56\xa2\xc9\xb0\xb9\x38\xee\x93\xa6\x15\xa5\x78\xa0\x58\x2c\
+\x64\x46\x0e\x00\x44\x8c\x62\x6f\x1e\x4a\xf1\x20\x59\xb7\xb2\xb9\
+\x38\xee\xbf\x25\x40\xf9\x6e\x86\x89\xbe\xec\xe9\x2d\x80\xf8\x7c\
+\xf7\xdd\xa9\x88\x9e\xde\x02\x14\xd1\x2d\xe5\xbb\x99\x66\x1c\x68\
+\x7e\x6a\x2f\xbb\x0b\x41\x18\x86\x41\xe6\xe4\x27\x11\xd5\x63\xd4\
+\x6b\x71\x24\x46\x3e\x1a\x9a\x5e\xdb\x66\x00\x10\xa8\x59\x66\x0a\
+\x83\xc0\x6f\xb7\xff\xbd\x11\x84\x3e\x98\x39\x24\x8f\x66\x01\x80\
+\x5e\x3e\xfc\xae\x2b\xb7\x5f\x7f\x9d\x2f\x84\xf9\x20\xbc\x7c\x01\
+\x00\x10\x47\x09\x6a\x95\xa8\x5a\xd5\xaf\x3f\x60\x7f\x2f\x9e\x00\
+\x90\xcf\x75\xe5\xae\x84\x1c\x00\x72\x5d\x39\x80\x50\xe8\x49\xaf\
+\x4d\xb0\x90\xbb\xad\x3d\xd5\xb6\xc3\x65\x09\xa5\x18\xda\x53\x00\
+\xd3\x1d\x06\x64\x54\x7b\xfa\xca\xc8\x8f\xa1\x3d\x0d\x11\x8c\x68\
+\x07\x2a\x31\x9f\xce\x5e\x20\xd8\xde\xae\x21\x8e\xd2\x4c\xc8\x7c\
+\xdf\x43\x69\x20\x0f\x3a\xd1\xf7\x0e\x39\xa9\xa4\x09\x28\xa9\x96\
+\xa6\xf3\xec\xaf\x1d\x3c\x59\xdf\xca\x84\xfc\x18\x37\x6f\x96\xf0\
+\xf9\x67\x37\x9a\xcf\x87\x9c\x52\x3a\xf3\xe2\x95\xca\xbe\x11\xb5\
+\x56\xf9\x18\x5a\x80\xb2\x15\xf7\xc9\xc9\xe0\xe8\x48\x1f\xae\x5f\
+\x0f\x11\x45\x26\x13\x72\x3f\xd0\xe8\xef\xcb\x9f\x8a\x59\x71\x00\
+\xa8\xac\x19\x52\x76\xee\xb4\x00\x10\xd0\xd7\xb2\x21\x6b\x38\xe7\
+\x00\x48\x99\x01\x7a\x61\xd2\x6c\x32\x3d\x0f\x4c\x6a\x40\x84\x0d\
+\x26\xe1\x07\x26\xb5\xb0\xd6\x5d\x19\xb9\xb5\xee\x70\x74\x73\x72\
+\x9f\xf7\xf5\xce\x23\x08\xaa\x8d\x83\x8e\x66\xc8\x4c\xd0\x38\x68\
+\x00\x82\x6a\xc5\xdb\x7d\xcc\x63\x53\x1b\x0d\x10\x96\xa2\x7a\x0c\
+\x11\xb9\x74\x72\x11\x41\x54\x4f\x00\xc6\xbd\xb1\xa9\x8d\xc6\xe1\
+\xdf\xd0\xc8\x9c\x73\x12\xc5\xf1\x99\x73\x63\xa6\x88\xa3\x04\xce\
+\xb9\x48\x52\xb9\x0b\x1c\x0d\x24\x43\xd3\x6b\xdb\x04\x2c\xc4\xb5\
+\x04\xc6\xd8\x4b\x23\x37\xc6\x22\xae\x27\x20\x60\xe1\x78\x5c\x6f\
+\x76\x07\x9b\xf0\xbc\x15\x59\xaf\xec\x55\x21\x92\xfd\x0b\x29\xe2\
+\x0e\x87\x53\x91\xf5\x83\x62\xf7\xaf\xc7\xf1\x53\x2d\x6f\x73\x79\
+\xbc\x9f\xad\x7b\xea\xe5\xf4\xe0\x95\x0f\xa5\x00\x30\x3c\xb5\xfa\
+\x8a\x2d\x26\xd3\x86\xd9\x7a\xb3\x5b\xc9\xe4\x3a\x8c\xb1\x78\xb3\
+\x5b\x41\xda\x30\x5b\x6c\x31\xd9\xea\x0d\xda\x1b\x93\x6e\x1f\x41\
+\x78\x41\x63\x12\x25\x88\xeb\x09\x44\xe4\x89\x55\xfc\x43\x47\xc6\
+\xa4\x29\xe2\xbd\xad\x59\x02\xe7\x5c\x9d\x40\x0b\x07\xc5\x70\xfe\
+\xe3\xc9\x3f\x0e\xce\x5a\xdf\x36\xad\x23\xb3\x32\x77\x6e\x73\xca\
+\xb8\x27\xa9\xdc\xbd\xb0\x39\x6d\xc5\xf3\xe5\x91\x5c\x4f\x7a\x6d\
+\x02\x4c\x77\x44\x30\x02\x50\x09\x90\xd2\xd1\x31\x65\x40\xca\x44\
+\xd8\x80\x93\xfb\x15\x6f\xf7\x71\xa7\xf6\xfc\x3f\x0f\xf4\xcc\xa5\
+\x24\x80\x2d\x10\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\
+\x00\x00\x03\xb6\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x03\x68\x49\x44\x41\x54\x58\x85\xbd\
+\x97\xbd\x6b\x1c\x57\x14\xc5\xcf\xbd\x6f\x66\x34\x33\xda\x2f\x70\
+\x08\xce\x5a\x01\x09\x92\x46\x56\xca\xc4\x45\x88\x59\xa5\xb3\xb0\
+\x21\x69\x16\x02\x51\x91\x7f\x21\xad\x0a\xc9\x10\xb5\xfa\x17\x54\
+\x38\x58\xa0\x4a\x60\xe3\x74\xb6\x88\x9a\x08\x97\xb6\xb7\x71\xb1\
+\x21\x16\x2b\x63\x2c\x2c\xed\xc7\xcc\xec\xcc\x7b\xef\xa6\x58\x69\
+\xb1\x15\xc7\xbb\x92\x57\xfb\x2b\x1f\x33\xef\x9c\x77\x1f\x73\xe7\
+\x1e\xc2\x90\x3c\xdd\x9c\xf5\x8a\xfa\xd3\xef\x85\xec\x4d\x40\xae\
+\x5a\x50\x99\x80\x32\x00\x08\xd0\x60\x48\x03\xa0\x67\x24\x7c\xff\
+\xc8\x79\xf5\x70\xae\x5a\x4b\x87\xd9\x97\x06\x3d\xf0\xcf\xc6\xb7\
+\x65\x81\x5a\x86\xe0\x27\x10\xf2\x8e\xab\xe0\xb8\x0e\x98\x19\x8a\
+\x18\x00\x60\xc4\xc2\x5a\x0b\x9d\x69\xe8\xcc\x00\x82\x16\x08\x1b\
+\xa2\x65\x65\x7a\x71\x67\xff\x5c\x06\xea\xeb\x15\x5f\xf9\x76\x49\
+\x80\x5f\x99\x29\x0c\x27\x03\x78\x13\x1e\x94\xe2\x0f\x1a\x36\xc6\
+\x22\xed\xa6\x88\x3a\x31\xac\x95\x88\x80\x35\x93\xf0\xea\xcc\x2f\
+\xdb\xc9\xd0\x06\xea\x9b\x95\xcb\x64\xec\x96\x22\xba\x16\xe4\x7c\
+\x04\x81\x0f\xa2\x81\xc5\x7a\x07\x11\x41\x1c\x27\x88\xdb\x09\x8c\
+\xc8\xae\x28\xfe\x61\xa6\xba\xfd\x72\xa0\x81\x17\xbf\x5f\xff\xca\
+\x2a\x3c\x50\x8a\xa7\x0a\xa5\x3c\x1c\x47\x9d\x49\xf8\x34\x5a\x1b\
+\x34\x0f\x5b\x30\xc6\xee\xb1\xc1\xc2\xe7\x3f\xff\xf9\xe4\x7f\x0d\
+\xfc\x7d\xe7\xbb\xcf\xc8\xa1\xc7\xae\xe7\x5c\x29\x96\x72\x20\xfa\
+\x70\xb9\x87\x45\xc4\xe2\xe8\xb0\x8d\x2c\xd5\x7b\x56\xf1\xd7\x6f\
+\x57\xa2\xaf\x50\x5f\xaf\xf8\xe4\xd0\x96\x52\x7c\xa5\x58\xcc\x8f\
+\x4c\x1c\x00\x88\x18\xc5\x52\x0e\x4a\xf1\x14\x19\xbb\x55\x5f\xaf\
+\xf8\xff\x31\xa0\x7c\xbb\xc4\x44\xdf\x14\x4a\x79\x10\x9f\xed\xbe\
+\x87\x35\x51\x28\xe5\xa1\x88\xae\x29\xdf\x2e\xf5\xd7\x81\xfe\xa7\
+\xf6\x7c\x32\x1f\x84\x61\x18\x8c\x5c\xfc\x6d\xa2\x4e\x8c\x4e\x3b\
+\x8e\x44\xcb\x17\xd3\x8b\x3b\xfb\x0c\x00\x02\xb5\xcc\x4c\x61\x10\
+\xf8\x83\xde\xff\x68\x82\xd0\x07\x33\x87\xe4\xd2\x32\x00\xd0\xf3\
+\x07\x37\x26\xbc\xa3\xce\xeb\x5c\x3e\xcc\x05\xe1\xc5\x1b\x00\x80\
+\x38\x4a\xd0\x6e\x46\xad\x96\xf3\xfa\x13\xf6\x0f\xe3\x79\x00\x39\
+\x6f\xc2\x1b\x8b\x38\x00\x78\x13\x1e\x40\xc8\x17\xb2\x4b\xf3\x2c\
+\x64\x6f\x3a\xae\x1a\xd8\xe1\x46\x89\x52\x0c\xc7\x55\x00\xd3\x2d\
+\x06\xe4\xaa\xe3\x3a\x63\x13\x3f\xc1\x71\x1d\x88\x60\x96\x2d\xa8\
+\xcc\x3c\xbe\xd3\x9f\xd0\xd3\xa4\x32\x13\x50\x56\x23\x6c\x3a\xc3\
+\xd2\xd3\x94\xf2\xf8\x95\x4f\xc1\x02\x34\x8c\xd8\xb1\x0b\xf7\x34\
+\xa9\xc1\x0c\x69\x58\x3b\x7e\x03\x3d\x4d\x69\x30\x40\xcf\x74\xa6\
+\xc7\x6e\x40\x67\x1a\x44\xa8\x31\x09\xdf\xd7\x99\x81\x31\xe3\xab\
+\x82\x31\xb6\x37\xba\x59\xb9\xc7\x47\xce\xab\x87\x10\xb4\xd2\xee\
+\x50\x33\xe4\x48\x48\xbb\x29\x20\x68\x35\xdd\x83\x47\x3c\x57\xad\
+\xa5\x20\x6c\x44\x9d\x18\x22\x72\xe1\xe2\x22\x82\xa8\x93\x00\x8c\
+\xbb\x73\xd5\x5a\xda\xfb\x1b\x6a\x59\xb1\x56\xa2\x38\x7e\xef\xdc\
+\x38\x52\xe2\x28\x81\xb5\x36\x92\x4c\x6e\x03\xc7\x03\xc9\xf4\xe2\
+\xce\x3e\x01\x6b\x71\x3b\x81\xd6\xe6\xc2\xc4\xb5\x36\x88\x3b\x09\
+\x08\x58\x3b\x19\xd7\xfb\x8d\xc8\x24\xbc\x6a\x44\x76\x9b\x87\x2d\
+\xc8\x05\xf4\x05\x11\xdb\x1b\x4e\x45\x76\xbb\xc5\xc9\xdf\x4e\xd6\
+\xdf\x99\xbd\xea\x9b\x95\xcb\x6c\xec\x63\xd7\x73\xa6\xc6\x3e\x94\
+\x02\xc0\x4c\x75\xfb\x25\x1b\x2c\x64\xa9\xde\x7b\x73\xd0\x1c\xc9\
+\x75\x68\x6d\xf0\xe6\xa0\x89\x2c\xd5\x7b\x6c\xb0\x70\x3a\x1b\x0c\
+\x0e\x26\x93\x3e\x82\xf0\x9c\xc1\x24\x4a\x10\x77\x12\x88\xc8\x5f\
+\x46\xf1\x8f\x43\x05\x93\xbe\x89\x8f\x8e\x66\x09\xac\xb5\x1d\x02\
+\xad\x75\x8b\xe1\xea\x97\x0b\x7f\x74\xdf\xf7\xfc\xc0\x63\x1d\x87\
+\x95\x95\x33\x87\x53\xc6\x5d\xc9\xe4\xf6\xb9\xc3\xe9\x69\x9e\x6e\
+\xce\x7a\x85\xec\xd2\x3c\x98\x6e\x89\x60\x16\xa0\x32\x20\xe5\xe3\
+\x6d\x1a\x80\x34\x88\x50\x83\x95\x7b\x4d\xf7\xe0\xd1\xb0\xf1\xfc\
+\x5f\xfd\x9e\xba\x33\x94\x6f\xab\x45\x00\x00\x00\x00\x49\x45\x4e\
+\x44\xae\x42\x60\x82\
+\x00\x00\x03\xf2\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x03\xa4\x49\x44\x41\x54\x58\x85\xc5\
+\x97\xcd\x4b\x9c\x47\x1c\xc7\x3f\x33\x3b\xcf\xfa\xb8\x2f\x35\x2b\
+\x29\x35\x6b\x0a\x42\xb7\x87\x6e\xf0\x10\xfa\x92\xb3\xbd\x55\x12\
+\xb0\x08\x42\x8f\xa1\xff\x41\xaf\x1e\x34\xd0\x1c\x7a\xf1\x5f\xf0\
+\x52\x12\xb0\x14\x2c\x09\x39\x26\xd7\x4a\xf1\x24\x59\x1b\xaa\x20\
+\xcd\xba\x6e\xd1\xee\xa3\xee\xfb\x33\xf3\xcc\xf4\xd0\x5d\xb1\xc6\
+\xb0\xd6\xae\xdb\x0f\x0c\x3c\x0c\xf3\x3c\xdf\xef\xcc\x30\xf3\xfc\
+\xbe\x82\x0b\x92\x5f\xc9\xc7\x95\x52\x9f\x3b\x2b\xee\x02\xb7\x80\
+\x6c\xa7\x01\x94\x3a\xed\xa5\x90\xee\xa9\x31\xe6\x79\x61\xae\x10\
+\x5e\xe4\xbb\xa2\xd7\x80\xdb\x3f\xdd\xce\x1a\x6d\x17\x80\xaf\x80\
+\x74\xc2\x1b\x22\x19\xf7\xf1\x84\x22\x1e\x53\x00\x84\x91\x41\x3b\
+\x43\x3d\x6c\xd1\xd0\x6d\x80\x2a\xf0\xd8\x08\xb5\xb8\x39\xbb\xbe\
+\x77\x29\x03\x13\xcb\x13\x7e\x3a\x35\x32\x8f\xe0\x1b\x2f\xa6\x12\
+\x63\xc9\x0c\xd7\xfc\x34\x43\x1d\xd1\xb7\xd1\x8e\x0c\x87\xad\x2a\
+\xe5\x7a\x80\x8e\x4c\x03\xc7\x52\xb5\x76\xf4\x70\xe7\xfe\x4e\xeb\
+\xc2\x06\xf2\x2b\xf9\xb1\x98\xf4\x56\x63\x42\xde\x19\x4b\x8d\x32\
+\x96\xcc\x20\x44\xcf\xc5\xfa\x07\xce\x39\xca\xf5\x80\x72\xad\x42\
+\xe4\xec\x5a\x64\xf5\x4c\x61\xae\x50\xee\x69\x60\x72\x65\x72\x12\
+\x29\x9f\xf9\xca\xbb\x99\xcb\x8c\xe3\xab\xf8\xbf\x12\x3e\x4b\xd3\
+\x84\x6c\x07\xbb\xb4\x8c\x2e\x62\xed\xf4\xc6\xdc\xc6\xc6\x5b\x0d\
+\x7c\xf4\xe3\xc7\x37\x94\x33\xbf\xa4\xe2\xc3\xe3\xb9\x4c\x16\x25\
+\x63\xff\x49\xbc\x8b\xb1\x11\x5b\x41\x89\x5a\xd8\x2c\x46\x56\x7f\
+\x7a\x7a\x25\x64\xf7\x61\x62\x79\xc2\x8f\x61\x56\x7d\xe5\x8d\x7f\
+\xd8\x47\x71\x00\x25\x63\xe4\x32\x59\x7c\xe5\xdd\x8c\x49\x6f\x75\
+\x62\x79\xc2\x7f\xc3\x40\x3a\x35\x32\xaf\x90\x9f\xe5\x32\xe3\xc4\
+\xfa\x28\x7e\xda\xc4\x07\x99\x71\x62\x42\xde\x49\xa7\x46\xe6\xbb\
+\xfd\x02\x4e\x8e\xda\x6f\xe3\xe9\xeb\x89\x1b\xa9\xd1\xbe\x8b\x9f\
+\x66\xaf\x5e\x61\xf7\xf8\xa0\x61\x84\xca\x6d\xce\xae\xef\x49\x00\
+\xa3\xed\x42\xf7\xa8\x5d\x35\x63\x89\x0c\x9e\x54\x09\x85\x59\x00\
+\x10\xb9\x67\xb9\xa1\xe1\x46\xf2\xe0\xfd\x77\xde\x4d\xbd\x37\x00\
+\x03\x00\x7f\xd4\x03\x5e\x1f\xef\x57\x23\xab\xaf\xcb\x44\x2b\x31\
+\x05\xa4\xae\xf9\xe9\x81\x88\x03\x64\xfc\x14\x40\xda\x93\xde\x94\
+\x74\x56\xdc\x4d\x78\x43\x3d\x6f\xb8\x7e\x12\x8f\x79\x24\xbc\x21\
+\x2c\xdc\x93\xc0\xad\x64\xdc\xef\xf9\x52\xbf\x49\xc6\x7d\x04\xe4\
+\x25\x90\xf5\xc4\xe0\x66\xdf\xc5\x93\x0a\x07\x59\x09\x64\xe3\x03\
+\x5c\xfe\x2e\x71\xa9\xa0\x63\xe0\x7f\x45\x02\xa5\x30\x32\x03\x17\
+\x0e\xad\x01\x28\x49\xa0\xa4\xdd\xe0\x0d\x68\x6b\x10\x1d\x03\x2f\
+\xeb\xe1\xb9\xb5\xc2\x95\x52\x0f\x5b\x38\x28\x48\x21\xdd\xd3\x86\
+\x6e\xd3\x1e\xe0\x36\x84\x91\xa6\xa1\xdb\x48\x78\x22\x8d\x31\xcf\
+\x81\xea\x61\xab\x3a\x30\x03\x41\xab\x06\x50\xd5\x56\xbf\x90\x9d\
+\xea\xf5\x71\xb9\x1e\xe0\x9c\xbb\x72\x71\xe7\x1c\xe5\x5a\x00\x82\
+\x47\x85\xb9\x42\xf8\xf7\xdf\x50\xa8\x45\x1d\x99\x46\xb9\x1e\x5c\
+\xb9\x81\x72\x23\x40\x5b\xd3\x30\xa8\x07\xd0\x29\x48\x36\x67\xd7\
+\xf7\x70\x2c\x95\x6b\x15\x9a\xe6\x42\xe5\xfc\xa5\x68\x9a\x90\x72\
+\xb5\x02\x8e\xa5\x6e\xb9\x7e\x72\x11\x55\x6b\x47\x0f\x23\x67\xd7\
+\xb6\x83\x5d\x8c\x8d\xfa\x2e\x6e\x6c\xc4\x56\xa5\x44\xe4\xec\x5a\
+\x33\x59\xff\xb6\xdb\x7f\x62\x60\xe7\xfe\x4e\x2b\xb2\x7a\xa6\x65\
+\x74\x71\x2b\x28\xf5\xd5\x44\xb7\x28\x6d\x47\x61\x31\xb2\x7a\x66\
+\x6b\x7a\xab\xfd\x86\x01\x80\xc2\x5c\xa1\x8c\xb5\xd3\xb5\xb0\x59\
+\xfc\xf5\xcf\xdf\x69\xf5\x61\x3b\x9a\x26\x64\xf3\xe0\x35\xb5\xb0\
+\x59\xc4\xda\xe9\xb3\xd9\xa0\x77\x30\x49\x8f\x32\x96\xb8\x64\x30\
+\x69\x04\x94\xab\x15\x22\x67\x7f\x8e\xac\xfe\xf2\xbc\x60\x72\x6e\
+\xf9\xbb\xff\xc3\x7e\x2d\xf1\xc5\xf0\xf7\x9e\x37\x44\x35\x6c\x7c\
+\x72\xd0\x3c\xf6\x04\x10\x8f\xa9\x9e\x15\x73\x18\x69\x0e\x9a\xc7\
+\x6c\x07\x7b\x1c\xb6\x6a\x75\x27\xdc\x77\xcd\x44\xfd\xeb\x57\x33\
+\xaf\x8e\xce\x1b\xdf\x73\x5a\x9d\xb0\xb2\xc8\xd9\x70\x2a\x55\xf7\
+\x97\x4a\x68\x0d\xda\x9e\x09\xa7\x82\x47\x06\xf5\xe0\xd2\xe1\xf4\
+\x2c\xf9\x95\x7c\xdc\x93\xde\x94\x85\x7b\x02\xf2\xee\x4c\x3c\x17\
+\x50\x72\x50\x90\xf0\x44\x5b\xfd\xe2\xa2\xf1\xfc\x2f\x9b\xcb\xc4\
+\x11\x23\xae\xf1\xad\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
+\x82\
+\x00\x00\x04\xe8\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x04\x9a\x49\x44\x41\x54\x58\x85\xc5\
+\x97\xd9\x76\xe2\x46\x10\x86\xbf\x66\x11\x12\x60\x50\x9c\xc4\x9e\
+\xf1\x24\x39\x59\xde\xff\x9d\x72\x31\x9e\x49\x1c\xcf\x18\x6c\x23\
+\x19\x24\xa8\x5c\xd4\xdf\xa8\x91\x71\x72\x97\xd4\x39\x1c\x89\x56\
+\xd7\xf6\xd7\xd6\x0d\x58\x09\x16\xf8\xcf\xc9\x02\x58\x19\xa4\x7c\
+\x09\xac\x21\x58\xf7\x91\x4b\x20\x1a\x96\x25\xef\x93\x44\x4a\x5c\
+\xb3\x64\x6d\x9b\xac\xed\xf4\x7e\x00\x1e\x7a\xf2\x97\xc0\x3a\xf4\
+\x16\x0e\xc0\x05\x30\x00\xaa\x44\x59\x90\x11\x13\xd8\x0d\x21\x8c\
+\x81\x71\xcf\xa5\x16\xac\x81\xac\x95\x11\x51\xb9\x01\x0d\x90\x4b\
+\xfe\x23\x30\x3c\x75\xd8\xf7\x2d\xc0\x7e\x11\x34\x63\xb0\x99\xd6\
+\x33\xb0\xf7\xf0\x50\x82\xe5\x60\x13\xb0\x82\x57\x64\x85\xbe\x4d\
+\xb5\xf7\xca\x79\xc1\xd7\x2c\x93\xec\x5f\xc1\x2e\xfa\x10\x02\xf6\
+\x01\xf8\x24\x24\x0c\x78\x01\x0a\xd8\xbd\x87\xec\xa3\xbc\x00\x58\
+\xc8\x8b\x73\x94\x7e\x9b\xc0\xee\x06\xb2\x5b\x21\x92\x4b\xdf\x1a\
+\xb8\x81\x70\x0b\x30\x92\xf2\x80\xc3\x3e\x96\xf2\x1b\xe0\xde\x19\
+\xb2\xfb\x44\xf9\x04\x0f\x91\x71\x1a\xf7\xe8\xcc\x4c\xca\xf4\xcb\
+\xbe\xc2\xa6\x80\xd9\x18\x78\x07\x7c\x94\x8e\x41\x0f\x01\xfb\x4e\
+\xff\x2b\x08\x15\xd8\xb5\xbe\xfd\x09\xcc\x1d\x8d\xd5\x0c\x4a\x5c\
+\x70\xa8\xcf\x03\x60\x73\xa0\xc5\xf3\xa5\xd2\xf3\x80\x27\xf4\x0e\
+\x78\xc2\xe3\xff\x0d\xb0\x82\xb0\x19\x25\xdc\x63\x29\xcf\xe5\xdd\
+\x1a\xb8\x92\xc5\x39\x94\x4f\x82\x71\x02\x66\x1d\x0f\x24\x08\xe5\
+\xc0\xb3\x94\x95\x42\x38\x03\xee\xf0\xf0\x64\x10\x9e\x12\x07\x3b\
+\x28\xdc\x52\x9b\xc0\xcb\xb5\x18\x83\xa0\x5c\x48\x68\xa4\x39\x1e\
+\x86\xb9\xf8\x07\xfa\x1f\xd7\x22\x6d\xc4\xbb\x93\xac\x00\xdb\xf7\
+\x4a\xcc\x63\xee\xc5\x10\xbc\x73\x41\x15\x30\xfd\x8c\xc7\xb2\x96\
+\xf5\x23\xc1\x56\x43\x75\x09\xd3\xb5\x23\x75\x8e\x6c\x21\x99\x35\
+\x30\x95\x03\x53\xba\xd2\x1b\x49\xf6\x1c\x0f\xc1\x97\x14\x81\x09\
+\xb4\x2f\x49\x6d\x16\x8a\xb5\xe1\x96\x5d\xc3\x74\xe5\x48\xbd\x49\
+\xb1\xce\xbf\x17\x8f\x09\x89\x58\xb6\x2d\x3c\x36\x78\xe8\xfa\x21\
+\x68\x4a\x58\x3c\x74\xc6\x30\x54\x3e\xe4\x78\xd2\xfc\x25\xc1\x85\
+\xfa\x41\xee\x49\x67\xb3\xee\x3f\x05\x9e\x37\x5f\x61\x73\x29\xde\
+\x3c\x91\x09\x2c\x9e\x49\x42\x15\x0d\xc8\xbc\x8b\x91\x0b\xc6\x52\
+\x1e\xb4\x62\x5c\xe1\x89\xf6\x20\x48\x73\x3d\x83\xa0\x9d\xba\x0c\
+\xa6\xae\x9c\x06\x66\x0f\xda\xd7\xe2\x3d\xe5\x12\xef\x31\x43\x68\
+\x4c\xfb\x63\x1f\x20\x40\x50\xd7\x0a\x8f\xde\xb9\x82\x32\xdb\x0c\
+\x82\xfa\xbb\x35\x12\x36\x06\xee\x7b\xbd\xfd\xca\x8d\x8e\x7c\xb4\
+\x60\x7b\x7f\x86\x1d\xd8\x33\x5e\x86\x03\xba\x24\x3f\xa9\x82\x61\
+\x52\xdf\x49\x93\xa9\xd3\x3d\xda\xc7\xbd\x7b\x63\xe9\x30\xbb\x4b\
+\x1c\x8a\x94\x4e\x59\xc9\x0c\x55\xe7\x6c\xc7\x30\x82\xf1\x21\xf1\
+\x86\xe4\xbd\x4d\x84\x8c\x80\xc6\x3d\xb7\x35\xea\x4c\x78\x46\x5b\
+\xd2\x1f\x52\x4a\x1d\x78\x35\x3d\x07\xc9\x73\x7f\x86\xb9\x4f\x87\
+\x9e\xc0\x3e\x9d\x6b\xcf\x96\xbc\xbf\xda\x17\x85\xed\xa0\x51\x57\
+\x0b\xd6\x6d\x0e\x06\xf5\xb0\x67\xc0\x30\x81\x7d\xa5\xdf\x32\x99\
+\x27\x7d\x83\x4f\x46\x6e\xdf\x98\x94\xa1\x55\x29\xf5\xac\x2d\xfa\
+\x75\xdf\xe2\x09\xa7\x79\x1e\x62\xdb\xbe\xa6\x3b\x03\x44\x0a\xaf\
+\xdf\xad\x00\x3b\xee\x8b\x39\x60\xca\x70\x53\x19\xce\x34\x58\xc0\
+\x4b\xb3\x94\xe2\x02\x6f\xb9\x6a\x36\x96\x42\xdc\x00\xdf\x4a\xb8\
+\x49\xb6\x0e\x21\x16\x3b\x20\x32\x76\x1f\xf9\xa2\x01\x3b\x08\x43\
+\x95\xdb\xd6\x0f\x24\x34\xfe\xdf\xc0\x33\x7f\x23\x21\x9f\xff\x61\
+\x1a\xee\x38\x9e\x76\xd6\x25\x2c\xef\x3a\x07\x79\xc0\x4b\x38\xee\
+\xd9\xc1\x49\x08\xc6\x75\xe2\xf5\x16\x35\x0a\x51\x05\x2f\x3f\xc9\
+\xf3\x73\x99\x7e\xb4\x40\x1e\x7e\x80\xe5\x53\xb7\xbc\x2a\xa4\x1c\
+\x37\x6c\xbc\x89\x5f\x06\x09\xe3\x06\xea\xb2\x63\xa2\xf6\x86\x14\
+\x0f\x1a\xf9\x2d\x3e\xdd\xfa\x67\xc1\x94\x22\xd4\x7f\xe0\xed\x36\
+\xf8\xb3\x4c\x86\x57\x36\x93\x31\x27\x21\xd8\xfb\xe6\xe2\x19\xec\
+\x86\x6e\xe0\x14\xf8\x49\xe6\x77\x3c\x9e\x7b\xa0\x74\xa4\xea\x41\
+\x97\xa0\xf5\x50\x02\xd5\x21\x8f\x7b\x7f\xc6\xbb\x9f\x8e\x77\x2c\
+\xa1\xb8\x95\xcc\x6d\x6a\x00\x6e\x40\x78\x06\x1b\xd0\xc5\x7c\x24\
+\x6f\x0e\x10\x36\x60\x2d\xf0\x0c\xe1\xe5\x3c\x00\x36\x77\x19\xa0\
+\x83\xeb\x67\x7c\x96\x6c\x24\x73\xe5\xf9\xd3\x45\x31\x0d\x41\xe3\
+\x93\x2d\x3c\x42\x7d\xe1\x9e\xb2\x96\xf5\x5b\xe5\xc7\x71\x8c\xbe\
+\x4d\x36\x56\xe8\x1a\x3c\xd1\xd6\xc0\x25\x54\x33\x47\xc3\x66\x5a\
+\x3f\x09\xc1\x57\xe0\x07\xdf\x6c\x4b\x60\x06\x2f\x41\x93\x74\x42\
+\x67\xb2\x0e\x97\x55\x05\x85\xd1\x75\xcf\xd8\xac\x0a\x3c\xdb\x77\
+\x38\xf3\xc2\x8d\xaf\xa7\x30\x9d\xe3\x13\x76\xe3\x8e\x87\x4d\x62\
+\x40\x30\xb0\x03\x5e\xeb\x01\xf8\x04\x45\x34\x86\x0e\x56\xf0\x30\
+\x4c\x75\xf4\x36\x21\x18\xe2\x1c\x59\x38\x82\xc7\xbd\x17\x6e\xcc\
+\xf4\x8b\x64\xc5\xd9\x72\xee\x50\x63\x17\xba\x34\xf4\x2f\x26\x0b\
+\xa8\x7e\xec\x2e\x23\xff\x76\x31\x01\xe7\xad\x3e\x74\x65\x7d\x72\
+\x31\xf9\xed\xcc\xc5\xe4\xd8\xdb\xf7\x82\x6d\x20\x2b\x33\x1c\xfe\
+\x81\x7f\x6f\x32\x79\x30\x84\x71\x7a\xf7\xcb\x75\x30\x6e\x7d\xd4\
+\x8e\x6a\xbc\x67\xec\xc5\xdb\xd0\x0d\xa6\x35\xc9\xd5\xec\x8d\xcb\
+\x69\xf4\xe2\x98\x70\xc3\xe4\x7d\xa2\xf7\x09\x6c\x35\x3b\x26\x95\
+\x94\x18\xdd\xe5\x54\x06\xb9\xb0\x18\xf3\x9e\xc3\x6b\xf8\x9f\xaf\
+\xe7\x7f\x03\x88\x7c\xd3\x3b\xed\x32\x4f\xdf\x00\x00\x00\x00\x49\
+\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x04\xe8\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x04\x9a\x49\x44\x41\x54\x58\x85\xc5\
+\x97\xd9\x76\xe2\x46\x10\x86\xbf\x66\x11\x12\x60\x50\x9c\xc4\x9e\
+\xf1\x24\x39\x59\xde\xff\x9d\x72\x31\x9e\x49\x1c\xcf\x18\x6c\x23\
+\x19\x24\xa8\x5c\xd4\xdf\xa8\x91\x71\x72\x97\xd4\x39\x1c\x89\x56\
+\xd7\xf6\xd7\xd6\x0d\x58\x09\x16\xf8\xcf\xc9\x02\x58\x19\xa4\x7c\
+\x09\xac\x21\x58\xf7\x91\x4b\x20\x1a\x96\x25\xef\x93\x44\x4a\x5c\
+\xb3\x64\x6d\x9b\xac\xed\xf4\x7e\x00\x1e\x7a\xf2\x97\xc0\x3a\xf4\
+\x16\x0e\xc0\x05\x30\x00\xaa\x44\x59\x90\x11\x13\xd8\x0d\x21\x8c\
+\x81\x71\xcf\xa5\x16\xac\x81\xac\x95\x11\x51\xb9\x01\x0d\x90\x4b\
+\xfe\x23\x30\x3c\x75\xd8\xf7\x2d\xc0\x7e\x11\x34\x63\xb0\x99\xd6\
+\x33\xb0\xf7\xf0\x50\x82\xe5\x60\x13\xb0\x82\x57\x64\x85\xbe\x4d\
+\xb5\xf7\xca\x79\xc1\xd7\x2c\x93\xec\x5f\xc1\x2e\xfa\x10\x02\xf6\
+\x01\xf8\x24\x24\x0c\x78\x01\x0a\xd8\xbd\x87\xec\xa3\xbc\x00\x58\
+\xc8\x8b\x73\x94\x7e\x9b\xc0\xee\x06\xb2\x5b\x21\x92\x4b\xdf\x1a\
+\xb8\x81\x70\x0b\x30\x92\xf2\x80\xc3\x3e\x96\xf2\x1b\xe0\xde\x19\
+\xb2\xfb\x44\xf9\x04\x0f\x91\x71\x1a\xf7\xe8\xcc\x4c\xca\xf4\xcb\
+\xbe\xc2\xa6\x80\xd9\x18\x78\x07\x7c\x94\x8e\x41\x0f\x01\xfb\x4e\
+\xff\x2b\x08\x15\xd8\xb5\xbe\xfd\x09\xcc\x1d\x8d\xd5\x0c\x4a\x5c\
+\x70\xa8\xcf\x03\x60\x73\xa0\xc5\xf3\xa5\xd2\xf3\x80\x27\xf4\x0e\
+\x78\xc2\xe3\xff\x0d\xb0\x82\xb0\x19\x25\xdc\x63\x29\xcf\xe5\xdd\
+\x1a\xb8\x92\xc5\x39\x94\x4f\x82\x71\x02\x66\x1d\x0f\x24\x08\xe5\
+\xc0\xb3\x94\x95\x42\x38\x03\xee\xf0\xf0\x64\x10\x9e\x12\x07\x3b\
+\x28\xdc\x52\x9b\xc0\xcb\xb5\x18\x83\xa0\x5c\x48\x68\xa4\x39\x1e\
+\x86\xb9\xf8\x07\xfa\x1f\xd7\x22\x6d\xc4\xbb\x93\xac\x00\xdb\xf7\
+\x4a\xcc\x63\xee\xc5\x10\xbc\x73\x41\x15\x30\xfd\x8c\xc7\xb2\x96\
+\xf5\x23\xc1\x56\x43\x75\x09\xd3\xb5\x23\x75\x8e\x6c\x21\x99\x35\
+\x30\x95\x03\x53\xba\xd2\x1b\x49\xf6\x1c\x0f\xc1\x97\x14\x81\x09\
+\xb4\x2f\x49\x6d\x16\x8a\xb5\xe1\x96\x5d\xc3\x74\xe5\x48\xbd\x49\
+\xb1\xce\xbf\x17\x8f\x09\x89\x58\xb6\x2d\x3c\x36\x78\xe8\xfa\x21\
+\x68\x4a\x58\x3c\x74\xc6\x30\x54\x3e\xe4\x78\xd2\xfc\x25\xc1\x85\
+\xfa\x41\xee\x49\x67\xb3\xee\x3f\x05\x9e\x37\x5f\x61\x73\x29\xde\
+\x3c\x91\x09\x2c\x9e\x49\x42\x15\x0d\xc8\xbc\x8b\x91\x0b\xc6\x52\
+\x1e\xb4\x62\x5c\xe1\x89\xf6\x20\x48\x73\x3d\x83\xa0\x9d\xba\x0c\
+\xa6\xae\x9c\x06\x66\x0f\xda\xd7\xe2\x3d\xe5\x12\xef\x31\x43\x68\
+\x4c\xfb\x63\x1f\x20\x40\x50\xd7\x0a\x8f\xde\xb9\x82\x32\xdb\x0c\
+\x82\xfa\xbb\x35\x12\x36\x06\xee\x7b\xbd\xfd\xca\x8d\x8e\x7c\xb4\
+\x60\x7b\x7f\x86\x1d\xd8\x33\x5e\x86\x03\xba\x24\x3f\xa9\x82\x61\
+\x52\xdf\x49\x93\xa9\xd3\x3d\xda\xc7\xbd\x7b\x63\xe9\x30\xbb\x4b\
+\x1c\x8a\x94\x4e\x59\xc9\x0c\x55\xe7\x6c\xc7\x30\x82\xf1\x21\xf1\
+\x86\xe4\xbd\x4d\x84\x8c\x80\xc6\x3d\xb7\x35\xea\x4c\x78\x46\x5b\
+\xd2\x1f\x52\x4a\x1d\x78\x35\x3d\x07\xc9\x73\x7f\x86\xb9\x4f\x87\
+\x9e\xc0\x3e\x9d\x6b\xcf\x96\xbc\xbf\xda\x17\x85\xed\xa0\x51\x57\
+\x0b\xd6\x6d\x0e\x06\xf5\xb0\x67\xc0\x30\x81\x7d\xa5\xdf\x32\x99\
+\x27\x7d\x83\x4f\x46\x6e\xdf\x98\x94\xa1\x55\x29\xf5\xac\x2d\xfa\
+\x75\xdf\xe2\x09\xa7\x79\x1e\x62\xdb\xbe\xa6\x3b\x03\x44\x0a\xaf\
+\xdf\xad\x00\x3b\xee\x8b\x39\x60\xca\x70\x53\x19\xce\x34\x58\xc0\
+\x4b\xb3\x94\xe2\x02\x6f\xb9\x6a\x36\x96\x42\xdc\x00\xdf\x4a\xb8\
+\x49\xb6\x0e\x21\x16\x3b\x20\x32\x76\x1f\xf9\xa2\x01\x3b\x08\x43\
+\x95\xdb\xd6\x0f\x24\x34\xfe\xdf\xc0\x33\x7f\x23\x21\x9f\xff\x61\
+\x1a\xee\x38\x9e\x76\xd6\x25\x2c\xef\x3a\x07\x79\xc0\x4b\x38\xee\
+\xd9\xc1\x49\x08\xc6\x75\xe2\xf5\x16\x35\x0a\x51\x05\x2f\x3f\xc9\
+\xf3\x73\x99\x7e\xb4\x40\x1e\x7e\x80\xe5\x53\xb7\xbc\x2a\xa4\x1c\
+\x37\x6c\xbc\x89\x5f\x06\x09\xe3\x06\xea\xb2\x63\xa2\xf6\x86\x14\
+\x0f\x1a\xf9\x2d\x3e\xdd\xfa\x67\xc1\x94\x22\xd4\x7f\xe0\xed\x36\
+\xf8\xb3\x4c\x86\x57\x36\x93\x31\x27\x21\xd8\xfb\xe6\xe2\x19\xec\
+\x86\x6e\xe0\x14\xf8\x49\xe6\x77\x3c\x9e\x7b\xa0\x74\xa4\xea\x41\
+\x97\xa0\xf5\x50\x02\xd5\x21\x8f\x7b\x7f\xc6\xbb\x9f\x8e\x77\x2c\
+\xa1\xb8\x95\xcc\x6d\x6a\x00\x6e\x40\x78\x06\x1b\xd0\xc5\x7c\x24\
+\x6f\x0e\x10\x36\x60\x2d\xf0\x0c\xe1\xe5\x3c\x00\x36\x77\x19\xa0\
+\x83\xeb\x67\x7c\x96\x6c\x24\x73\xe5\xf9\xd3\x45\x31\x0d\x41\xe3\
+\x93\x2d\x3c\x42\x7d\xe1\x9e\xb2\x96\xf5\x5b\xe5\xc7\x71\x8c\xbe\
+\x4d\x36\x56\xe8\x1a\x3c\xd1\xd6\xc0\x25\x54\x33\x47\xc3\x66\x5a\
+\x3f\x09\xc1\x57\xe0\x07\xdf\x6c\x4b\x60\x06\x2f\x41\x93\x74\x42\
+\x67\xb2\x0e\x97\x55\x05\x85\xd1\x75\xcf\xd8\xac\x0a\x3c\xdb\x77\
+\x38\xf3\xc2\x8d\xaf\xa7\x30\x9d\xe3\x13\x76\xe3\x8e\x87\x4d\x62\
+\x40\x30\xb0\x03\x5e\xeb\x01\xf8\x04\x45\x34\x86\x0e\x56\xf0\x30\
+\x4c\x75\xf4\x36\x21\x18\xe2\x1c\x59\x38\x82\xc7\xbd\x17\x6e\xcc\
+\xf4\x8b\x64\xc5\xd9\x72\xee\x50\x63\x17\xba\x34\xf4\x2f\x26\x0b\
+\xa8\x7e\xec\x2e\x23\xff\x76\x31\x01\xe7\xad\x3e\x74\x65\x7d\x72\
+\x31\xf9\xed\xcc\xc5\xe4\xd8\xdb\xf7\x82\x6d\x20\x2b\x33\x1c\xfe\
+\x81\x7f\x6f\x32\x79\x30\x84\x71\x7a\xf7\xcb\x75\x30\x6e\x7d\xd4\
+\x8e\x6a\xbc\x67\xec\xc5\xdb\xd0\x0d\xa6\x35\xc9\xd5\xec\x8d\xcb\
+\x69\xf4\xe2\x98\x70\xc3\xe4\x7d\xa2\xf7\x09\x6c\x35\x3b\x26\x95\
+\x94\x18\xdd\xe5\x54\x06\xb9\xb0\x18\xf3\x9e\xc3\x6b\xf8\x9f\xaf\
+\xe7\x7f\x03\x88\x7c\xd3\x3b\xed\x32\x4f\xdf\x00\x00\x00\x00\x49\
+\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x0c\xd6\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x0c\x88\x49\x44\x41\x54\x78\x9c\xe5\
+\x9b\x5b\x6f\x5b\xc7\x11\x80\xbf\x25\x45\x8a\x94\x28\x89\x92\xad\
+\xbb\x64\xc9\x4e\x9a\xc2\x41\xe0\x26\x45\xd1\xa0\x48\x0a\xf4\xa9\
+\x7d\xe9\x7b\x81\x16\xfd\xa3\x7d\x2a\x50\xb4\x0f\x41\x90\x36\x4e\
+\x52\x20\x69\x92\xc6\x96\x6c\xc9\x37\x5d\x48\x49\xa4\x2e\xe4\xf4\
+\x61\xf6\x1c\xee\xd9\x33\x87\xa4\xe4\xf4\xc9\x03\x10\x24\x77\xf7\
+\xcc\xce\xcc\xee\xce\x6d\xe7\x00\xb2\x05\xe2\x78\xe3\x40\x9c\xf2\
+\x9e\xfe\x78\x93\x84\x90\xe3\xf9\x4d\x12\x42\x96\x57\x97\xed\xe0\
+\x0e\xf0\x18\x9c\x14\x3c\xdc\x00\x6e\x19\x1d\x25\x60\x32\x8b\x2f\
+\x6d\xaf\x0d\xa1\x66\x12\x10\xe0\x62\xc8\x98\x73\xa0\x67\xb4\x77\
+\x81\xbe\xd1\xfe\x12\xdc\xa9\x8d\x2a\xcf\xa3\x1b\x35\x00\x64\x1b\
+\xb8\xed\x09\x3d\x01\x5e\xf8\x89\xa7\x80\x39\xdf\x2e\xc0\x59\xd0\
+\x3e\xeb\xdb\xfa\xbe\x1d\x8f\xa3\x0a\x34\x81\x8a\xef\x3f\xf7\x34\
+\x54\xfd\xf7\x25\x70\x04\x97\xa7\x50\x39\xf2\x6d\x53\xa8\x20\x9d\
+\x9f\xff\xc4\xff\x9f\xf2\x6d\x0e\x68\x01\xa7\xbe\x7d\x29\xe8\x7b\
+\x01\xee\x71\x31\x6f\x85\x52\x92\x2d\x90\x09\x90\x8f\x40\x56\x8d\
+\x31\x6b\x20\x0b\x46\xfb\x06\xc8\xbc\xff\x3d\x05\x72\x0f\xe4\xae\
+\xff\xcc\x80\xdc\x01\x19\xb2\x23\xa4\xee\xc7\x2c\xa8\xe0\xe5\xae\
+\xc7\x31\xe1\xfb\xe7\x40\x36\xf3\x47\x55\x9a\x05\xed\x1b\x20\xbf\
+\x06\x29\x5f\xf3\x88\xcb\x04\xc8\x9f\xf5\xc1\x5c\xdf\x36\x48\xc5\
+\x68\x7f\xdb\x3f\xb7\xe2\x27\x5b\x8e\xf0\xdd\x1b\x73\x72\x3c\xe3\
+\x25\xff\xdb\x79\x46\xb6\xa0\x75\x4b\xdb\xe5\x2d\x83\xd9\x32\xc8\
+\x4f\x8c\xf6\x09\x90\x3f\xda\xbc\x14\x13\xf0\x91\x7f\x30\x92\x9a\
+\xac\x17\x30\x7f\xc7\x7f\xb6\xed\x15\x96\xed\x6b\x4c\x4e\x60\xa2\
+\xe2\xf6\x59\x15\x4e\x7b\x49\xe7\xcb\xf5\x97\xb3\xcf\xa5\xbb\xb9\
+\x02\xf2\xab\x71\x27\xdf\x1e\x6c\xfb\x50\x63\xca\x14\xc8\x6d\x63\
+\xfc\x2a\xc8\x07\xba\x7d\x4d\x7c\xf3\x5e\x79\x5e\x13\x64\x56\xb7\
+\xbc\xd9\x37\x07\xf2\x00\x64\xd1\xe8\x6b\xfa\x67\x23\xcb\x26\x9b\
+\xfa\xc9\x82\x71\x26\xe4\x17\xe0\x3e\x0d\xfe\x27\xca\xa3\x07\xec\
+\x01\x21\xa3\xab\x70\x79\x0b\x2a\x5f\x0e\xe1\x64\x0d\x78\x5a\xd0\
+\x97\xda\xe1\x1b\x3c\x0b\xf0\x00\xba\x4f\xa0\xf6\x2a\x68\xeb\x28\
+\x5d\x94\xc9\x29\xbc\x98\x37\x98\x30\x90\xc6\xc4\x34\x50\xe6\x1f\
+\xa0\x5a\xbd\xed\xc7\x6c\x01\x2f\x54\xa1\x0f\x05\xf1\xc4\x2c\xf9\
+\xff\x89\xe9\x4a\x34\x78\xd8\x46\xd0\xf6\xc2\xa0\x25\x86\x17\x20\
+\x82\x32\xbc\xe7\x9f\x5d\x02\x7e\x06\x7c\x0e\xcc\xa0\x16\x22\x81\
+\x9c\xd9\x8c\x04\x20\x0d\xd4\xcc\x24\xff\x37\x80\x36\xb8\x5d\x3f\
+\x51\x05\x35\x5d\x9b\xc0\xd7\xe0\xae\xf4\x7c\xb9\x13\x72\x20\xce\
+\x8f\x9b\x42\x7d\x81\x6f\x47\x98\x9f\xf8\xd9\x45\x60\x1a\x35\xa9\
+\x7b\xf6\xb3\xd2\x86\xfa\x0b\xd4\x9f\x58\x01\x7e\x00\x16\x80\xcf\
+\x80\xe7\x80\xb7\x3c\xec\xf8\xe7\x7b\xaa\xdb\xdc\x55\xd1\xc4\x5b\
+\x03\xf3\x26\x5b\x59\xcd\x29\x1b\x5e\x0f\x7c\x1c\x29\x46\xcb\x4c\
+\x2e\xa1\xa6\x72\x46\x3f\x37\x05\x59\xf5\xca\x78\x3d\x6b\x55\xd2\
+\xfe\x99\x81\x7e\x91\x09\x90\xdf\x78\x2b\x11\xb6\x07\x8a\x51\xee\
+\xaa\x8e\x18\x40\xc9\x98\xb5\xaf\x13\xb2\x0b\xae\x17\x8d\x5d\x03\
+\xfe\x0e\xdc\x09\x84\x10\xac\xcc\x61\x53\x19\xe7\x10\xdc\x53\xdf\
+\x37\xe6\xaa\x9b\xe0\x9f\x75\x4f\x80\x03\xc5\x7d\xd8\xcc\xf7\x8b\
+\x03\xd6\x81\xbf\x01\xf7\xb2\x73\xba\x9e\xf2\x22\xeb\x18\x47\xc0\
+\x12\xc0\x14\x70\x16\x31\x0f\x7a\xe6\xbf\xf3\x5b\xe9\x31\x59\x21\
+\xa0\x1a\xb9\xd9\x57\xc6\xdd\xe5\xf8\x3c\x8e\x0b\xee\x52\x71\x37\
+\xfb\xd1\x6e\x08\x3d\xbc\x1e\xf0\x04\x3d\x7a\xe1\x90\x1e\xea\x29\
+\x4e\xc7\x58\x2d\x25\x38\xe7\x57\x2f\x00\xd9\x46\x95\x4c\x29\x30\
+\x77\x07\xc0\x7d\xe0\xd2\x9b\xab\x57\xe8\xee\x09\x4d\x9e\x9f\xd0\
+\xdc\x04\x25\xe8\xfa\xe3\x56\x3b\xc4\xf6\xf7\xa7\x81\x2e\x48\x78\
+\x66\xfb\x3a\x56\xee\x03\x47\xe8\xca\x7f\xad\x63\x05\xa0\x03\x9d\
+\x13\xa8\x2f\x92\xd1\x67\xee\x08\xe4\xa7\xf1\x04\x63\x58\x01\x79\
+\x0b\x2e\x2a\x50\x9d\x46\x15\xd3\x29\x83\xad\xbd\x0b\xfc\x0e\xf8\
+\x4b\x01\x03\x01\x74\xe6\xa1\x9e\x04\x3f\x3e\x4e\xa8\x1d\xf9\xce\
+\x79\xd4\x52\xf8\x1d\xd5\x39\x87\xfa\xe1\x10\x64\x5d\xd4\x3c\xfe\
+\x06\xf8\x24\xa0\xd9\x2b\xcf\x7a\x0d\xb8\x0d\x72\x1e\x2d\x66\x6e\
+\x25\x62\x01\xc4\xd1\xe1\x5d\x60\x1a\x26\x1f\xaa\x12\x74\xfb\xd9\
+\xe1\xb2\x0e\xfc\x03\x0d\x70\x8c\x20\x43\x80\xee\x6d\xa8\x4d\x40\
+\xfd\x25\xb8\x4e\x01\x43\x47\xd9\xbf\x52\x07\x16\xe0\xa2\x06\xd5\
+\x93\xbc\xd6\x4e\x7d\x93\xbf\x02\x6b\xe0\xf6\x82\xce\x36\xc8\x09\
+\xba\x63\xdf\xf6\x9e\x6b\x42\x5b\x9f\xe8\xd8\xc7\x3a\xa0\x0a\x9c\
+\xfb\x09\xee\xa1\xab\xf2\x85\x4d\xb3\x2c\xa1\xdb\xbe\x87\xad\x13\
+\xa6\x81\x55\xa8\xb5\x55\x89\x15\x32\x6f\x80\xeb\xe8\x33\xd5\xb6\
+\x32\x18\x1e\xab\x30\xaa\xa3\x87\xfa\x02\x2b\x05\x88\xbe\xf1\x63\
+\xee\xf9\xe7\x3a\x64\x1d\xb9\x22\x2b\xc0\x06\xf0\x0c\xf5\x01\x8c\
+\x03\x7c\xd8\x04\xba\xe0\xba\x9e\xe0\x48\x31\x1e\xcd\x43\xbb\x86\
+\xae\xc2\xf9\x58\x3c\xdb\x70\x01\x3c\x85\xf6\x24\x1c\x2f\x60\x87\
+\xb4\x5d\xe0\x4c\xe7\x8c\xc1\x9d\xa1\x8b\xfa\x83\xe7\x29\xc7\x8b\
+\x25\x80\x06\xea\x3d\x2d\xe6\xb7\x7c\x02\xcd\x29\x70\xad\x6c\x5b\
+\x22\x84\xcb\xf7\x61\xae\x07\xb3\xaf\xcc\x47\x6f\x04\xb3\xaf\x60\
+\xf6\x52\x71\x5b\x47\xcd\xb5\x60\xae\x20\x16\x61\x07\x35\xdf\x2d\
+\xd4\xc2\x65\xc0\x12\xc0\x34\xaa\x3d\x0b\x94\x9a\x2c\xa3\x6e\xaa\
+\x01\xc7\x4d\xa8\x7c\x0f\xcc\x33\x7e\xec\x3d\x06\x88\x03\x16\xa0\
+\xf2\x9d\xce\x61\xc2\x73\xdb\x59\x72\x97\x40\x19\xdc\x31\xba\xb8\
+\x19\xb0\x04\x20\xa8\x69\xd9\x29\x20\x64\xc2\xb6\xf3\x32\x05\xa5\
+\x64\x22\x7f\x1c\xac\x60\xeb\xda\x10\x6e\xfb\x16\x94\x4a\x5e\xbf\
+\xc4\xc3\xae\x94\x36\xb1\x78\x3a\xd4\x23\x34\xda\x0a\x94\x07\x83\
+\x4c\xbf\x7d\x13\xd5\xb2\xe1\x2a\xcc\x82\x74\x81\x15\x98\xd9\x0f\
+\xfa\x5a\xc0\xbb\xc0\x13\xd2\x8c\x4e\x06\x92\xd4\x19\xa8\x4f\x61\
+\xe5\x05\xe7\xd0\x40\xe7\x07\xfd\x2d\xa0\x3b\x73\x03\xe4\x19\x03\
+\x3f\x23\xc1\x7f\xa6\x7d\x1c\x64\xd1\xb8\x63\xef\x0e\x27\x81\x59\
+\x0a\x31\x61\x35\x72\x49\x48\x99\x47\x83\x8d\x65\x4f\x64\x84\x9c\
+\x1e\x74\x66\xa1\x7e\x00\xc4\x41\xc6\x23\x4f\xd0\xd7\xc1\xe4\x2b\
+\x40\x1f\x3a\x67\x50\xdf\x05\x1c\x74\x6f\x41\x2d\xc9\x2f\x3e\xf3\
+\xdf\xce\xcf\xf9\x05\x9a\x2b\x0c\xe1\x15\x74\x66\xa0\x9e\x08\x2d\
+\x9c\xb7\x89\x2a\xbe\xbe\xee\x86\x54\x57\x25\x79\xcb\x4c\xc2\xc6\
+\x5a\x99\x45\xe0\x4b\x90\xaa\x27\xe0\x25\xb8\x43\x34\xd3\x73\x96\
+\x8f\xfc\xa4\x01\xf5\x32\xb8\xe7\x79\x54\x82\x67\x7e\x01\x38\x46\
+\x57\xec\x1b\x63\x77\xb5\xfd\xf8\x32\xba\xe2\x07\x9e\x8e\xff\x68\
+\x5f\x2e\x7a\x3b\xf1\xa6\xcf\x67\x7f\x43\x9a\x64\x1f\x15\x98\x17\
+\x9a\x6c\x02\x4f\xe0\xa4\x03\x8d\x29\xb2\xe1\xb1\xa9\x03\x4a\xa8\
+\x04\x6f\x83\xdb\x09\xec\xf7\x2d\x6c\xe5\x37\x0d\x47\x05\x69\x68\
+\xa5\x00\xcd\xf4\x6e\x01\x4f\x87\x87\xc4\xa9\x2f\x7f\x1f\x0d\x67\
+\x87\x05\x52\x27\x18\xbe\xbd\x5f\x08\x9f\xb9\x72\x27\xa8\xb7\xba\
+\x01\x8d\x03\xf4\x48\x65\xa0\x48\x09\x2e\xe5\xe3\x01\x28\x20\xbe\
+\x01\xf3\x47\x46\x7b\x02\x65\x25\xb4\xf2\x90\x9c\xb3\x94\x9b\x3a\
+\x51\x78\x9f\x61\xdf\x3f\x84\xb4\x14\x08\x20\x37\x4e\x7c\x6a\x7c\
+\xcd\xea\xb5\x04\xb0\x00\x58\xf6\xdf\xba\x84\x18\x07\x56\x18\x24\
+\x34\x0c\x8f\x31\x81\x9c\x93\xf3\x12\x2e\x8c\xd4\x7b\x06\x8a\x84\
+\x69\xd1\xfa\x0a\x43\x60\x05\x47\xe0\x5a\xe1\xec\x28\xc1\xf4\x07\
+\x3b\xa7\x30\x94\x36\x3c\x3c\xd7\x85\xea\xa8\x7c\xdb\x35\x72\x0d\
+\xee\x0c\x55\xe6\x19\x88\x05\x30\x41\x71\x54\x77\x13\x9b\x5e\x83\
+\x6e\x64\xde\x62\x21\x0c\xbd\xb1\xb9\xa9\x1f\x51\xf4\x5c\xae\x3d\
+\xb6\x02\xcb\x70\x65\x69\xf3\xc0\x3f\xc8\xb4\x97\xec\xf6\x14\x9a\
+\x50\x7b\x66\xd0\x21\x20\x8f\xd1\x24\x0b\xc0\xa3\x02\xfd\x32\x62\
+\x85\xbb\x7d\x8d\x34\x73\xd0\xc3\xce\xd6\x8e\x8a\x05\x7a\x15\x98\
+\xb8\xce\xf6\x4f\xec\x75\x11\xf4\x47\xf4\xbf\x26\xd4\x1c\xc5\x47\
+\x70\xac\x79\x23\x01\x94\x9f\xa1\xf6\x37\xc6\xd5\xb3\x11\x8e\xcc\
+\xf2\x1e\x90\x9a\xa4\x10\xd2\x6d\xff\xc8\x7f\x46\x58\x87\x42\x28\
+\x12\x40\x19\xdb\xb3\xcc\xcd\x11\xeb\x80\x2e\x51\xbc\x1c\x40\x11\
+\xb3\xc3\x08\xbf\xca\xcf\x11\x9f\xf9\x51\xd6\x61\x28\x14\x8d\x1f\
+\x5b\x39\xc6\x02\x48\x72\xe7\x39\x6d\x79\x03\x22\x12\xe8\x93\xde\
+\x27\x16\x29\x3c\x4b\x08\x32\x43\xea\xe9\xdd\x78\xee\x00\xc4\xe7\
+\x17\xb3\x60\x99\xc1\x23\x06\xb7\x38\x3f\x06\x3c\x07\x56\x46\x68\
+\x7b\x22\x21\x94\x50\xaf\xcd\xb8\x70\xc9\xc0\x98\xbe\x49\x12\x4e\
+\xe7\x05\x6a\x09\xc0\x01\xfb\xe4\x2f\x12\x8b\xa4\x7d\x00\x6d\x43\
+\x6f\x64\xe0\x25\xf0\x21\x23\x8b\x13\x9c\xa0\x61\xf8\x47\x0c\xbf\
+\x13\xc4\x67\x80\x8e\x8b\x10\x0d\x7e\x8a\x43\xad\xcd\x2e\x63\xe8\
+\x00\x00\xf1\x8e\xd0\x53\x15\x42\x7a\xb3\x73\x80\x79\x1b\xcb\x25\
+\x34\xaa\x43\x28\x4d\xee\xeb\xfe\x05\x6c\x6a\xde\xa0\x08\x64\x8e\
+\xc1\xe5\xcb\xa6\x45\xf0\x00\xe6\x26\x31\xd3\x6d\xed\x45\xd2\x88\
+\x55\x9a\x68\x6e\xe3\x91\xc7\x35\x32\x1f\x00\x9a\xe7\x9f\x04\x77\
+\x0e\xec\x28\x12\xd9\x40\xad\xc3\xbc\x8f\xbd\x43\x44\x4b\xc0\x19\
+\xc8\x3b\x44\x91\x16\x9a\x81\x59\x43\xa3\xba\x26\x70\x01\x17\x5b\
+\x5e\xc7\x58\x4e\xcf\x29\x1a\x19\x2e\xe9\x58\x1e\x00\xff\x06\x89\
+\x4d\x73\x92\xd9\x49\xf2\x01\xc9\xff\x24\x84\xee\x78\xfc\x7b\x7a\
+\xaf\x09\x3e\x83\x9d\xf3\x49\x62\x01\x74\x7c\xdb\x32\x7a\x1e\xd1\
+\x0b\x05\x8e\x3c\xbd\x02\xec\x67\xb7\xb1\xa0\xb9\x43\x59\xcf\xe6\
+\x10\xd3\x73\xf7\x4f\x70\xed\x60\x8e\x82\x3c\xa3\x05\x02\x9a\x38\
+\xd9\x8d\xe6\x5c\xd3\x60\x2d\x61\x3c\x09\x87\xc5\xa1\xbb\xfa\x38\
+\xdb\x0e\x0c\x0a\xb6\x32\xd9\xe9\xf8\x08\x84\x57\xd7\x16\xec\xa1\
+\xc1\x8d\x05\xcf\xc8\x14\x56\xe0\x6f\x65\x5f\xfb\x6e\x30\xb6\x0e\
+\x2b\x14\xe6\x24\x93\xc0\xcb\x84\xe4\x3a\x3e\xa3\x38\x8b\x94\xe0\
+\x85\x6d\x0a\x5d\x5f\x89\xb2\xea\x6d\xdc\x15\xd0\xf2\x67\x30\xc9\
+\xdb\xbf\x0e\xf3\x09\x04\x42\x68\xdd\x46\x13\x24\x56\x4e\xb2\x1c\
+\xd0\x18\xf7\x2d\xa3\xd6\x68\x2c\x25\xd8\x46\xed\xa5\x19\x3f\xfb\
+\x6d\x6e\x64\x5f\x01\x38\x83\xc6\x32\x9c\x9c\x8d\xe1\x25\x5e\x03\
+\x9c\x28\xce\x99\x15\x06\x65\x77\x31\x2c\x53\x7c\xbc\x92\x1a\x85\
+\x9c\x59\xb5\x04\x70\x86\x2a\x97\x72\x41\x86\x15\x38\xee\x90\xbb\
+\xf7\x4f\xb7\xfd\x57\xd0\x38\xd3\x73\xfa\x63\x81\xac\x2a\x4e\xbe\
+\xc2\xf4\x18\xa5\x01\xad\xae\x2d\x74\x99\x83\xb3\x2e\xca\x53\x4e\
+\x78\x45\xf9\x80\xc4\x66\xbe\x6d\x13\xd4\x3c\x54\x84\xc9\x31\xc9\
+\xb9\xb7\xa7\xe8\x96\x5b\x85\x4e\x41\xa1\xd3\x38\x70\x3e\xab\x38\
+\x92\xea\x4f\xd3\x6d\x9e\x04\x66\x61\x2e\x4e\xd6\x26\xb0\x02\x53\
+\xd3\x01\x4f\x19\x88\x05\x70\x41\x9a\x34\x70\xde\x74\xc9\xba\x8d\
+\xd7\xed\x2b\x72\x4a\xd8\xee\xed\x15\xb0\x07\xf5\x4b\x55\x5c\xb2\
+\x38\x9e\xaf\x2f\xce\x8f\x5d\x81\x49\x8f\x23\x3c\xf3\xa1\x10\x28\
+\x01\xab\x76\xfa\x0e\xd4\x34\x5f\x54\xc0\x7d\xeb\x1b\xea\x44\x56\
+\x20\x36\x83\xf1\x95\xd3\x27\x68\x39\x1a\xc0\x32\x5a\x27\xd4\x0f\
+\xc6\x5d\x02\xbf\x45\xaf\xc7\x97\x0d\x9d\x97\xa4\xa0\x4e\xd1\xf8\
+\xfc\x3d\x2f\x84\x61\x89\x0f\x21\xad\x35\xa0\x81\xba\xd1\x56\x4d\
+\xcf\x25\xf0\x7b\xe0\x53\x06\x97\xa3\x89\x19\x4c\xca\x6b\x27\xf5\
+\x66\x3b\x85\x12\xc3\xdd\x67\xd9\x42\x0b\x0f\xc2\xb6\x86\xf7\x08\
+\x37\xa2\xf6\xa4\x0e\x6f\xcd\x7f\x1b\x56\x43\x1a\xdc\xa8\x46\x30\
+\x7d\x7e\x05\xf3\x52\x45\xaa\x68\x09\xed\x1c\xc8\xbb\xb6\x4e\x90\
+\xf7\xf3\xd6\x4a\x3e\x64\x8c\x1a\xa1\x43\x90\x20\x23\xeb\x4e\xe0\
+\xa4\xab\xf5\x80\x29\xa2\xf0\x8a\xba\x0f\xee\x11\xea\x25\xbe\x06\
+\xb3\xe3\x82\xcc\xa0\x29\xfb\xef\xd1\xcc\xcf\x0e\x79\xc5\xb8\x81\
+\xa6\xe0\xc3\x0b\x9e\xe4\x6e\x22\x03\x96\x00\xba\x40\x95\x4c\x49\
+\xec\xcc\x0b\xa8\x4c\x7a\xc9\x16\x85\xb4\xfb\xd0\xaa\xaa\xce\xb8\
+\x56\x5d\xee\x98\x20\x65\xc5\xdd\xaa\x90\xaf\xfa\x08\x14\x63\x7b\
+\x11\xba\x1d\x32\x1a\x5f\x2a\xa8\x6e\xcb\xd5\x28\x58\xb1\x40\x09\
+\xdc\x9e\x6e\x79\x79\x16\x28\xa0\xa7\xa8\x46\xee\x01\xff\x0d\x98\
+\x0f\x24\x3f\x77\xe0\x05\x94\x84\xbf\xa1\x0b\x7c\x13\x48\xbc\xbf\
+\x55\x94\xd1\xa7\x30\x27\x51\xbf\x04\x39\xc6\xfb\xd0\x68\x91\xb9\
+\xbe\x93\x8a\xd2\xe3\x76\x40\xee\x1a\xcc\x66\xe0\x25\x69\x2e\xc0\
+\xed\xa2\x75\x36\xc9\xd6\x17\x54\xf1\x54\xc8\x66\x8d\x22\x1c\x4e\
+\x54\x80\xec\xa3\xb5\x3f\xf7\xc6\x08\x97\x0d\x68\xdd\x46\x9d\x9b\
+\x25\xe0\xb9\xee\xb0\x9c\x9d\x9f\x26\x5d\xd5\xe3\x26\xba\xea\x65\
+\x54\x79\x76\xd0\xda\xe6\x25\x65\x1e\xd0\xcb\xd8\x8c\x33\x14\xed\
+\x00\x77\x9a\x0d\x57\xdd\x1e\x5a\xc3\xbf\x81\x46\x66\x9f\xa3\x42\
+\x78\x00\xe7\x27\x50\x3d\x52\x22\x0b\xcd\x5b\x5f\xe7\x68\x24\x15\
+\x9b\x49\x1b\x80\x83\x0b\xbf\xbb\xaa\xc9\x0b\x14\x21\x1c\x7b\x66\
+\xbc\xa9\x33\x1d\xcb\x65\xc5\x2f\x4b\x1e\x6f\x12\x23\x7c\x00\x3c\
+\x04\x0e\xc0\xbd\x0c\xc6\x97\xe3\x7b\x46\xeb\x08\xc4\xcc\x74\x3d\
+\x21\x0f\xd1\x82\x45\xd0\x2b\xef\x65\xdf\xbe\x1f\xb4\x1b\x20\x62\
+\xf7\x8b\x83\xea\xa4\x67\xb0\x53\xe0\xc5\xad\x8f\xc0\x7d\x05\x4c\
+\xc1\xd1\xf7\xd9\xeb\x39\x71\x9e\xb6\xf8\xcc\x8f\x93\x42\x93\x3b\
+\x03\xe7\x27\x53\x2e\x5f\xcf\x5a\x07\xf0\x66\xe8\x7d\xec\x44\x49\
+\x32\xe6\xff\x50\x2e\x0f\xba\x00\xf2\xf3\xbc\xf9\x95\xa6\x5a\x8a\
+\x5c\xb9\xfc\x1d\xcc\xb2\x5e\x1b\xf9\xc7\xd8\x2f\x4c\xac\x92\x7b\
+\x61\x42\x1c\xfa\x82\x85\xf1\x02\x43\x3a\x66\x7b\xcc\x89\x43\x9c\
+\x05\xcf\x88\x43\xdf\x18\xf9\xa5\xd1\x57\xce\xfa\x2b\xa9\x10\xaa\
+\x8c\xff\xc2\x44\x8a\xe8\x4f\x05\x4e\xc8\x46\x5e\x08\x00\xf2\x1e\
+\xfa\xca\x4a\xee\xa5\x04\x5e\xeb\x95\x99\xb4\xad\xe4\x9d\x9f\xb7\
+\x40\xde\x31\x9c\x9f\xb2\xa5\xe5\x3d\xf3\x7f\xc8\xe3\x2b\x9e\x3c\
+\x91\x5a\x59\xa5\x16\x7b\x80\xe0\x77\x82\x71\x7d\x2d\x1b\x7e\x6b\
+\xde\xd3\x4f\x2b\x74\x9e\x2a\x8c\x7e\x69\x6a\xca\x8f\x09\x04\x2f\
+\x2b\x0c\x5e\xbe\x2a\x7a\x39\x6a\x1e\x33\x66\x91\x2d\xcf\x43\x29\
+\xbf\x9b\x15\x62\x44\x86\x93\x23\x9b\xa8\xb6\xf5\x35\xba\xb4\xfc\
+\xef\x1a\x6a\xe6\x1c\x7a\x01\x72\xc1\xe0\xb5\xb9\x19\x40\xa0\x37\
+\x0d\xe5\xc4\x29\x4a\x4a\x64\x7b\xc1\xff\xe4\xf6\x26\x79\x6d\x2e\
+\x28\x97\x4d\xe9\xeb\xfa\x71\x0e\x35\x61\xa7\xfe\xf7\x24\xaa\xc4\
+\x7d\x01\x06\x1d\x54\xa1\xce\x06\x78\xf6\x06\x4e\x93\xed\xc0\x8d\
+\xb8\xa2\x8e\x41\x26\x30\x4a\xcd\x3c\x9e\x3a\x79\x2d\x1b\xbf\x38\
+\x59\x42\xaf\xca\x92\x23\x54\x65\xe0\x5f\xe0\x99\x38\x24\x6b\xf3\
+\xac\x17\x27\x85\x41\xe2\x33\x06\xa3\xb4\x36\x7d\xac\x88\xc7\x37\
+\xf7\xd5\x59\xab\xe1\x0d\x80\x0c\xcf\x6f\x1a\xf3\x09\xa8\x10\xfe\
+\x07\xb4\x0a\xfd\x7e\xcf\x22\x5b\xc2\x00\x00\x00\x00\x49\x45\x4e\
+\x44\xae\x42\x60\x82\
+\x00\x00\x00\x68\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x00\x1a\x49\x44\x41\x54\x58\x85\xed\
+\xc1\x01\x01\x00\x00\x00\x82\x20\xff\xaf\x6e\x48\x40\x01\x00\x00\
+\x00\xef\x06\x10\x20\x00\x01\x47\x01\xa0\x88\x00\x00\x00\x00\x49\
+\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x09\xaa\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x09\x5c\x49\x44\x41\x54\x78\x9c\xd5\
+\x9b\xdb\x6f\x1c\xd5\x1d\xc7\x3f\xe7\xcc\xde\x2f\x5e\xdb\xeb\x0b\
+\x84\x04\x50\x09\x31\x18\xbb\x21\x75\x25\xa4\xb6\x44\x6a\x1b\x5e\
+\xe8\x43\x4b\x93\x42\xa1\x48\x81\xa8\x90\x27\x5a\xda\x87\xf6\x6f\
+\xe0\xa9\x46\x79\x4a\xa5\x2a\xa4\x82\x50\x02\x81\x22\x35\xa0\x0a\
+\x9e\x80\x17\xa4\xba\xd4\xb1\x71\xea\x84\xa0\xb6\x24\x81\x38\x6b\
+\x7b\xbd\xf7\xeb\xfc\xfa\x30\x3b\xeb\x8d\xbd\xf1\xde\x66\xb1\xfd\
+\x7d\xda\x33\x73\xe6\xcc\xef\xf7\xdd\x39\xbf\x73\x7e\x97\xa3\xe8\
+\x32\xf6\x9d\xde\x37\x58\x54\xe6\x83\x0a\xee\x43\x33\x82\xb0\x07\
+\x18\x04\x09\x83\x0a\x5b\xbd\x24\x09\x2a\x09\x5c\x47\x71\x01\x93\
+\x79\x81\x4f\xdd\xa2\x3f\xfc\xe4\xd1\x4f\xae\x77\x53\x3e\xd5\x8d\
+\x41\xc7\xde\xd8\xf7\x6d\x85\xf9\x38\xf0\x10\x30\xd6\xc1\x7b\x04\
+\x98\x05\xde\x13\xf4\xab\xb3\x87\x3e\xf9\x87\x53\x32\xda\x70\x8c\
+\x80\xdd\x2f\x3f\xd0\x13\xf0\xe5\x8f\x0a\xe6\xd3\xa0\xee\xbd\x59\
+\x3f\x97\x36\x70\x1b\x2e\x0c\xa5\x30\x94\x06\xa0\x2c\x26\x65\x11\
+\x8a\xe5\x12\x25\xb3\xbc\xc1\x5b\xe4\xbc\x42\x9f\xc8\xe4\xbc\xc7\
+\x3f\x7b\xf2\xe3\x84\x13\x72\x77\x4c\xc0\xe8\xe9\xd1\x7e\xc3\x70\
+\x3f\x8f\xf0\x1c\xd0\x5b\x7b\xcf\xd0\x9a\xb0\xc7\x4f\xd8\x13\x20\
+\xe8\xf6\xe1\x73\x79\x71\x69\xbd\xe1\x78\x25\xd3\x24\x57\xca\x93\
+\x2e\xe6\x48\x16\x32\x24\x0b\x59\xca\xa6\xb9\xb6\x5b\x1c\xc5\xb1\
+\x72\xb9\x38\x39\xf7\xe8\xdc\x52\x27\xf2\xb7\x4f\x80\xa0\xc6\xde\
+\xfc\xe6\x11\x25\xbc\x00\x2a\x6a\x5f\xd6\x28\x22\xfe\x20\x51\x5f\
+\x84\x88\x2f\xd8\x31\xc3\x02\xac\xe4\xd2\x2c\xe6\x56\x58\xc9\xa6\
+\x31\x91\xd5\x7b\x8a\x18\xc2\xef\x67\x0f\x4e\x9f\x40\xd5\xdc\x68\
+\x01\x6d\xc9\x37\xf6\xd6\xd8\x5d\xba\x6c\x9c\x14\xf8\xae\x7d\xcd\
+\xd0\x9a\x21\x7f\x2f\xc3\xa1\x3e\x5c\xda\x68\x67\xd8\x86\x28\x99\
+\x65\xae\xa5\x96\x59\xc8\xc6\x6f\xf8\x2a\x44\xf1\x11\xba\xfc\xd4\
+\xec\x23\xb3\x97\x5a\x1d\xb3\x65\x02\xc6\xce\xec\x7d\x4c\x09\x7f\
+\x04\x7a\xec\x01\x86\x82\x7d\xec\x08\x47\xab\x73\xba\xdb\x28\x8b\
+\xc9\xd5\xe4\x22\x0b\xe9\xe5\xda\xbf\x3d\x21\x8a\x67\x67\x0f\x4e\
+\xbf\xd6\xca\x58\xcd\x13\x20\xa8\xb1\x33\xf7\xff\x41\x21\xbf\xb6\
+\x2f\x05\xdd\x7e\xee\x8c\x0c\xe1\x77\x7b\x5b\x79\xa7\x63\xc8\x16\
+\xf3\xfc\x67\x65\x81\x74\x31\x5b\x2b\xe6\x8b\xb3\x07\xff\xf5\x9b\
+\x66\xa7\x44\x53\x04\x4c\x1c\x9f\x70\xe7\x07\x4a\x7f\x56\xc2\xcf\
+\xed\x6b\xb7\x86\xfa\xd9\x11\x1e\xe8\xce\x3a\xda\x02\x04\xb8\x92\
+\x8c\xf1\x55\xaa\xd6\x16\xaa\x57\x3d\x8b\xc6\xe1\xa9\xa3\x53\xc5\
+\x46\xcf\x37\x94\x7f\xe2\xf8\x84\xbb\x10\x2d\xfe\x15\xd4\xc3\x00\
+\x5a\x69\xbe\xd1\x7b\x2b\xbd\xbe\x60\xfb\x52\x77\x01\x2b\xf9\x14\
+\x97\x96\xbf\xc2\x94\x8a\x6d\x10\xce\x7a\x96\x5c\x8f\x34\x22\x61\
+\xe3\x49\x2b\xa8\x42\xb4\x7c\xd2\x56\xde\xa5\x35\x23\xfd\x3b\xb7\
+\x9c\xf2\x00\x11\x6f\x88\x91\xe8\xce\xd5\x65\x56\xf1\xa3\x42\xb4\
+\xf8\x12\xb2\xf1\x9f\xbc\xa1\xb9\x1e\x1b\xbf\x7f\x52\x21\xbf\x84\
+\x8a\xf2\xd1\xdb\x09\x6c\xd2\x7c\x6f\x06\x1e\xc3\x45\xc4\x17\x62\
+\x39\x97\xc0\x14\x01\xd4\xf8\xf0\xdc\x70\x64\xe1\xf5\x6b\x7f\xbf\
+\xd9\x33\x37\x65\xa7\x62\xed\xff\x02\xd6\x67\x3f\xd2\xbf\x93\xa0\
+\xc7\xd7\x05\xb1\x9d\x47\xba\x98\x63\x7e\xf1\x72\x75\x3a\x08\x3c\
+\x36\x7b\x68\xfa\x74\xbd\xbe\x75\x09\x18\x7b\x6b\xec\x2e\x55\x36\
+\xfe\x49\x65\xa9\xdb\xdd\x77\xdb\x96\xfc\xec\x37\xc2\x4a\x3e\xc5\
+\xc5\xa5\xab\x76\x33\x01\xe6\xbe\x99\x43\x33\x9f\xaf\xed\xb7\xde\
+\x06\x08\x4a\x97\x8d\x93\x54\x94\xbf\x25\xd4\xbf\xed\x94\x07\xcb\
+\x26\xdc\x12\xea\xb7\x9b\x3d\xa2\xf4\xc9\x7a\xf6\x60\xdd\x85\xb1\
+\x37\xf6\x1e\x51\xf0\x27\xb0\xd6\xf9\x7b\x06\x76\xb5\xbd\xd4\x65\
+\x96\xd3\x24\xaf\x39\xe2\xb3\x00\x60\xb8\x34\xfe\xbe\x10\x81\x3e\
+\x3f\xaa\x81\x4f\x01\xd6\x12\xf9\xef\xd8\x17\xab\xfb\x04\xe1\xc8\
+\xcc\xcf\xa6\x4f\xd4\xf6\xb9\x41\xb7\xd1\xd3\xa3\xfd\x86\x76\x5d\
+\x00\x15\x55\xc0\xe8\xc0\x1d\x1d\x6d\x72\x4c\x53\xb8\xf8\xfe\x79\
+\xe2\x5f\x2c\xb6\x3d\x46\x3d\xf8\x7a\xfc\xdc\xb5\x7f\x0f\xa1\xe1\
+\x9e\x86\x7d\xb3\xc5\x3c\x9f\xc6\xfe\x0b\x58\xbe\x83\xca\x99\x7b\
+\x66\x7e\x31\xb3\x6c\xdf\xbf\x81\x46\xc3\x70\x3f\x6f\x3b\x36\x43\
+\xc1\xbe\x8e\x77\x78\x5a\x2b\xee\x3e\x70\x2f\xbd\xbb\xa2\x8d\x3b\
+\xb7\x80\x5c\x22\xcb\xdc\xd9\x73\x64\x16\xd3\x0d\xfb\xfa\xdd\x5e\
+\x86\x83\x7d\x00\x28\x61\x00\xaf\x7e\xfe\x06\x19\xed\x1f\xbb\x5f\
+\x7e\xa0\xa7\xe2\xd2\x62\x68\xcd\x8e\xb0\x33\x42\x77\x8b\x04\x11\
+\xe1\xf3\x8f\x2e\x34\xd5\x77\x47\x38\x8a\xb1\xba\x3f\x78\x6e\xe4\
+\xed\x91\x70\x55\x3e\xfb\x47\xc0\x97\x3f\x4a\xc5\x9f\x1f\xf2\xf7\
+\x3a\xea\xd8\x74\x8b\x84\x74\x2c\x45\x29\x57\x6a\xd8\xcf\x50\x9a\
+\xa1\x40\x25\x54\x21\xf4\xb9\x0b\xde\xa3\x55\xd9\xec\x1f\x56\x24\
+\xc7\xf2\xe7\x87\x43\x7d\x8e\x0a\x0a\xdd\x23\x21\xb3\xdc\x78\x1a\
+\x00\x0c\x07\xfb\xd0\x15\x93\xa7\x94\x7a\xba\x2a\x17\x58\x31\x3c\
+\x3b\x8c\x15\xf1\x07\xbb\xe6\xcf\x77\x83\x04\x59\x1f\x2d\xaa\x0b\
+\x97\x36\x88\xf8\x42\x76\x73\x74\xfc\xf4\xf8\x04\x54\x08\xa8\x04\
+\x30\x01\x88\xfa\x22\x8e\x09\x57\x0f\x5a\x2b\xf6\xfc\xd0\xf9\x2f\
+\xa1\x19\x0c\x04\xc2\xab\x0d\xad\x9f\x80\xd5\x29\xf0\x10\x58\xc6\
+\x2f\xd2\xc2\xa6\xa7\x90\xc9\x53\xc8\x16\x5a\x16\x44\x19\x9b\x43\
+\x42\x8f\x27\xb8\x6a\x0c\x51\x07\x00\xf4\xbe\xd3\xfb\x06\xb1\x42\
+\xd7\x84\x3d\xfe\x96\x36\x3d\xa5\x6c\x89\xf3\xef\x9c\xdb\x36\x24\
+\x28\xa5\x08\xbb\xfd\x95\x96\x8c\x4f\x9c\x9a\x18\xd0\x45\x65\x3e\
+\x48\x65\x43\x14\xf6\x04\x5a\x1e\x34\x17\xcf\x6e\x2b\x12\x42\xde\
+\xaa\x8e\x2a\xef\x2e\xed\xd7\x0a\xee\xb3\xaf\x04\xdd\xed\x79\x7b\
+\xdb\x89\x84\x50\x8d\x8e\x4a\x33\xaa\xd1\x8c\xd8\x17\x7c\x2e\x4f\
+\xdb\x03\x6f\x17\x12\x7c\xae\x9a\xdd\xad\x30\xa2\x2b\xb9\x3a\x5c\
+\xda\xe8\x78\xf9\x73\x82\x84\xbe\xdb\xbb\x4b\x82\x4b\xeb\x5a\x3d\
+\x47\x34\x30\x08\xe0\x36\x5c\x8e\xbc\xc0\x26\xa1\x98\x69\x8f\x84\
+\xbb\x7f\xd0\x7d\x12\x6a\x74\x1d\xd0\x56\x96\x16\x0c\xe5\x5c\x7c\
+\x37\x17\xcf\x32\xf7\xee\xd6\x25\xc1\xd6\x55\x14\x61\x6d\xa7\xa8\
+\x9d\x4e\x6a\x6c\x65\x12\x6c\x5d\x95\xd0\xd3\xd5\x54\xce\x56\x26\
+\xc1\x86\xb6\x8a\x13\xac\x74\x53\x37\xb0\x15\x49\xb0\x75\x15\x45\
+\x42\x57\x2a\x33\x28\x4b\x5b\xc9\xd5\xa6\xe0\x08\x09\x77\x38\x47\
+\x82\xad\xab\x12\x92\x1a\xb8\x0e\x50\x2c\x37\xf6\xab\x3b\x41\xc7\
+\x24\x7c\xdf\x39\x12\x6a\x74\x8d\x69\x14\x17\xc0\x4a\x3d\x97\x9a\
+\x74\x2d\xdb\x45\x2e\x9e\xe5\xfc\xbb\x33\x9b\x4a\x42\xc9\x34\x6b\
+\xab\x50\xe6\x35\x26\xf3\x55\x01\x4b\xf9\x8e\x06\x6f\x06\xd9\x78\
+\x66\x53\x49\xb8\x41\x47\xc5\xbc\x16\xf8\xd4\x6e\xa7\x8a\xb9\xb6\
+\x07\x6e\x05\x9b\x49\x42\xad\x8e\x62\x32\xa7\xdd\xa2\x3f\xc4\x0a\
+\xa1\x93\xca\x67\xda\x1a\xb4\x1d\x6c\x16\x09\x35\x3a\x8a\xb7\xe8\
+\xfa\x40\x57\xea\xf0\x66\x01\x92\x85\x2c\xd2\xc5\xd5\x60\x2d\x9c\
+\x20\x21\xd0\xdf\x7c\x00\x47\x44\x48\x56\x8b\x29\xd4\xcc\xd4\x13\
+\x53\x31\x7b\x23\xf4\x1e\x58\xeb\xe3\xca\xd7\xf8\x15\x40\xe7\x24\
+\xb8\xfd\xcd\x7b\xb0\x89\x42\xba\xa6\xb6\x48\xde\x87\x4a\x48\x4c\
+\xd0\xaf\xda\x9d\x16\xb3\x2b\x2d\x0b\xd2\x29\xaa\x24\xb4\xe1\x45\
+\xb6\x82\x58\x26\xb9\xda\x30\xcd\x53\x50\x21\xc0\xaa\xc0\x94\xf3\
+\x00\xf1\x7c\xba\xe9\x3d\x81\x32\x9c\x73\xa0\xb2\xf1\x0c\xe7\xdf\
+\xe9\x1e\x09\x25\xb3\xcc\x4a\x2e\x65\x37\xe7\x66\x1e\x9d\x99\x82\
+\x9a\xbc\x80\x42\x9f\x00\x6b\x9e\x5c\x4b\x2f\xaf\x1f\xa1\x0e\x7c\
+\x3d\x3e\xb4\xde\x1e\x24\x5c\x4b\x2f\x57\x6b\x0c\x45\xa4\x9a\x20\
+\xad\x12\x90\xc9\x79\x8f\x03\x71\x80\xeb\x99\x95\x06\x25\xab\x16\
+\x94\xd6\x44\x76\xf6\x37\xec\xd7\x0a\xba\x41\x42\x59\x4c\x16\x32\
+\x71\xab\xa1\x58\x2e\x7a\xf2\xc7\xed\x7b\x55\x02\x3e\x7b\xf2\xe3\
+\x04\x8a\x63\xf6\x03\x57\x93\xcd\x65\x74\xef\xfc\xce\x6e\x0c\x8f\
+\xb3\x89\x14\xa7\x49\xb8\x9a\x5c\x5c\x35\x7e\xc2\xb1\xf9\x1f\xcf\
+\x57\x8d\xc1\x0d\xee\x70\xb9\x5c\x9c\x14\x45\x0c\x60\x21\x13\x27\
+\x53\x6c\xbc\x33\xf4\x04\x3d\x8c\xff\xe4\x5b\xf4\xdc\xe2\x6c\x42\
+\xc5\x29\x12\xb2\xc5\x7c\x75\x4a\x8b\x22\x46\xde\x9c\xac\xbd\xdf\
+\xa0\x40\xc2\xcb\x3d\xd1\xdb\x51\x4d\x46\x8b\x0a\x99\x3c\x99\x58\
+\x9a\x72\xa9\xf1\xf4\x69\x16\xbe\xb0\x8f\xe0\x60\xb8\x71\xc7\x3a\
+\x68\xb9\x40\xa2\xd2\x49\x8d\xbd\xb9\xf7\x03\x25\x7c\x0f\xac\xa4\
+\xe2\xae\x9e\xc1\xb6\x04\xd8\x6c\x5c\xae\x29\xa0\x14\xc5\x47\xb3\
+\x3f\x9d\xde\xbf\xb6\x82\x74\x7d\x44\x48\x21\xe8\xf2\x53\x40\x02\
+\x2c\xeb\xb9\xbc\xba\x7c\x6c\x1b\xac\xe4\x53\xb5\xd5\xa3\x09\x25\
+\xe6\xe1\x7a\xe5\xb3\x75\x43\x62\xb3\x8f\xcc\x5e\x12\xc5\xb3\x76\
+\xfb\xf3\xf8\x97\xa4\x0a\xd9\x7a\x5d\xb7\x24\xd2\xc5\x1c\x97\x96\
+\xbf\xaa\xb6\x05\x9e\xa9\x57\x21\x06\x1b\x54\x8a\xce\x1e\x9c\x7e\
+\x4d\x50\x2f\x82\xb5\x37\xb8\xb8\x74\x85\xcc\xd7\xe0\x2e\x77\x8a\
+\x6c\xa9\xc0\xc5\xa5\xcb\x35\x25\xb3\x32\x79\xb3\x1a\x41\x68\x54\
+\x2b\x2c\xa8\xf1\x33\xf7\xbf\x02\xf2\x38\x58\xd1\xd4\xbb\xfb\x6f\
+\x23\xe4\xf1\x6f\xf8\xd8\x66\x21\x5d\xcc\x72\x71\xe9\x4a\x4d\x60\
+\x47\x4e\xcd\x1c\x3c\xf7\xe4\x46\x95\xe3\x1b\x47\x85\x15\xe2\x59\
+\x34\x0e\x23\x9c\x05\x6b\x7f\x30\xbf\x74\x99\xf8\x16\xb4\x09\x2b\
+\xf9\x14\xf3\x8b\x35\xca\x0b\x67\x3d\x8b\xee\xa7\x1a\x95\xcd\x37\
+\xdc\xc1\x7c\xf9\xb7\x2f\xcd\x5d\x07\x76\xbe\x5e\x0e\xc8\x6e\x60\
+\x1c\x60\x29\x97\xc4\x14\x93\xb0\x27\xd0\xf4\x12\xd9\x2d\x08\x70\
+\x25\x71\x9d\xff\x25\xae\x23\x55\x5d\xe5\x94\x67\xc9\xfd\xb8\x23\
+\xe5\xf2\x35\x6f\xaa\x73\x60\xc2\xc7\x1d\x91\xe1\x4d\x2b\xa0\xae\
+\x77\x60\x02\x91\xc9\x99\x43\xe7\x7e\xeb\xe8\x81\x89\x5a\xac\x3d\
+\x32\x03\x30\x14\xe8\x65\x47\x38\xda\xb5\xda\xa2\xb5\xb8\xe9\x91\
+\x19\x78\x66\x23\x83\x57\x0f\xce\x1d\x9a\x52\x9a\xc1\x60\x2f\xc3\
+\x81\x5e\xc7\x12\xad\x6b\x51\x32\xcb\x5c\x4b\x2f\xb3\x90\x59\x7f\
+\x68\x4a\x89\x79\xf8\x66\x4b\xdd\x46\xe8\xec\xd8\xdc\x99\xbd\x4f\
+\xa3\x78\x41\x09\x03\xd5\x01\x95\xa2\xd7\x1b\x24\x1a\xe8\x21\xe2\
+\x09\x76\x6c\x23\x44\x84\x44\x21\x4d\x2c\x93\x64\x25\x97\x5a\x77\
+\x6c\x4e\x99\xfc\x6e\xe6\xd0\xf4\x4b\x5f\xeb\xb1\xb9\x5a\x8c\xbf\
+\x32\xde\x57\x29\x3f\xfd\x15\xf5\x0e\x4e\xba\xfd\x84\xbc\x01\x42\
+\x2d\x1e\x9c\x4c\x15\x73\xa4\xf2\x95\x83\x93\x6b\xd3\x76\x8a\x65\
+\x84\x63\xe4\xcd\xc9\xda\xba\xdf\x76\xe0\x98\x09\x1f\x79\x7b\x24\
+\xec\x2e\x78\x8f\x2a\xc5\x91\xee\x1d\x9d\x65\x4e\x44\x4e\x14\x3d\
+\xf9\xe3\xb5\x2e\x6d\x27\xe8\xca\x1a\x36\x7e\x7a\x7c\xc2\xaa\xc3\
+\x53\x07\x40\xc6\x3b\x78\x8f\x80\x9a\x01\x79\x1f\xd3\x3c\x65\x87\
+\xb1\x9c\x44\xd7\x17\xf1\x89\x53\x13\x03\x79\x77\x69\xbf\xd2\x8c\
+\x22\x8c\x00\x23\xc0\x80\x28\xc2\x4a\xac\x95\x44\x14\x09\x25\x24\
+\x81\x18\x30\x8f\x62\x5e\x4c\xe6\xbc\x45\xd7\x07\x53\x4f\x4c\xc5\
+\xba\x29\xdf\xff\x01\x54\x3e\x72\xb7\x6b\x26\x82\x39\x00\x00\x00\
+\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x00\x68\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x00\x1a\x49\x44\x41\x54\x58\x85\xed\
+\xc1\x01\x01\x00\x00\x00\x82\x20\xff\xaf\x6e\x48\x40\x01\x00\x00\
+\x00\xef\x06\x10\x20\x00\x01\x47\x01\xa0\x88\x00\x00\x00\x00\x49\
+\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x04\xd4\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x04\x86\x49\x44\x41\x54\x58\x85\xbd\
+\x97\x4d\x4c\x54\x57\x18\x86\x9f\xef\x9e\x3b\x77\x06\x84\x41\xc5\
+\xc1\x4a\xb1\x81\x2a\x12\x7f\x9a\x34\x69\xc5\xb0\xa0\x99\xd6\xa8\
+\x91\xd8\xa6\x5d\xb0\x68\xd2\x2e\x6c\xba\x70\xd7\xd6\x45\x37\xb6\
+\x55\x53\x5d\xd6\xb8\xb4\x2b\x16\x4d\x74\xc1\xa2\x26\x1a\x8c\x2e\
+\x14\xb5\x0d\x55\xbb\xb0\x51\xa4\x86\x54\x0c\x45\x44\xe9\x02\x66\
+\x90\xe1\xce\xdc\x73\x4e\x17\x30\x14\xe7\xc7\x19\x90\xf4\x4d\x66\
+\x31\xf7\x7e\xe7\x3c\xef\x3d\xbf\xdf\x27\x94\xa9\xbb\x9d\x9d\x5e\
+\xcd\xb3\xf1\xf7\xac\x23\xfb\xb0\x6c\x05\xea\xe7\x7e\x00\xa3\xc0\
+\x28\x42\xbf\x18\x7b\x7e\x72\x45\xec\xf2\xb6\xee\xee\x74\x39\xfd\
+\x4a\xa9\x80\xe1\x0f\x76\xd5\x8b\x0e\x0e\x1b\xf8\x58\xa0\x5a\x79\
+\x1e\x4e\xd8\x43\x94\x42\x1c\x05\x80\x35\x1a\xab\x35\xc6\x4f\xa3\
+\xd3\x69\x2c\x24\x1d\x38\xa3\x83\xe0\x48\xe3\xc5\xeb\x8f\x97\x64\
+\x60\x28\x1e\x8f\xa8\x2a\x0e\x61\xe5\xa0\x28\x55\x19\xaa\x89\xa2\
+\x2a\x2a\x70\x5c\xf7\x85\x86\x4d\x10\xa0\x53\x29\x32\x93\x09\xac\
+\xd6\xd3\x88\x3d\xa1\xa7\x38\xde\xd4\xdb\x3b\x53\xb6\x81\xa1\x8e\
+\xf8\x2b\x4a\xe4\x2c\xe2\xec\x08\xd5\x44\xf1\xa2\xd5\x20\x25\x07\
+\xeb\x79\x59\x4b\x3a\x91\x24\x33\x99\x00\x6b\x6e\x68\x6b\x3f\x6c\
+\xea\xe9\x1d\x2b\x69\xe0\xef\x8e\x77\xde\xb0\xa2\x7a\xc4\x75\x1b\
+\x22\x75\x31\x9c\x50\x68\x71\xe0\x1c\x99\x4c\x86\x99\xa7\xe3\xd8\
+\x20\x18\x11\xab\x3b\xd6\xf7\x5c\xbb\x53\xd4\xc0\xc3\x3d\xed\xeb\
+\x1c\xd7\xbd\xa5\xc2\xe1\x57\xc3\x75\x31\xc4\x71\x5e\x0a\x9e\x95\
+\x35\x06\xff\xe9\x38\xda\xf7\x47\xb4\xb5\xdb\x17\x8e\xc4\x3c\x61\
+\x28\x1e\x8f\x38\xae\x7b\x56\x5c\x77\x59\xe1\x00\xe2\x38\x84\xeb\
+\x62\x88\xeb\x36\x28\x91\xb3\x43\xf1\x78\x24\xcf\x80\xaa\xe2\x10\
+\xe2\xb4\x46\x96\x19\xbe\xd0\x44\xa4\x2e\x06\xe2\xec\x50\x55\x1c\
+\x9a\xe7\xc2\xec\x56\xc3\xd8\x33\xa1\x95\x35\x21\xb7\xb2\xf2\xb9\
+\x86\x17\xfa\xff\xe4\xc7\x5f\xfa\x08\xbb\x21\x1a\x6b\x57\x95\x05\
+\xbb\x3a\xf8\x80\x93\x57\xae\x61\x2d\x34\xd7\xad\xf9\xcf\x84\x52\
+\x88\x80\x4e\xf9\x6f\x7f\xf1\xfa\xfa\xae\x93\x7f\x0d\x4f\x39\x00\
+\xa2\x83\xc3\xa2\x54\xa5\x17\xad\xce\xeb\xec\xe2\xc0\x7d\x1e\x4d\
+\x24\x38\x75\xbd\x8f\x4b\x03\x83\x25\xe1\x97\x06\x06\x39\x75\xbd\
+\x8f\x27\x89\x29\x2e\x0e\xdc\xcf\x7b\x1f\xaa\xae\x46\x94\xaa\x74\
+\x5c\xf7\x30\x80\x1a\xdc\xbb\x37\xac\x24\xf8\xc9\x5b\xb5\xd2\x53\
+\xe1\x70\x5e\x83\x8a\x90\xc7\xef\xc3\x23\x00\xdc\x1e\x79\x44\x34\
+\x52\xc1\x86\x58\x6d\x51\x78\x57\xdf\xcd\xf9\xff\x9f\xb6\xbe\x95\
+\x3f\x6a\x22\x20\x42\x90\x9a\x69\xf9\xfc\xcd\xed\x3f\xa8\xaf\x37\
+\x35\xec\x42\xe4\x33\x6f\xf5\xea\x82\x73\xdf\x58\xbb\x8a\x68\xa4\
+\x82\xdb\x23\x8f\x5e\x68\x22\x17\xbe\xbf\xad\x95\x9d\x2d\x1b\x0b\
+\x1a\x15\xa5\x08\x92\xc9\x70\x38\x33\xfd\xab\xfa\xaa\xa5\xe9\x4b\
+\xe5\x79\xad\xa1\x9a\x68\xc1\x60\x80\x0d\xb1\xda\x17\x9a\x28\x04\
+\xdf\xbd\xb9\xb9\x68\x7f\xe2\x38\xe8\x54\x0a\x6b\xf4\xa4\x8b\x65\
+\xab\x13\xf6\x8a\x06\x67\x95\xed\x30\x0b\x5a\x08\x5c\x0c\x3c\x2b\
+\x15\xf6\xd0\x69\x7f\x8b\x0b\xd4\x8b\x52\x25\x1b\x94\x32\xb1\x18\
+\x38\xcc\x4e\x03\x22\xf5\x0e\x50\x9f\xbd\xd5\xca\x35\xb1\xbf\xad\
+\x35\xef\xf9\x62\xe0\xc0\xec\x4d\x6a\xa9\x5f\xfe\x13\x67\x91\x72\
+\x80\x51\x6b\x74\xd9\x0d\x72\x17\x5c\x56\x5d\x7d\x37\xcb\x3a\x27\
+\xb2\xb2\x46\x83\x30\x3a\x6b\x40\x97\x67\xa0\xd0\x6a\x5f\x38\x1d\
+\x8b\x31\x61\xb5\x06\x6b\x47\x5d\x84\x7e\xe3\xa7\xe3\x4b\x81\x2f\
+\x9c\xf3\xdc\x85\x59\x6a\x3d\x68\x3f\x8d\x88\xdc\x53\x07\x37\x36\
+\x1a\x63\xcc\x27\x6e\xd5\x8a\xa2\x97\x50\x29\x78\xa9\x73\x22\x57\
+\x26\x08\xc8\x4c\x4c\x00\x7c\xe7\x4c\xae\x88\x5d\xb6\x90\xd4\xa9\
+\x54\xc1\xe0\xab\x83\x0f\xca\xda\xe7\xb9\xbb\xa3\xab\xef\x26\x57\
+\x07\x1f\x14\xfe\xfa\x54\x0a\x0b\xc9\x44\xe5\x9a\x2b\xce\xb6\xee\
+\xee\xb4\x03\x67\x66\x53\x27\x9b\x17\x7c\xee\x4e\x7f\x49\x78\x31\
+\x13\x3f\xff\x71\x27\x3f\xc8\x5a\x32\x93\x09\x04\x4e\xcf\xb1\x41\
+\x07\xc1\x11\xab\xf5\x74\x3a\x91\xcc\x8b\xdf\xd9\xb2\x89\xb5\xd1\
+\x2a\x0e\xb4\xb7\x95\xb5\xcf\x77\x6f\x6e\xe6\x40\x7b\x1b\x6b\xa3\
+\x55\xec\xd9\xdc\x92\xf7\x3e\x93\x4c\x62\xb5\x9e\x36\x41\x70\x14\
+\x16\xa4\x64\xc3\xfb\xe2\xdf\x83\xfa\xa6\x62\xdd\xda\x97\xce\x03\
+\x8b\xc9\x64\x32\xa4\x1e\x3f\x01\xf4\xb1\xd7\xce\xf7\x7e\x0b\x0b\
+\x32\x22\x3d\xc5\x71\xac\xb9\x31\xf3\x74\x1c\x6b\xcc\xb2\xc3\xad\
+\x31\xf8\xe3\xe3\x60\xcd\x0d\x5f\x57\x1c\xcb\x3e\x7f\x2e\x29\x9d\
+\x4b\xc7\x6f\xa9\x70\xb8\xe1\x7f\x4f\x4a\x01\x9a\x7a\x7a\xc7\xc4\
+\xea\x0e\xed\xfb\x23\xa9\xc7\x63\x98\x4c\xe6\xa5\xe1\x26\x93\x61\
+\x66\x6c\x0c\xed\xfb\x23\x62\x75\x47\x6e\x6d\x50\xb2\x30\xf1\x56\
+\x46\x09\x55\x2f\xad\x30\xc9\x24\x93\xa4\x27\x12\x80\xf9\x4d\x1b\
+\xfb\x51\x59\x85\xc9\xbc\x89\xe5\x29\xcd\x9e\x01\x27\x7c\x13\x39\
+\xde\x7c\xe1\x82\x5f\x28\xbe\xe4\x67\x3d\xdc\xd3\xbe\x4e\xb9\xee\
+\x91\x6c\x71\xea\x78\x1e\xaa\x48\x71\xaa\xfd\x34\x66\xae\x38\x15\
+\x38\x6d\x82\xe0\xe8\x92\x8b\xd3\x5c\xdd\xed\xec\xf4\xa2\xd3\xff\
+\xbc\x8b\xf0\xbe\xb5\x76\x0b\x22\xf5\xd8\xb9\xf2\x5c\x18\xc5\xda\
+\x51\x11\xb9\x87\xe5\x5c\xa2\x72\xcd\x95\x72\xcb\xf3\x7f\x01\x57\
+\x38\x3d\xc8\x18\xce\x3f\x0e\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
+\x42\x60\x82\
+\x00\x00\x07\x6f\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x07\x21\x49\x44\x41\x54\x78\x9c\xe5\
+\x9b\xbf\x6f\x5b\xd7\x15\xc7\x3f\xe7\xbe\x5f\x72\x00\x09\xf9\x21\
+\x77\xed\x10\xc4\x72\x5d\x92\x56\x15\x0e\x06\x9a\x66\x4a\x97\x76\
+\xca\xe4\xda\x28\x60\x3b\x40\xe2\xa9\xad\xdb\x21\xf9\x1b\xb2\xb4\
+\x0a\x3c\xb9\x8b\xe3\x02\xb5\x9b\x4e\x5d\x3c\x25\x93\xe3\xc1\x03\
+\x2b\x48\x24\xe3\x58\x09\x52\xa0\x63\x61\x21\x0e\x24\xc0\x16\xdf\
+\x8f\x7b\x3a\xbc\xf7\xc8\x47\x8a\xa2\x28\x89\xb4\x45\xea\x0b\x48\
+\x8f\xf7\x07\x2f\xef\x39\xf7\x9c\x7b\xdf\xbd\xf7\x7b\x84\x31\x63\
+\x65\x65\xe5\xa4\x31\xde\x2f\x40\x7f\x0a\x2c\x18\x38\xa5\x70\x12\
+\x65\x16\x61\x16\x00\x65\x0b\x61\x4b\xe0\xb1\x85\x6f\x80\x75\x90\
+\xaf\xac\x8d\xbe\x5c\x5a\x5a\x7a\x3c\xce\xfe\xc9\x38\x1a\x6d\xac\
+\x34\xaa\x6a\xf4\x82\xc2\x2f\x81\xd2\x21\x7e\x47\x81\xa6\xc0\xe7\
+\x62\xe5\x4e\x79\xa9\x5c\x1b\x5d\x2f\x53\x8c\x4c\x01\x0f\x1e\x7c\
+\x3b\x77\x22\x78\x7a\x15\x23\x57\x50\x7e\xb2\x5b\x3d\x55\xc5\xaa\
+\x05\x55\x54\xb3\x4e\x48\xfa\xcf\x88\x41\x64\x40\x97\x84\xaf\xb1\
+\x7a\xf3\x59\xeb\xa5\x1b\xe7\xce\xbd\xb1\x39\x8a\x7e\x1f\x5a\x01\
+\xcd\x66\xf3\x55\x1b\xdb\x6b\x0a\xbf\x03\x5e\x2e\x96\x59\xb5\x58\
+\x6b\xb1\x36\xc9\x9e\x76\xa8\x36\x8d\x31\xd9\x9f\x93\x3e\xc5\xf4\
+\x56\xf9\x41\xe0\xba\x71\xcd\x72\xa9\x54\xfa\xfe\x30\xfd\x3f\xb0\
+\x02\x54\x55\xea\xf5\xe6\x7b\x58\xfd\x18\xe1\xb5\x42\x3e\x49\x92\
+\x10\x27\xd1\xd0\x02\xef\x05\x63\x0c\xae\xe3\xe1\x38\x4e\x8f\x85\
+\xc8\x86\xc2\x47\x67\xcf\x96\x6e\x8a\x88\x1e\xa4\xed\x03\x29\xa0\
+\xd1\x68\xbc\x6e\x13\x7b\x0b\xe4\xe7\x9d\x5c\x25\x8c\x22\xe2\x38\
+\x3a\x48\x93\x43\xc3\x75\x3d\x7c\xcf\xa3\xbb\xeb\x72\xdf\x38\x5c\
+\x2e\x97\xcb\xdf\xed\xb7\xbd\x7d\x2b\x60\x75\xb5\x71\xde\xa0\x7f\
+\x55\x98\xcb\xf3\xa2\x38\x15\x5c\xf5\x40\x83\xb0\x6f\x88\x08\xae\
+\xeb\xe1\xb9\x5e\x27\x0f\x36\x2d\xf2\xc1\xe2\x62\xf9\xb3\x7d\xb5\
+\x35\x6c\x45\x55\x95\xfa\x6a\xf3\x2f\x88\xfe\x21\xcf\x4b\x92\x84\
+\x30\x0a\x51\x1d\x8d\xa9\xef\x17\x22\x06\xdf\xf3\x71\x1c\xa7\x93\
+\xa9\xf2\x49\x65\xb1\xf4\xc7\x61\x5d\x62\x28\x05\xd4\x6a\x35\xcf\
+\x73\x83\xbf\x81\xfe\x26\xcf\x0b\xa3\x70\xec\xe6\x3e\x2c\x52\xb7\
+\xf0\x3b\x19\xca\x9d\x28\x09\x2f\x55\xab\xd5\x3d\x3b\xb8\xa7\x02\
+\x6a\xb5\x9a\xe7\x79\xfe\xbf\x50\x7e\x05\xe9\x24\xd7\x0a\xb7\x47\
+\x36\xc1\x8d\x0a\xc6\x18\x02\x7f\xa6\x3d\x49\x0a\xdc\x0d\xe3\xf0\
+\xdd\xbd\x94\xb0\x63\x7d\x29\x42\x55\xc5\x73\xfc\x5b\x45\xe1\xb7\
+\x5b\x47\x4f\x78\x00\x6b\x2d\xdb\xad\xed\xf6\x3c\xa4\xf0\x6b\xcf\
+\xf3\x3f\x55\xd5\x81\x83\x3c\x50\x01\xa9\xcf\x73\x01\x3a\xc2\xbf\
+\x28\x7f\x1f\x06\xaa\xdd\x4a\x40\xb9\x58\xaf\x37\xfe\x3c\xe8\x3b\
+\xbb\x6a\x67\x75\xb5\x71\x5e\xd0\x7f\xa4\x0d\x2b\xdb\xad\x67\xcf\
+\x6d\x96\x3f\x2c\x44\x84\x99\xe0\x44\xdb\x1d\x14\x39\xbf\xb8\x58\
+\xfe\x67\xdf\xba\xfd\x32\x1b\x8d\xc6\xeb\x9a\xe8\x4a\xbe\xd4\xb5\
+\x5a\xdb\x24\x36\x19\x5b\x87\xc7\x01\xc7\x38\x04\xc1\x0c\x90\x2e\
+\x91\x18\x7e\x56\xa9\x54\xfe\xd3\x5b\x6f\x87\x0b\xa8\xaa\xd8\xc4\
+\xde\xca\x85\x8f\xe2\x70\xe2\x84\x07\x48\x6c\x42\x14\x85\x00\x28\
+\xcc\xa9\x95\x5b\xfd\xe6\x83\x1d\x0a\x58\x5b\x6b\x5e\xc9\xdf\xf0\
+\xac\x4d\x88\xa2\xa3\xb1\xd4\x1d\x04\x51\x1c\x61\xdb\x83\xa7\x6f\
+\x35\xd6\x1a\x97\x7b\xeb\x74\x69\xa4\xd9\x6c\xbe\x9a\x44\xf6\x1b\
+\x84\xd7\x26\xcd\xef\x77\x43\xf7\x7c\x20\x1b\x62\xf4\x54\xa5\x52\
+\x79\x92\x97\x77\x59\x80\x8d\xed\xb5\x7c\x63\x93\x24\xf1\xc4\x0b\
+\x0f\xf9\xe6\x2c\xce\x53\xf3\x58\xae\x15\xcb\xdb\x16\xf0\xe0\xc1\
+\xb7\x73\x27\x66\x9e\xfd\x17\x78\x59\x55\x79\xb6\xfd\xf4\x79\xf6\
+\x73\xac\xe8\x59\x15\x9e\x04\x33\xfe\x8f\x4f\x9f\x3e\xbd\x05\x05\
+\x0b\x38\x11\x3c\xbd\x4a\xb6\x9f\x3f\x2a\xaf\xb8\xa3\x82\xaa\x12\
+\x75\x64\x7a\xa5\xd5\x8a\xae\xe6\x89\x8e\x0b\x18\xb9\x92\x7f\x8c\
+\xdb\x26\x33\x3d\x48\x0a\x32\x89\x6a\x5b\x56\x03\xe9\x19\x5e\x7e\
+\x8c\x35\x2d\xbe\xdf\x8b\xe2\x5c\xa0\x70\xa6\x5e\xaf\xbf\x09\x99\
+\x02\xd4\xe8\x85\xbc\x62\x1c\x4f\xdf\xe8\xe7\x88\x8a\xb2\x59\x2e\
+\x42\xae\x80\xf4\xf4\x36\xd5\xd2\x04\xbe\xf4\x0c\x0b\x6b\x93\xce\
+\x66\x49\x79\x07\x40\x56\x56\x56\x4e\x3a\xc6\xfd\x1f\x20\x49\x12\
+\xd3\x0a\x5b\x2f\xb2\x8f\x63\x87\xef\x07\xb8\x8e\x0b\xa0\x51\x1c\
+\xfe\xc8\xa4\x97\x16\xe9\x72\x98\x1c\xc1\x6d\xee\xa8\x51\xd8\xca\
+\x8b\xeb\x06\x6f\x9b\xec\xc6\x26\x2b\x9c\x5e\xf3\xcf\x51\x94\xd1\
+\xa0\x67\x0c\xb0\x90\x67\x4c\xe3\xec\xdf\x8b\x1e\x19\x17\x8c\x81\
+\x53\x79\xc1\x71\x51\x40\x41\xce\x05\xa3\x70\x12\x40\x99\x7e\xe1\
+\x73\x14\x8e\xcd\xe6\x0d\x9a\xdf\xd0\x1e\x23\x05\xb4\x07\x5b\x66\
+\x4d\xfb\x8a\xfa\x18\xa1\x73\x06\xa0\x73\x03\x0f\x45\xa7\x15\x45\
+\x5b\x37\x28\x5b\xbd\x99\xc7\x07\xb2\x69\x90\x54\x01\x32\x1e\xae\
+\xc4\x91\x44\x47\x56\xdd\x32\x02\x8f\x81\xc1\xc4\x84\x29\x43\xe1\
+\xf6\x68\xc3\x64\x9c\x1c\x44\xe4\x58\x28\xa1\x47\xce\x75\x03\xac\
+\xe7\x29\x63\xa6\x7f\x4e\xec\x61\x9b\xac\x1b\x90\xaf\x76\x29\x9c\
+\x4a\x48\x61\x90\x2d\xf2\xd0\x58\x1b\x7d\x49\xb6\x08\x18\xe3\xec\
+\xf6\xbd\xa9\x81\xdb\xe1\x12\x68\x1c\xb7\xee\x99\x8c\x87\xd7\x04\
+\xfa\x70\x70\xa6\x0b\x22\xd2\x19\x64\xa5\x51\xad\x56\x37\x0c\x80\
+\xc0\xe7\x79\xa5\x69\x9e\x07\x8a\xb2\x89\xf0\x05\x64\x47\x62\x62\
+\xe5\x4e\x5e\xe0\x3a\xde\x8e\x2f\x4e\x0b\xba\x64\x33\xdc\x4e\x1f\
+\x40\x79\xa9\x5c\x43\xf8\x1a\xa6\xd7\x0d\x44\xa4\xcd\x25\x12\x78\
+\x58\xa9\x54\xfe\x0d\xc5\x7b\x01\xab\x37\xf3\x8f\xae\x3b\x7d\x56\
+\xe0\xb9\x1d\x0e\x91\x8a\xb4\x65\x6d\x2b\xe0\x59\xeb\xa5\x1b\xc0\
+\x0f\x69\x65\x6f\xaa\xac\x20\xa5\xd5\xb9\x79\xf2\x49\x10\x78\x37\
+\xf2\x44\x5b\x01\xe7\xce\xbd\xb1\x29\x70\x3d\x4f\x7b\x45\xd6\xd5\
+\x84\xa3\x28\x8b\xc0\xf5\xfc\x5e\x10\x7a\x6e\x87\x8d\x6b\x96\x41\
+\x36\x00\x5c\xc7\x9d\x8a\x15\x21\xa5\xd9\xe6\xa3\x2f\x1b\x18\x96\
+\xbb\xca\x8b\x89\x52\xa9\xf4\xbd\xc2\x47\x79\xda\xf7\x82\x89\x76\
+\x05\x11\xc1\xf7\x82\x4e\x1a\xfd\xb0\xc8\x0d\x48\xf3\x7a\xa0\xaa\
+\x52\x5f\x6b\xde\x03\x7d\x0b\xd2\x9b\xe2\x30\xa3\x9a\x4c\x1a\x7c\
+\xcf\x2f\x4c\xe8\x72\xbf\x72\xb6\xf4\x76\x2f\x83\x74\x87\x8d\x8b\
+\x88\x1a\x87\xcb\x02\x9b\x90\xae\x08\x4e\xdb\x84\x26\x07\x8e\xe3\
+\xb6\x85\x17\xd8\x14\xa3\x97\xfa\xd1\x67\xfb\x3a\x79\xb9\x5c\xfe\
+\xce\x22\x1f\xe4\xe9\xc0\x0f\x70\x26\x68\x9f\xe0\x18\x87\xc0\xef\
+\x98\xbe\x45\xde\xef\xc7\x10\x83\x01\x44\xc9\xc5\xc5\xf2\x67\xa8\
+\x7c\x92\xa7\x7d\x3f\x98\x88\x49\xd1\x18\x83\x5f\x10\x1e\x61\x79\
+\x37\x8e\x60\x5a\x3c\x00\x29\x43\xbc\xf1\xf7\x22\x5b\x34\x0c\x5b\
+\x47\xf6\x06\xd9\x18\x87\x99\x8c\x1b\x08\x80\x70\xbb\x52\x29\xff\
+\x76\x10\x73\x7c\xe0\x90\x8a\x88\x46\x49\x78\x49\xe0\x6e\x96\x26\
+\x08\x66\x0a\xcb\xca\xd1\x81\xeb\xb8\x5d\xc2\x0b\xdc\x8d\xa2\xf0\
+\xf2\x5e\xb4\xf9\x3d\x6d\xba\x5a\xad\x46\x61\x1c\xbe\x8b\xd2\xde\
+\x30\xf9\x7e\xd0\x4d\x4f\x7f\xc1\xf0\x3d\xbf\xd7\xec\x6f\x0f\xc3\
+\x14\x4f\xab\x0e\x89\x7e\x01\x13\x56\x2d\x51\x14\x92\x24\x2f\xc6\
+\x25\x1c\xc7\xc1\xf3\xfc\xee\x93\x2c\x61\xb9\x52\x29\xff\x69\xa4\
+\x01\x13\x45\xf4\x0b\x99\x49\x92\x38\x8b\x1c\x79\x7e\x21\x33\x69\
+\xa4\x48\xc7\x15\xb3\x90\x99\xf7\x07\x4d\x78\x7d\xdb\x3a\x48\x07\
+\xfa\x07\x4d\xa5\xfc\xa2\x51\x46\x8b\xf5\x22\x8f\x1e\x2b\x6c\x6c\
+\x32\xc8\x7d\x31\x7a\x69\xb7\xa5\x6e\x10\x0e\x15\x36\xb7\xb6\xd6\
+\xbc\x22\xf0\x31\xe8\x7c\xb1\xcc\xda\x24\x53\x46\xc2\xe1\xef\x9c\
+\x04\xd7\x71\x70\x5d\xb7\xcf\x99\xa5\x6c\x08\xfa\x61\xf9\x6c\xf9\
+\xd3\xe7\x1a\x36\x57\x44\xbd\x5e\x7f\x05\xcb\x35\x85\xdf\xd3\x13\
+\x38\x09\x74\x07\x4e\xea\xde\xc1\x93\x79\xa0\x64\x31\x70\xb2\x0f\
+\x9e\x08\x5c\xc7\xb0\xdc\xfb\x6e\xbf\x5f\x8c\x6c\xa7\xf3\xe8\xd1\
+\xa3\xd9\x94\x81\xa9\xef\x0d\x0a\x9d\x85\x22\x49\xa1\x7d\x4d\x3d\
+\xd4\xc5\x8c\xc0\x43\x15\xb9\x19\x04\xde\x8d\xe2\x96\xf6\x30\x18\
+\xcb\x56\xaf\x5e\xaf\xbf\x89\xe5\xa2\x2a\xef\x20\x94\x0f\xf1\x3b\
+\x8a\xd2\x10\xe1\x0b\x0c\xb7\xf3\x63\xac\x51\x62\xec\x7b\xdd\x5a\
+\xad\x36\x9f\xb2\xb1\xf4\x0c\x29\x1f\x69\x41\x61\x1e\x64\x16\x34\
+\x5b\x49\x64\x13\x74\x4b\x60\x83\xf4\xa6\x6a\xdd\x22\x0f\xe3\xb8\
+\x75\xaf\x5a\xad\x6e\x8c\xb3\x7f\xff\x07\x96\x9e\x18\x69\x3f\xfc\
+\x8d\x24\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x04\xe8\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x04\x9a\x49\x44\x41\x54\x58\x85\xc5\
+\x97\xd9\x76\xe2\x46\x10\x86\xbf\x66\x11\x12\x60\x50\x9c\xc4\x9e\
+\xf1\x24\x39\x59\xde\xff\x9d\x72\x31\x9e\x49\x1c\xcf\x18\x6c\x23\
+\x19\x24\xa8\x5c\xd4\xdf\xa8\x91\x71\x72\x97\xd4\x39\x1c\x89\x56\
+\xd7\xf6\xd7\xd6\x0d\x58\x09\x16\xf8\xcf\xc9\x02\x58\x19\xa4\x7c\
+\x09\xac\x21\x58\xf7\x91\x4b\x20\x1a\x96\x25\xef\x93\x44\x4a\x5c\
+\xb3\x64\x6d\x9b\xac\xed\xf4\x7e\x00\x1e\x7a\xf2\x97\xc0\x3a\xf4\
+\x16\x0e\xc0\x05\x30\x00\xaa\x44\x59\x90\x11\x13\xd8\x0d\x21\x8c\
+\x81\x71\xcf\xa5\x16\xac\x81\xac\x95\x11\x51\xb9\x01\x0d\x90\x4b\
+\xfe\x23\x30\x3c\x75\xd8\xf7\x2d\xc0\x7e\x11\x34\x63\xb0\x99\xd6\
+\x33\xb0\xf7\xf0\x50\x82\xe5\x60\x13\xb0\x82\x57\x64\x85\xbe\x4d\
+\xb5\xf7\xca\x79\xc1\xd7\x2c\x93\xec\x5f\xc1\x2e\xfa\x10\x02\xf6\
+\x01\xf8\x24\x24\x0c\x78\x01\x0a\xd8\xbd\x87\xec\xa3\xbc\x00\x58\
+\xc8\x8b\x73\x94\x7e\x9b\xc0\xee\x06\xb2\x5b\x21\x92\x4b\xdf\x1a\
+\xb8\x81\x70\x0b\x30\x92\xf2\x80\xc3\x3e\x96\xf2\x1b\xe0\xde\x19\
+\xb2\xfb\x44\xf9\x04\x0f\x91\x71\x1a\xf7\xe8\xcc\x4c\xca\xf4\xcb\
+\xbe\xc2\xa6\x80\xd9\x18\x78\x07\x7c\x94\x8e\x41\x0f\x01\xfb\x4e\
+\xff\x2b\x08\x15\xd8\xb5\xbe\xfd\x09\xcc\x1d\x8d\xd5\x0c\x4a\x5c\
+\x70\xa8\xcf\x03\x60\x73\xa0\xc5\xf3\xa5\xd2\xf3\x80\x27\xf4\x0e\
+\x78\xc2\xe3\xff\x0d\xb0\x82\xb0\x19\x25\xdc\x63\x29\xcf\xe5\xdd\
+\x1a\xb8\x92\xc5\x39\x94\x4f\x82\x71\x02\x66\x1d\x0f\x24\x08\xe5\
+\xc0\xb3\x94\x95\x42\x38\x03\xee\xf0\xf0\x64\x10\x9e\x12\x07\x3b\
+\x28\xdc\x52\x9b\xc0\xcb\xb5\x18\x83\xa0\x5c\x48\x68\xa4\x39\x1e\
+\x86\xb9\xf8\x07\xfa\x1f\xd7\x22\x6d\xc4\xbb\x93\xac\x00\xdb\xf7\
+\x4a\xcc\x63\xee\xc5\x10\xbc\x73\x41\x15\x30\xfd\x8c\xc7\xb2\x96\
+\xf5\x23\xc1\x56\x43\x75\x09\xd3\xb5\x23\x75\x8e\x6c\x21\x99\x35\
+\x30\x95\x03\x53\xba\xd2\x1b\x49\xf6\x1c\x0f\xc1\x97\x14\x81\x09\
+\xb4\x2f\x49\x6d\x16\x8a\xb5\xe1\x96\x5d\xc3\x74\xe5\x48\xbd\x49\
+\xb1\xce\xbf\x17\x8f\x09\x89\x58\xb6\x2d\x3c\x36\x78\xe8\xfa\x21\
+\x68\x4a\x58\x3c\x74\xc6\x30\x54\x3e\xe4\x78\xd2\xfc\x25\xc1\x85\
+\xfa\x41\xee\x49\x67\xb3\xee\x3f\x05\x9e\x37\x5f\x61\x73\x29\xde\
+\x3c\x91\x09\x2c\x9e\x49\x42\x15\x0d\xc8\xbc\x8b\x91\x0b\xc6\x52\
+\x1e\xb4\x62\x5c\xe1\x89\xf6\x20\x48\x73\x3d\x83\xa0\x9d\xba\x0c\
+\xa6\xae\x9c\x06\x66\x0f\xda\xd7\xe2\x3d\xe5\x12\xef\x31\x43\x68\
+\x4c\xfb\x63\x1f\x20\x40\x50\xd7\x0a\x8f\xde\xb9\x82\x32\xdb\x0c\
+\x82\xfa\xbb\x35\x12\x36\x06\xee\x7b\xbd\xfd\xca\x8d\x8e\x7c\xb4\
+\x60\x7b\x7f\x86\x1d\xd8\x33\x5e\x86\x03\xba\x24\x3f\xa9\x82\x61\
+\x52\xdf\x49\x93\xa9\xd3\x3d\xda\xc7\xbd\x7b\x63\xe9\x30\xbb\x4b\
+\x1c\x8a\x94\x4e\x59\xc9\x0c\x55\xe7\x6c\xc7\x30\x82\xf1\x21\xf1\
+\x86\xe4\xbd\x4d\x84\x8c\x80\xc6\x3d\xb7\x35\xea\x4c\x78\x46\x5b\
+\xd2\x1f\x52\x4a\x1d\x78\x35\x3d\x07\xc9\x73\x7f\x86\xb9\x4f\x87\
+\x9e\xc0\x3e\x9d\x6b\xcf\x96\xbc\xbf\xda\x17\x85\xed\xa0\x51\x57\
+\x0b\xd6\x6d\x0e\x06\xf5\xb0\x67\xc0\x30\x81\x7d\xa5\xdf\x32\x99\
+\x27\x7d\x83\x4f\x46\x6e\xdf\x98\x94\xa1\x55\x29\xf5\xac\x2d\xfa\
+\x75\xdf\xe2\x09\xa7\x79\x1e\x62\xdb\xbe\xa6\x3b\x03\x44\x0a\xaf\
+\xdf\xad\x00\x3b\xee\x8b\x39\x60\xca\x70\x53\x19\xce\x34\x58\xc0\
+\x4b\xb3\x94\xe2\x02\x6f\xb9\x6a\x36\x96\x42\xdc\x00\xdf\x4a\xb8\
+\x49\xb6\x0e\x21\x16\x3b\x20\x32\x76\x1f\xf9\xa2\x01\x3b\x08\x43\
+\x95\xdb\xd6\x0f\x24\x34\xfe\xdf\xc0\x33\x7f\x23\x21\x9f\xff\x61\
+\x1a\xee\x38\x9e\x76\xd6\x25\x2c\xef\x3a\x07\x79\xc0\x4b\x38\xee\
+\xd9\xc1\x49\x08\xc6\x75\xe2\xf5\x16\x35\x0a\x51\x05\x2f\x3f\xc9\
+\xf3\x73\x99\x7e\xb4\x40\x1e\x7e\x80\xe5\x53\xb7\xbc\x2a\xa4\x1c\
+\x37\x6c\xbc\x89\x5f\x06\x09\xe3\x06\xea\xb2\x63\xa2\xf6\x86\x14\
+\x0f\x1a\xf9\x2d\x3e\xdd\xfa\x67\xc1\x94\x22\xd4\x7f\xe0\xed\x36\
+\xf8\xb3\x4c\x86\x57\x36\x93\x31\x27\x21\xd8\xfb\xe6\xe2\x19\xec\
+\x86\x6e\xe0\x14\xf8\x49\xe6\x77\x3c\x9e\x7b\xa0\x74\xa4\xea\x41\
+\x97\xa0\xf5\x50\x02\xd5\x21\x8f\x7b\x7f\xc6\xbb\x9f\x8e\x77\x2c\
+\xa1\xb8\x95\xcc\x6d\x6a\x00\x6e\x40\x78\x06\x1b\xd0\xc5\x7c\x24\
+\x6f\x0e\x10\x36\x60\x2d\xf0\x0c\xe1\xe5\x3c\x00\x36\x77\x19\xa0\
+\x83\xeb\x67\x7c\x96\x6c\x24\x73\xe5\xf9\xd3\x45\x31\x0d\x41\xe3\
+\x93\x2d\x3c\x42\x7d\xe1\x9e\xb2\x96\xf5\x5b\xe5\xc7\x71\x8c\xbe\
+\x4d\x36\x56\xe8\x1a\x3c\xd1\xd6\xc0\x25\x54\x33\x47\xc3\x66\x5a\
+\x3f\x09\xc1\x57\xe0\x07\xdf\x6c\x4b\x60\x06\x2f\x41\x93\x74\x42\
+\x67\xb2\x0e\x97\x55\x05\x85\xd1\x75\xcf\xd8\xac\x0a\x3c\xdb\x77\
+\x38\xf3\xc2\x8d\xaf\xa7\x30\x9d\xe3\x13\x76\xe3\x8e\x87\x4d\x62\
+\x40\x30\xb0\x03\x5e\xeb\x01\xf8\x04\x45\x34\x86\x0e\x56\xf0\x30\
+\x4c\x75\xf4\x36\x21\x18\xe2\x1c\x59\x38\x82\xc7\xbd\x17\x6e\xcc\
+\xf4\x8b\x64\xc5\xd9\x72\xee\x50\x63\x17\xba\x34\xf4\x2f\x26\x0b\
+\xa8\x7e\xec\x2e\x23\xff\x76\x31\x01\xe7\xad\x3e\x74\x65\x7d\x72\
+\x31\xf9\xed\xcc\xc5\xe4\xd8\xdb\xf7\x82\x6d\x20\x2b\x33\x1c\xfe\
+\x81\x7f\x6f\x32\x79\x30\x84\x71\x7a\xf7\xcb\x75\x30\x6e\x7d\xd4\
+\x8e\x6a\xbc\x67\xec\xc5\xdb\xd0\x0d\xa6\x35\xc9\xd5\xec\x8d\xcb\
+\x69\xf4\xe2\x98\x70\xc3\xe4\x7d\xa2\xf7\x09\x6c\x35\x3b\x26\x95\
+\x94\x18\xdd\xe5\x54\x06\xb9\xb0\x18\xf3\x9e\xc3\x6b\xf8\x9f\xaf\
+\xe7\x7f\x03\x88\x7c\xd3\x3b\xed\x32\x4f\xdf\x00\x00\x00\x00\x49\
+\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x00\x75\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x40\x00\x00\x00\x40\x08\x06\x00\x00\x00\xaa\x69\x71\xde\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x00\x27\x49\x44\x41\x54\x78\x9c\xed\
+\xc1\x01\x0d\x00\x00\x00\xc2\xa0\xf7\x4f\x6d\x0e\x37\xa0\x00\x00\
+\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x80\x77\x03\
+\x40\x40\x00\x01\x8f\xf2\xc9\x51\x00\x00\x00\x00\x49\x45\x4e\x44\
+\xae\x42\x60\x82\
+\x00\x00\x05\x4f\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x1d\x87\x00\x00\x1d\x87\
+\x01\x8f\xe5\xf1\x65\x00\x00\x05\x01\x49\x44\x41\x54\x58\x85\xad\
+\x97\x4d\x6c\x54\x55\x14\xc7\x7f\xf7\xbe\x37\x6f\x5e\xa7\x85\x7e\
+\x80\x89\x94\x16\x5a\x8a\x36\x50\x64\xc5\x87\x86\x34\x19\x89\x68\
+\x20\x1a\x44\xa4\x89\x44\x4d\xaa\x1b\xdd\x19\xb7\xa8\x60\x84\x85\
+\x0b\x5d\xb8\x72\x43\xca\x87\x81\x04\x34\x60\xfc\x5c\x10\x5a\x43\
+\xf8\xb2\x21\x05\x6c\x6b\xc4\x84\xea\x58\x86\xa6\xa0\xb1\x69\x67\
+\x98\x79\xf3\xee\x3d\x2e\xfa\x61\xdb\x99\xb6\xd3\xea\x7f\xf7\xde\
+\xbd\xf7\xfc\xff\xf7\x9c\x73\xcf\xbd\x47\x51\x24\x4e\xed\x59\xeb\
+\xa5\xfe\x2a\xdf\xaa\x2c\xcf\x6a\x68\x12\xa5\xaa\x41\xaa\x47\x47\
+\x55\x52\x89\x24\x2d\xf4\x88\xe6\xeb\xd2\xaa\xa1\xf3\x2d\xa7\x7b\
+\x83\x62\xec\xaa\xb9\x26\x1c\xde\xb6\xa5\x3a\x62\xed\x7e\x11\x5e\
+\x02\x16\xb9\x8e\x83\xe3\x38\x68\xa5\x51\x5a\x03\x20\xd6\x62\xc5\
+\x62\x8c\x21\x34\x06\x60\x58\x29\x4e\xaa\xc0\x3d\xf0\xca\x85\x0b\
+\x77\x17\x24\xa0\x2d\x1e\xf7\x1d\x9d\xd9\x27\xa8\xb7\xb5\xd6\xb1\
+\xa8\x17\xc5\x73\x23\x28\x3d\xbb\x66\xb1\x42\x10\xe6\xc8\x06\x59\
+\xac\xb5\x69\x85\x7c\x6c\xac\x7f\xa8\xb5\xa3\x23\x53\xb4\x80\xb6\
+\xf8\xc6\x87\xb5\x76\xcf\x2a\xa5\x36\xfb\xd1\x28\x51\xcf\x9b\x4d\
+\xeb\x4c\x52\xc8\x06\x01\x99\x6c\x16\x11\xb9\x6a\x6d\xf8\x7c\x6b\
+\x47\xe7\xc0\x9c\x02\xda\x9e\x7a\xe2\x31\x6d\xf9\x56\x6b\xa7\xa6\
+\x2c\x16\x43\x8f\xb9\x79\xa1\xb0\xd6\x92\x7a\x90\xc2\x18\xdb\x6f\
+\x35\x3b\x5a\xcf\x5d\xfe\x69\x46\x01\xc7\x9b\x9b\x97\xd9\x48\xd8\
+\xe9\xba\xee\xf2\xd2\x58\x0c\x35\xef\x5d\x17\x86\x88\x90\x4a\xa7\
+\x08\x8d\xe9\xb7\x36\xdc\x38\xd9\x13\x13\xdb\x6b\x8b\xc7\x7d\x1b\
+\x09\xcf\x6a\xed\xfc\xaf\xe4\x00\x4a\x29\x4a\x63\xa5\x38\x8e\xae\
+\xd1\xda\x3d\xdb\x16\x8f\xfb\x79\x02\x1c\x9d\xd9\xa7\x94\xda\x54\
+\xf6\x3f\x93\x4f\x11\x51\x52\x8a\x52\x6a\xb3\xa3\x33\xfb\x26\x78\
+\x61\xf4\xa8\x69\xe1\x64\x89\xef\x47\x22\x6e\x64\xca\xc2\xef\x6e\
+\xdd\xe6\x68\x57\x37\x65\x9e\xc7\xf2\xc5\x8b\x8a\x22\xbb\x94\xb8\
+\xc3\xa7\x9d\x37\x10\x11\x56\x55\x55\x4c\x11\xa1\x94\x22\x17\x86\
+\x1b\x76\xd7\xd4\xb7\x9d\x49\x24\x46\x34\x40\xc4\xda\xfd\x5a\xa9\
+\x98\xe7\x45\xf3\x8c\xb5\xf7\x25\x18\x4c\xa5\x39\x7c\xed\x26\x97\
+\x13\x77\xe6\x24\xef\xe8\x4b\x70\xa4\xab\x9b\x7b\xa9\x34\xed\x7d\
+\x7f\xe4\x8d\x7b\x9e\x87\x56\x2a\x66\xdd\x70\x3f\x80\xf3\xc9\xf6\
+\xed\xd1\x68\x98\x39\xee\xfb\x25\x9e\xeb\x38\x79\x0b\x5c\xad\xe9\
+\x1e\xbc\x0f\xc0\x8d\x81\x41\x96\xc6\x4a\xa8\x2d\x5f\x3c\x23\xf9\
+\x89\x9b\x3f\x4f\x7c\xb7\xac\x6b\xcc\x9b\xab\x46\x5d\x41\x68\xc2\
+\xc6\xbd\x1b\x16\x7f\xe4\xb4\xac\x7c\x68\x9b\x82\xd7\x62\x25\x25\
+\x28\x95\x1f\xfb\xfa\xca\x72\xa2\x8e\x43\xef\xbd\x3f\x27\x44\x2c\
+\x29\x20\x62\x3a\xf9\xde\xf5\x6b\x68\xae\xab\x2d\x28\x54\x6b\x4d\
+\x36\xc8\x46\x4d\xda\xbf\xe8\xec\xaa\xab\x7d\xcb\x75\x9d\x4d\x7e\
+\x01\xf7\x8f\xa3\x61\x49\xe5\xac\x22\x0a\x91\xc7\xeb\x57\xcc\x68\
+\x6f\x2c\x0f\x30\x56\x86\x5c\x0d\x4d\x4e\x01\xd7\x4f\xc7\xd3\x8f\
+\xd4\x23\x0a\xbe\xe8\xb9\x85\x00\x47\xbb\xba\x01\x08\x8c\x99\x17\
+\xf9\x38\x1c\xc7\xc1\x98\x70\xad\x2b\x4a\x55\x6b\x55\x5c\xb5\x7b\
+\x66\x75\x3d\xf0\xaf\x88\x23\x63\x22\xe6\x4b\x0e\x30\xca\xa9\xaa\
+\x35\x48\xb5\x9e\xe3\x82\x99\x2e\x62\x77\xd3\xa3\x79\xff\xe7\x43\
+\x0e\x30\xc6\x59\xbd\xa0\x42\x1f\x2d\x10\x32\xaf\x88\x30\x4e\x81\
+\x8c\x09\x01\x95\x14\x6b\x8b\x5e\x37\x3d\xe1\xc6\x71\xb4\xab\x9b\
+\x4b\x45\xd4\x89\x71\x58\xb1\x00\x49\xad\x44\x92\x56\x64\x41\xe4\
+\x7b\xd7\xaf\xe1\xc5\xa6\x46\x80\x89\xc4\xbc\xf8\x7b\x7f\x51\xb6\
+\x44\x04\x90\xa4\x6b\xa1\x27\x0c\x4d\x7c\x21\xe4\x93\x63\xfe\x79\
+\xcf\x2f\x08\x70\xec\x7a\x0f\x00\x5b\x56\xd6\xcc\x6a\x2f\x0c\x0d\
+\x22\xaa\xd7\xd9\xd9\x50\x6b\x11\x79\x39\x12\xf1\xd0\x05\x0a\x51\
+\x31\xe4\x0d\x55\x15\xf8\xae\x3b\x51\x27\x6e\x0e\xdc\xa3\xaa\xc4\
+\x67\x45\x45\xe1\x8a\x69\xad\x25\x93\xcd\xa0\xe1\x3d\x5d\x5a\x35\
+\x74\x1e\x18\x0e\x73\xb9\x82\x93\x2f\x25\xee\x14\x75\xce\xb7\xad\
+\xae\x63\xcf\xa4\x70\x1c\xbb\xde\xc3\x8f\xfd\x85\x9f\x83\xb9\x51\
+\xae\x61\x7f\xe9\x50\xbb\x6e\x39\xdd\x1b\x28\xc5\xc9\x6c\x2e\x40\
+\xc8\xcf\x85\x6f\x6e\xdd\x9e\x93\x7c\x26\x11\xdf\xff\xda\x97\x37\
+\x47\x10\xb2\xb9\x00\x84\x13\x2d\xa7\x7b\x03\x07\xe0\x85\x9a\xfa\
+\x6b\x56\x9b\x37\x15\x2a\xe2\xba\xee\xd4\x05\x22\x0c\xa6\x1e\xd0\
+\xb2\xae\x71\xc6\xda\x3e\x19\x0d\x55\x15\x94\xfb\x51\xee\x8e\xa4\
+\xd8\xba\x6a\x05\x75\x95\xe5\x53\xc6\xb3\xd9\x80\x5c\x98\x4b\xeb\
+\xd0\xdd\x7d\x26\x91\x18\x99\x08\xfa\xb1\xad\x8f\x7f\x00\xfa\x9d\
+\xb2\xb2\x52\x1c\x3d\xcf\x33\x5d\x24\x8c\x35\x8c\x8c\xa4\x00\x7b\
+\xf0\xd5\xf3\x57\xde\x85\x49\x2f\x22\x63\xfd\x43\x82\x5c\x4d\xa5\
+\xd3\x88\x14\x5f\x17\x8a\x85\xb5\x42\x2a\x9d\x46\x90\xab\x7f\x47\
+\x2b\x0f\x8e\xff\x9f\x92\xf6\x63\xcf\xf1\x4e\xc7\x71\x6b\xca\x62\
+\xb1\x82\xd7\xf3\x42\x20\x22\x8c\xa4\x53\x98\xd9\x1e\xa5\x00\xad\
+\x1d\x9d\x03\x56\xb3\xc3\x98\xb0\x7f\x78\x64\x18\x63\xfe\xbb\x27\
+\x8c\x31\x8c\xda\x32\xa3\xcf\xf2\x69\xbd\xc1\xac\x8d\x09\x4a\x6d\
+\xf6\x3d\x8f\xa8\x17\x9d\xb7\x37\x44\x84\x6c\x90\x25\x13\x04\x80\
+\xbd\x62\x8d\xd9\x55\xa8\x31\x29\x98\x6d\x5f\xfe\x96\x1c\xd9\xb9\
+\x72\xf5\x67\x5a\xe5\x08\x8d\xd9\x90\x0b\x83\x88\x00\x5a\x29\xd4\
+\x1c\x57\xb7\xb5\x86\x6c\x2e\xc7\x83\x4c\x9a\x5c\x18\xa6\x50\x7c\
+\x38\xe4\x55\xbe\xfe\xc6\xb9\x1f\x86\x0a\xcd\x9f\x73\x5b\xc7\x9b\
+\x9b\x97\x89\x17\x1e\x18\x6f\x4e\xb5\xd6\xb8\x8e\x8b\xd2\x6a\xa2\
+\x72\x5a\x11\xc4\x0a\xa1\x09\xb1\xa3\x17\xdb\x30\xc2\x09\x1d\xba\
+\xef\x2f\xb8\x39\x9d\x8e\x53\x7b\xd6\x7a\x99\xfb\xe5\x4f\x5a\x78\
+\x4e\x29\x59\x0b\xaa\x1a\x18\x6b\xcf\x49\x82\x24\x45\x54\xaf\x86\
+\xaf\xfc\xa5\x43\xed\xc5\xb6\xe7\xff\x00\x13\x6b\x5c\x28\xc6\x7f\
+\x62\x3e\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+"
+
+qt_resource_name = b"\
+\x00\x09\
+\x09\x5f\x97\x13\
+\x00\x71\
+\x00\x73\x00\x73\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x73\
+\x00\x02\
+\x00\x00\x07\x83\
+\x00\x72\
+\x00\x63\
+\x00\x12\
+\x00\x68\xca\xe7\
+\x00\x74\
+\x00\x72\x00\x61\x00\x6e\x00\x73\x00\x70\x00\x61\x00\x72\x00\x65\x00\x6e\x00\x74\x00\x40\x00\x32\x00\x78\x00\x2e\x00\x70\x00\x6e\
+\x00\x67\
+\x00\x27\
+\x00\x95\x94\xa7\
+\x00\x62\
+\x00\x75\x00\x74\x00\x74\x00\x6f\x00\x6e\x00\x5f\x00\x6e\x00\x74\x00\x5f\x00\x63\x00\x6c\x00\x6f\x00\x73\x00\x65\x00\x5f\x00\x73\
+\x00\x71\x00\x75\x00\x61\x00\x72\x00\x65\x00\x5f\x00\x68\x00\x6f\x00\x76\x00\x65\x00\x72\x00\x5f\x00\x72\x00\x65\x00\x64\x00\x40\
+\x00\x32\x00\x78\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x25\
+\x00\xad\xa0\x87\
+\x00\x62\
+\x00\x75\x00\x74\x00\x74\x00\x6f\x00\x6e\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x77\x00\x69\x00\x6e\x00\x5f\x00\x6d\x00\x69\x00\x6e\
+\x00\x69\x00\x6d\x00\x69\x00\x7a\x00\x65\x00\x5f\x00\x70\x00\x72\x00\x65\x00\x73\x00\x73\x00\x65\x00\x64\x00\x40\x00\x32\x00\x78\
+\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x25\
+\x00\xaf\xf0\x87\
+\x00\x62\
+\x00\x75\x00\x74\x00\x74\x00\x6f\x00\x6e\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x77\x00\x69\x00\x6e\x00\x5f\x00\x6d\x00\x61\x00\x78\
+\x00\x69\x00\x6d\x00\x69\x00\x7a\x00\x65\x00\x5f\x00\x70\x00\x72\x00\x65\x00\x73\x00\x73\x00\x65\x00\x64\x00\x40\x00\x32\x00\x78\
+\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x17\
+\x01\x78\x04\xe7\
+\x00\x62\
+\x00\x75\x00\x74\x00\x74\x00\x6f\x00\x6e\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x77\x00\x69\x00\x6e\x00\x5f\x00\x63\x00\x6c\x00\x6f\
+\x00\x73\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x1d\
+\x01\xd2\x07\xc7\
+\x00\x62\
+\x00\x75\x00\x74\x00\x74\x00\x6f\x00\x6e\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x77\x00\x69\x00\x6e\x00\x5f\x00\x6d\x00\x61\x00\x78\
+\x00\x69\x00\x6d\x00\x69\x00\x7a\x00\x65\x00\x40\x00\x32\x00\x78\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x20\
+\x02\x02\x91\x47\
+\x00\x62\
+\x00\x75\x00\x74\x00\x74\x00\x6f\x00\x6e\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x77\x00\x69\x00\x6e\x00\x5f\x00\x63\x00\x6c\x00\x6f\
+\x00\x73\x00\x65\x00\x5f\x00\x68\x00\x6f\x00\x76\x00\x65\x00\x72\x00\x40\x00\x32\x00\x78\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x1b\
+\x02\xd4\x90\x87\
+\x00\x74\
+\x00\x72\x00\x61\x00\x6e\x00\x73\x00\x70\x00\x61\x00\x72\x00\x65\x00\x6e\x00\x74\x00\x5f\x00\x64\x00\x69\x00\x73\x00\x61\x00\x62\
+\x00\x6c\x00\x65\x00\x64\x00\x40\x00\x32\x00\x78\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x15\
+\x03\x1c\x93\x87\
+\x00\x74\
+\x00\x72\x00\x61\x00\x6e\x00\x73\x00\x70\x00\x61\x00\x72\x00\x65\x00\x6e\x00\x74\x00\x5f\x00\x66\x00\x6f\x00\x63\x00\x75\x00\x73\
+\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x16\
+\x04\x9c\xa4\xa7\
+\x00\x62\
+\x00\x61\x00\x73\x00\x65\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x5f\x00\x64\x00\x69\x00\x73\x00\x61\x00\x62\x00\x6c\x00\x65\
+\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x23\
+\x04\xe4\x6c\x47\
+\x00\x62\
+\x00\x75\x00\x74\x00\x74\x00\x6f\x00\x6e\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x77\x00\x69\x00\x6e\x00\x5f\x00\x6d\x00\x69\x00\x6e\
+\x00\x69\x00\x6d\x00\x69\x00\x7a\x00\x65\x00\x5f\x00\x68\x00\x6f\x00\x76\x00\x65\x00\x72\x00\x40\x00\x32\x00\x78\x00\x2e\x00\x70\
+\x00\x6e\x00\x67\
+\x00\x22\
+\x05\x31\x64\x07\
+\x00\x62\
+\x00\x75\x00\x74\x00\x74\x00\x6f\x00\x6e\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x77\x00\x69\x00\x6e\x00\x5f\x00\x6d\x00\x61\x00\x78\
+\x00\x69\x00\x6d\x00\x69\x00\x7a\x00\x65\x00\x5f\x00\x70\x00\x72\x00\x65\x00\x73\x00\x73\x00\x65\x00\x64\x00\x2e\x00\x70\x00\x6e\
+\x00\x67\
+\x00\x1a\
+\x05\x35\xb6\x67\
+\x00\x74\
+\x00\x72\x00\x61\x00\x6e\x00\x73\x00\x70\x00\x61\x00\x72\x00\x65\x00\x6e\x00\x74\x00\x5f\x00\x70\x00\x72\x00\x65\x00\x73\x00\x73\
+\x00\x65\x00\x64\x00\x40\x00\x32\x00\x78\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x10\
+\x05\x3e\x39\x67\
+\x00\x62\
+\x00\x61\x00\x73\x00\x65\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x40\x00\x32\x00\x78\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x20\
+\x05\x5d\x99\xe7\
+\x00\x62\
+\x00\x75\x00\x74\x00\x74\x00\x6f\x00\x6e\x00\x5f\x00\x6e\x00\x74\x00\x5f\x00\x63\x00\x6c\x00\x6f\x00\x73\x00\x65\x00\x5f\x00\x68\
+\x00\x6f\x00\x76\x00\x65\x00\x72\x00\x5f\x00\x72\x00\x65\x00\x64\x00\x40\x00\x32\x00\x78\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x16\
+\x05\x7a\xd3\x67\
+\x00\x62\
+\x00\x61\x00\x73\x00\x65\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x5f\x00\x66\x00\x6f\x00\x63\x00\x75\x00\x73\x00\x40\x00\x32\
+\x00\x78\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x1d\
+\x05\xd2\x06\xe7\
+\x00\x62\
+\x00\x75\x00\x74\x00\x74\x00\x6f\x00\x6e\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x77\x00\x69\x00\x6e\x00\x5f\x00\x6d\x00\x69\x00\x6e\
+\x00\x69\x00\x6d\x00\x69\x00\x7a\x00\x65\x00\x40\x00\x32\x00\x78\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x24\
+\x06\x10\x67\xa7\
+\x00\x62\
+\x00\x75\x00\x74\x00\x74\x00\x6f\x00\x6e\x00\x5f\x00\x6e\x00\x74\x00\x5f\x00\x63\x00\x6c\x00\x6f\x00\x73\x00\x65\x00\x5f\x00\x73\
+\x00\x71\x00\x75\x00\x61\x00\x72\x00\x65\x00\x5f\x00\x68\x00\x6f\x00\x76\x00\x65\x00\x72\x00\x5f\x00\x72\x00\x65\x00\x64\x00\x2e\
+\x00\x70\x00\x6e\x00\x67\
+\x00\x1a\
+\x06\x2a\x84\x67\
+\x00\x62\
+\x00\x75\x00\x74\x00\x74\x00\x6f\x00\x6e\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x77\x00\x69\x00\x6e\x00\x5f\x00\x64\x00\x69\x00\x73\
+\x00\x61\x00\x62\x00\x6c\x00\x65\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x22\
+\x06\x50\xad\x47\
+\x00\x62\
+\x00\x75\x00\x74\x00\x74\x00\x6f\x00\x6e\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x77\x00\x69\x00\x6e\x00\x5f\x00\x63\x00\x6c\x00\x6f\
+\x00\x73\x00\x65\x00\x5f\x00\x70\x00\x72\x00\x65\x00\x73\x00\x73\x00\x65\x00\x64\x00\x40\x00\x32\x00\x78\x00\x2e\x00\x70\x00\x6e\
+\x00\x67\
+\x00\x1d\
+\x06\x7a\x3b\x27\
+\x00\x62\
+\x00\x75\x00\x74\x00\x74\x00\x6f\x00\x6e\x00\x5f\x00\x6e\x00\x74\x00\x5f\x00\x63\x00\x6c\x00\x6f\x00\x73\x00\x65\x00\x5f\x00\x68\
+\x00\x6f\x00\x76\x00\x65\x00\x72\x00\x5f\x00\x72\x00\x65\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x1a\
+\x06\xa1\x78\x67\
+\x00\x62\
+\x00\x75\x00\x74\x00\x74\x00\x6f\x00\x6e\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x77\x00\x69\x00\x6e\x00\x5f\x00\x63\x00\x6c\x00\x6f\
+\x00\x73\x00\x65\x00\x40\x00\x32\x00\x78\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x17\
+\x07\x06\x3d\xa7\
+\x00\x74\
+\x00\x72\x00\x61\x00\x6e\x00\x73\x00\x70\x00\x61\x00\x72\x00\x65\x00\x6e\x00\x74\x00\x5f\x00\x70\x00\x72\x00\x65\x00\x73\x00\x73\
+\x00\x65\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x22\
+\x07\xb1\x64\x27\
+\x00\x62\
+\x00\x75\x00\x74\x00\x74\x00\x6f\x00\x6e\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x77\x00\x69\x00\x6e\x00\x5f\x00\x6d\x00\x69\x00\x6e\
+\x00\x69\x00\x6d\x00\x69\x00\x7a\x00\x65\x00\x5f\x00\x70\x00\x72\x00\x65\x00\x73\x00\x73\x00\x65\x00\x64\x00\x2e\x00\x70\x00\x6e\
+\x00\x67\
+\x00\x18\
+\x08\xd2\xa3\x27\
+\x00\x62\
+\x00\x61\x00\x73\x00\x65\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x5f\x00\x70\x00\x72\x00\x65\x00\x73\x00\x73\x00\x65\x00\x64\
+\x00\x40\x00\x32\x00\x78\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x20\
+\x09\xc9\xa0\xa7\
+\x00\x62\
+\x00\x75\x00\x74\x00\x74\x00\x6f\x00\x6e\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x77\x00\x69\x00\x6e\x00\x5f\x00\x6d\x00\x61\x00\x78\
+\x00\x69\x00\x6d\x00\x69\x00\x7a\x00\x65\x00\x5f\x00\x68\x00\x6f\x00\x76\x00\x65\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x20\
+\x09\xdb\x20\xa7\
+\x00\x62\
+\x00\x75\x00\x74\x00\x74\x00\x6f\x00\x6e\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x77\x00\x69\x00\x6e\x00\x5f\x00\x6d\x00\x69\x00\x6e\
+\x00\x69\x00\x6d\x00\x69\x00\x7a\x00\x65\x00\x5f\x00\x68\x00\x6f\x00\x76\x00\x65\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x1a\
+\x0a\x84\x33\xc7\
+\x00\x62\
+\x00\x75\x00\x74\x00\x74\x00\x6f\x00\x6e\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x77\x00\x69\x00\x6e\x00\x5f\x00\x6d\x00\x69\x00\x6e\
+\x00\x69\x00\x6d\x00\x69\x00\x7a\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x1a\
+\x0a\x8d\x73\xc7\
+\x00\x62\
+\x00\x75\x00\x74\x00\x74\x00\x6f\x00\x6e\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x77\x00\x69\x00\x6e\x00\x5f\x00\x6d\x00\x61\x00\x78\
+\x00\x69\x00\x6d\x00\x69\x00\x7a\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0d\
+\x0b\x72\x3d\x07\
+\x00\x62\
+\x00\x61\x00\x73\x00\x65\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x13\
+\x0c\x24\x39\x47\
+\x00\x62\
+\x00\x61\x00\x73\x00\x65\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x5f\x00\x66\x00\x6f\x00\x63\x00\x75\x00\x73\x00\x2e\x00\x70\
+\x00\x6e\x00\x67\
+\x00\x19\
+\x0c\xa5\xc5\x27\
+\x00\x62\
+\x00\x61\x00\x73\x00\x65\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x5f\x00\x64\x00\x69\x00\x73\x00\x61\x00\x62\x00\x6c\x00\x65\
+\x00\x64\x00\x40\x00\x32\x00\x78\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0f\
+\x0c\xe2\x68\x67\
+\x00\x74\
+\x00\x72\x00\x61\x00\x6e\x00\x73\x00\x70\x00\x61\x00\x72\x00\x65\x00\x6e\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x23\
+\x0c\xe4\x6e\x07\
+\x00\x62\
+\x00\x75\x00\x74\x00\x74\x00\x6f\x00\x6e\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x77\x00\x69\x00\x6e\x00\x5f\x00\x6d\x00\x61\x00\x78\
+\x00\x69\x00\x6d\x00\x69\x00\x7a\x00\x65\x00\x5f\x00\x68\x00\x6f\x00\x76\x00\x65\x00\x72\x00\x40\x00\x32\x00\x78\x00\x2e\x00\x70\
+\x00\x6e\x00\x67\
+\x00\x18\
+\x0e\x31\x43\xa7\
+\x00\x74\
+\x00\x72\x00\x61\x00\x6e\x00\x73\x00\x70\x00\x61\x00\x72\x00\x65\x00\x6e\x00\x74\x00\x5f\x00\x64\x00\x69\x00\x73\x00\x61\x00\x62\
+\x00\x6c\x00\x65\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x1d\
+\x0e\x33\x4e\xc7\
+\x00\x62\
+\x00\x75\x00\x74\x00\x74\x00\x6f\x00\x6e\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x77\x00\x69\x00\x6e\x00\x5f\x00\x63\x00\x6c\x00\x6f\
+\x00\x73\x00\x65\x00\x5f\x00\x68\x00\x6f\x00\x76\x00\x65\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x1d\
+\x0e\xa9\x93\xe7\
+\x00\x62\
+\x00\x75\x00\x74\x00\x74\x00\x6f\x00\x6e\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x77\x00\x69\x00\x6e\x00\x5f\x00\x64\x00\x69\x00\x73\
+\x00\x61\x00\x62\x00\x6c\x00\x65\x00\x64\x00\x40\x00\x32\x00\x78\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x15\
+\x0f\xac\xe3\xc7\
+\x00\x62\
+\x00\x61\x00\x73\x00\x65\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x5f\x00\x70\x00\x72\x00\x65\x00\x73\x00\x73\x00\x65\x00\x64\
+\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x18\
+\x0f\xd7\x34\x67\
+\x00\x74\
+\x00\x72\x00\x61\x00\x6e\x00\x73\x00\x70\x00\x61\x00\x72\x00\x65\x00\x6e\x00\x74\x00\x5f\x00\x66\x00\x6f\x00\x63\x00\x75\x00\x73\
+\x00\x40\x00\x32\x00\x78\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x1f\
+\x0f\xdf\x0b\xe7\
+\x00\x62\
+\x00\x75\x00\x74\x00\x74\x00\x6f\x00\x6e\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x77\x00\x69\x00\x6e\x00\x5f\x00\x63\x00\x6c\x00\x6f\
+\x00\x73\x00\x65\x00\x5f\x00\x70\x00\x72\x00\x65\x00\x73\x00\x73\x00\x65\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
+\x00\x00\x00\x18\x00\x02\x00\x00\x00\x28\x00\x00\x00\x03\
+\x00\x00\x00\x22\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x4c\x00\x00\x00\x00\x00\x01\x00\x00\x00\x79\
+\x00\x00\x00\xa0\x00\x00\x00\x00\x00\x01\x00\x00\x02\x74\
+\x00\x00\x00\xf0\x00\x00\x00\x00\x00\x01\x00\x00\x0b\x3a\
+\x00\x00\x01\x40\x00\x00\x00\x00\x00\x01\x00\x00\x14\x8e\
+\x00\x00\x01\x74\x00\x00\x00\x00\x00\x01\x00\x00\x18\x41\
+\x00\x00\x01\xb4\x00\x00\x00\x00\x00\x01\x00\x00\x20\xbc\
+\x00\x00\x01\xfa\x00\x00\x00\x00\x00\x01\x00\x00\x2a\xa0\
+\x00\x00\x02\x36\x00\x00\x00\x00\x00\x01\x00\x00\x2b\x19\
+\x00\x00\x02\x66\x00\x00\x00\x00\x00\x01\x00\x00\x2b\x85\
+\x00\x00\x02\x98\x00\x00\x00\x00\x00\x01\x00\x00\x30\x71\
+\x00\x00\x02\xe4\x00\x00\x00\x00\x00\x01\x00\x00\x38\xfa\
+\x00\x00\x03\x2e\x00\x00\x00\x00\x00\x01\x00\x00\x3d\x85\
+\x00\x00\x03\x68\x00\x00\x00\x00\x00\x01\x00\x00\x3d\xfe\
+\x00\x00\x03\x8e\x00\x00\x00\x00\x00\x01\x00\x00\x4a\xd8\
+\x00\x00\x03\xd4\x00\x00\x00\x00\x00\x01\x00\x00\x4c\x92\
+\x00\x00\x04\x06\x00\x00\x00\x00\x00\x01\x00\x00\x59\x6c\
+\x00\x00\x04\x46\x00\x00\x00\x00\x00\x01\x00\x00\x61\x64\
+\x00\x00\x04\x94\x00\x00\x00\x00\x00\x01\x00\x00\x62\x53\
+\x00\x00\x04\xce\x00\x00\x00\x00\x00\x01\x00\x00\x65\xe0\
+\x00\x00\x05\x18\x00\x00\x00\x00\x00\x01\x00\x00\x70\x37\
+\x00\x00\x05\x58\x00\x00\x00\x00\x00\x01\x00\x00\x71\x4c\
+\x00\x00\x05\x92\x00\x00\x00\x00\x00\x01\x00\x00\x79\x54\
+\x00\x00\x05\xc6\x00\x00\x00\x00\x00\x01\x00\x00\x79\xc0\
+\x00\x00\x06\x10\x00\x00\x00\x00\x00\x01\x00\x00\x7d\xe9\
+\x00\x00\x06\x46\x00\x00\x00\x00\x00\x01\x00\x00\x8a\xc3\
+\x00\x00\x06\x8c\x00\x00\x00\x00\x00\x01\x00\x00\x8f\x66\
+\x00\x00\x06\xd2\x00\x00\x00\x00\x00\x01\x00\x00\x93\x6b\
+\x00\x00\x07\x0c\x00\x00\x00\x00\x00\x01\x00\x00\x97\x25\
+\x00\x00\x07\x46\x00\x00\x00\x00\x00\x01\x00\x00\x9b\x1b\
+\x00\x00\x07\x66\x00\x00\x00\x00\x00\x01\x00\x00\xa0\x07\
+\x00\x00\x07\x92\x00\x00\x00\x00\x00\x01\x00\x00\xa4\xf3\
+\x00\x00\x07\xca\x00\x00\x00\x00\x00\x01\x00\x00\xb1\xcd\
+\x00\x00\x07\xee\x00\x00\x00\x00\x00\x01\x00\x00\xb2\x39\
+\x00\x00\x08\x3a\x00\x00\x00\x00\x00\x01\x00\x00\xbb\xe7\
+\x00\x00\x08\x70\x00\x00\x00\x00\x00\x01\x00\x00\xbc\x53\
+\x00\x00\x08\xb0\x00\x00\x00\x00\x00\x01\x00\x00\xc1\x2b\
+\x00\x00\x08\xf0\x00\x00\x00\x00\x00\x01\x00\x00\xc8\x9e\
+\x00\x00\x09\x20\x00\x00\x00\x00\x00\x01\x00\x00\xcd\x8a\
+\x00\x00\x09\x56\x00\x00\x00\x00\x00\x01\x00\x00\xce\x03\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x18\x00\x02\x00\x00\x00\x28\x00\x00\x00\x03\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x22\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x00\x4c\x00\x00\x00\x00\x00\x01\x00\x00\x00\x79\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x00\xa0\x00\x00\x00\x00\x00\x01\x00\x00\x02\x74\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x00\xf0\x00\x00\x00\x00\x00\x01\x00\x00\x0b\x3a\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x01\x40\x00\x00\x00\x00\x00\x01\x00\x00\x14\x8e\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x01\x74\x00\x00\x00\x00\x00\x01\x00\x00\x18\x41\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x01\xb4\x00\x00\x00\x00\x00\x01\x00\x00\x20\xbc\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x01\xfa\x00\x00\x00\x00\x00\x01\x00\x00\x2a\xa0\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x02\x36\x00\x00\x00\x00\x00\x01\x00\x00\x2b\x19\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x02\x66\x00\x00\x00\x00\x00\x01\x00\x00\x2b\x85\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x02\x98\x00\x00\x00\x00\x00\x01\x00\x00\x30\x71\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x02\xe4\x00\x00\x00\x00\x00\x01\x00\x00\x38\xfa\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x03\x2e\x00\x00\x00\x00\x00\x01\x00\x00\x3d\x85\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x03\x68\x00\x00\x00\x00\x00\x01\x00\x00\x3d\xfe\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x03\x8e\x00\x00\x00\x00\x00\x01\x00\x00\x4a\xd8\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x03\xd4\x00\x00\x00\x00\x00\x01\x00\x00\x4c\x92\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x04\x06\x00\x00\x00\x00\x00\x01\x00\x00\x59\x6c\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x04\x46\x00\x00\x00\x00\x00\x01\x00\x00\x61\x64\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x04\x94\x00\x00\x00\x00\x00\x01\x00\x00\x62\x53\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x04\xce\x00\x00\x00\x00\x00\x01\x00\x00\x65\xe0\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x05\x18\x00\x00\x00\x00\x00\x01\x00\x00\x70\x37\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x05\x58\x00\x00\x00\x00\x00\x01\x00\x00\x71\x4c\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x05\x92\x00\x00\x00\x00\x00\x01\x00\x00\x79\x54\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x05\xc6\x00\x00\x00\x00\x00\x01\x00\x00\x79\xc0\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x06\x10\x00\x00\x00\x00\x00\x01\x00\x00\x7d\xe9\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x06\x46\x00\x00\x00\x00\x00\x01\x00\x00\x8a\xc3\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x06\x8c\x00\x00\x00\x00\x00\x01\x00\x00\x8f\x66\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x06\xd2\x00\x00\x00\x00\x00\x01\x00\x00\x93\x6b\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x07\x0c\x00\x00\x00\x00\x00\x01\x00\x00\x97\x25\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x07\x46\x00\x00\x00\x00\x00\x01\x00\x00\x9b\x1b\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x07\x66\x00\x00\x00\x00\x00\x01\x00\x00\xa0\x07\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x07\x92\x00\x00\x00\x00\x00\x01\x00\x00\xa4\xf3\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x07\xca\x00\x00\x00\x00\x00\x01\x00\x00\xb1\xcd\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x07\xee\x00\x00\x00\x00\x00\x01\x00\x00\xb2\x39\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x08\x3a\x00\x00\x00\x00\x00\x01\x00\x00\xbb\xe7\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x08\x70\x00\x00\x00\x00\x00\x01\x00\x00\xbc\x53\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x08\xb0\x00\x00\x00\x00\x00\x01\x00\x00\xc1\x2b\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x08\xf0\x00\x00\x00\x00\x00\x01\x00\x00\xc8\x9e\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x09\x20\x00\x00\x00\x00\x00\x01\x00\x00\xcd\x8a\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+\x00\x00\x09\x56\x00\x00\x00\x00\x00\x01\x00\x00\xce\x03\
+\x00\x00\x01\x85\x91\xa8\x15\x70\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
@@ -0,0 +1,1120 @@
+# -*- coding: utf-8 -*-
+
+# QSS template created by the qtsass compiler v0.4.0
+#
+# The definitions are in the "qrainbowstyle.qss._styles.scss" module.
+# Even items are QSS fragments, odd items are names of palette variables.
+#
+# WARNING! All changes made in this file will be lost!
+
+TOKENS = (
+    '/* QDarkStyleSheet -----------------------------------------------------------\n\nThis is the main style sheet, the palette has nine colors.\n\nIt is based on three selecting colors, three greyish (background) colors\nplus three whitish (foreground) colors. Each set of widgets of the same\ntype have a header like this:\n\n    ------------------\n    GroupName --------\n    ------------------\n\nAnd each widget is separated with a header like this:\n\n    QWidgetName ------\n\nThis makes more easy to find and change some css field. The basic\nconfiguration is described bellow.\n\n    BACKGROUND -----------\n\n        Light   (unpressed)\n        Normal  (border, disabled, pressed, checked, toolbars, menus)\n        Dark    (background)\n\n    FOREGROUND -----------\n\n        Light   (texts/labels)\n        Normal  (not used yet)\n        Dark    (disabled texts)\n\n    SELECTION ------------\n\n        Light  (selection/hover/active)\n        Normal (selected)\n        Dark   (selected disabled)\n\nIf a stranger configuration is required because of a bugfix or anything\nelse, keep the comment on the line above so nobody changes it, including the\nissue number.\n\n*/\n/*\n\nSee Qt documentation:\n\n  - https://doc.qt.io/qt-5/stylesheet.html\n  - https://doc.qt.io/qt-5/stylesheet-reference.html\n  - https://doc.qt.io/qt-5/stylesheet-examples.html\n\n--------------------------------------------------------------------------- */\n/* Reset elements ------------------------------------------------------------\n\nResetting everything helps to unify styles across different operating systems\n\n--------------------------------------------------------------------------- */\n* {\n  padding: 0px;\n  margin: 0px;\n  border: 0px;\n  border-style: none;\n  border-image: none;\n  outline: 0;\n}\n\n/* specific reset for elements inside QToolBar */\nQToolBar * {\n  margin: 0px;\n  padding: 0px;\n}\n\n/* QWidget ----------------------------------------------------------------\n\n--------------------------------------------------------------------------- */\nQWidget {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  border: 0px solid ',
+    'COLOR_BACKGROUND_4',
+    ';\n  padding: 0px;\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n  selection-background-color: ',
+    'COLOR_ACCENT_2',
+    ';\n  selection-color: ',
+    'COLOR_TEXT_1',
+    ';\n}\n\nQWidget:disabled {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  color: ',
+    'COLOR_TEXT_4',
+    ';\n  selection-background-color: ',
+    'COLOR_ACCENT_1',
+    ';\n  selection-color: ',
+    'COLOR_TEXT_4',
+    ';\n}\n\nQWidget::item:selected {\n  background-color: ',
+    'COLOR_ACCENT_2',
+    ';\n}\n\nQWidget::item:hover:!selected {\n  background-color: ',
+    'COLOR_ACCENT_3',
+    ';\n}\n\n/* QMainWindow ------------------------------------------------------------\n\nThis adjusts the splitter in the dock widget, not qsplitter\nhttps://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qmainwindow\n\n--------------------------------------------------------------------------- */\nQMainWindow::separator {\n  background-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n  border: 0px solid ',
+    'COLOR_BACKGROUND_1',
+    ';\n  spacing: 0px;\n  padding: 2px;\n}\n\nQMainWindow::separator:hover {\n  background-color: ',
+    'COLOR_BACKGROUND_6',
+    ';\n  border: 0px solid ',
+    'COLOR_ACCENT_3',
+    ';\n}\n\nQMainWindow::separator:horizontal {\n  width: 5px;\n  margin-top: 2px;\n  margin-bottom: 2px;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/toolbar_separator_vertical.png");\n}\n\nQMainWindow::separator:vertical {\n  height: 5px;\n  margin-left: 2px;\n  margin-right: 2px;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/toolbar_separator_horizontal.png");\n}\n\n/* QToolTip ---------------------------------------------------------------\n\nhttps://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qtooltip\n\n--------------------------------------------------------------------------- */\nQToolTip {\n  background-color: ',
+    'COLOR_ACCENT_2',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n  /* If you remove the border property, background stops working on Windows */\n  border: none;\n  /* Remove padding, for fix combo box tooltip */\n  padding: 0px;\n  /* Remove opacity, fix #174 - may need to use RGBA */\n}\n\n/* QStatusBar -------------------------------------------------------------\n\nhttps://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qstatusbar\n\n--------------------------------------------------------------------------- */\nQStatusBar {\n  border: ',
+    'BORDER_2',
+    ';\n  /* Fixes Spyder #9120, #9121 */\n  background: ',
+    'COLOR_BACKGROUND_4',
+    ';\n  /* Fixes #205, white vertical borders separating items */\n}\n\nQStatusBar::item {\n  border: none;\n}\n\nQStatusBar QToolTip {\n  background-color: ',
+    'COLOR_ACCENT_3',
+    ';\n  border: ',
+    'BORDER_1',
+    ';\n  color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  /* Remove padding, for fix combo box tooltip */\n  padding: 0px;\n  /* Reducing transparency to read better */\n  opacity: ',
+    'OPACITY_TOOLTIP',
+    ';\n}\n\nQStatusBar QLabel {\n  /* Fixes Spyder #9120, #9121 */\n  background: transparent;\n}\n\n/* QCheckBox --------------------------------------------------------------\n\nhttps://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qcheckbox\n\n--------------------------------------------------------------------------- */\nQCheckBox {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n  spacing: 4px;\n  outline: none;\n  padding-top: 4px;\n  padding-bottom: 4px;\n}\n\nQCheckBox:focus {\n  border: none;\n}\n\nQCheckBox QWidget:disabled {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  color: ',
+    'COLOR_TEXT_4',
+    ';\n}\n\nQCheckBox::indicator {\n  margin-left: 2px;\n  height: 14px;\n  width: 14px;\n}\n\nQCheckBox::indicator:unchecked {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/checkbox_unchecked.png");\n}\n\nQCheckBox::indicator:unchecked:hover, QCheckBox::indicator:unchecked:focus, QCheckBox::indicator:unchecked:pressed {\n  border: none;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/checkbox_unchecked_focus.png");\n}\n\nQCheckBox::indicator:unchecked:disabled {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/checkbox_unchecked_disabled.png");\n}\n\nQCheckBox::indicator:checked {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/checkbox_checked.png");\n}\n\nQCheckBox::indicator:checked:hover, QCheckBox::indicator:checked:focus, QCheckBox::indicator:checked:pressed {\n  border: none;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/checkbox_checked_focus.png");\n}\n\nQCheckBox::indicator:checked:disabled {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/checkbox_checked_disabled.png");\n}\n\nQCheckBox::indicator:indeterminate {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/checkbox_indeterminate.png");\n}\n\nQCheckBox::indicator:indeterminate:disabled {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/checkbox_indeterminate_disabled.png");\n}\n\nQCheckBox::indicator:indeterminate:focus, QCheckBox::indicator:indeterminate:hover, QCheckBox::indicator:indeterminate:pressed {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/checkbox_indeterminate_focus.png");\n}\n\n/* QGroupBox --------------------------------------------------------------\n\nhttps://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qgroupbox\n\n--------------------------------------------------------------------------- */\nQGroupBox {\n  font-weight: bold;\n  border: ',
+    'BORDER_2',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  padding: 2px;\n  margin-top: 6px;\n  margin-bottom: 4px;\n}\n\nQGroupBox::title {\n  subcontrol-origin: margin;\n  subcontrol-position: top left;\n  left: 4px;\n  padding-left: 2px;\n  padding-right: 4px;\n  padding-top: -4px;\n}\n\nQGroupBox::indicator {\n  margin-left: 2px;\n  margin-top: 2px;\n  padding: 0;\n  height: 14px;\n  width: 14px;\n}\n\nQGroupBox::indicator:unchecked {\n  border: none;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/checkbox_unchecked.png");\n}\n\nQGroupBox::indicator:unchecked:hover, QGroupBox::indicator:unchecked:focus, QGroupBox::indicator:unchecked:pressed {\n  border: none;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/checkbox_unchecked_focus.png");\n}\n\nQGroupBox::indicator:unchecked:disabled {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/checkbox_unchecked_disabled.png");\n}\n\nQGroupBox::indicator:checked {\n  border: none;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/checkbox_checked.png");\n}\n\nQGroupBox::indicator:checked:hover, QGroupBox::indicator:checked:focus, QGroupBox::indicator:checked:pressed {\n  border: none;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/checkbox_checked_focus.png");\n}\n\nQGroupBox::indicator:checked:disabled {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/checkbox_checked_disabled.png");\n}\n\n/* QRadioButton -----------------------------------------------------------\n\nhttps://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qradiobutton\n\n--------------------------------------------------------------------------- */\nQRadioButton {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n  spacing: 4px;\n  padding-top: 4px;\n  padding-bottom: 4px;\n  border: none;\n  outline: none;\n}\n\nQRadioButton:focus {\n  border: none;\n}\n\nQRadioButton:disabled {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  color: ',
+    'COLOR_TEXT_4',
+    ';\n  border: none;\n  outline: none;\n}\n\nQRadioButton QWidget {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n  spacing: 0px;\n  padding: 0px;\n  outline: none;\n  border: none;\n}\n\nQRadioButton::indicator {\n  border: none;\n  outline: none;\n  margin-left: 2px;\n  height: 14px;\n  width: 14px;\n}\n\nQRadioButton::indicator:unchecked {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/radio_unchecked.png");\n}\n\nQRadioButton::indicator:unchecked:hover, QRadioButton::indicator:unchecked:focus, QRadioButton::indicator:unchecked:pressed {\n  border: none;\n  outline: none;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/radio_unchecked_focus.png");\n}\n\nQRadioButton::indicator:unchecked:disabled {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/radio_unchecked_disabled.png");\n}\n\nQRadioButton::indicator:checked {\n  border: none;\n  outline: none;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/radio_checked.png");\n}\n\nQRadioButton::indicator:checked:hover, QRadioButton::indicator:checked:focus, QRadioButton::indicator:checked:pressed {\n  border: none;\n  outline: none;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/radio_checked_focus.png");\n}\n\nQRadioButton::indicator:checked:disabled {\n  outline: none;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/radio_checked_disabled.png");\n}\n\n/* QMenuBar ---------------------------------------------------------------\n\nhttps://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qmenubar\n\n--------------------------------------------------------------------------- */\nQMenuBar {\n  background-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n  padding: 2px;\n  border: ',
+    'BORDER_1',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n  selection-background-color: ',
+    'COLOR_ACCENT_3',
+    ';\n}\n\nQMenuBar:focus {\n  border: ',
+    'BORDER_SELECTION_2',
+    ';\n}\n\nQMenuBar::item {\n  background: transparent;\n  padding: 4px;\n}\n\nQMenuBar::item:selected {\n  padding: 4px;\n  background: transparent;\n  border: 0px solid ',
+    'COLOR_BACKGROUND_4',
+    ';\n  background-color: ',
+    'COLOR_ACCENT_3',
+    ';\n}\n\nQMenuBar::item:pressed {\n  padding: 4px;\n  border: 0px solid ',
+    'COLOR_BACKGROUND_4',
+    ';\n  background-color: ',
+    'COLOR_ACCENT_3',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n  margin-bottom: 0px;\n  padding-bottom: 0px;\n}\n\n/* QMenu ------------------------------------------------------------------\n\nhttps://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qmenu\n\n--------------------------------------------------------------------------- */\nQMenu {\n  border: 0px solid ',
+    'COLOR_BACKGROUND_4',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n  margin: 0px;\n  background-color: ',
+    'COLOR_BACKGROUND_3',
+    ';\n  selection-background-color: ',
+    'COLOR_ACCENT_3',
+    ';\n}\n\nQMenu::separator {\n  height: 1px;\n  background-color: ',
+    'COLOR_BACKGROUND_6',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n}\n\nQMenu::item {\n  background-color: ',
+    'COLOR_BACKGROUND_3',
+    ';\n  padding: 4px 24px 4px 28px;\n  /* Reserve space for selection border */\n  border: 1px transparent ',
+    'COLOR_BACKGROUND_4',
+    ';\n}\n\nQMenu::item:selected {\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n  background-color: ',
+    'COLOR_ACCENT_3',
+    ';\n}\n\nQMenu::item:pressed {\n  background-color: ',
+    'COLOR_ACCENT_3',
+    ';\n}\n\nQMenu::icon {\n  padding-left: 10px;\n  width: 14px;\n  height: 14px;\n}\n\nQMenu::indicator {\n  padding-left: 8px;\n  width: 12px;\n  height: 12px;\n  /* non-exclusive indicator = check box style indicator (see QActionGroup::setExclusive) */\n  /* exclusive indicator = radio button style indicator (see QActionGroup::setExclusive) */\n}\n\nQMenu::indicator:non-exclusive:unchecked {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/checkbox_unchecked.png");\n}\n\nQMenu::indicator:non-exclusive:unchecked:hover, QMenu::indicator:non-exclusive:unchecked:focus, QMenu::indicator:non-exclusive:unchecked:pressed {\n  border: none;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/checkbox_unchecked_focus.png");\n}\n\nQMenu::indicator:non-exclusive:unchecked:disabled {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/checkbox_unchecked_disabled.png");\n}\n\nQMenu::indicator:non-exclusive:checked {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/checkbox_checked.png");\n}\n\nQMenu::indicator:non-exclusive:checked:hover, QMenu::indicator:non-exclusive:checked:focus, QMenu::indicator:non-exclusive:checked:pressed {\n  border: none;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/checkbox_checked_focus.png");\n}\n\nQMenu::indicator:non-exclusive:checked:disabled {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/checkbox_checked_disabled.png");\n}\n\nQMenu::indicator:non-exclusive:indeterminate {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/checkbox_indeterminate.png");\n}\n\nQMenu::indicator:non-exclusive:indeterminate:disabled {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/checkbox_indeterminate_disabled.png");\n}\n\nQMenu::indicator:non-exclusive:indeterminate:focus, QMenu::indicator:non-exclusive:indeterminate:hover, QMenu::indicator:non-exclusive:indeterminate:pressed {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/checkbox_indeterminate_focus.png");\n}\n\nQMenu::indicator:exclusive:unchecked {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/radio_unchecked.png");\n}\n\nQMenu::indicator:exclusive:unchecked:hover, QMenu::indicator:exclusive:unchecked:focus, QMenu::indicator:exclusive:unchecked:pressed {\n  border: none;\n  outline: none;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/radio_unchecked_focus.png");\n}\n\nQMenu::indicator:exclusive:unchecked:disabled {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/radio_unchecked_disabled.png");\n}\n\nQMenu::indicator:exclusive:checked {\n  border: none;\n  outline: none;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/radio_checked.png");\n}\n\nQMenu::indicator:exclusive:checked:hover, QMenu::indicator:exclusive:checked:focus, QMenu::indicator:exclusive:checked:pressed {\n  border: none;\n  outline: none;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/radio_checked_focus.png");\n}\n\nQMenu::indicator:exclusive:checked:disabled {\n  outline: none;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/radio_checked_disabled.png");\n}\n\nQMenu::right-arrow {\n  margin: 5px;\n  padding-left: 12px;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/arrow_right.png");\n  height: 12px;\n  width: 12px;\n}\n\n/* QAbstractItemView ------------------------------------------------------\n\nhttps://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qcombobox\n\n--------------------------------------------------------------------------- */\nQAbstractItemView {\n  alternate-background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n  border: ',
+    'BORDER_2',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n}\n\nQAbstractItemView QLineEdit {\n  padding: 2px;\n}\n\n/* QAbstractScrollArea ----------------------------------------------------\n\nhttps://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qabstractscrollarea\n\n--------------------------------------------------------------------------- */\nQAbstractScrollArea {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  border: ',
+    'BORDER_2',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  padding: 2px;\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n}\n\nQAbstractScrollArea:disabled {\n  color: ',
+    'COLOR_TEXT_4',
+    ';\n}\n\n/* QScrollArea ------------------------------------------------------------\n\n--------------------------------------------------------------------------- */\nQScrollArea QWidget QWidget:disabled {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n}\n\n/* QScrollBar -------------------------------------------------------------\n\nhttps://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qscrollbar\n\n--------------------------------------------------------------------------- */\nQScrollBar:horizontal {\n  height: 16px;\n  margin: 2px 16px 2px 16px;\n  border: ',
+    'BORDER_2',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n}\n\nQScrollBar:vertical {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  width: 16px;\n  margin: 16px 2px 16px 2px;\n  border: ',
+    'BORDER_2',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n}\n\nQScrollBar::handle:horizontal {\n  background-color: ',
+    'COLOR_BACKGROUND_6',
+    ';\n  border: ',
+    'BORDER_2',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  min-width: 8px;\n}\n\nQScrollBar::handle:horizontal:hover {\n  background-color: ',
+    'COLOR_ACCENT_2',
+    ';\n  border: ',
+    'COLOR_ACCENT_2',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  min-width: 8px;\n}\n\nQScrollBar::handle:horizontal:focus {\n  border: ',
+    'BORDER_SELECTION_3',
+    ';\n}\n\nQScrollBar::handle:vertical {\n  background-color: ',
+    'COLOR_BACKGROUND_6',
+    ';\n  border: ',
+    'BORDER_2',
+    ';\n  min-height: 8px;\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n}\n\nQScrollBar::handle:vertical:hover {\n  background-color: ',
+    'COLOR_ACCENT_2',
+    ';\n  border: ',
+    'COLOR_ACCENT_2',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  min-height: 8px;\n}\n\nQScrollBar::handle:vertical:focus {\n  border: ',
+    'BORDER_SELECTION_3',
+    ';\n}\n\nQScrollBar::add-line:horizontal {\n  margin: 0px 0px 0px 0px;\n  border-image: url("',
+    'PATH_RESOURCES',
+    '/rc/arrow_right_disabled.png");\n  height: 12px;\n  width: 12px;\n  subcontrol-position: right;\n  subcontrol-origin: margin;\n}\n\nQScrollBar::add-line:horizontal:hover, QScrollBar::add-line:horizontal:on {\n  border-image: url("',
+    'PATH_RESOURCES',
+    '/rc/arrow_right.png");\n  height: 12px;\n  width: 12px;\n  subcontrol-position: right;\n  subcontrol-origin: margin;\n}\n\nQScrollBar::add-line:vertical {\n  margin: 3px 0px 3px 0px;\n  border-image: url("',
+    'PATH_RESOURCES',
+    '/rc/arrow_down_disabled.png");\n  height: 12px;\n  width: 12px;\n  subcontrol-position: bottom;\n  subcontrol-origin: margin;\n}\n\nQScrollBar::add-line:vertical:hover, QScrollBar::add-line:vertical:on {\n  border-image: url("',
+    'PATH_RESOURCES',
+    '/rc/arrow_down.png");\n  height: 12px;\n  width: 12px;\n  subcontrol-position: bottom;\n  subcontrol-origin: margin;\n}\n\nQScrollBar::sub-line:horizontal {\n  margin: 0px 3px 0px 3px;\n  border-image: url("',
+    'PATH_RESOURCES',
+    '/rc/arrow_left_disabled.png");\n  height: 12px;\n  width: 12px;\n  subcontrol-position: left;\n  subcontrol-origin: margin;\n}\n\nQScrollBar::sub-line:horizontal:hover, QScrollBar::sub-line:horizontal:on {\n  border-image: url("',
+    'PATH_RESOURCES',
+    '/rc/arrow_left.png");\n  height: 12px;\n  width: 12px;\n  subcontrol-position: left;\n  subcontrol-origin: margin;\n}\n\nQScrollBar::sub-line:vertical {\n  margin: 3px 0px 3px 0px;\n  border-image: url("',
+    'PATH_RESOURCES',
+    '/rc/arrow_up_disabled.png");\n  height: 12px;\n  width: 12px;\n  subcontrol-position: top;\n  subcontrol-origin: margin;\n}\n\nQScrollBar::sub-line:vertical:hover, QScrollBar::sub-line:vertical:on {\n  border-image: url("',
+    'PATH_RESOURCES',
+    '/rc/arrow_up.png");\n  height: 12px;\n  width: 12px;\n  subcontrol-position: top;\n  subcontrol-origin: margin;\n}\n\nQScrollBar::up-arrow:horizontal, QScrollBar::down-arrow:horizontal {\n  background: none;\n}\n\nQScrollBar::up-arrow:vertical, QScrollBar::down-arrow:vertical {\n  background: none;\n}\n\nQScrollBar::add-page:horizontal, QScrollBar::sub-page:horizontal {\n  background: none;\n}\n\nQScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {\n  background: none;\n}\n\n/* QTextEdit --------------------------------------------------------------\n\nhttps://doc.qt.io/qt-5/stylesheet-examples.html#customizing-specific-widgets\n\n--------------------------------------------------------------------------- */\nQTextEdit {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  border: ',
+    'BORDER_2',
+    ';\n}\n\nQTextEdit:focus {\n  border: ',
+    'BORDER_SELECTION_3',
+    ';\n}\n\nQTextEdit:selected {\n  background: ',
+    'COLOR_ACCENT_2',
+    ';\n  color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n}\n\n/* QPlainTextEdit ---------------------------------------------------------\n\n--------------------------------------------------------------------------- */\nQPlainTextEdit {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  border: ',
+    'BORDER_2',
+    ';\n}\n\nQPlainTextEdit:focus {\n  border: ',
+    'BORDER_SELECTION_3',
+    ';\n}\n\nQPlainTextEdit:selected {\n  background: ',
+    'COLOR_ACCENT_2',
+    ';\n  color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n}\n\n/* QSizeGrip --------------------------------------------------------------\n\nhttps://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qsizegrip\n\n--------------------------------------------------------------------------- */\nQSizeGrip {\n  background: transparent;\n  width: 12px;\n  height: 12px;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/window_grip.png");\n}\n\n/* QStackedWidget ---------------------------------------------------------\n\n--------------------------------------------------------------------------- */\nQStackedWidget {\n  padding: 2px;\n  border: ',
+    'BORDER_2',
+    ';\n  border: ',
+    'BORDER_1',
+    ';\n}\n\n/* QToolBar ---------------------------------------------------------------\n\nhttps://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qtoolbar\n\n--------------------------------------------------------------------------- */\nQToolBar {\n  background-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n  border-bottom: ',
+    'BORDER_1',
+    ';\n  padding: 1px;\n  font-weight: bold;\n  spacing: 2px;\n}\n\nQToolBar:disabled {\n  /* Fixes #272 */\n  background-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n}\n\nQToolBar::handle:horizontal {\n  width: 16px;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/toolbar_move_horizontal.png");\n}\n\nQToolBar::handle:vertical {\n  height: 16px;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/toolbar_move_vertical.png");\n}\n\nQToolBar::separator:horizontal {\n  width: 16px;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/toolbar_separator_horizontal.png");\n}\n\nQToolBar::separator:vertical {\n  height: 16px;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/toolbar_separator_vertical.png");\n}\n\nQToolButton#qt_toolbar_ext_button {\n  background: ',
+    'COLOR_BACKGROUND_4',
+    ';\n  border: 0px;\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/arrow_right.png");\n}\n\n/* QAbstractSpinBox -------------------------------------------------------\n\n--------------------------------------------------------------------------- */\nQAbstractSpinBox {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  border: ',
+    'BORDER_2',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n  /* This fixes 103, 111 */\n  padding-top: 2px;\n  /* This fixes 103, 111 */\n  padding-bottom: 2px;\n  padding-left: 4px;\n  padding-right: 4px;\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  /* min-width: 5px; removed to fix 109 */\n}\n\nQAbstractSpinBox:up-button {\n  background-color: transparent ',
+    'COLOR_BACKGROUND_1',
+    ';\n  subcontrol-origin: border;\n  subcontrol-position: top right;\n  border-left: ',
+    'BORDER_2',
+    ';\n  border-bottom: ',
+    'BORDER_2',
+    ';\n  border-top-left-radius: 0;\n  border-bottom-left-radius: 0;\n  margin: 1px;\n  width: 12px;\n  margin-bottom: -1px;\n}\n\nQAbstractSpinBox::up-arrow, QAbstractSpinBox::up-arrow:disabled, QAbstractSpinBox::up-arrow:off {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/arrow_up_disabled.png");\n  height: 8px;\n  width: 8px;\n}\n\nQAbstractSpinBox::up-arrow:hover {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/arrow_up.png");\n}\n\nQAbstractSpinBox:down-button {\n  background-color: transparent ',
+    'COLOR_BACKGROUND_1',
+    ';\n  subcontrol-origin: border;\n  subcontrol-position: bottom right;\n  border-left: ',
+    'BORDER_2',
+    ';\n  border-top: ',
+    'BORDER_2',
+    ';\n  border-top-left-radius: 0;\n  border-bottom-left-radius: 0;\n  margin: 1px;\n  width: 12px;\n  margin-top: -1px;\n}\n\nQAbstractSpinBox::down-arrow, QAbstractSpinBox::down-arrow:disabled, QAbstractSpinBox::down-arrow:off {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/arrow_down_disabled.png");\n  height: 8px;\n  width: 8px;\n}\n\nQAbstractSpinBox::down-arrow:hover {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/arrow_down.png");\n}\n\nQAbstractSpinBox:hover {\n  border: ',
+    'BORDER_SELECTION_2',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n}\n\nQAbstractSpinBox:focus {\n  border: ',
+    'BORDER_SELECTION_3',
+    ';\n}\n\nQAbstractSpinBox:selected {\n  background: ',
+    'COLOR_ACCENT_2',
+    ';\n  color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n}\n\n/* ------------------------------------------------------------------------ */\n/* DISPLAYS --------------------------------------------------------------- */\n/* ------------------------------------------------------------------------ */\n/* QLabel -----------------------------------------------------------------\n\nhttps://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qframe\n\n--------------------------------------------------------------------------- */\nQLabel {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  border: 0px solid ',
+    'COLOR_BACKGROUND_4',
+    ';\n  padding: 2px;\n  margin: 0px;\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n}\n\nQLabel:disabled {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  border: 0px solid ',
+    'COLOR_BACKGROUND_4',
+    ';\n  color: ',
+    'COLOR_TEXT_4',
+    ';\n}\n\n/* QTextBrowser -----------------------------------------------------------\n\nhttps://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qabstractscrollarea\n\n--------------------------------------------------------------------------- */\nQTextBrowser {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  border: ',
+    'BORDER_2',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n}\n\nQTextBrowser:disabled {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  border: ',
+    'BORDER_2',
+    ';\n  color: ',
+    'COLOR_TEXT_4',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n}\n\nQTextBrowser:hover, QTextBrowser:!hover, QTextBrowser:selected, QTextBrowser:pressed {\n  border: ',
+    'BORDER_2',
+    ';\n}\n\n/* QGraphicsView ----------------------------------------------------------\n\n--------------------------------------------------------------------------- */\nQGraphicsView {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  border: ',
+    'BORDER_2',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n}\n\nQGraphicsView:disabled {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  border: ',
+    'BORDER_2',
+    ';\n  color: ',
+    'COLOR_TEXT_4',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n}\n\nQGraphicsView:hover, QGraphicsView:!hover, QGraphicsView:selected, QGraphicsView:pressed {\n  border: ',
+    'BORDER_2',
+    ';\n}\n\n/* QCalendarWidget --------------------------------------------------------\n\n--------------------------------------------------------------------------- */\nQCalendarWidget {\n  border: ',
+    'BORDER_2',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n}\n\nQCalendarWidget:disabled {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  color: ',
+    'COLOR_TEXT_4',
+    ';\n}\n\n/* QLCDNumber -------------------------------------------------------------\n\n--------------------------------------------------------------------------- */\nQLCDNumber {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n}\n\nQLCDNumber:disabled {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  color: ',
+    'COLOR_TEXT_4',
+    ';\n}\n\n/* QProgressBar -----------------------------------------------------------\n\nhttps://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qprogressbar\n\n--------------------------------------------------------------------------- */\nQProgressBar {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  border: ',
+    'BORDER_2',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  text-align: center;\n}\n\nQProgressBar:disabled {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  border: ',
+    'BORDER_2',
+    ';\n  color: ',
+    'COLOR_TEXT_4',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  text-align: center;\n}\n\nQProgressBar::chunk {\n  background-color: ',
+    'COLOR_ACCENT_2',
+    ';\n  color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n}\n\nQProgressBar::chunk:disabled {\n  background-color: ',
+    'COLOR_ACCENT_1',
+    ';\n  color: ',
+    'COLOR_TEXT_4',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n}\n\n/* ------------------------------------------------------------------------ */\n/* BUTTONS ---------------------------------------------------------------- */\n/* ------------------------------------------------------------------------ */\n/* QPushButton ------------------------------------------------------------\n\nhttps://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qpushbutton\n\n--------------------------------------------------------------------------- */\nQPushButton {\n  background-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  padding: 2px;\n  outline: none;\n  border: none;\n}\n\nQPushButton:disabled {\n  background-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n  color: ',
+    'COLOR_TEXT_4',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  padding: 2px;\n}\n\nQPushButton:checked {\n  background-color: ',
+    'COLOR_BACKGROUND_6',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  padding: 2px;\n  outline: none;\n}\n\nQPushButton:checked:disabled {\n  background-color: ',
+    'COLOR_BACKGROUND_6',
+    ';\n  color: ',
+    'COLOR_TEXT_4',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  padding: 2px;\n  outline: none;\n}\n\nQPushButton:checked:selected {\n  background: ',
+    'COLOR_BACKGROUND_6',
+    ';\n}\n\nQPushButton:hover {\n  background-color: ',
+    'COLOR_BACKGROUND_5',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n}\n\nQPushButton:pressed {\n  background-color: ',
+    'COLOR_BACKGROUND_6',
+    ';\n}\n\nQPushButton:selected {\n  background: ',
+    'COLOR_BACKGROUND_6',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n}\n\nQPushButton::menu-indicator {\n  subcontrol-origin: padding;\n  subcontrol-position: bottom right;\n  bottom: 4px;\n}\n\nQDialogButtonBox QPushButton {\n  /* Issue #194 #248 - Special case of QPushButton inside dialogs, for better UI */\n  min-width: 80px;\n}\n\n/* QToolButton ------------------------------------------------------------\n\nhttps://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qtoolbutton\n\n--------------------------------------------------------------------------- */\nQToolButton {\n  background-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  padding: 2px;\n  outline: none;\n  border: none;\n  /* The subcontrols below are used only in the DelayedPopup mode */\n  /* The subcontrols below are used only in the MenuButtonPopup mode */\n  /* The subcontrol below is used only in the InstantPopup or DelayedPopup mode */\n}\n\nQToolButton:disabled {\n  background-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n  color: ',
+    'COLOR_TEXT_4',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  padding: 2px;\n}\n\nQToolButton:checked {\n  background-color: ',
+    'COLOR_BACKGROUND_6',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  padding: 2px;\n  outline: none;\n}\n\nQToolButton:checked:disabled {\n  background-color: ',
+    'COLOR_BACKGROUND_6',
+    ';\n  color: ',
+    'COLOR_TEXT_4',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  padding: 2px;\n  outline: none;\n}\n\nQToolButton:checked:hover {\n  background-color: ',
+    'COLOR_BACKGROUND_5',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n}\n\nQToolButton:checked:pressed {\n  background-color: ',
+    'COLOR_BACKGROUND_6',
+    ';\n}\n\nQToolButton:checked:selected {\n  background: ',
+    'COLOR_BACKGROUND_6',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n}\n\nQToolButton:hover {\n  background-color: ',
+    'COLOR_BACKGROUND_5',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n}\n\nQToolButton:pressed {\n  background-color: ',
+    'COLOR_BACKGROUND_6',
+    ';\n}\n\nQToolButton:selected {\n  background: ',
+    'COLOR_BACKGROUND_6',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n}\n\nQToolButton[popupMode="0"] {\n  /* Only for DelayedPopup */\n  padding-right: 2px;\n}\n\nQToolButton[popupMode="1"] {\n  /* Only for MenuButtonPopup */\n  padding-right: 20px;\n}\n\nQToolButton[popupMode="1"]::menu-button {\n  border: none;\n}\n\nQToolButton[popupMode="1"]::menu-button:hover {\n  border: none;\n  border-left: 1px solid ',
+    'COLOR_BACKGROUND_4',
+    ';\n  border-radius: 0;\n}\n\nQToolButton[popupMode="2"] {\n  /* Only for InstantPopup */\n  padding-right: 2px;\n}\n\nQToolButton::menu-button {\n  padding: 2px;\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  width: 12px;\n  border: none;\n  outline: none;\n}\n\nQToolButton::menu-button:hover {\n  border: ',
+    'BORDER_SELECTION_2',
+    ';\n}\n\nQToolButton::menu-button:checked:hover {\n  border: ',
+    'BORDER_SELECTION_2',
+    ';\n}\n\nQToolButton::menu-indicator {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/arrow_down.png");\n  height: 8px;\n  width: 8px;\n  top: 0;\n  /* Exclude a shift for better image */\n  left: -2px;\n  /* Shift it a bit */\n}\n\nQToolButton::menu-arrow {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/arrow_down.png");\n  height: 8px;\n  width: 8px;\n}\n\nQToolButton::menu-arrow:hover {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/arrow_down_focus.png");\n}\n\n/* QCommandLinkButton -----------------------------------------------------\n\n--------------------------------------------------------------------------- */\nQCommandLinkButton {\n  background-color: transparent;\n  border: ',
+    'BORDER_2',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  padding: 0px;\n  margin: 0px;\n}\n\nQCommandLinkButton:disabled {\n  background-color: transparent;\n  color: ',
+    'COLOR_TEXT_4',
+    ';\n}\n\n/* ------------------------------------------------------------------------ */\n/* INPUTS - NO FIELDS ----------------------------------------------------- */\n/* ------------------------------------------------------------------------ */\n/* QComboBox --------------------------------------------------------------\n\nhttps://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qcombobox\n\n--------------------------------------------------------------------------- */\nQComboBox {\n  border: ',
+    'BORDER_2',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  selection-background-color: ',
+    'COLOR_ACCENT_2',
+    ';\n  padding-left: 4px;\n  padding-right: 4px;\n  /* padding-right = 36; 4 + 16*2 See scrollbar size */\n  /* changed to 4px to fix #239 */\n  /* Fixes #103, #111 */\n  min-height: 1.5em;\n  /* padding-top: 2px;     removed to fix #132 */\n  /* padding-bottom: 2px;  removed to fix #132 */\n  /* min-width: 75px;      removed to fix #109 */\n  /* Needed to remove indicator - fix #132 */\n}\n\nQComboBox QAbstractItemView {\n  border: ',
+    'BORDER_2',
+    ';\n  border-radius: 0;\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  selection-background-color: ',
+    'COLOR_ACCENT_2',
+    ';\n}\n\nQComboBox QAbstractItemView:hover {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n}\n\nQComboBox QAbstractItemView:selected {\n  background: ',
+    'COLOR_ACCENT_2',
+    ';\n  color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n}\n\nQComboBox QAbstractItemView:alternate {\n  background: ',
+    'COLOR_BACKGROUND_1',
+    ';\n}\n\nQComboBox:disabled {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  color: ',
+    'COLOR_TEXT_4',
+    ';\n}\n\nQComboBox:hover {\n  border: ',
+    'BORDER_SELECTION_2',
+    ';\n}\n\nQComboBox:focus {\n  border: ',
+    'BORDER_SELECTION_3',
+    ';\n}\n\nQComboBox:on {\n  selection-background-color: ',
+    'COLOR_ACCENT_2',
+    ';\n}\n\nQComboBox::indicator {\n  border: none;\n  border-radius: 0;\n  background-color: transparent;\n  selection-background-color: transparent;\n  color: transparent;\n  selection-color: transparent;\n  /* Needed to remove indicator - fix #132 */\n}\n\nQComboBox::indicator:alternate {\n  background: ',
+    'COLOR_BACKGROUND_1',
+    ';\n}\n\nQComboBox::item:alternate {\n  background: ',
+    'COLOR_BACKGROUND_1',
+    ';\n}\n\nQComboBox::item:checked {\n  font-weight: bold;\n}\n\nQComboBox::item:selected {\n  border: 0px solid transparent;\n}\n\nQComboBox::drop-down {\n  subcontrol-origin: padding;\n  subcontrol-position: top right;\n  width: 12px;\n  border-left: 1px solid ',
+    'COLOR_BACKGROUND_4',
+    ';\n}\n\nQComboBox::down-arrow {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/arrow_down_disabled.png");\n  height: 8px;\n  width: 8px;\n}\n\nQComboBox::down-arrow:on, QComboBox::down-arrow:hover, QComboBox::down-arrow:focus {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/arrow_down.png");\n}\n\n/* QSlider ----------------------------------------------------------------\n\nhttps://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qslider\n\n--------------------------------------------------------------------------- */\nQSlider:disabled {\n  background: ',
+    'COLOR_BACKGROUND_1',
+    ';\n}\n\nQSlider:focus {\n  border: none;\n}\n\nQSlider::groove:horizontal {\n  background: ',
+    'COLOR_BACKGROUND_4',
+    ';\n  border: ',
+    'BORDER_2',
+    ';\n  height: 4px;\n  margin: 0px;\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n}\n\nQSlider::groove:vertical {\n  background: ',
+    'COLOR_BACKGROUND_4',
+    ';\n  border: ',
+    'BORDER_2',
+    ';\n  width: 4px;\n  margin: 0px;\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n}\n\nQSlider::add-page:vertical {\n  background: ',
+    'COLOR_ACCENT_2',
+    ';\n  border: ',
+    'BORDER_2',
+    ';\n  width: 4px;\n  margin: 0px;\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n}\n\nQSlider::add-page:vertical :disabled {\n  background: ',
+    'COLOR_ACCENT_1',
+    ';\n}\n\nQSlider::sub-page:horizontal {\n  background: ',
+    'COLOR_ACCENT_2',
+    ';\n  border: ',
+    'BORDER_2',
+    ';\n  height: 4px;\n  margin: 0px;\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n}\n\nQSlider::sub-page:horizontal:disabled {\n  background: ',
+    'COLOR_ACCENT_1',
+    ';\n}\n\nQSlider::handle:horizontal {\n  background: ',
+    'COLOR_TEXT_4',
+    ';\n  border: ',
+    'BORDER_2',
+    ';\n  width: 8px;\n  height: 8px;\n  margin: -8px 0px;\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n}\n\nQSlider::handle:horizontal:hover {\n  background: ',
+    'COLOR_ACCENT_2',
+    ';\n  border: ',
+    'BORDER_SELECTION_2',
+    ';\n}\n\nQSlider::handle:horizontal:focus {\n  border: ',
+    'BORDER_SELECTION_3',
+    ';\n}\n\nQSlider::handle:vertical {\n  background: ',
+    'COLOR_TEXT_4',
+    ';\n  border: ',
+    'BORDER_2',
+    ';\n  width: 8px;\n  height: 8px;\n  margin: 0 -8px;\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n}\n\nQSlider::handle:vertical:hover {\n  background: ',
+    'COLOR_ACCENT_2',
+    ';\n  border: ',
+    'BORDER_SELECTION_2',
+    ';\n}\n\nQSlider::handle:vertical:focus {\n  border: ',
+    'BORDER_SELECTION_3',
+    ';\n}\n\n/* QLineEdit --------------------------------------------------------------\n\nhttps://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qlineedit\n\n--------------------------------------------------------------------------- */\nQLineEdit {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  padding-top: 2px;\n  /* This QLineEdit fix  103, 111 */\n  padding-bottom: 2px;\n  /* This QLineEdit fix  103, 111 */\n  padding-left: 4px;\n  padding-right: 4px;\n  border-style: solid;\n  border: ',
+    'BORDER_2',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n}\n\nQLineEdit:disabled {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  color: ',
+    'COLOR_TEXT_4',
+    ';\n}\n\nQLineEdit:hover {\n  border: ',
+    'BORDER_SELECTION_2',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n}\n\nQLineEdit:focus {\n  border: ',
+    'BORDER_SELECTION_3',
+    ';\n}\n\nQLineEdit:selected {\n  background-color: ',
+    'COLOR_ACCENT_2',
+    ';\n  color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n}\n\n/* QTabWiget --------------------------------------------------------------\n\nhttps://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qtabwidget-and-qtabbar\n\n--------------------------------------------------------------------------- */\nQTabWidget {\n  padding: 2px;\n  selection-background-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n}\n\nQTabWidget QWidget {\n  /* Fixes #189 */\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n}\n\nQTabWidget::pane {\n  border: ',
+    'BORDER_2',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  margin: 0px;\n  /* Fixes double border inside pane with pyqt5 */\n  padding: 0px;\n}\n\nQTabWidget::pane:selected {\n  background-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n  border: 1px solid ',
+    'COLOR_ACCENT_2',
+    ';\n}\n\n/* QTabBar ----------------------------------------------------------------\n\nhttps://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qtabwidget-and-qtabbar\n\n--------------------------------------------------------------------------- */\nQTabBar, QDockWidget QTabBar {\n  qproperty-drawBase: 0;\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  margin: 0px;\n  padding: 2px;\n  border: 0;\n  /* left: 5px; move to the right by 5px - removed for fix */\n}\n\nQTabBar::close-button, QDockWidget QTabBar::close-button {\n  border: 0;\n  margin: 0;\n  padding: 4px;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/window_close.png");\n}\n\nQTabBar::close-button:hover, QDockWidget QTabBar::close-button:hover {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/window_close_focus.png");\n}\n\nQTabBar::close-button:pressed, QDockWidget QTabBar::close-button:pressed {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/window_close_pressed.png");\n}\n\nQTabBar::tab, QDockWidget QTabBar::tab {\n  /* !selected and disabled ----------------------------------------- */\n  /* selected ------------------------------------------------------- */\n}\n\nQTabBar::tab:top:selected:disabled, QDockWidget QTabBar::tab:top:selected:disabled {\n  border-bottom: 3px solid ',
+    'COLOR_ACCENT_1',
+    ';\n  color: ',
+    'COLOR_TEXT_4',
+    ';\n  background-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n}\n\nQTabBar::tab:bottom:selected:disabled, QDockWidget QTabBar::tab:bottom:selected:disabled {\n  border-top: 3px solid ',
+    'COLOR_ACCENT_1',
+    ';\n  color: ',
+    'COLOR_TEXT_4',
+    ';\n  background-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n}\n\nQTabBar::tab:left:selected:disabled, QDockWidget QTabBar::tab:left:selected:disabled {\n  border-right: 3px solid ',
+    'COLOR_ACCENT_1',
+    ';\n  color: ',
+    'COLOR_TEXT_4',
+    ';\n  background-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n}\n\nQTabBar::tab:right:selected:disabled, QDockWidget QTabBar::tab:right:selected:disabled {\n  border-left: 3px solid ',
+    'COLOR_ACCENT_1',
+    ';\n  color: ',
+    'COLOR_TEXT_4',
+    ';\n  background-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n}\n\nQTabBar::tab:top:!selected:disabled, QDockWidget QTabBar::tab:top:!selected:disabled {\n  border-bottom: 3px solid ',
+    'COLOR_BACKGROUND_1',
+    ';\n  color: ',
+    'COLOR_TEXT_4',
+    ';\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n}\n\nQTabBar::tab:bottom:!selected:disabled, QDockWidget QTabBar::tab:bottom:!selected:disabled {\n  border-top: 3px solid ',
+    'COLOR_BACKGROUND_1',
+    ';\n  color: ',
+    'COLOR_TEXT_4',
+    ';\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n}\n\nQTabBar::tab:left:!selected:disabled, QDockWidget QTabBar::tab:left:!selected:disabled {\n  border-right: 3px solid ',
+    'COLOR_BACKGROUND_1',
+    ';\n  color: ',
+    'COLOR_TEXT_4',
+    ';\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n}\n\nQTabBar::tab:right:!selected:disabled, QDockWidget QTabBar::tab:right:!selected:disabled {\n  border-left: 3px solid ',
+    'COLOR_BACKGROUND_1',
+    ';\n  color: ',
+    'COLOR_TEXT_4',
+    ';\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n}\n\nQTabBar::tab:top:!selected, QDockWidget QTabBar::tab:top:!selected {\n  border-bottom: 2px solid ',
+    'COLOR_BACKGROUND_1',
+    ';\n  margin-top: 2px;\n}\n\nQTabBar::tab:bottom:!selected, QDockWidget QTabBar::tab:bottom:!selected {\n  border-top: 2px solid ',
+    'COLOR_BACKGROUND_1',
+    ';\n  margin-bottom: 2px;\n}\n\nQTabBar::tab:left:!selected, QDockWidget QTabBar::tab:left:!selected {\n  border-left: 2px solid ',
+    'COLOR_BACKGROUND_1',
+    ';\n  margin-right: 2px;\n}\n\nQTabBar::tab:right:!selected, QDockWidget QTabBar::tab:right:!selected {\n  border-right: 2px solid ',
+    'COLOR_BACKGROUND_1',
+    ';\n  margin-left: 2px;\n}\n\nQTabBar::tab:top, QDockWidget QTabBar::tab:top {\n  background-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n  margin-left: 2px;\n  padding-left: 4px;\n  padding-right: 4px;\n  padding-top: 2px;\n  padding-bottom: 2px;\n  min-width: 5px;\n  border-bottom: 3px solid ',
+    'COLOR_BACKGROUND_4',
+    ';\n  border-top-left-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  border-top-right-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n}\n\nQTabBar::tab:top:selected, QDockWidget QTabBar::tab:top:selected {\n  background-color: ',
+    'COLOR_BACKGROUND_5',
+    ';\n  border-bottom: 3px solid ',
+    'COLOR_ACCENT_4',
+    ';\n  border-top-left-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  border-top-right-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n}\n\nQTabBar::tab:top:!selected:hover, QDockWidget QTabBar::tab:top:!selected:hover {\n  border: ',
+    'BORDER_SELECTION_3',
+    ';\n  border-bottom: 3px solid ',
+    'COLOR_ACCENT_3',
+    ';\n  /* Fixes spyder-ide/spyder#9766 and #243 */\n  padding-left: 3px;\n  padding-right: 3px;\n}\n\nQTabBar::tab:bottom, QDockWidget QTabBar::tab:bottom {\n  border-top: 3px solid ',
+    'COLOR_BACKGROUND_4',
+    ';\n  background-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n  margin-left: 2px;\n  padding-left: 4px;\n  padding-right: 4px;\n  padding-top: 2px;\n  padding-bottom: 2px;\n  border-bottom-left-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  border-bottom-right-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  min-width: 5px;\n}\n\nQTabBar::tab:bottom:selected, QDockWidget QTabBar::tab:bottom:selected {\n  background-color: ',
+    'COLOR_BACKGROUND_5',
+    ';\n  border-top: 3px solid ',
+    'COLOR_ACCENT_4',
+    ';\n  border-bottom-left-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  border-bottom-right-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n}\n\nQTabBar::tab:bottom:!selected:hover, QDockWidget QTabBar::tab:bottom:!selected:hover {\n  border: ',
+    'BORDER_SELECTION_3',
+    ';\n  border-top: 3px solid ',
+    'COLOR_ACCENT_3',
+    ';\n  /* Fixes spyder-ide/spyder#9766 and #243 */\n  padding-left: 3px;\n  padding-right: 3px;\n}\n\nQTabBar::tab:left, QDockWidget QTabBar::tab:left {\n  background-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n  margin-top: 2px;\n  padding-left: 2px;\n  padding-right: 2px;\n  padding-top: 4px;\n  padding-bottom: 4px;\n  border-top-left-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  border-bottom-left-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  min-height: 5px;\n}\n\nQTabBar::tab:left:selected, QDockWidget QTabBar::tab:left:selected {\n  background-color: ',
+    'COLOR_BACKGROUND_5',
+    ';\n  border-right: 3px solid ',
+    'COLOR_ACCENT_4',
+    ';\n}\n\nQTabBar::tab:left:!selected:hover, QDockWidget QTabBar::tab:left:!selected:hover {\n  border: ',
+    'BORDER_SELECTION_3',
+    ';\n  border-right: 3px solid ',
+    'COLOR_ACCENT_3',
+    ';\n  /* Fixes different behavior #271 */\n  margin-right: 0px;\n  padding-right: -1px;\n}\n\nQTabBar::tab:right, QDockWidget QTabBar::tab:right {\n  background-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n  margin-top: 2px;\n  padding-left: 2px;\n  padding-right: 2px;\n  padding-top: 4px;\n  padding-bottom: 4px;\n  border-top-right-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  border-bottom-right-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  min-height: 5px;\n}\n\nQTabBar::tab:right:selected, QDockWidget QTabBar::tab:right:selected {\n  background-color: ',
+    'COLOR_BACKGROUND_5',
+    ';\n  border-left: 3px solid ',
+    'COLOR_ACCENT_4',
+    ';\n}\n\nQTabBar::tab:right:!selected:hover, QDockWidget QTabBar::tab:right:!selected:hover {\n  border: ',
+    'BORDER_SELECTION_3',
+    ';\n  border-left: 3px solid ',
+    'COLOR_ACCENT_3',
+    ';\n  /* Fixes different behavior #271 */\n  margin-left: 0px;\n  padding-left: 0px;\n}\n\nQTabBar QToolButton, QDockWidget QTabBar QToolButton {\n  /* Fixes #136 */\n  background-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n  height: 12px;\n  width: 12px;\n}\n\nQTabBar QToolButton:pressed, QDockWidget QTabBar QToolButton:pressed {\n  background-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n}\n\nQTabBar QToolButton:pressed:hover, QDockWidget QTabBar QToolButton:pressed:hover {\n  border: ',
+    'BORDER_SELECTION_2',
+    ';\n}\n\nQTabBar QToolButton::left-arrow:enabled, QDockWidget QTabBar QToolButton::left-arrow:enabled {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/arrow_left.png");\n}\n\nQTabBar QToolButton::left-arrow:disabled, QDockWidget QTabBar QToolButton::left-arrow:disabled {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/arrow_left_disabled.png");\n}\n\nQTabBar QToolButton::right-arrow:enabled, QDockWidget QTabBar QToolButton::right-arrow:enabled {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/arrow_right.png");\n}\n\nQTabBar QToolButton::right-arrow:disabled, QDockWidget QTabBar QToolButton::right-arrow:disabled {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/arrow_right_disabled.png");\n}\n\n/* QDockWiget -------------------------------------------------------------\n\n--------------------------------------------------------------------------- */\nQDockWidget {\n  outline: ',
+    'BORDER_2',
+    ';\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  border: ',
+    'BORDER_2',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  titlebar-close-icon: url("',
+    'PATH_RESOURCES',
+    '/rc/transparent.png");\n  titlebar-normal-icon: url("',
+    'PATH_RESOURCES',
+    '/rc/transparent.png");\n}\n\nQDockWidget::title {\n  /* Better size for title bar */\n  padding: 3px;\n  spacing: 4px;\n  border: none;\n  background-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n}\n\nQDockWidget::close-button {\n  icon-size: 12px;\n  border: none;\n  background: transparent;\n  background-image: transparent;\n  border: 0;\n  margin: 0;\n  padding: 0;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/window_close.png");\n}\n\nQDockWidget::close-button:hover {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/window_close_focus.png");\n}\n\nQDockWidget::close-button:pressed {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/window_close_pressed.png");\n}\n\nQDockWidget::float-button {\n  icon-size: 12px;\n  border: none;\n  background: transparent;\n  background-image: transparent;\n  border: 0;\n  margin: 0;\n  padding: 0;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/window_undock.png");\n}\n\nQDockWidget::float-button:hover {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/window_undock_focus.png");\n}\n\nQDockWidget::float-button:pressed {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/window_undock_pressed.png");\n}\n\n/* QTreeView QListView QTableView -----------------------------------------\n\nhttps://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qtreeview\nhttps://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qlistview\nhttps://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qtableview\n\n--------------------------------------------------------------------------- */\nQTreeView:branch:selected, QTreeView:branch:hover {\n  background: url("',
+    'PATH_RESOURCES',
+    '/rc/transparent.png");\n}\n\nQTreeView:branch:has-siblings:!adjoins-item {\n  border-image: url("',
+    'PATH_RESOURCES',
+    '/rc/branch_line.png") 0;\n}\n\nQTreeView:branch:has-siblings:adjoins-item {\n  border-image: url("',
+    'PATH_RESOURCES',
+    '/rc/branch_more.png") 0;\n}\n\nQTreeView:branch:!has-children:!has-siblings:adjoins-item {\n  border-image: url("',
+    'PATH_RESOURCES',
+    '/rc/branch_end.png") 0;\n}\n\nQTreeView:branch:has-children:!has-siblings:closed, QTreeView:branch:closed:has-children:has-siblings {\n  border-image: none;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/branch_closed.png");\n}\n\nQTreeView:branch:open:has-children:!has-siblings, QTreeView:branch:open:has-children:has-siblings {\n  border-image: none;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/branch_open.png");\n}\n\nQTreeView:branch:has-children:!has-siblings:closed:hover, QTreeView:branch:closed:has-children:has-siblings:hover {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/branch_closed_focus.png");\n}\n\nQTreeView:branch:open:has-children:!has-siblings:hover, QTreeView:branch:open:has-children:has-siblings:hover {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/branch_open_focus.png");\n}\n\nQTreeView::indicator:checked,\nQListView::indicator:checked,\nQTableView::indicator:checked,\nQColumnView::indicator:checked {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/checkbox_checked.png");\n}\n\nQTreeView::indicator:checked:hover, QTreeView::indicator:checked:focus, QTreeView::indicator:checked:pressed,\nQListView::indicator:checked:hover,\nQListView::indicator:checked:focus,\nQListView::indicator:checked:pressed,\nQTableView::indicator:checked:hover,\nQTableView::indicator:checked:focus,\nQTableView::indicator:checked:pressed,\nQColumnView::indicator:checked:hover,\nQColumnView::indicator:checked:focus,\nQColumnView::indicator:checked:pressed {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/checkbox_checked_focus.png");\n}\n\nQTreeView::indicator:unchecked,\nQListView::indicator:unchecked,\nQTableView::indicator:unchecked,\nQColumnView::indicator:unchecked {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/checkbox_unchecked.png");\n}\n\nQTreeView::indicator:unchecked:hover, QTreeView::indicator:unchecked:focus, QTreeView::indicator:unchecked:pressed,\nQListView::indicator:unchecked:hover,\nQListView::indicator:unchecked:focus,\nQListView::indicator:unchecked:pressed,\nQTableView::indicator:unchecked:hover,\nQTableView::indicator:unchecked:focus,\nQTableView::indicator:unchecked:pressed,\nQColumnView::indicator:unchecked:hover,\nQColumnView::indicator:unchecked:focus,\nQColumnView::indicator:unchecked:pressed {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/checkbox_unchecked_focus.png");\n}\n\nQTreeView::indicator:indeterminate,\nQListView::indicator:indeterminate,\nQTableView::indicator:indeterminate,\nQColumnView::indicator:indeterminate {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/checkbox_indeterminate.png");\n}\n\nQTreeView::indicator:indeterminate:hover, QTreeView::indicator:indeterminate:focus, QTreeView::indicator:indeterminate:pressed,\nQListView::indicator:indeterminate:hover,\nQListView::indicator:indeterminate:focus,\nQListView::indicator:indeterminate:pressed,\nQTableView::indicator:indeterminate:hover,\nQTableView::indicator:indeterminate:focus,\nQTableView::indicator:indeterminate:pressed,\nQColumnView::indicator:indeterminate:hover,\nQColumnView::indicator:indeterminate:focus,\nQColumnView::indicator:indeterminate:pressed {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/checkbox_indeterminate_focus.png");\n}\n\nQTreeView,\nQListView,\nQTableView,\nQColumnView {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  border: ',
+    'BORDER_2',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n  gridline-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n}\n\nQTreeView:disabled,\nQListView:disabled,\nQTableView:disabled,\nQColumnView:disabled {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  color: ',
+    'COLOR_TEXT_4',
+    ';\n}\n\nQTreeView:selected,\nQListView:selected,\nQTableView:selected,\nQColumnView:selected {\n  background-color: ',
+    'COLOR_ACCENT_2',
+    ';\n  color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n}\n\nQTreeView:focus,\nQListView:focus,\nQTableView:focus,\nQColumnView:focus {\n  border: ',
+    'BORDER_SELECTION_3',
+    ';\n}\n\nQTreeView::item:pressed,\nQListView::item:pressed,\nQTableView::item:pressed,\nQColumnView::item:pressed {\n  background-color: ',
+    'COLOR_ACCENT_2',
+    ';\n}\n\nQTreeView::item:selected:active,\nQListView::item:selected:active,\nQTableView::item:selected:active,\nQColumnView::item:selected:active {\n  background-color: ',
+    'COLOR_ACCENT_2',
+    ';\n}\n\nQTreeView::item:selected:!active,\nQListView::item:selected:!active,\nQTableView::item:selected:!active,\nQColumnView::item:selected:!active {\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n  background-color: ',
+    'COLOR_BACKGROUND_3',
+    ';\n}\n\nQTreeView::item:!selected:hover,\nQListView::item:!selected:hover,\nQTableView::item:!selected:hover,\nQColumnView::item:!selected:hover {\n  outline: 0;\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n  background-color: ',
+    'COLOR_BACKGROUND_3',
+    ';\n}\n\nQTableCornerButton::section {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  border: 1px transparent ',
+    'COLOR_BACKGROUND_4',
+    ';\n  border-radius: 0px;\n}\n\n/* QHeaderView ------------------------------------------------------------\n\nhttps://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qheaderview\n\n--------------------------------------------------------------------------- */\nQHeaderView {\n  background-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n  border: 0px transparent ',
+    'COLOR_BACKGROUND_4',
+    ';\n  padding: 0;\n  margin: 0;\n  border-radius: 0;\n}\n\nQHeaderView:disabled {\n  background-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n  border: 1px transparent ',
+    'COLOR_BACKGROUND_4',
+    ';\n}\n\nQHeaderView::section {\n  background-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n  border-radius: 0;\n  text-align: left;\n  font-size: 13px;\n}\n\nQHeaderView::section::horizontal {\n  padding-top: 0;\n  padding-bottom: 0;\n  padding-left: 4px;\n  padding-right: 4px;\n  border-left: ',
+    'BORDER_1',
+    ';\n}\n\nQHeaderView::section::horizontal::first, QHeaderView::section::horizontal::only-one {\n  border-left: ',
+    'BORDER_2',
+    ';\n}\n\nQHeaderView::section::horizontal:disabled {\n  color: ',
+    'COLOR_TEXT_4',
+    ';\n}\n\nQHeaderView::section::vertical {\n  padding-top: 0;\n  padding-bottom: 0;\n  padding-left: 4px;\n  padding-right: 4px;\n  border-top: ',
+    'BORDER_1',
+    ';\n}\n\nQHeaderView::section::vertical::first, QHeaderView::section::vertical::only-one {\n  border-top: ',
+    'BORDER_2',
+    ';\n}\n\nQHeaderView::section::vertical:disabled {\n  color: ',
+    'COLOR_TEXT_4',
+    ';\n}\n\nQHeaderView::down-arrow {\n  /* Those settings (border/width/height/background-color) solve bug */\n  /* transparent arrow background and size */\n  background-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n  border: none;\n  height: 12px;\n  width: 12px;\n  padding-left: 2px;\n  padding-right: 2px;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/arrow_down.png");\n}\n\nQHeaderView::up-arrow {\n  background-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n  border: none;\n  height: 12px;\n  width: 12px;\n  padding-left: 2px;\n  padding-right: 2px;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/arrow_up.png");\n}\n\n/* QToolBox --------------------------------------------------------------\n\nhttps://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qtoolbox\n\n--------------------------------------------------------------------------- */\nQToolBox {\n  padding: 0px;\n  border: 0px;\n  border: ',
+    'BORDER_2',
+    ';\n}\n\nQToolBox:selected {\n  padding: 0px;\n  border: 2px solid ',
+    'COLOR_ACCENT_2',
+    ';\n}\n\nQToolBox::tab {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  border: ',
+    'BORDER_2',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n  border-top-left-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  border-top-right-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n}\n\nQToolBox::tab:disabled {\n  color: ',
+    'COLOR_TEXT_4',
+    ';\n}\n\nQToolBox::tab:selected {\n  background-color: ',
+    'COLOR_BACKGROUND_6',
+    ';\n  border-bottom: 2px solid ',
+    'COLOR_ACCENT_2',
+    ';\n}\n\nQToolBox::tab:selected:disabled {\n  background-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n  border-bottom: 2px solid ',
+    'COLOR_ACCENT_1',
+    ';\n}\n\nQToolBox::tab:!selected {\n  background-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n  border-bottom: 2px solid ',
+    'COLOR_BACKGROUND_4',
+    ';\n}\n\nQToolBox::tab:!selected:disabled {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n}\n\nQToolBox::tab:hover {\n  border-color: ',
+    'COLOR_ACCENT_3',
+    ';\n  border-bottom: 2px solid ',
+    'COLOR_ACCENT_3',
+    ';\n}\n\nQToolBox QScrollArea QWidget QWidget {\n  padding: 0px;\n  border: 0px;\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n}\n\n/* QFrame -----------------------------------------------------------------\n\nhttps://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qframe\nhttps://doc.qt.io/qt-5/qframe.html#-prop\nhttps://doc.qt.io/qt-5/qframe.html#details\nhttps://stackoverflow.com/questions/14581498/qt-stylesheet-for-hline-vline-color\n\n--------------------------------------------------------------------------- */\n/* (dot) .QFrame  fix #141, #126, #123 */\n.QFrame {\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  border-color: ',
+    'COLOR_ACCENT_3',
+    ';\n  border: ',
+    'BORDER_2',
+    ';\n  /* No frame */\n  /* HLine */\n  /* HLine */\n}\n\n.QFrame[frameShape="0"] {\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  border: 1px transparent ',
+    'COLOR_BACKGROUND_4',
+    ';\n}\n\n.QFrame[frameShape="4"] {\n  max-height: 2px;\n  border: none;\n  background-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n}\n\n.QFrame[frameShape="5"] {\n  max-width: 2px;\n  border: none;\n  background-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n}\n\n/* QSplitter --------------------------------------------------------------\n\nhttps://doc.qt.io/qt-5/stylesheet-examples.html#customizing-qsplitter\n\n--------------------------------------------------------------------------- */\nQSplitter {\n  background-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n  spacing: 0px;\n  padding: 0px;\n  margin: 0px;\n}\n\nQSplitter::handle {\n  background-color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n  border: 0px solid ',
+    'COLOR_BACKGROUND_1',
+    ';\n  spacing: 0px;\n  padding: 1px;\n  margin: 0px;\n}\n\nQSplitter::handle:hover {\n  background-color: ',
+    'COLOR_TEXT_4',
+    ';\n}\n\nQSplitter::handle:horizontal {\n  width: 5px;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/line_vertical.png");\n}\n\nQSplitter::handle:vertical {\n  height: 5px;\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/line_horizontal.png");\n}\n\n/* QDateEdit, QDateTimeEdit -----------------------------------------------\n\n--------------------------------------------------------------------------- */\nQDateEdit, QDateTimeEdit {\n  selection-background-color: ',
+    'COLOR_ACCENT_2',
+    ';\n  border-style: solid;\n  border: ',
+    'BORDER_2',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  /* This fixes 103, 111 */\n  padding-top: 2px;\n  /* This fixes 103, 111 */\n  padding-bottom: 2px;\n  padding-left: 4px;\n  padding-right: 4px;\n  min-width: 10px;\n}\n\nQDateEdit:on, QDateTimeEdit:on {\n  selection-background-color: ',
+    'COLOR_ACCENT_2',
+    ';\n}\n\nQDateEdit::drop-down, QDateTimeEdit::drop-down {\n  subcontrol-origin: padding;\n  subcontrol-position: top right;\n  width: 12px;\n  border-left: 1px solid ',
+    'COLOR_BACKGROUND_4',
+    ';\n}\n\nQDateEdit::down-arrow, QDateTimeEdit::down-arrow {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/arrow_down_disabled.png");\n  height: 8px;\n  width: 8px;\n}\n\nQDateEdit::down-arrow:on, QDateEdit::down-arrow:hover, QDateEdit::down-arrow:focus, QDateTimeEdit::down-arrow:on, QDateTimeEdit::down-arrow:hover, QDateTimeEdit::down-arrow:focus {\n  image: url("',
+    'PATH_RESOURCES',
+    '/rc/arrow_down.png");\n}\n\nQDateEdit QAbstractItemView, QDateTimeEdit QAbstractItemView {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n  border-radius: ',
+    'SIZE_BORDER_RADIUS',
+    ';\n  border: ',
+    'BORDER_2',
+    ';\n  selection-background-color: ',
+    'COLOR_ACCENT_2',
+    ';\n}\n\n/* QAbstractView ----------------------------------------------------------\n\n--------------------------------------------------------------------------- */\nQAbstractView:hover {\n  border: ',
+    'BORDER_SELECTION_2',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n}\n\nQAbstractView:selected {\n  background: ',
+    'COLOR_ACCENT_2',
+    ';\n  color: ',
+    'COLOR_BACKGROUND_4',
+    ';\n}\n\n/* QDial -----------------------------------------------\n\n--------------------------------------------------------------------------- */\nQDial {\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n}\n\nQDial:disabled {\n  background-color: ',
+    'COLOR_TEXT_4',
+    ';\n}\n\n/* PlotWidget -------------------------------------------------------------\n\n--------------------------------------------------------------------------- */\nPlotWidget {\n  /* Fix cut labels in plots #134 */\n  padding: 0px;\n}\n\n/* Titlebar  ----------------------------------------------------------------\n\n--------------------------------------------------------------------------- */\nTitlebar {\n  background-color: ',
+    'TITLE_BAR_BACKGROUND_COLOR',
+    ';\n}\n\nTitlebar:disabled {\n  background-color: ',
+    'TITLE_BAR_BUTTONS_DISABLED_COLOR',
+    ';\n}\n\nTitlebar QLabel {\n  font: 16px;\n  background-color: ',
+    'TITLE_BAR_BACKGROUND_COLOR',
+    ';\n  color: ',
+    'COLOR_TEXT_1',
+    ';\n}\n\nTitlebar QLabel:disabled {\n  background-color: ',
+    'TITLE_BAR_BUTTONS_DISABLED_COLOR',
+    ';\n}\n\nMenuButton {\n  margin: 0px;\n  padding: 0px;\n  border: none;\n  outline: none;\n  border: none;\n  border-radius: 0px;\n  color: ',
+    'TITLE_BAR_TEXT_COLOR',
+    ';\n  background-color: ',
+    'TITLE_BAR_BACKGROUND_COLOR',
+    ';\n}\n\nMenuButton::menu-indicator {\n  image: none;\n}\n\nMenuButton:hover {\n  background-color: ',
+    'TITLE_BAR_BUTTONS_HOVER_COLOR',
+    ';\n}\n\nMenuButton:pressed, MenuButton:checked, MenuButton:selected {\n  background-color: ',
+    'TITLE_BAR_BUTTONS_DISABLED_COLOR',
+    ';\n}\n\nMenuButton:disabled {\n  background-color: ',
+    'TITLE_BAR_BUTTONS_DISABLED_COLOR',
+    ';\n}\n\nTitlebarWindowsButton {\n  border: none;\n  padding: 0px;\n  border-radius: 0px;\n  outline: none;\n  margin: 0px;\n  min-width: 45;\n  max-width: 45;\n  background-color: ',
+    'TITLE_BAR_BACKGROUND_COLOR',
+    ';\n}\n\nTitlebarWindowsButton:disabled {\n  color: ',
+    'TITLE_BAR_BUTTONS_DISABLED_COLOR',
+    ';\n  background-color: ',
+    'TITLE_BAR_BUTTONS_DISABLED_COLOR',
+    ';\n}\n\nMinimizeWindowsButton {\n  background-color: ',
+    'TITLE_BAR_BACKGROUND_COLOR',
+    ';\n  icon: url(":/qss_icons/rc/button_nt_minimize.png");\n}\n\nMinimizeWindowsButton:hover {\n  icon: url(":/qss_icons/rc/button_nt_minimize_hover.png");\n}\n\nMinimizeWindowsButton:disabled {\n  icon: url(":/qss_icons/rc/button_nt_minimize_disabled.png");\n  background-color: ',
+    'TITLE_BAR_BUTTONS_DISABLED_COLOR',
+    ';\n}\n\nMaximizeWindowsButton {\n  background-color: ',
+    'TITLE_BAR_BACKGROUND_COLOR',
+    ';\n  icon: url(":/qss_icons/rc/button_nt_maximize.png");\n}\n\nMaximizeWindowsButton:hover {\n  icon: url(":/qss_icons/rc/button_nt_maximize_hover.png");\n}\n\nMaximizeWindowsButton:disabled {\n  icon: url(":/qss_icons/rc/button_nt_maximize_disabled.png");\n  background-color: ',
+    'TITLE_BAR_BUTTONS_DISABLED_COLOR',
+    ';\n}\n\nRestoreWindowsButton {\n  background-color: ',
+    'TITLE_BAR_BACKGROUND_COLOR',
+    ';\n  icon: url(":/qss_icons/rc/button_nt_restore.png");\n}\n\nRestoreWindowsButton:hover {\n  icon: url(":/qss_icons/rc/button_nt_restore_hover.png");\n}\n\nRestoreWindowsButton:disabled {\n  icon: url(":/qss_icons/rc/button_nt_restore_disabled.png");\n  background-color: ',
+    'TITLE_BAR_BUTTONS_DISABLED_COLOR',
+    ';\n}\n\nCloseWindowsButton {\n  background-color: ',
+    'TITLE_BAR_BACKGROUND_COLOR',
+    ';\n  icon: url(":/qss_icons/rc/button_nt_close.png");\n}\n\nCloseWindowsButton:hover {\n  icon: url(":/qss_icons/rc/button_nt_close_hover_red.png");\n}\n\nCloseWindowsButton:disabled {\n  icon: url(":/qss_icons/rc/button_nt_close_disabled.png");\n  background-color: ',
+    'TITLE_BAR_BUTTONS_DISABLED_COLOR',
+    ';\n}\n\nCloseSquareWindowsButton {\n  min-width: 30;\n  max-width: 30;\n  background-color: ',
+    'TITLE_BAR_BACKGROUND_COLOR',
+    ';\n  icon: url(":/qss_icons/rc/button_nt_close_square.png");\n}\n\nCloseSquareWindowsButton:hover {\n  icon: url(":/qss_icons/rc/button_nt_close_square_hover_red.png");\n}\n\nCloseSquareWindowsButton:disabled {\n  icon: url(":/qss_icons/rc/button_nt_close_square_disabled.png");\n  background-color: ',
+    'TITLE_BAR_BUTTONS_DISABLED_COLOR',
+    ';\n}\n\n/* Darwin Buttons  ----------------------------------------------------------------\n\n--------------------------------------------------------------------------- */\nTitlebarDarwinButton {\n  border: none;\n  padding: 0px;\n  border-radius: 0px;\n  outline: none;\n  margin: 0px;\n  background-color: ',
+    'TITLE_BAR_BACKGROUND_COLOR',
+    ';\n}\n\nTitlebarDarwinButton:disabled {\n  color: ',
+    'TITLE_BAR_BUTTONS_DISABLED_COLOR',
+    ';\n  background-color: ',
+    'TITLE_BAR_BUTTONS_DISABLED_COLOR',
+    ';\n}\n\nTitlebarDarwinButton:pressed, TitlebarDarwinButton:checked, TitlebarDarwinButton:selected, TitlebarDarwinButton:hover {\n  background-color: ',
+    'TITLE_BAR_BACKGROUND_COLOR',
+    ';\n}\n\nMinimizeDarwinButton {\n  icon: url(":/qss_icons/rc/button_darwin_minimize.png");\n}\n\nMinimizeDarwinButton:hover {\n  icon: url(":/qss_icons/rc/button_darwin_minimize_hover.png");\n}\n\nMinimizeDarwinButton:pressed {\n  icon: url(":/qss_icons/rc/button_darwin_minimize_pressed.png");\n}\n\nMaximizeDarwinButton {\n  icon: url(":/qss_icons/rc/button_darwin_maximize.png");\n}\n\nMaximizeDarwinButton:hover {\n  icon: url(":/qss_icons/rc/button_darwin_maximize_hover.png");\n}\n\nMaximizeDarwinButton:pressed {\n  icon: url(":/qss_icons/rc/button_darwin_maximize_pressed.png");\n}\n\nRestoreDarwinButton {\n  icon: url(":/qss_icons/rc/button_darwin_restore.png");\n}\n\nRestoreDarwinButton:hover {\n  icon: url(":/qss_icons/rc/button_darwin_restore_hover.png");\n}\n\nRestoreDarwinButton:pressed {\n  icon: url(":/qss_icons/rc/button_darwin_restore_pressed.png");\n}\n\nCloseDarwinButton {\n  icon: url(":/qss_icons/rc/button_darwin_close.png");\n}\n\nCloseDarwinButton:hover {\n  icon: url(":/qss_icons/rc/button_darwin_close_hover.png");\n}\n\nCloseDarwinButton:pressed {\n  icon: url(":/qss_icons/rc/button_darwin_close_pressed.png");\n}\n\nAppLogo {\n  border: none;\n  padding: 0px;\n  border-radius: 0px;\n  outline: none;\n  margin: 0px;\n  background-color: ',
+    'TITLE_BAR_BACKGROUND_COLOR',
+    ';\n}\n\nAppLogo:disabled {\n  background-color: ',
+    'TITLE_BAR_BUTTONS_DISABLED_COLOR',
+    ';\n}\n\n/* FramelessWindow ----------------------------------------------------------------\n\n--------------------------------------------------------------------------- */\nFramelessWindow #__centralWidget {\n  padding: 0px;\n  border: none;\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n}\n\nFramelessWindow #__contentWidget {\n  padding: 0px;\n  border-width: 2px;\n  border-style: solid;\n  border-color: ',
+    'COLOR_ACCENT_3',
+    ';\n  border-top: none;\n  background-color: ',
+    'COLOR_BACKGROUND_1',
+    ';\n}\n\nFramelessWindow #__contentWidget:disabled {\n  border-color: ',
+    'TITLE_BAR_BUTTONS_DISABLED_COLOR',
+    ';\n}\n\nButtonsWidget {\n  border: none;\n  padding: 0px;\n  border-radius: 0px;\n  outline: none;\n  margin: 0px;\n}\n',
+)
@@ -4,4 +4,6 @@
 Utilities for processing SASS and images from default and custom palette.
 """
 
-from .__utils import getAllScreensGeometry, getAllScreensWorkspace, getWorkspace, setStylesheetOnQApp, StyleLooper
+from .__utils import (getAllScreensGeometry, getAllScreensWorkspace, getWorkspace, setStylesheetOnQApp,
+                      setStylesheetOnWidget, StyleLooper, StyleReloader, ThemeState)
+from .transition import ThemeTransition
@@ -1,5 +1,8 @@
+import os
+
 from qtpy.QtWidgets import QApplication, QDesktopWidget
-from qtpy.QtCore import QRect
+from qtpy.QtCore import QFileSystemWatcher, QObject, QRect, QTimer, Signal
+from qtpy.QtGui import QBrush
 
 import qrainbowstyle
 
@@ -25,16 +28,161 @@ def setStylesheetOnQApp(style):
     app.setStyleSheet(qrainbowstyle.load_stylesheet(style=style))
 
 
+def setStylesheetOnWidget(widget, style, palette=None):
+    """Set stylesheet scoped to widget, only the widget and its children are re-polished.
+
+    Widget without object name gets a unique one, used as the stylesheet scope.
+    """
+    if not widget.objectName():
+        widget.setObjectName("qrainbowstyle_{}".format(id(widget)))
+    widget.setStyleSheet(qrainbowstyle.load_scoped_stylesheet(widget.objectName(), style=style, palette=palette))
+
+
 class StyleLooper:
-    def __init__(self):
+    """Loop over available styles.
+
+    Args:
+        preload (bool): Prepare next style in background thread after every change.
+    """
+
+    def __init__(self, preload=False):
         super(StyleLooper, self).__init__()
 
         self.style_index = 0
         self.styles = qrainbowstyle.getAvailableStyles()
+        self.preload = preload
 
-    def change(self):
-        self.style_index = self.style_index + 1
-        if self.style_index >= len(self.styles):
-            self.style_index = 0
+    def _next_index(self):
+        return (self.style_index + 1) % len(self.styles)
 
+    def change(self):
+        self.style_index = self._next_index()
         setStylesheetOnQApp(self.styles[self.style_index])
+
+        if self.preload:
+            qrainbowstyle.preloadStylesheet(self.styles[self._next_index()])
+
+
+class StyleReloader(QObject):
+    """Reload stylesheet in running app when its style is rebuilt.
+
+    Compiled files of the style, shared resources and QSS template are watched,
+    so the app follows ``scripts/process_qrc.py --watch`` without a restart.
+    Changes are collected for `delay` ms, because one build writes many files.
+
+    Args:
+        style (str): Style to reload.
+        palette (BasePalette): Palette class used to render the stylesheet.
+        widget (QWidget): Widget which stylesheet is reloaded. Defaults to None, i.e. app.
+        delay (int): Debounce window in ms.
+    """
+
+    reloaded = Signal(str)
+
+    def __init__(self, style, palette=None, widget=None, delay=300, parent=None):
+        super(StyleReloader, self).__init__(parent)
+
+        self.style = style
+        self.palette = palette
+        self.widget = widget
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self.reload)
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_changed)
+        self._watcher.directoryChanged.connect(self._on_changed)
+        self._watch()
+
+    def _get_paths(self):
+        style_dir = os.path.join(qrainbowstyle.STYLES_PATH, qrainbowstyle._get_style_dir(self.style))
+        shared_dir = os.path.join(qrainbowstyle.STYLES_PATH, qrainbowstyle.SHARED_RESOURCES_DIR)
+        paths = [style_dir, shared_dir, qrainbowstyle.QSS_TEMPLATE_FILEPATH]
+        for path in (style_dir, shared_dir):
+            paths += [os.path.join(path, x) for x in (qrainbowstyle.QSS_FILE, qrainbowstyle.RCC_FILE, "style_rc.py")]
+        return [x for x in paths if os.path.exists(x)]
+
+    def _watch(self):
+        # files replaced by build are no longer watched, add them again
+        watched = set(self._watcher.files() + self._watcher.directories())
+        paths = [x for x in self._get_paths() if x not in watched]
+        if paths:
+            self._watcher.addPaths(paths)
+
+    def _on_changed(self, path):
+        self._timer.start()
+
+    def reload(self):
+        """Reload style and set its stylesheet."""
+        self._watch()
+        if self.widget is None:
+            stylesheet = qrainbowstyle.reloadStylesheet(style=self.style, palette=self.palette)
+            QApplication.instance().setStyleSheet(stylesheet)
+        else:
+            qrainbowstyle.reloadStyles()
+            if self.palette is not None:
+                import qrainbowstyle.palette as source
+                self.palette = getattr(source, self.palette.__name__, self.palette)
+            setStylesheetOnWidget(self.widget, self.style, self.palette)
+        self.reloaded.emit(self.style)
+
+
+class ThemeState(QObject):
+    """Palette of loaded stylesheet, shared by widgets painting with its colors.
+
+    Colors and brushes of all palette variables are built once per palette,
+    so widgets read them without parsing the palette again. Widgets connect to
+    `paletteChanged` once instead of checking the palette on every style change.
+    Use qrainbowstyle.getCurrentTheme() to get the instance updated by the package.
+
+    Args:
+        palette (BasePalette): Initial palette. Defaults to None, i.e. no stylesheet loaded.
+    """
+
+    paletteChanged = Signal(object)
+
+    def __init__(self, palette=None, parent=None):
+        super(ThemeState, self).__init__(parent)
+
+        self._palette = None
+        self._frozen = None
+        self._colors = {}
+        self._brushes = {}
+        if palette is not None:
+            self.setPalette(palette)
+
+    def palette(self):
+        """Return current palette, None if no stylesheet is loaded."""
+        return self._palette
+
+    def color(self, name):
+        """Return QColor of palette variable, e.g. ``COLOR_ACCENT_4``. Do not modify it, copy it instead."""
+        try:
+            return self._colors[name]
+        except KeyError:
+            raise KeyError("Palette has no color {}".format(name)) from None
+
+    def brush(self, name):
+        """Return QBrush of palette variable, e.g. ``COLOR_BACKGROUND_1``."""
+        try:
+            return self._brushes[name]
+        except KeyError:
+            raise KeyError("Palette has no color {}".format(name)) from None
+
+    def colors(self):
+        """Return dictionary of variable name to QColor of all palette colors."""
+        return dict(self._colors)
+
+    def setPalette(self, palette):
+        """Set palette, `paletteChanged` is emitted only when its values change."""
+        frozen = palette.freeze()
+        self._palette = palette
+        if frozen == self._frozen:
+            return
+
+        self._frozen = frozen
+        self._colors = frozen.qcolors()
+        self._brushes = {name: QBrush(color) for name, color in self._colors.items()}
+        self.paletteChanged.emit(palette)
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Utilities for skipping build steps whose inputs did not change."""
+
+# Standard library imports
+import hashlib
+import json
+import logging
+import os
+
+# Local imports
+from qrainbowstyle import REPO_PATH
+
+BUILD_CACHE_VERSION = 1
+
+BUILD_CACHE_FILEPATH = os.path.join(REPO_PATH, '.build_cache.json')
+
+_logger = logging.getLogger(__name__)
+
+
+def fingerprint(*items):
+    """
+    Return sha256 digest of items.
+
+    Bytes are hashed directly, other items are serialized to JSON first.
+    """
+    digest = hashlib.sha256()
+    for item in items:
+        if not isinstance(item, bytes):
+            item = json.dumps(item, sort_keys=True, default=str).encode('utf-8')
+        digest.update(hashlib.sha256(item).digest())
+    return digest.hexdigest()
+
+
+def files_fingerprint(paths):
+    """Return sha256 digest of names and contents of files."""
+    items = []
+    for path in sorted(paths):
+        with open(path, 'rb') as fh:
+            items.extend([os.path.basename(path), fh.read()])
+    return fingerprint(*items)
+
+
+def tool_versions():
+    """Return versions of tools used to create styles."""
+    import qtsass
+    from qtpy import API_NAME, PYQT_VERSION, PYSIDE_VERSION, QT_VERSION
+
+    return {
+        'cache': BUILD_CACHE_VERSION,
+        'qtsass': qtsass.__version__,
+        'api': API_NAME,
+        'binding': PYQT_VERSION or PYSIDE_VERSION,
+        'qt': QT_VERSION,
+    }
+
+
+class BuildCache:
+    """Fingerprints of inputs of build steps, saved between builds.
+
+    Cache can be sent to another process, fingerprints updated there
+    are returned by `updated` and merged with `merge`.
+
+    Args:
+        filepath (str, optional): Path to cache file. Defaults to BUILD_CACHE_FILEPATH.
+        enabled (bool, optional): If False, all steps are run. Defaults to True.
+    """
+
+    def __init__(self, filepath=BUILD_CACHE_FILEPATH, enabled=True):
+        super(BuildCache, self).__init__()
+        self.filepath = filepath
+        self.enabled = enabled
+        self.updated = {}
+        self._entries = {}
+
+        if enabled:
+            try:
+                with open(filepath, 'r') as fh:
+                    self._entries = json.load(fh)
+            except (FileNotFoundError, ValueError):
+                _logger.debug("Build cache not found, building everything")
+
+    def is_fresh(self, key, digest, outputs=()):
+        """Check that step was built from the same inputs and its outputs exist."""
+        return (self.enabled and self._entries.get(key) == digest
+                and all(os.path.exists(path) for path in outputs))
+
+    def update(self, key, digest):
+        """Store fingerprint of inputs of successfully built step."""
+        self._entries[key] = digest
+        self.updated[key] = digest
+
+    def merge(self, updated):
+        """Store fingerprints updated in another process."""
+        for key, digest in updated.items():
+            self.update(key, digest)
+
+    def run(self, key, inputs, outputs, func, *args, **kwargs):
+        """
+        Run build step if its inputs changed or outputs are missing.
+
+        Args:
+            key (str): Unique name of build step.
+            inputs (list): Items used to fingerprint inputs of the step, see fingerprint.
+            outputs (list(str)): Paths to files created by the step.
+            func (callable): Build step, called with `args` and `kwargs`.
+
+        Returns:
+            bool: True if step was run.
+        """
+        digest = fingerprint(*inputs)
+        if self.is_fresh(key, digest, outputs):
+            _logger.debug("Up to date: %s", key)
+            return False
+
+        func(*args, **kwargs)
+        self.update(key, digest)
+        return True
+
+    def save(self):
+        """Write cache file."""
+        with open(self.filepath, 'w') as fh:
+            json.dump(self._entries, fh, indent=2, sort_keys=True)
+            fh.write('\n')
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Find colors of qrainbowstyle.colorsystem by value.
+
+The index of all colors of the color system is built once at import. It maps
+hex values back to their ramp and step, e.g. ``#e0e1e3`` to ``('Gray', 'B130')``,
+and snaps arbitrary colors to the perceptually nearest color of the system.
+Distances are measured in OKLab, see qrainbowstyle.utils.colors. The color
+system has about a hundred colors, so nearest colors of many inputs are found
+by comparing them with all colors at once, e.g.
+
+.. code-block:: python
+
+    snap_colors(['#263238', '#56bfba'])  # ['#293544', '#20c997']
+    MySnappedTheme = snap_palette(MyTheme)
+
+Requires NumPy, install it with ``pip install qrainbowstyle[generator]``.
+"""
+
+# Standard library imports
+from collections import namedtuple
+
+# Third party imports
+import numpy as np
+
+# Local imports
+from qrainbowstyle import colorsystem
+from qrainbowstyle.utils.colors import hex_to_rgb, rgb_to_oklab
+
+# Number of colors compared with the color system at once, limits memory of distance matrices
+SEARCH_CHUNK_SIZE = 4096
+
+SystemColor = namedtuple('SystemColor', ['ramp', 'step', 'value'])
+NearestColor = namedtuple('NearestColor', ['ramp', 'step', 'value', 'distance'])
+
+
+def normalize_hex(color):
+    """Return color in lowercase #rrggbb format, e.g. ``#FFF`` -> ``#ffffff``."""
+    value = color.strip().lstrip('#').lower()
+    if len(value) == 3:
+        value = ''.join(x * 2 for x in value)
+    if len(value) != 6 or any(x not in '0123456789abcdef' for x in value):
+        raise ValueError("Invalid hex color: {}".format(color))
+    return '#' + value
+
+
+def _build_index():
+    """Collect colors of ramps in order of definition, the first ramp defining a value owns it."""
+    colors = []
+    for ramp_name, ramp in vars(colorsystem).items():
+        if not isinstance(ramp, type) or ramp_name.startswith('_'):
+            continue
+        for step, value in vars(ramp).items():
+            if step.startswith('_') or not isinstance(value, str):
+                continue
+            colors.append(SystemColor(ramp_name, step, normalize_hex(value)))
+
+    index = {}
+    for color in colors:
+        index.setdefault(color.value, color)
+
+    # duplicates, e.g. black and white in every ramp, are searched only once
+    unique = list(index.values())
+    return colors, index, unique, rgb_to_oklab(hex_to_rgb([x.value for x in unique]))
+
+
+# All colors of the system, hex value -> its first color, colors searched by nearest and their OKLab coordinates
+COLORS, HEX_INDEX, _SEARCHED, _SEARCHED_LAB = _build_index()
+_SEARCHED_NORMS = (_SEARCHED_LAB ** 2).sum(axis=1)
+
+
+def find_color(color):
+    """
+    Find ramp and step of color system defining the color.
+
+    Args:
+        color (str): Hex color, in any case, #rrggbb or #rgb format.
+
+    Returns:
+        SystemColor: (ramp, step, value) e.g. ``('Gray', 'B130', '#e0e1e3')``, None if not in the system.
+    """
+    return HEX_INDEX.get(normalize_hex(color))
+
+
+def find_steps(color):
+    """Return all (ramp, step, value) of color system with the color, e.g. black is in every ramp."""
+    value = normalize_hex(color)
+    return [x for x in COLORS if x.value == value]
+
+
+def nearest_indices(colors):
+    """
+    Find nearest colors of color system for sRGB colors.
+
+    Args:
+        colors (numpy.ndarray): sRGB colors, shape (n, 3).
+
+    Returns:
+        tuple(numpy.ndarray): indices to searched colors and OKLab distances, both of shape (n,).
+    """
+    lab = rgb_to_oklab(np.asarray(colors, dtype=float).reshape(-1, 3))
+    indices = np.empty(len(lab), dtype=np.intp)
+    distances = np.empty(len(lab))
+
+    for start in range(0, len(lab), SEARCH_CHUNK_SIZE):
+        chunk = lab[start:start + SEARCH_CHUNK_SIZE]
+        # |a - b|^2 = |a|^2 - 2ab + |b|^2, the matrix product is much faster than differences of all pairs
+        squared = (chunk ** 2).sum(axis=1)[:, None] - 2 * chunk @ _SEARCHED_LAB.T + _SEARCHED_NORMS
+        nearest = squared.argmin(axis=1)
+        indices[start:start + len(chunk)] = nearest
+        distances[start:start + len(chunk)] = np.sqrt(np.maximum(squared[np.arange(len(chunk)), nearest], 0.0))
+
+    return indices, distances
+
+
+def nearest_colors(colors):
+    """
+    Find nearest colors of color system.
+
+    Args:
+        colors (list(str)): Hex colors.
+
+    Returns:
+        list(NearestColor): (ramp, step, value, distance) for every color, distance is 0 for colors
+        of the system.
+    """
+    if not colors:
+        return []
+    indices, distances = nearest_indices(hex_to_rgb([normalize_hex(x) for x in colors]))
+    return [NearestColor(*_SEARCHED[i], float(d)) for i, d in zip(indices, distances)]
+
+
+def nearest_color(color):
+    """Return nearest (ramp, step, value, distance) of color system for hex color."""
+    return nearest_colors([color])[0]
+
+
+def snap_colors(colors):
+    """Return hex values of nearest colors of color system, for list of hex colors."""
+    return [x.value for x in nearest_colors(colors)]
+
+
+def snap_palette(palette, name=None):
+    """
+    Create palette with all colors replaced by the nearest colors of color system.
+
+    Args:
+        palette (type): BasePalette subclass.
+        name (str, optional): Name of created palette class. Defaults to palette name + ``Snapped``.
+
+    Returns:
+        type: subclass of palette.
+    """
+    frozen = palette.freeze()
+    names = [x for x in frozen.rgba() if isinstance(getattr(palette, x), str)]
+    values = snap_colors([frozen[x] for x in names])
+    return type(name or palette.__name__ + 'Snapped', (palette, ), dict(zip(names, values)))
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Vectorized conversions of colors between sRGB and OKLab color spaces.
+
+All functions work on NumPy arrays of any shape whose last axis holds
+color components, so thousands of colors are converted in one call.
+sRGB components are floats in range [0, 1]. OKLab is a perceptual color
+space, equal distances in it look like equal differences of colors, see
+https://bottosson.github.io/posts/oklab/. OKLCH is its polar form with
+lightness, chroma and hue in radians.
+
+Requires NumPy, install it with ``pip install qrainbowstyle[generator]``.
+"""
+
+# Third party imports
+import numpy as np
+
+# Matrices of conversion from linear sRGB to OKLab, see https://bottosson.github.io/posts/oklab/
+_RGB_TO_LMS = np.array([
+    [0.4122214708, 0.5363325363, 0.0514459929],
+    [0.2119034982, 0.6806995451, 0.1073969566],
+    [0.0883024619, 0.2817188376, 0.6299787005],
+])
+
+_LMS_TO_OKLAB = np.array([
+    [0.2104542553, 0.7936177850, -0.0040720468],
+    [1.9779984951, -2.4285922050, 0.4505937099],
+    [0.0259040371, 0.7827717662, -0.8086757660],
+])
+
+_LMS_TO_RGB = np.linalg.inv(_RGB_TO_LMS)
+_OKLAB_TO_LMS = np.linalg.inv(_LMS_TO_OKLAB)
+
+# Iterations of bisection in gamut mapping, chroma error is below 0.4 / 2 ** 16
+GAMUT_ITERATIONS = 16
+
+
+def hex_to_rgb(colors):
+    """
+    Convert hex color strings, e.g. ``#ff8000``, to sRGB array.
+
+    Args:
+        colors (str or sequence(str)): Color or colors in #rrggbb or #rgb format.
+
+    Returns:
+        numpy.ndarray: sRGB components, shape (3,) for one color, otherwise (n, 3).
+    """
+    single = isinstance(colors, str)
+    values = []
+    for color in ([colors] if single else colors):
+        color = color.lstrip('#')
+        if len(color) == 3:
+            color = ''.join(x * 2 for x in color)
+        if len(color) != 6:
+            raise ValueError("Invalid hex color: {}".format(color))
+        value = int(color, 16)
+        values.append(((value >> 16) & 0xff, (value >> 8) & 0xff, value & 0xff))
+
+    rgb = np.array(values, dtype=float).reshape(-1, 3) / 255.0
+    return rgb[0] if single else rgb
+
+
+def rgb_to_hex(rgb):
+    """
+    Convert sRGB array to hex color strings.
+
+    Args:
+        rgb (numpy.ndarray): sRGB components, values are clipped to range [0, 1].
+
+    Returns:
+        str or list: ``#rrggbb`` for array of shape (3,), otherwise nested lists of strings.
+    """
+    values = np.rint(np.clip(rgb, 0.0, 1.0) * 255.0).astype(np.int64)
+    packed = (values[..., 0] << 16) | (values[..., 1] << 8) | values[..., 2]
+
+    if packed.ndim == 0:
+        return '#{:06x}'.format(int(packed))
+    return np.vectorize('#{:06x}'.format, otypes=[object])(packed).tolist()
+
+
+def srgb_to_linear(rgb):
+    """Remove sRGB gamma from components."""
+    rgb = np.asarray(rgb, dtype=float)
+    return np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+
+
+def linear_to_srgb(rgb):
+    """Apply sRGB gamma to linear components."""
+    rgb = np.clip(np.asarray(rgb, dtype=float), 0.0, None)
+    return np.where(rgb <= 0.0031308, rgb * 12.92, 1.055 * rgb ** (1 / 2.4) - 0.055)
+
+
+def linear_to_oklab(rgb):
+    """Convert linear sRGB to OKLab."""
+    lms = np.cbrt(np.asarray(rgb, dtype=float) @ _RGB_TO_LMS.T)
+    return lms @ _LMS_TO_OKLAB.T
+
+
+def oklab_to_linear(lab):
+    """Convert OKLab to linear sRGB, components may be out of range [0, 1]."""
+    lms = np.asarray(lab, dtype=float) @ _OKLAB_TO_LMS.T
+    return (lms ** 3) @ _LMS_TO_RGB.T
+
+
+def rgb_to_oklab(rgb):
+    """Convert sRGB to OKLab."""
+    return linear_to_oklab(srgb_to_linear(rgb))
+
+
+def oklab_to_rgb(lab):
+    """Convert OKLab to sRGB, colors out of sRGB gamut are clipped, see clip_chroma."""
+    return np.clip(linear_to_srgb(oklab_to_linear(lab)), 0.0, 1.0)
+
+
+def oklab_to_oklch(lab):
+    """Convert OKLab to lightness, chroma and hue in radians."""
+    lab = np.asarray(lab, dtype=float)
+    chroma = np.hypot(lab[..., 1], lab[..., 2])
+    hue = np.arctan2(lab[..., 2], lab[..., 1])
+    return np.stack([lab[..., 0], chroma, hue], axis=-1)
+
+
+def oklch_to_oklab(lch):
+    """Convert lightness, chroma and hue in radians to OKLab."""
+    lch = np.asarray(lch, dtype=float)
+    return np.stack([lch[..., 0], lch[..., 1] * np.cos(lch[..., 2]), lch[..., 1] * np.sin(lch[..., 2])], axis=-1)
+
+
+def in_gamut(lab, tolerance=1e-6):
+    """Check which OKLab colors can be displayed in sRGB."""
+    rgb = oklab_to_linear(lab)
+    return np.all((rgb >= -tolerance) & (rgb <= 1 + tolerance), axis=-1)
+
+
+def clip_chroma(lch):
+    """
+    Map OKLCH colors into sRGB gamut by reducing their chroma.
+
+    Lightness and hue are kept, so mapped colors look as close as possible
+    to the requested ones. Chroma is found by bisection of all colors at once.
+
+    Args:
+        lch (numpy.ndarray): OKLCH colors, lightness is clipped to range [0, 1].
+
+    Returns:
+        numpy.ndarray: OKLCH colors in sRGB gamut.
+    """
+    lch = np.array(lch, dtype=float)
+    lch[..., 0] = np.clip(lch[..., 0], 0.0, 1.0)
+
+    # only colors out of gamut are searched
+    outside = ~in_gamut(oklch_to_oklab(lch))
+    candidate = lch[outside]
+    low = np.zeros(len(candidate))
+    high = candidate[:, 1].copy()
+
+    for _ in range(GAMUT_ITERATIONS):
+        candidate[:, 1] = (low + high) / 2
+        ok = in_gamut(oklch_to_oklab(candidate))
+        low = np.where(ok, candidate[:, 1], low)
+        high = np.where(ok, high, candidate[:, 1])
+
+    lch[outside, 1] = low
+    return lch
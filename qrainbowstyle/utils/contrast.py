@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Check contrast of palette colors, see https://www.w3.org/TR/WCAG21/#contrast-minimum.
+
+Contrast ratios and perceptual distances of all pairs of colors are computed
+with NumPy for any number of palettes at once, so palettes created by
+qrainbowstyle.utils.palette_generator can be checked by thousands, e.g.
+
+.. code-block:: python
+
+    colors = generate_colors(accents)
+    ratios, requirements = check_contrast(colors, roles=GENERATED_VARIABLES)
+    readable = ~violations(ratios, requirements).any(axis=-1)
+
+Requires NumPy, install it with ``pip install qrainbowstyle[generator]``.
+"""
+
+# Standard library imports
+from collections import namedtuple
+
+# Third party imports
+import numpy as np
+
+# Local imports
+from qrainbowstyle.utils.colors import rgb_to_oklab, srgb_to_linear
+
+# Color variables of palettes, in order of colors returned by palette_colors
+ROLES = [
+    'COLOR_BACKGROUND_1',
+    'COLOR_BACKGROUND_2',
+    'COLOR_BACKGROUND_3',
+    'COLOR_BACKGROUND_4',
+    'COLOR_BACKGROUND_5',
+    'COLOR_BACKGROUND_6',
+    'COLOR_TEXT_1',
+    'COLOR_TEXT_2',
+    'COLOR_TEXT_3',
+    'COLOR_TEXT_4',
+    'COLOR_ACCENT_1',
+    'COLOR_ACCENT_2',
+    'COLOR_ACCENT_3',
+    'COLOR_ACCENT_4',
+    'COLOR_ACCENT_5',
+    'TITLE_BAR_BACKGROUND_COLOR',
+    'TITLE_BAR_BUTTONS_HOVER_COLOR',
+    'TITLE_BAR_BUTTONS_DISABLED_COLOR',
+    'TITLE_BAR_TEXT_COLOR',
+]
+
+# Minimum contrast of normal text and of user interface components in WCAG 2.1 level AA
+MIN_TEXT_CONTRAST = 4.5
+MIN_UI_CONTRAST = 3.0
+
+# Relative luminance of linear sRGB components
+LUMINANCE_WEIGHTS = np.array([0.2126, 0.7152, 0.0722])
+
+# (foreground, background, minimum contrast) of colors used together in the stylesheet.
+# Disabled text, COLOR_TEXT_4, has no requirement in WCAG.
+CONTRAST_REQUIREMENTS = [
+    ('COLOR_TEXT_1', 'COLOR_BACKGROUND_1', MIN_TEXT_CONTRAST),
+    ('COLOR_TEXT_1', 'COLOR_BACKGROUND_2', MIN_TEXT_CONTRAST),
+    ('COLOR_TEXT_1', 'COLOR_BACKGROUND_3', MIN_TEXT_CONTRAST),
+    ('COLOR_TEXT_1', 'COLOR_BACKGROUND_4', MIN_TEXT_CONTRAST),
+    ('COLOR_TEXT_1', 'COLOR_BACKGROUND_5', MIN_TEXT_CONTRAST),
+    ('COLOR_TEXT_1', 'COLOR_BACKGROUND_6', MIN_TEXT_CONTRAST),
+    ('COLOR_TEXT_1', 'COLOR_ACCENT_2', MIN_TEXT_CONTRAST),
+    ('COLOR_TEXT_1', 'COLOR_ACCENT_3', MIN_TEXT_CONTRAST),
+    ('COLOR_TEXT_2', 'COLOR_BACKGROUND_1', MIN_TEXT_CONTRAST),
+    ('COLOR_TEXT_3', 'COLOR_BACKGROUND_1', MIN_TEXT_CONTRAST),
+    ('TITLE_BAR_TEXT_COLOR', 'TITLE_BAR_BACKGROUND_COLOR', MIN_TEXT_CONTRAST),
+    ('COLOR_ACCENT_3', 'COLOR_BACKGROUND_1', MIN_UI_CONTRAST),
+]
+
+Violation = namedtuple('Violation', ['palette', 'foreground', 'background', 'ratio', 'minimum'])
+
+
+def relative_luminance(rgb):
+    """Return relative luminance of sRGB colors, shape of input without the last axis."""
+    return srgb_to_linear(rgb) @ LUMINANCE_WEIGHTS
+
+
+def contrast_ratio(foreground, background):
+    """
+    Compute contrast ratio of colors, from 1 for equal colors to 21 for black and white.
+
+    Args:
+        foreground (numpy.ndarray): sRGB colors, shape (..., 3).
+        background (numpy.ndarray): sRGB colors, broadcastable with foreground.
+
+    Returns:
+        numpy.ndarray: contrast ratios, shape of colors without the last axis.
+    """
+    first = relative_luminance(foreground)
+    second = relative_luminance(background)
+    return (np.maximum(first, second) + 0.05) / (np.minimum(first, second) + 0.05)
+
+
+def contrast_matrix(colors):
+    """
+    Compute contrast ratios of all pairs of colors.
+
+    Args:
+        colors (numpy.ndarray): sRGB colors, shape (..., n, 3), e.g. (palettes, roles, 3).
+
+    Returns:
+        numpy.ndarray: symmetric matrices of contrast ratios, shape (..., n, n).
+    """
+    luminance = relative_luminance(colors)
+    first, second = luminance[..., :, None], luminance[..., None, :]
+    return (np.maximum(first, second) + 0.05) / (np.minimum(first, second) + 0.05)
+
+
+def distance_matrix(colors):
+    """
+    Compute perceptual distances of all pairs of colors, euclidean distances in OKLab.
+
+    Distance below 0.02 is hardly visible, distance of black and white is 1.
+
+    Args:
+        colors (numpy.ndarray): sRGB colors, shape (..., n, 3).
+
+    Returns:
+        numpy.ndarray: symmetric matrices of distances, shape (..., n, n).
+    """
+    lab = rgb_to_oklab(colors)
+    return np.linalg.norm(lab[..., :, None, :] - lab[..., None, :, :], axis=-1)
+
+
+def palette_colors(palettes, roles=ROLES):
+    """
+    Collect colors of palette classes to array.
+
+    Args:
+        palettes (list(type)): BasePalette subclasses.
+        roles (list(str), optional): Color variables. Defaults to ROLES.
+
+    Returns:
+        numpy.ndarray: sRGB colors of shape (palettes, roles, 3), NaN for missing or invalid colors.
+    """
+    colors = np.full((len(palettes), len(roles), 3), np.nan)
+    for index, palette in enumerate(palettes):
+        rgba = palette.freeze().rgba()
+        for role_index, role in enumerate(roles):
+            if role in rgba:
+                colors[index, role_index] = rgba[role][:3]
+    return colors / 255.0
+
+
+def check_contrast(colors, roles=ROLES, requirements=CONTRAST_REQUIREMENTS):
+    """
+    Compute contrast ratios of required pairs of colors.
+
+    Requirements with roles missing in `roles` are skipped.
+
+    Args:
+        colors (numpy.ndarray): sRGB colors, shape (..., len(roles), 3).
+        roles (list(str), optional): Color variables of colors. Defaults to ROLES.
+        requirements (list(tuple)): (foreground, background, minimum contrast) of checked pairs.
+            Defaults to CONTRAST_REQUIREMENTS.
+
+    Returns:
+        tuple: contrast ratios of shape (..., len(checked)) and list of checked requirements.
+    """
+    index = {role: i for i, role in enumerate(roles)}
+    checked = [x for x in requirements if x[0] in index and x[1] in index]
+    foreground = [index[x[0]] for x in checked]
+    background = [index[x[1]] for x in checked]
+
+    colors = np.asarray(colors, dtype=float)
+    return contrast_ratio(colors[..., foreground, :], colors[..., background, :]), checked
+
+
+def violations(ratios, requirements):
+    """Return mask of contrast ratios lower than required, missing colors are not violations."""
+    minimum = np.array([x[2] for x in requirements], dtype=float)
+    return ratios < minimum
+
+
+def find_violations(palettes, requirements=CONTRAST_REQUIREMENTS):
+    """
+    Find pairs of colors with insufficient contrast in palettes.
+
+    Args:
+        palettes (list(type)): BasePalette subclasses.
+        requirements (list(tuple)): (foreground, background, minimum contrast) of checked pairs.
+            Defaults to CONTRAST_REQUIREMENTS.
+
+    Returns:
+        list(Violation): violations sorted by palette and requirement.
+    """
+    ratios, checked = check_contrast(palette_colors(palettes), requirements=requirements)
+    return [Violation(palettes[i].__name__, checked[j][0], checked[j][1], float(ratios[i, j]), checked[j][2])
+            for i, j in np.argwhere(violations(ratios, checked))]
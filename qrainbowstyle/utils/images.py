@@ -6,15 +6,17 @@ Utilities to process and convert svg images to png using palette colors.
 
 # Standard library imports
 
+import hashlib
 import logging
+import multiprocessing
 import os
 import re
 import shutil
-import tempfile
 
 # Third party imports
-from qtpy.QtCore import QSize
-from qtpy.QtGui import QIcon
+from qtpy.QtCore import QByteArray, QSize, Qt
+from qtpy.QtGui import QImage, QPainter, QPixmap
+from qtpy.QtSvg import QSvgRenderer
 from qtpy.QtWidgets import QApplication
 
 # Local imports
@@ -24,6 +26,12 @@ from qrainbowstyle.palette import BasePalette
 
 IMAGE_BLACKLIST = ['base_palette']
 
+# Heights of images and their file name endings, see: https://doc.qt.io/qt-5/scalability.html
+IMAGE_HEIGHTS = {
+    32: '.png',
+    64: '@2x.png',
+}
+
 TEMPLATE_QRC_HEADER = '''
 <RCC warning="File created programmatically. All changes made in this file will be lost!">
   <qresource prefix="{resource_prefix}">
@@ -39,66 +47,70 @@ TEMPLATE_QRC_FOOTER = '''
 </RCC>
 '''
 
+TEMPLATE_QRC_SHARED_FOOTER = '''
+  </qresource>
+</RCC>
+'''
+
+# Root element of svg image and its size attributes
+SVG_TAG_PATTERN = re.compile(rb'<svg\s[^>]*>')
+SVG_SIZE_PATTERN = re.compile(rb'\s(width|height)="[^"]*"')
+
 _logger = logging.getLogger(__name__)
 
+# Application of image pool worker process
+_worker_app = None
+
+
+def _create_colored_nt_button(data, palette):
+    """Replace color names in svg data of windows style button."""
+    data = data.replace(b"TITLE_BAR_BUTTONS_DISABLED_COLOR", palette.TITLE_BAR_BUTTONS_DISABLED_COLOR.encode())
+    data = data.replace(b"COLOR_BACKGROUND_DARK", palette.TITLE_BAR_BACKGROUND_COLOR.encode())
+    data = data.replace(b"COLOR_BACKGROUND_NORMAL", palette.TITLE_BAR_BUTTONS_HOVER_COLOR.encode())
+    data = data.replace(b"COLOR_FOREGROUND_LIGHT", palette.TITLE_BAR_TEXT_COLOR.encode())
+    return data
+
 
 def _create_nt_buttons(base_svg_path=BUTTONS_NT_PATH, rc_path=RC_PATH, palette=BasePalette):
     """Create png images from svg files for windows style buttons"""
 
     sizes = [{"ext": '.png', "width": 45, "height": 30}, {"ext": '@2x.png', "width": 90, "height": 60}]
 
-    temp_dir = tempfile.mkdtemp()
     svg_fnames = [f for f in os.listdir(base_svg_path) if f.endswith('.svg')]
-
-    background = palette.TITLE_BAR_BACKGROUND_COLOR
-    background_hover = palette.TITLE_BAR_BUTTONS_HOVER_COLOR
-    disabled = palette.TITLE_BAR_BUTTONS_DISABLED_COLOR
-    text = palette.TITLE_BAR_TEXT_COLOR
+    images = {}
 
     for svg in svg_fnames:
         svg_path = os.path.join(base_svg_path, svg)
-        with open(svg_path, 'r') as fh:
-            data = fh.read()
+        with open(svg_path, 'rb') as fh:
+            data = _create_colored_nt_button(fh.read(), palette)
 
-            new_data = data
-            new_data = new_data.replace("TITLE_BAR_BUTTONS_DISABLED_COLOR", disabled)
-            new_data = new_data.replace("COLOR_BACKGROUND_DARK", background)
-            new_data = new_data.replace("COLOR_BACKGROUND_NORMAL", background_hover)
-            new_data = new_data.replace("COLOR_FOREGROUND_LIGHT", text)
-
-        temp_svg_path = os.path.join(temp_dir, svg)
-        with open(temp_svg_path, 'w') as fh:
-            fh.write(new_data)
-
-        for size in sizes:
-            png_fname = svg.replace('.svg', size['ext'])
-            png_path = os.path.join(rc_path, png_fname)
-            convert_svg_to_png(temp_svg_path, png_path, size['width'], size['height'])
+        outputs = [(os.path.join(rc_path, svg.replace('.svg', size['ext'])), size['width'], size['height'])
+                   for size in sizes]
+        render_svg_to_png(data, outputs, images)
 
 
 def _create_darwin_buttons(base_svg_path=BUTTONS_DARWIN_PATH, rc_path=RC_PATH):
     """Create png images from svg files for darwin style buttons"""
 
-    temp_dir = tempfile.mkdtemp()
     svg_fnames = [f for f in os.listdir(base_svg_path) if f.endswith('.svg')]
 
     sizes = [{"ext": '.png', "width": 32, "height": 32}, {"ext": '@2x.png', "width": 64, "height": 64}]
+    images = {}
 
     for svg in svg_fnames:
         svg_path = os.path.join(base_svg_path, svg)
-        temp_svg_path = os.path.join(temp_dir, svg)
-        shutil.copy2(svg_path, temp_svg_path)
+        with open(svg_path, 'rb') as fh:
+            data = fh.read()
 
-        for size in sizes:
-            png_fname = svg.replace('.svg', size['ext'])
-            png_path = os.path.join(rc_path, png_fname)
-            convert_svg_to_png(temp_svg_path, png_path, size['height'], size['width'])
+        outputs = [(os.path.join(rc_path, svg.replace('.svg', size['ext'])), size['height'], size['width'])
+                   for size in sizes]
+        render_svg_to_png(data, outputs, images)
 
 
 def create_titlebar_images(buttons_svg_path=SVG_PATH, rc_path=RC_PATH, palette=BasePalette):
     """Create resources `rc` png image files from titlebar buttons svg files and palette
     """
-    _ = QApplication([])
+    _ = QApplication.instance() or QApplication([])
     _create_nt_buttons(rc_path=rc_path, palette=palette)
     _create_darwin_buttons(rc_path=rc_path)
 
@@ -123,29 +135,57 @@ def _get_file_color_map(fname, palette):
     return file_colors
 
 
-def _create_colored_svg(svg_path, temp_svg_path, color):
+def _create_colored_svg(data, color):
     """
-    Replace base svg with fill color.
+    Replace base svg fill color in svg data.
     """
-    with open(svg_path, 'r') as fh:
-        data = fh.read()
+    base_color = b'#ff0000'  # Hardcoded in base svg files
+    return data.replace(base_color, color.encode())
+
+
+def render_svg_to_png(data, outputs, images=None):
+    """
+    Render svg data to png files using Qt.
 
-    base_color = '#ff0000'  # Hardcoded in base svg files
-    new_data = data.replace(base_color, color)
+    Svg is parsed once and rendered in every size keeping its aspect ratio,
+    like QIcon does. Images are reused for outputs of the same size.
+
+    Args:
+        data (bytes): svg file content.
+        outputs (list(tuple)): (png path, height, width) of every png file.
+        images (dict, optional): Images reused between calls, size -> QImage.
+    """
+    if images is None:
+        images = {}
 
-    with open(temp_svg_path, 'w') as fh:
-        fh.write(new_data)
+    renderer = QSvgRenderer(QByteArray(data))
+
+    for png_path, height, width in outputs:
+        size = QSize(height, width)
+        default_size = renderer.defaultSize()
+        if not default_size.isNull():
+            size = default_size.scaled(size, Qt.KeepAspectRatio)
+
+        key = (size.width(), size.height())
+        img = images.get(key)
+        if img is None:
+            img = images[key] = QImage(size, QImage.Format_ARGB32_Premultiplied)
+        img.fill(Qt.transparent)
+
+        painter = QPainter(img)
+        renderer.render(painter)
+        painter.end()
+
+        # opaque images are saved without alpha channel, like QIcon pixmaps
+        QPixmap.fromImage(img).toImage().save(png_path)
 
 
 def convert_svg_to_png(svg_path, png_path, height, width):
     """
     Convert svg files to png files using Qt.
     """
-    size = QSize(height, width)
-    icon = QIcon(svg_path)
-    pixmap = icon.pixmap(size)
-    img = pixmap.toImage()
-    img.save(png_path)
+    with open(svg_path, 'rb') as fh:
+        render_svg_to_png(fh.read(), [(png_path, height, width)])
 
 
 def create_palette_image(base_svg_path=SVG_PATH, path=IMAGES_PATH,
@@ -154,7 +194,7 @@ def create_palette_image(base_svg_path=SVG_PATH, path=IMAGES_PATH,
     Create palette image svg and png image on specified path.
     """
     # Needed to use QPixmap
-    _ = QApplication([])
+    _ = QApplication.instance() or QApplication([])
 
     base_palette_svg_path = os.path.join(base_svg_path, 'base_palette.svg')
     palette_svg_path = os.path.join(path, 'palette.svg')
@@ -181,88 +221,195 @@ def create_palette_image(base_svg_path=SVG_PATH, path=IMAGES_PATH,
     return palette_svg_path, palette_png_path
 
 
+def _init_image_worker():
+    """Create offscreen QGuiApplication in image pool worker process."""
+    global _worker_app
+
+    os.environ['QT_QPA_PLATFORM'] = 'offscreen'
+    from qtpy.QtGui import QGuiApplication
+
+    _worker_app = QGuiApplication.instance() or QGuiApplication(['qrainbowstyle'])
+
+
+def _rasterize_image(job):
+    """Recolor svg data and render it to png files."""
+    data, color, outputs = job
+    render_svg_to_png(_create_colored_svg(data, color), outputs)
+    return [png_path for png_path, _, _ in outputs]
+
+
+def _set_svg_size(data, width, height):
+    """Set default size of svg image, i.e. size of its png image at 1x."""
+    def _replace(match):
+        tag = SVG_SIZE_PATTERN.sub(b'', match.group(0))
+        return tag[:4] + ' width="{}" height="{}"'.format(width, height).encode() + tag[4:]
+
+    return SVG_TAG_PATTERN.sub(_replace, data, count=1)
+
+
+def get_svg_images(palette=BasePalette, base_svg_path=SVG_PATH):
+    """Return svg images recolored with palette, which can be used instead of png images.
+
+    Images have the same names as png images created by create_images and
+    create_titlebar_images, but with .svg extension, and the same default size.
+
+    Args:
+        palette (BasePalette, optional): Palette. Defaults to BasePalette.
+        base_svg_path (str, optional): Input svgs directory path. Defaults to SVG_PATH.
+
+    Returns:
+        dict: svg file name to svg data.
+    """
+    images = {}
+
+    for svg_fname in sorted(os.listdir(base_svg_path)):
+        if not svg_fname.endswith('.svg') or svg_fname[:-4] in IMAGE_BLACKLIST:
+            continue
+        with open(os.path.join(base_svg_path, svg_fname), 'rb') as fh:
+            data = fh.read()
+        for color_svg_name, color in _get_file_color_map(svg_fname, palette).items():
+            images[color_svg_name] = _create_colored_svg(data, color)
+
+    buttons_nt_path = os.path.join(base_svg_path, os.path.basename(BUTTONS_NT_PATH))
+    buttons_darwin_path = os.path.join(base_svg_path, os.path.basename(BUTTONS_DARWIN_PATH))
+
+    for svg_fname in sorted(os.listdir(buttons_nt_path)):
+        with open(os.path.join(buttons_nt_path, svg_fname), 'rb') as fh:
+            images[svg_fname] = _create_colored_nt_button(fh.read(), palette)
+
+    for svg_fname in sorted(os.listdir(buttons_darwin_path)):
+        with open(os.path.join(buttons_darwin_path, svg_fname), 'rb') as fh:
+            images[svg_fname] = _set_svg_size(fh.read(), 32, 32)
+
+    return images
+
+
+def remove_svg_replaced_images(rc_path, base_svg_path=SVG_PATH):
+    """Remove png images which are replaced by svg images in svg resource mode.
+
+    Args:
+        rc_path (str): Path to rc folder of style.
+        base_svg_path (str, optional): Input svgs directory path. Defaults to SVG_PATH.
+    """
+    removed = 0
+    for svg_fname in get_svg_images(base_svg_path=base_svg_path):
+        for fname in (svg_fname[:-4] + '.png', svg_fname[:-4] + '@2x.png'):
+            path = os.path.join(rc_path, fname)
+            if os.path.exists(path):
+                os.remove(path)
+                removed += 1
+
+    _logger.debug("Removed %s png images replaced by svg images from: %s", removed, rc_path)
+
+
+def create_image_pool(processes=None):
+    """Create pool of processes rasterizing images for create_images.
+
+    Every worker process has its own offscreen QGuiApplication, which is also
+    used by other image functions run in the pool. Processes are spawned, not
+    forked, because Qt can not be used in forked processes.
+
+    Args:
+        processes (int, optional): Number of processes. Defaults to number of CPUs.
+
+    Returns:
+        multiprocessing.pool.Pool: image pool, close it after use.
+    """
+    context = multiprocessing.get_context('spawn')
+    return context.Pool(processes, initializer=_init_image_worker)
+
+
+def get_image_colors(svg_fname, palette=BasePalette):
+    """Return map of png images created from svg file by create_images to their colors."""
+    return {color_svg_name.replace('.svg', ext): color
+            for ext in IMAGE_HEIGHTS.values()
+            for color_svg_name, color in _get_file_color_map(svg_fname, palette).items()}
+
+
 def create_images(base_svg_path=SVG_PATH, rc_path=RC_PATH,
-                  palette=BasePalette):
+                  palette=BasePalette, pool=None, svg_fnames=None):
     """Create resources `rc` png image files from base svg files and palette.
 
     Search all SVG files in `base_svg_path` excluding IMAGE_BLACKLIST,
-    change its colors using `palette` creating temporary SVG files, for each
-    state generating PNG images for each size `heights`.
+    change its colors in memory using `palette`, for each state
+    generating PNG images for each size in IMAGE_HEIGHTS.
 
     Args:
         base_svg_path (str, optional): Input svgs directory path. Defaults to SVG_PATH.
         rc_path (str, optional): Output pngs directory path. Defaults to RC_PATH.
         palette (BasePalette, optional): Palette . Defaults to BasePalette.
+        pool (multiprocessing.pool.Pool, optional): Pool created by create_image_pool
+            to rasterize images in parallel. Defaults to None, i.e. images are
+            rasterized in this process.
+        svg_fnames (list(str), optional): Names of svg files to process.
+            Defaults to None, i.e. all svg files in `base_svg_path`.
     """
 
-    # Needed to use QPixmap
-    _ = QApplication([])
-
-    temp_dir = tempfile.mkdtemp()
-    svg_fnames = [f for f in os.listdir(base_svg_path) if f.endswith('.svg')]
+    if svg_fnames is None:
+        svg_fnames = [f for f in os.listdir(base_svg_path) if f.endswith('.svg')]
     base_height = 32
 
-    # See: https://doc.qt.io/qt-5/scalability.html
-    heights = {
-        32: '.png',
-        64: '@2x.png',
-    }
-
     _logger.info("Creating images ...")
     _logger.info("SVG folder: %s", base_svg_path)
-    _logger.info("TMP folder: %s", temp_dir)
     _logger.info("PNG folder: %s", rc_path)
 
     num_svg = len(svg_fnames)
-    num_png = 0
     num_ignored = 0
 
     # Get rc links from scss to check matches
     rc_list = get_rc_links_from_scss()
     num_rc_list = len(rc_list)
 
-    for height, ext in heights.items():
-        width = height
-
-        _logger.debug(" Size HxW (px): {} X {}".format(height, width))
-
-        for svg_fname in svg_fnames:
-            svg_name = svg_fname.split('.')[0]
-
-            # Skip blacklist
-            if svg_name not in IMAGE_BLACKLIST:
-                svg_path = os.path.join(base_svg_path, svg_fname)
-                color_files = _get_file_color_map(svg_fname, palette=palette)
-
-                _logger.debug("  Working on: %s"
-                              % os.path.basename(svg_fname))
-
-                # Replace colors and create all file for different states
-                for color_svg_name, color in color_files.items():
-                    temp_svg_path = os.path.join(temp_dir, color_svg_name)
-                    _create_colored_svg(svg_path, temp_svg_path, color)
-
-                    png_fname = color_svg_name.replace('.svg', ext)
-                    png_path = os.path.join(rc_path, png_fname)
-                    convert_svg_to_png(temp_svg_path, png_path, height, width)
-                    num_png += 1
-                    _logger.debug("   Creating: %s"
-                                  % os.path.basename(png_fname))
-
-                    # Check if the rc_name is in the rc_list from scss
-                    # only for the base size
-                    if height == base_height:
-                        rc_base = os.path.basename(rc_path)
-                        png_base = os.path.basename(png_fname)
-                        rc_name = '/' + os.path.join(rc_base, png_base)
-                        try:
-                            rc_list.remove(rc_name)
-                        except ValueError:
-                            pass
-            else:
-                num_ignored += 1
-                _logger.debug("  Ignored blacklist: %s"
-                              % os.path.basename(svg_fname))
+    # (svg data, color, [(png path, height, width)]) of every state
+    jobs = []
+
+    for svg_fname in svg_fnames:
+        svg_name = svg_fname.split('.')[0]
+
+        # Skip blacklist
+        if svg_name not in IMAGE_BLACKLIST:
+            # Base svg is read once for all states and sizes
+            with open(os.path.join(base_svg_path, svg_fname), 'rb') as fh:
+                data = fh.read()
+
+            color_files = _get_file_color_map(svg_fname, palette=palette)
+
+            _logger.debug("  Working on: %s"
+                          % os.path.basename(svg_fname))
+
+            # Replace colors and create all file for different states
+            for color_svg_name, color in color_files.items():
+                outputs = [(os.path.join(rc_path, color_svg_name.replace('.svg', ext)), height, height)
+                           for height, ext in IMAGE_HEIGHTS.items()]
+                jobs.append((data, color, outputs))
+
+                # Check if the rc_name is in the rc_list from scss
+                # only for the base size
+                rc_base = os.path.basename(rc_path)
+                png_base = color_svg_name.replace('.svg', IMAGE_HEIGHTS[base_height])
+                rc_name = '/' + os.path.join(rc_base, png_base)
+                try:
+                    rc_list.remove(rc_name)
+                except ValueError:
+                    pass
+        else:
+            num_ignored += 1
+            _logger.debug("  Ignored blacklist: %s"
+                          % os.path.basename(svg_fname))
+
+    if pool is None:
+        # Needed to use QPainter
+        _ = QApplication.instance() or QApplication([])
+        results = (_rasterize_image(job) for job in jobs)
+    else:
+        results = pool.imap_unordered(_rasterize_image, jobs, chunksize=4)
+
+    num_png = 0
+    for png_paths in results:
+        for png_path in png_paths:
+            num_png += 1
+            _logger.debug("   Creating: %s"
+                          % os.path.basename(png_path))
 
     _logger.info("# SVG files: %s", num_svg)
     _logger.info("# SVG ignored: %s", num_ignored)
@@ -283,7 +430,8 @@ def generate_qrc_file(resource_prefix='qss_icons', style_prefix='qrainbowstyle',
         resource_prefix (str, optional): Prefix used in resources.
             Defaults to 'qss_icons'.
         style_prefix (str, optional): Prefix used to this style.
-            Defaults to 'qrainbowstyle'.
+            Defaults to 'qrainbowstyle'. If empty, style.qss file
+            is not added to QRC file.
         rc_path (str, optional): Source path
             Defaults to 'RC_PATH'
         qrc_path (str, optional): Output path
@@ -302,10 +450,15 @@ def generate_qrc_file(resource_prefix='qss_icons', style_prefix='qrainbowstyle',
     for fname in sorted(os.listdir(rc_path)):
         files.append(TEMPLATE_QRC_FILE.format(fname=fname))
 
+    if style_prefix:
+        footer = TEMPLATE_QRC_FOOTER.format(style_prefix=style_prefix)
+    else:
+        footer = TEMPLATE_QRC_SHARED_FOOTER
+
     # Join parts
     qrc_content = (TEMPLATE_QRC_HEADER.format(resource_prefix=resource_prefix)
                    + '\n'.join(files)
-                   + TEMPLATE_QRC_FOOTER.format(style_prefix=style_prefix))
+                   + footer)
 
     _logger.info("Writing in: %s", qrc_path)
 
@@ -314,6 +467,79 @@ def generate_qrc_file(resource_prefix='qss_icons', style_prefix='qrainbowstyle',
         fh.write(qrc_content)
 
 
+def get_shared_images(rc_paths):
+    """
+    Get names of images which are byte-identical in all rc folders.
+
+    Args:
+        rc_paths (list(str)): Paths to rc folders of all styles.
+
+    Returns:
+        list(str): sorted list of shared image names.
+    """
+    if len(rc_paths) < 2:
+        return []
+
+    shared = None
+
+    for rc_path in rc_paths:
+        digests = {}
+        for fname in os.listdir(rc_path):
+            with open(os.path.join(rc_path, fname), 'rb') as fh:
+                digests[fname] = hashlib.sha256(fh.read()).hexdigest()
+
+        if shared is None:
+            shared = digests
+        else:
+            shared = {fname: digest for fname, digest in shared.items()
+                      if digests.get(fname) == digest}
+
+    return sorted(shared)
+
+
+def move_shared_images(rc_paths, shared_rc_path, fnames):
+    """
+    Move images shared by all styles to one rc folder.
+
+    Images which are no longer shared are removed from `shared_rc_path`.
+
+    Args:
+        rc_paths (list(str)): Paths to rc folders of all styles.
+        shared_rc_path (str): Output path for shared images.
+        fnames (list(str)): Names of shared images, see get_shared_images.
+    """
+    os.makedirs(shared_rc_path, exist_ok=True)
+
+    for fname in os.listdir(shared_rc_path):
+        if fname not in fnames:
+            os.remove(os.path.join(shared_rc_path, fname))
+
+    _logger.info("Moving %s shared images to: %s", len(fnames), shared_rc_path)
+
+    for fname in fnames:
+        shutil.copy2(os.path.join(rc_paths[0], fname), os.path.join(shared_rc_path, fname))
+        for rc_path in rc_paths:
+            os.remove(os.path.join(rc_path, fname))
+
+
+def restore_shared_images(rc_path, shared_rc_path):
+    """
+    Copy images shared by all styles back to rc folder of style.
+
+    Used before incremental build, so rc folder contains all images of the style again.
+
+    Args:
+        rc_path (str): Path to rc folder of style.
+        shared_rc_path (str): Path to shared images.
+    """
+    if not os.path.isdir(shared_rc_path):
+        return
+
+    for fname in os.listdir(shared_rc_path):
+        if not os.path.exists(os.path.join(rc_path, fname)):
+            shutil.copy2(os.path.join(shared_rc_path, fname), os.path.join(rc_path, fname))
+
+
 def get_rc_links_from_scss(pattern=r"\/.*\.png"):
     """
     Get all rc links from scss file returning the list of unique links.
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Utilities for creating manifest of compiled styles."""
+
+# Standard library imports
+import hashlib
+import json
+import logging
+import os
+import re
+
+# Local imports
+from qrainbowstyle import (MANIFEST_FILEPATH, QSS_FILE, RCC_FILE, SHARED_RESOURCES_DIR,
+                           STYLES_PATH)
+
+MANIFEST_VERSION = 1
+
+RESOURCE_FILES = [RCC_FILE, 'style_rc.py']
+
+DPR_PATTERN = re.compile(r'@(\d+)x\.png$')
+
+_logger = logging.getLogger(__name__)
+
+
+def _get_resources(path):
+    """Return sizes of resource files in directory."""
+    return {fname: os.path.getsize(os.path.join(path, fname))
+            for fname in RESOURCE_FILES if os.path.isfile(os.path.join(path, fname))}
+
+
+def _get_dprs(rc_path):
+    """Return device pixel ratios of images in rc folder."""
+    dprs = {1}
+    if os.path.isdir(rc_path):
+        for fname in os.listdir(rc_path):
+            match = DPR_PATTERN.search(fname)
+            if match:
+                dprs.add(int(match.group(1)))
+    return sorted(dprs)
+
+
+def create_manifest(styles_path=STYLES_PATH, manifest_filepath=MANIFEST_FILEPATH, images='png'):
+    """
+    Create manifest of compiled styles.
+
+    Every directory in `styles_path` is a style generated from palette class
+    with the same name. Manifest lists palette, hash and size of QSS file,
+    sizes of resource files, supported device pixel ratios and format of
+    images, png or svg recolored when the style is loaded, of each style.
+
+    Args:
+        styles_path (str, optional): Path to compiled styles. Defaults to STYLES_PATH.
+        manifest_filepath (str, optional): Output path. Defaults to MANIFEST_FILEPATH.
+        images (str, optional): Format of images of styles, 'png' or 'svg'. Defaults to 'png'.
+
+    Returns:
+        dict: manifest data.
+    """
+    styles = {}
+
+    for name in sorted(os.listdir(styles_path)):
+        style_path = os.path.join(styles_path, name)
+        qss_filepath = os.path.join(style_path, QSS_FILE)
+
+        if name == SHARED_RESOURCES_DIR or not os.path.isfile(qss_filepath):
+            continue
+
+        with open(qss_filepath, 'rb') as fh:
+            qss = fh.read()
+
+        styles[name] = {
+            'palette': name,
+            'qss_sha256': hashlib.sha256(qss).hexdigest(),
+            'qss_size': len(qss),
+            'resources': _get_resources(style_path),
+            'dprs': _get_dprs(os.path.join(style_path, 'rc')),
+            'images': images,
+        }
+
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'shared': {'resources': _get_resources(os.path.join(styles_path, SHARED_RESOURCES_DIR))},
+        'styles': styles,
+    }
+
+    _logger.info("Writing manifest of %s styles in: %s", len(styles), manifest_filepath)
+
+    with open(manifest_filepath, 'w') as fh:
+        json.dump(manifest, fh, indent=2, sort_keys=True)
+        fh.write('\n')
+
+    return manifest
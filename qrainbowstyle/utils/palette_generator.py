@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Generate palettes from one or two seed colors.
+
+Color ramps are created in OKLCH color space, so steps of ramps look evenly
+spaced for any hue. Lightness of the ramps follows the hand-made palettes
+in qrainbowstyle.palette. The accent seed becomes ``COLOR_ACCENT_3``, the
+main accent used e.g. by title bars. Backgrounds and texts are tinted with
+hue of the background seed, or of the accent if no background is given.
+
+Colors of any number of palettes are computed at once with NumPy, so
+thousands of candidates can be generated and evaluated in a fraction of
+a second, e.g.
+
+.. code-block:: python
+
+    accents = numpy.random.rand(10000, 3)
+    colors = generate_colors(accents)  # shape (10000, 15, 3)
+
+Requires NumPy, install it with ``pip install qrainbowstyle[generator]``.
+"""
+
+# Third party imports
+import numpy as np
+
+# Local imports
+from qrainbowstyle.palette import BasePalette
+from qrainbowstyle.utils.colors import (clip_chroma, hex_to_rgb, oklab_to_oklch, oklab_to_rgb, oklch_to_oklab,
+                                        rgb_to_hex, rgb_to_oklab)
+
+# Palette variables created by generator, in order of colors returned by generate_colors
+GENERATED_VARIABLES = [
+    'COLOR_BACKGROUND_1',
+    'COLOR_BACKGROUND_2',
+    'COLOR_BACKGROUND_3',
+    'COLOR_BACKGROUND_4',
+    'COLOR_BACKGROUND_5',
+    'COLOR_BACKGROUND_6',
+    'COLOR_TEXT_1',
+    'COLOR_TEXT_2',
+    'COLOR_TEXT_3',
+    'COLOR_TEXT_4',
+    'COLOR_ACCENT_1',
+    'COLOR_ACCENT_2',
+    'COLOR_ACCENT_3',
+    'COLOR_ACCENT_4',
+    'COLOR_ACCENT_5',
+]
+
+# OKLCH lightness and maximum chroma of background without seed, hue and chroma are taken from accent
+DEFAULT_BACKGROUND = {True: (0.25, 0.024), False: (0.985, 0.004)}
+
+# Lightness of backgrounds relative to the background seed, for dark and light palettes
+BACKGROUND_LIGHTNESS = {
+    True: np.array([0.0, 0.06, 0.12, 0.155, 0.19, 0.23]),
+    False: np.array([0.0, -0.075, -0.125, -0.14, -0.19, -0.23]),
+}
+
+# Chroma of backgrounds relative to chroma of the background seed
+BACKGROUND_CHROMA = np.array([1.0, 1.05, 1.1, 1.15, 1.2, 1.25])
+
+# Lightness of texts, for dark and light palettes
+TEXT_LIGHTNESS = {
+    True: np.array([0.91, 0.846, 0.758, 0.729]),
+    False: np.array([0.25, 0.325, 0.508, 0.632]),
+}
+
+# Chroma of texts relative to chroma of backgrounds, which is limited by MAX_TEXT_TINT
+TEXT_CHROMA = np.array([0.125, 0.25, 0.375, 0.9])
+MAX_TEXT_TINT = 0.024
+
+# Lightness and chroma of accents relative to the accent seed
+ACCENT_LIGHTNESS = np.array([-0.14, -0.07, 0.0, 0.08, 0.16])
+ACCENT_CHROMA = np.array([1.0, 1.0, 1.0, 0.9, 0.75])
+
+
+def _to_rgb(colors):
+    """Return sRGB array of colors given as hex strings or sRGB array, shape (n, 3)."""
+    if isinstance(colors, str) or (len(colors) and isinstance(colors[0], str)):
+        colors = hex_to_rgb(colors)
+    return np.asarray(colors, dtype=float).reshape(-1, 3)
+
+
+def generate_colors(accents, backgrounds=None, dark=True):
+    """
+    Generate colors of palettes from seed colors.
+
+    Args:
+        accents (numpy.ndarray or list(str)): sRGB array of shape (n, 3) or hex strings
+            of accent seeds, one for every palette.
+        backgrounds (numpy.ndarray or list(str), optional): Background seeds, which become
+            ``COLOR_BACKGROUND_1``. Defaults to a nearly gray color tinted with the accent.
+        dark (bool, optional): Create dark palettes with light text. Defaults to True.
+
+    Returns:
+        numpy.ndarray: sRGB colors of shape (n, 15, 3), in order of GENERATED_VARIABLES.
+    """
+    accent = oklab_to_oklch(rgb_to_oklab(_to_rgb(accents)))
+    count = len(accent)
+
+    if backgrounds is None:
+        lightness, chroma = DEFAULT_BACKGROUND[dark]
+        background = np.stack([np.full(count, lightness), np.minimum(accent[:, 1], chroma), accent[:, 2]], axis=-1)
+    else:
+        background = oklab_to_oklch(rgb_to_oklab(_to_rgb(backgrounds)))
+        background = np.broadcast_to(background, (count, 3))
+
+    # chroma is relative to the seed, ramps of gray seeds stay gray
+    background_lightness = background[:, :1] + BACKGROUND_LIGHTNESS[dark]
+    background_chroma = background[:, 1:2] * BACKGROUND_CHROMA
+    text_lightness = np.broadcast_to(TEXT_LIGHTNESS[dark], (count, len(TEXT_CHROMA)))
+    text_chroma = np.minimum(background[:, 1:2], MAX_TEXT_TINT) * TEXT_CHROMA
+    accent_lightness = accent[:, :1] + ACCENT_LIGHTNESS
+    accent_chroma = accent[:, 1:2] * ACCENT_CHROMA
+
+    lch = np.empty((count, len(GENERATED_VARIABLES), 3))
+    lch[:, :, 0] = np.concatenate([background_lightness, text_lightness, accent_lightness], axis=1)
+    lch[:, :, 1] = np.concatenate([background_chroma, text_chroma, accent_chroma], axis=1)
+    lch[:, :10, 2] = background[:, 2:3]
+    lch[:, 10:, 2] = accent[:, 2:3]
+
+    return oklab_to_rgb(oklch_to_oklab(clip_chroma(lch)))
+
+
+def create_palette(name, colors, base=BasePalette):
+    """
+    Create palette class from generated colors.
+
+    Args:
+        name (str): Name of palette class.
+        colors (numpy.ndarray): sRGB colors of one palette, shape (15, 3), see generate_colors.
+        base (type, optional): Base class of palette. Defaults to BasePalette.
+
+    Returns:
+        type: palette class.
+    """
+    attributes = dict(zip(GENERATED_VARIABLES, rgb_to_hex(colors)))
+    attributes.update({
+        'TITLE_BAR_BACKGROUND_COLOR': attributes['COLOR_ACCENT_3'],
+        'TITLE_BAR_BUTTONS_HOVER_COLOR': attributes['COLOR_ACCENT_4'],
+        'TITLE_BAR_BUTTONS_DISABLED_COLOR': attributes['COLOR_ACCENT_1'],
+        'TITLE_BAR_TEXT_COLOR': attributes['COLOR_TEXT_1'],
+        'OPACITY_TOOLTIP': 230,
+        '__doc__': "Palette generated from seed colors.",
+    })
+    return type(name, (base, ), attributes)
+
+
+def generate_palette(accent, background=None, dark=True, name='GeneratedPalette'):
+    """
+    Generate palette class from seed colors.
+
+    Args:
+        accent (str): Accent seed color, e.g. ``#097d74``.
+        background (str, optional): Background seed color. Defaults to a nearly gray
+            color tinted with the accent.
+        dark (bool, optional): Create dark palette with light text. Defaults to True.
+        name (str, optional): Name of palette class.
+
+    Returns:
+        type: BasePalette subclass.
+    """
+    backgrounds = None if background is None else [background]
+    return create_palette(name, generate_colors([accent], backgrounds, dark=dark)[0])
@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Utilities for parsing and scoping Qt stylesheets."""
+
+# Standard library imports
+import functools
+import re
+from collections import OrderedDict
+
+# Type selector at the beginning of compound selector, e.g. QFrame, .QFrame or *
+TYPE_SELECTOR_PATTERN = re.compile(r'^(\*|\.?[A-Za-z_][\w-]*)?')
+
+COMMENT_PATTERN = re.compile(r'/\*.*?\*/', re.DOTALL)
+
+STRING_PATTERN = re.compile(r'("[^"]*"|\'[^\']*\')')
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Whitespace around child combinator is not needed
+COMBINATOR_PATTERN = re.compile(r'\s*>\s*')
+
+
+def _split_top_level(text, separators):
+    """Split text on separators which are not inside quotes, brackets or parentheses."""
+    parts = []
+    depth = 0
+    quote = None
+    start = 0
+
+    for index, char in enumerate(text):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in '"\'':
+            quote = char
+        elif char in '([':
+            depth += 1
+        elif char in ')]':
+            depth -= 1
+        elif depth == 0 and char in separators:
+            parts.append(text[start:index])
+            parts.append(char)
+            start = index + 1
+
+    parts.append(text[start:])
+    return parts
+
+
+def parse_qss(stylesheet):
+    """
+    Parse stylesheet to list of rules.
+
+    Comments are removed. QSS has no nested blocks, so every rule
+    is a selector list followed by a declaration block.
+
+    Args:
+        stylesheet (str): Qt stylesheet.
+
+    Returns:
+        list: tuples (list of selectors, declaration block without braces).
+    """
+    stylesheet = COMMENT_PATTERN.sub('', stylesheet)
+    rules = []
+    parts = _split_top_level(stylesheet, '{}')
+
+    selectors = None
+    for part in parts:
+        if part == '{':
+            continue
+        elif part == '}':
+            selectors = None
+        elif selectors is None:
+            selectors = [x.strip() for x in _split_top_level(part, ',')[::2]]
+        else:
+            rules.append((selectors, part.strip()))
+
+    return rules
+
+
+def _scope_root(selector, scope):
+    """Return selector matching only the scope widget itself, None if not possible."""
+    compounds = _split_top_level(selector, ' >')
+    last = compounds[-1]
+
+    if '#' in last:
+        # compound selector can contain only one ID
+        return None
+
+    type_selector = TYPE_SELECTOR_PATTERN.match(last).group(0)
+    rest = last[len(type_selector):]
+    if type_selector == '*':
+        type_selector = ''
+
+    compounds[-1] = type_selector + '#' + scope + rest
+    return ''.join(compounds)
+
+
+def scope_selector(selector, scope):
+    """
+    Limit selector to widget with object name `scope` and its children.
+
+    Args:
+        selector (str): single selector, e.g. ``QPushButton:hover``.
+        scope (str): object name of widget.
+
+    Returns:
+        list: selectors matching children of the widget and the widget itself.
+    """
+    selectors = ['#{} {}'.format(scope, selector)]
+    root = _scope_root(selector, scope)
+    if root is not None:
+        selectors.append(root)
+    return selectors
+
+
+@functools.lru_cache(maxsize=16)
+def scope_stylesheet(stylesheet, scope):
+    """
+    Limit all rules of stylesheet to widget with object name `scope`.
+
+    Stylesheet set on a widget is inherited by all its children, including popups
+    and dialogs created with the widget as parent. Scoped rules match only the
+    widget subtree, so they do not leak into widgets with their own theme and
+    several scoped stylesheets can be combined in a single stylesheet.
+
+    Args:
+        stylesheet (str): Qt stylesheet.
+        scope (str): object name of widget.
+
+    Returns:
+        str: scoped stylesheet.
+    """
+    rules = []
+    for selectors, declarations in parse_qss(stylesheet):
+        scoped = [x for selector in selectors for x in scope_selector(selector, scope)]
+        rules.append('{} {{\n  {}\n}}\n'.format(',\n'.join(scoped), declarations))
+    return ''.join(rules)
+
+
+def _collapse_whitespace(text, pattern=WHITESPACE_PATTERN, replacement=' '):
+    """Replace whitespace outside of quoted strings."""
+    parts = STRING_PATTERN.split(text)
+    parts[::2] = [pattern.sub(replacement, x) for x in parts[::2]]
+    return ''.join(parts).strip()
+
+
+def _minify_selector(selector):
+    """Remove redundant whitespace from selector."""
+    selector = _collapse_whitespace(selector)
+    return _collapse_whitespace(selector, COMBINATOR_PATTERN, '>')
+
+
+def _minify_declarations(declarations):
+    """Remove redundant whitespace and overridden duplicated properties."""
+    properties = {}
+    for declaration in _split_top_level(declarations, ';')[::2]:
+        name, _, value = declaration.partition(':')
+        name = name.strip()
+        if name:
+            # the last declaration wins, keep it in its position
+            properties.pop(name, None)
+            properties[name] = _collapse_whitespace(value)
+
+    return ';'.join('{}:{}'.format(name, value) for name, value in properties.items())
+
+
+def minify_qss(stylesheet):
+    """
+    Minify stylesheet to make it faster to parse by Qt.
+
+    Comments and redundant whitespace are removed, overridden duplicated
+    properties are dropped and adjacent rules with identical selectors
+    or declarations are merged. Only adjacent rules are merged, so the order
+    in which rules are applied does not change.
+
+    Args:
+        stylesheet (str): Qt stylesheet.
+
+    Returns:
+        str: minified stylesheet.
+    """
+    rules = []
+    for selectors, declarations in parse_qss(stylesheet):
+        selectors = list(OrderedDict.fromkeys(_minify_selector(x) for x in selectors))
+        declarations = _minify_declarations(declarations)
+
+        if not declarations:
+            continue
+
+        if rules and rules[-1][0] == selectors:
+            rules[-1][1] = _minify_declarations(rules[-1][1] + ';' + declarations)
+        elif rules and rules[-1][1] == declarations:
+            rules[-1][0] = list(OrderedDict.fromkeys(rules[-1][0] + selectors))
+        else:
+            rules.append([selectors, declarations])
+
+    return ''.join('{}{{{}}}'.format(','.join(selectors), declarations) for selectors, declarations in rules)
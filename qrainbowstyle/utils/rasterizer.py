@@ -0,0 +1,176 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Render images for device pixel ratios which are not shipped with styles.
+
+Styles contain png images for device pixel ratios 1 and 2. Images for
+higher ratios, e.g. ``@3x.png``, are rendered from svg files when a screen
+needing them is found and stored in the user cache directory, so they
+are rendered only once. Files in the cache are removed in least recently
+used order when its size exceeds the limit.
+"""
+
+# Standard library imports
+import hashlib
+import json
+import logging
+import os
+
+# Local imports
+from qrainbowstyle import __version__
+
+# Maximum size of cached images in bytes
+IMAGE_CACHE_SIZE = 32 * 1024 * 1024
+
+_logger = logging.getLogger(__name__)
+
+
+def get_cache_path():
+    """Return path to qrainbowstyle directory in the user cache directory."""
+    from qtpy.QtCore import QStandardPaths
+
+    path = QStandardPaths.writableLocation(QStandardPaths.GenericCacheLocation)
+    return os.path.join(path or os.path.expanduser('~'), 'qrainbowstyle', 'images')
+
+
+def palette_digest(palette):
+    """Return digest of palette values, images of the same palette share cache directory."""
+    data = json.dumps([__version__, palette.to_dict()], sort_keys=True, default=str)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()[:16]
+
+
+class ImageCache:
+    """Directory with rendered images, limited in size.
+
+    Every read updates modification time of the file, the least recently
+    used files are removed first when the cache grows over `max_size`.
+
+    Args:
+        path (str, optional): Cache directory. Defaults to get_cache_path().
+        max_size (int, optional): Maximum size of files in bytes. Defaults to IMAGE_CACHE_SIZE.
+    """
+
+    def __init__(self, path=None, max_size=IMAGE_CACHE_SIZE):
+        super(ImageCache, self).__init__()
+        self.path = path or get_cache_path()
+        self.max_size = max_size
+
+    def filepath(self, key):
+        """Return path of cached file, key is relative path, e.g. ``<palette>/arrow_up@3x.png``."""
+        return os.path.join(self.path, *key.split('/'))
+
+    def get(self, key):
+        """Return data of cached file, None if it is not cached."""
+        filepath = self.filepath(key)
+        try:
+            with open(filepath, 'rb') as fh:
+                data = fh.read()
+            os.utime(filepath)
+        except OSError:
+            return None
+        return data
+
+    def put(self, key, render, evict=True):
+        """
+        Create cached file and remove the least recently used files over the size limit.
+
+        Args:
+            key (str): Relative path of the file.
+            render (callable): Called with path of temporary file, which it has to create.
+            evict (bool, optional): Remove files over the size limit. Pass False when many files
+                are created at once and call evict() after the last one, because it scans the cache.
+
+        Returns:
+            bytes: data of created file.
+        """
+        filepath = self.filepath(key)
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+
+        # other processes may render the same image, the file is replaced atomically
+        root, ext = os.path.splitext(filepath)
+        tmp_filepath = '{}.{}{}'.format(root, os.getpid(), ext)
+        render(tmp_filepath)
+        with open(tmp_filepath, 'rb') as fh:
+            data = fh.read()
+        os.replace(tmp_filepath, filepath)
+
+        if evict:
+            self.evict()
+        return data
+
+    def evict(self):
+        """Remove the least recently used files until the cache fits to the size limit."""
+        files = []
+        for dirpath, _, fnames in os.walk(self.path):
+            for fname in fnames:
+                filepath = os.path.join(dirpath, fname)
+                try:
+                    stat = os.stat(filepath)
+                except OSError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, filepath))
+
+        size = sum(x[1] for x in files)
+        for _, file_size, filepath in sorted(files):
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(filepath)
+            except OSError:
+                continue
+            size -= file_size
+            _logger.debug("Removed image from cache: %s", filepath)
+
+    def clear(self):
+        """Remove all cached files."""
+        self.max_size, max_size = -1, self.max_size
+        try:
+            self.evict()
+        finally:
+            self.max_size = max_size
+
+
+def rasterize_images(palette, images, dpr, cache=None):
+    """
+    Render images of palette for device pixel ratio, reusing cached images.
+
+    Args:
+        palette (BasePalette): Palette which colored the images.
+        images (dict): Name of png image at 1x, e.g. ``arrow_up.png``, to its (width, height).
+        dpr (int): Device pixel ratio.
+        cache (ImageCache, optional): Cache of rendered images. Defaults to ImageCache().
+
+    Returns:
+        dict: name of image for device pixel ratio, e.g. ``arrow_up@3x.png``, to png data.
+    """
+    from qrainbowstyle.utils.images import get_svg_images, render_svg_to_png
+
+    cache = cache or ImageCache()
+    digest = palette_digest(palette)
+    svg_images = None
+    rendered = False
+    rasterized = {}
+
+    for name, (width, height) in images.items():
+        dpr_name = '{}@{}x.png'.format(name[:-len('.png')], dpr)
+        key = '{}/{}'.format(digest, dpr_name)
+
+        data = cache.get(key)
+        if data is None:
+            if svg_images is None:
+                svg_images = get_svg_images(palette)
+            svg_data = svg_images.get(name[:-len('.png')] + '.svg')
+            if svg_data is None:
+                continue
+
+            def _render(filepath):
+                render_svg_to_png(svg_data, [(filepath, width * dpr, height * dpr)])
+
+            data = cache.put(key, _render, evict=False)
+            rendered = True
+            _logger.debug("Rendered image %s of palette %s", dpr_name, palette.__name__)
+
+        rasterized[dpr_name] = data
+
+    if rendered:
+        cache.evict()
+    return rasterized
@@ -0,0 +1,278 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Pure Python compiler of Qt resources.
+
+Writes binary ``.rcc`` files (format version 1 or 2) and ``_rc.py`` modules
+in the format of pyrcc5, from .qrc files or from data kept in memory, so no
+external resource compiler is needed to build styles.
+
+Output is deterministic: children of every directory are sorted by hash
+and name, file data follows the order of the tree and modification times
+are not stored.
+"""
+
+# Standard library imports
+import logging
+import os
+import struct
+import xml.etree.ElementTree as ElementTree
+import zlib
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+# Default compression of rcc
+COMPRESS_LEVEL = -1
+
+# Data is compressed only if it makes it smaller by at least this many percent
+COMPRESS_THRESHOLD = 70
+
+RCC_VERSIONS = (1, 2)
+
+# Flags of tree nodes
+FLAG_COMPRESSED = 0x01
+FLAG_DIRECTORY = 0x02
+
+# Country and language of files without locale, QLocale::AnyCountry and QLocale::C
+LOCALE_COUNTRY = 0
+LOCALE_LANGUAGE = 1
+
+# Import of QtCore in _rc.py module for every binding
+QT_CORE_IMPORTS = {
+    'pyqt': 'from PyQt4 import QtCore',
+    'pyqt5': 'from PyQt5 import QtCore',
+    'pyside': 'from PySide import QtCore',
+    'pyside2': 'from PySide2 import QtCore',
+    'qtpy': 'from qtpy import QtCore',
+    'pyqtgraph': 'from pyqtgraph.Qt import QtCore',
+}
+
+HEADER_PY = """# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: qrainbowstyle resource compiler
+#
+# WARNING! All changes made in this file will be lost!
+
+{}
+
+"""
+
+FOOTER_PY = """
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
+"""
+
+CompiledResources = namedtuple('CompiledResources', ['data', 'names', 'structs'])
+
+_logger = logging.getLogger(__name__)
+
+
+def qt_hash(name):
+    """Return hash of resource name, used by Qt for binary search in resource tree."""
+    encoded = name.encode('utf-16-be')
+    h = 0
+    for unit in struct.unpack('>{}H'.format(len(encoded) // 2), encoded):
+        h = (h << 4) + unit
+        h ^= (h & 0xf0000000) >> 23
+        h &= 0x0fffffff
+    return h
+
+
+def read_qrc(qrc_filepath):
+    """
+    Read files listed in .qrc file.
+
+    Args:
+        qrc_filepath (str): Path to .qrc file, paths of files are relative to it.
+
+    Returns:
+        OrderedDict: resource path to file path.
+    """
+    base_path = os.path.dirname(os.path.abspath(qrc_filepath))
+    files = OrderedDict()
+
+    for qresource in ElementTree.parse(qrc_filepath).getroot().iter('qresource'):
+        prefix = qresource.get('prefix', '/').strip('/')
+        for element in qresource.iter('file'):
+            name = element.get('alias') or element.text.strip()
+            path = '/'.join(x for x in (prefix, name) if x)
+            files[path] = os.path.join(base_path, element.text.strip())
+
+    return files
+
+
+def _compress(data, level, threshold):
+    """Compress data like qCompress if it saves at least `threshold` percent."""
+    if not data or level == 0:
+        return data, 0
+
+    compressed = struct.pack('>I', len(data)) + zlib.compress(data, level)
+    if 100.0 * (len(data) - len(compressed)) / len(data) >= threshold:
+        return compressed, FLAG_COMPRESSED
+    return data, 0
+
+
+def _build_tree(paths):
+    """Create tree of directories (dicts) and files (resource paths) from resource paths."""
+    root = {}
+    for path in paths:
+        parts = [x for x in path.split('/') if x]
+        node = root
+        for part in parts[:-1]:
+            node = node.setdefault(part, {})
+            if not isinstance(node, dict):
+                raise ValueError("Resource path is both file and directory: " + path)
+        if parts[-1] in node:
+            raise ValueError("Duplicated resource path: " + path)
+        node[parts[-1]] = path
+    return root
+
+
+def _sorted_children(node):
+    """Return children of directory in order required by Qt."""
+    return sorted(node.items(), key=lambda item: (qt_hash(item[0]), item[0]))
+
+
+def compile_resources(files, compress_level=COMPRESS_LEVEL, compress_threshold=COMPRESS_THRESHOLD,
+                      max_workers=None):
+    """
+    Compile resources to data, names and tree structures.
+
+    Args:
+        files (dict): resource path, e.g. ``qss_icons/rc/arrow_up.png``, to data (bytes)
+            or to path of the file.
+        compress_level (int, optional): zlib compression level, 0 disables compression.
+        compress_threshold (int, optional): minimal size reduction in percent to store
+            compressed data.
+        max_workers (int, optional): Number of threads compressing files.
+
+    Returns:
+        CompiledResources: data and names sections and tree for every version in RCC_VERSIONS.
+    """
+    root = _build_tree(files)
+
+    # nodes in order of tree, every directory is followed later by its children
+    nodes = [('', root)]
+    child_offsets = {}
+    index = 0
+    while index < len(nodes):
+        _, node = nodes[index]
+        if isinstance(node, dict):
+            child_offsets[index] = len(nodes)
+            nodes.extend(_sorted_children(node))
+        index += 1
+
+    paths = [node for _, node in nodes if not isinstance(node, dict)]
+
+    def _read(path):
+        data = files[path]
+        if not isinstance(data, bytes):
+            with open(data, 'rb') as fh:
+                data = fh.read()
+        return _compress(data, compress_level, compress_threshold)
+
+    # zlib releases GIL, so files are compressed in parallel
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        blobs = dict(zip(paths, executor.map(_read, paths)))
+
+    data = bytearray()
+    data_offsets = {}
+    for path in paths:
+        blob, _ = blobs[path]
+        data_offsets[path] = len(data)
+        data += struct.pack('>I', len(blob)) + blob
+
+    names = bytearray()
+    name_offsets = {}
+    for name, _ in nodes[1:]:
+        if name not in name_offsets:
+            encoded = name.encode('utf-16-be')
+            name_offsets[name] = len(names)
+            names += struct.pack('>HI', len(encoded) // 2, qt_hash(name)) + encoded
+
+    structs = {}
+    for version in RCC_VERSIONS:
+        tree = bytearray()
+        for index, (name, node) in enumerate(nodes):
+            name_offset = name_offsets.get(name, 0) if index else 0
+            if isinstance(node, dict):
+                tree += struct.pack('>IHII', name_offset, FLAG_DIRECTORY, len(node), child_offsets[index])
+            else:
+                tree += struct.pack('>IHHHI', name_offset, blobs[node][1], LOCALE_COUNTRY, LOCALE_LANGUAGE,
+                                    data_offsets[node])
+            if version >= 2:
+                # modification time is not stored, output does not depend on file system
+                tree += struct.pack('>Q', 0)
+        structs[version] = bytes(tree)
+
+    _logger.debug("Compiled %s resources, data size: %s", len(paths), len(data))
+    return CompiledResources(bytes(data), bytes(names), structs)
+
+
+def write_rcc(rcc_filepath, resources, version=2):
+    """
+    Write binary resources file, which can be registered with QResource.registerResource.
+
+    Args:
+        rcc_filepath (str): Output path.
+        resources (CompiledResources): Resources created by compile_resources.
+        version (int, optional): Format version, 1 or 2.
+    """
+    if version not in RCC_VERSIONS:
+        raise ValueError("Unsupported rcc format version: {}".format(version))
+
+    # header: magic, version, offsets of tree, data and names
+    header_size = 20
+    data_offset = header_size
+    names_offset = data_offset + len(resources.data)
+    tree_offset = names_offset + len(resources.names)
+
+    with open(rcc_filepath, 'wb') as fh:
+        fh.write(b'qres' + struct.pack('>IIII', version, tree_offset, data_offset, names_offset))
+        fh.write(resources.data)
+        fh.write(resources.names)
+        fh.write(resources.structs[version])
+
+
+def _bytes_literal(data):
+    """Format bytes as literal with 16 bytes per line."""
+    lines = ['b"\\\n']
+    for start in range(0, len(data), 16):
+        lines.append(''.join('\\x{:02x}'.format(x) for x in data[start:start + 16]) + '\\\n')
+    lines.append('"\n')
+    return ''.join(lines)
+
+
+def write_rc_py(py_filepath, resources, binding='qtpy', footer=''):
+    """
+    Write Python module registering resources on import, in the format of pyrcc5.
+
+    Args:
+        py_filepath (str): Output path.
+        resources (CompiledResources): Resources created by compile_resources.
+        binding (str, optional): Qt binding imported by the module, see QT_CORE_IMPORTS.
+        footer (str, optional): Code appended to the module.
+    """
+    data = HEADER_PY.format(QT_CORE_IMPORTS[binding])
+    data += 'qt_resource_data = ' + _bytes_literal(resources.data) + '\n'
+    data += 'qt_resource_name = ' + _bytes_literal(resources.names) + '\n'
+    for version in RCC_VERSIONS:
+        data += 'qt_resource_struct_v{} = '.format(version) + _bytes_literal(resources.structs[version]) + '\n'
+    data += FOOTER_PY + footer
+
+    with open(py_filepath, 'w') as fh:
+        fh.write(data)
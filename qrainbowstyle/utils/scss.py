@@ -3,22 +3,25 @@
 """Utilities for compiling SASS files."""
 
 # Standard library imports
+import ast
 import keyword
 import logging
 import os
 import re
 import shutil
 import sys
+import tempfile
 
 # Third party imports
 import qtsass
 
 # Local imports
 from qrainbowstyle import (MAIN_SCSS_FILE, MAIN_SCSS_FILEPATH, QSS_PATH,
-                           QSS_FILEPATH, RC_PATH, QSS_FILE,
-                           VARIABLES_SCSS_FILE, VARIABLES_SCSS_FILEPATH)
-from qrainbowstyle.palette import BasePalette
+                           QSS_FILEPATH, RC_PATH, QSS_FILE, QSS_TEMPLATE_FILEPATH,
+                           STYLES_SCSS_FILE, VARIABLES_SCSS_FILE, VARIABLES_SCSS_FILEPATH)
+from qrainbowstyle.palette import BasePalette, VARIABLES
 from qrainbowstyle.utils.images import create_images, create_palette_image
+from qrainbowstyle.utils.qss import minify_qss
 
 # Constants
 PY2 = sys.version[0] == '2'
@@ -45,6 +48,21 @@ HEADER_QSS = '''/* -------------------------------------------------------------
 --------------------------------------------------------------------------- */
 '''
 
+HEADER_TEMPLATE = '''# -*- coding: utf-8 -*-
+
+# QSS template created by the qtsass compiler v{}
+#
+# The definitions are in the "qrainbowstyle.qss._styles.scss" module.
+# Even items are QSS fragments, odd items are names of palette variables.
+#
+# WARNING! All changes made in this file will be lost!
+
+TOKENS = (
+'''
+
+SENTINEL_TEMPLATE = '__QRS_{}__'
+SENTINEL_PATTERN = re.compile(r'__QRS_([A-Z0-9_]+?)__')
+
 _logger = logging.getLogger(__name__)
 
 
@@ -88,8 +106,8 @@ def _create_scss_variables(variables_scss_filepath, palette,
         f.write(data)
 
 
-def _create_qss(main_scss_path, qss_filepath, header=HEADER_QSS):
-    """Create a styles.qss file from qtsass."""
+def _create_qss(main_scss_path, qss_filepath, header=HEADER_QSS, minify=False):
+    """Create a styles.qss file from qtsass. Minified file has no header."""
     data = ''
 
     qtsass.compile_filename(main_scss_path, qss_filepath,
@@ -98,7 +116,10 @@ def _create_qss(main_scss_path, qss_filepath, header=HEADER_QSS):
     with open(qss_filepath, 'r') as f:
         data = f.read()
 
-    data = header.format(qtsass.__version__) + data
+    if minify:
+        data = minify_qss(data)
+    else:
+        data = header.format(qtsass.__version__) + data
 
     with open(qss_filepath, 'w') as f:
         f.write(data)
@@ -108,14 +129,145 @@ def _create_qss(main_scss_path, qss_filepath, header=HEADER_QSS):
 
 def create_qss(qss_filepath=QSS_FILEPATH, main_scss_filepath=MAIN_SCSS_FILEPATH,
                variables_scss_filepath=VARIABLES_SCSS_FILEPATH,
-               palette=BasePalette):
-    """Create variables files and run qtsass compilation."""
+               palette=BasePalette, minify=False):
+    """Create variables files and run qtsass compilation, optionally minify the stylesheet."""
     _create_scss_variables(variables_scss_filepath, palette)
-    stylesheet = _create_qss(main_scss_filepath, qss_filepath)
+    stylesheet = _create_qss(main_scss_filepath, qss_filepath, minify=minify)
 
     return stylesheet
 
 
+def _create_scss_sentinels(variables_scss_filepath, header=HEADER_SCSS):
+    """Create a scss variables file with sentinels instead of palette values."""
+    data = {}
+    for name in VARIABLES:
+        sentinel = SENTINEL_TEMPLATE.format(name)
+        # quoted variables must stay quoted, e.g. in url($PATH_RESOURCES + '/rc/...')
+        if str(getattr(BasePalette, name)).startswith(("'", '"')):
+            sentinel = "'{}'".format(sentinel)
+        data[name] = sentinel
+
+    with open(variables_scss_filepath, 'w') as f:
+        f.write(header + _dict_to_scss(data) + '\n')
+
+
+def copy_scss_files(path, main_scss_filepath=MAIN_SCSS_FILEPATH):
+    """
+    Copy main and styles SCSS files to `path`.
+
+    Variables file can then be created next to the copies without modifying
+    the original one, e.g. to compile several palettes at the same time.
+
+    Returns:
+        str: path to copied main SCSS file.
+    """
+    scss_path = os.path.dirname(main_scss_filepath)
+    for fname in (os.path.basename(main_scss_filepath), STYLES_SCSS_FILE):
+        shutil.copy2(os.path.join(scss_path, fname), path)
+    return os.path.join(path, os.path.basename(main_scss_filepath))
+
+
+def compile_qss_template(main_scss_filepath=MAIN_SCSS_FILEPATH, minify=False):
+    """
+    Compile SCSS files once with sentinel variables.
+
+    The SCSS files are copied to a temporary directory, so the variables
+    file next to `main_scss_filepath` is not modified. Minified template
+    renders the same stylesheets as create_qss with `minify` enabled.
+
+    Returns:
+        tuple(str): QSS fragments at even and variable names at odd positions.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_main_scss_filepath = copy_scss_files(temp_dir, main_scss_filepath)
+        _create_scss_sentinels(os.path.join(temp_dir, VARIABLES_SCSS_FILE))
+        data = qtsass.compile_filename(temp_main_scss_filepath, output_style='expanded')
+
+    if minify:
+        data = minify_qss(data)
+
+    return tuple(SENTINEL_PATTERN.split(data))
+
+
+def create_qss_template(template_filepath=QSS_TEMPLATE_FILEPATH, main_scss_filepath=MAIN_SCSS_FILEPATH,
+                        header=HEADER_TEMPLATE, minify=False):
+    """Create a Python module with QSS template used to render stylesheets at runtime."""
+    tokens = compile_qss_template(main_scss_filepath, minify=minify)
+    data = header.format(qtsass.__version__)
+    data += ''.join('    {!r},\n'.format(token) for token in tokens) + ')\n'
+
+    with open(template_filepath, 'w') as f:
+        f.write(data)
+
+    _logger.info("QSS template with %s variables written to: %s", len(tokens) // 2, template_filepath)
+
+    return tokens
+
+
+def read_qss_template(template_filepath=QSS_TEMPLATE_FILEPATH):
+    """Read tokens of QSS template module created by create_qss_template."""
+    with open(template_filepath, 'r') as f:
+        data = f.read()
+
+    return ast.literal_eval(data[data.index('TOKENS = ') + len('TOKENS = '):])
+
+
+def render_qss(palette, tokens, header=HEADER_QSS, minify=False):
+    """Render QSS of palette from QSS template, the same as created by create_qss."""
+    from qrainbowstyle import _render_stylesheet
+
+    data = _render_stylesheet(palette, tokens)
+    if not minify:
+        data = header.format(qtsass.__version__) + data
+
+    return data
+
+
+def create_qss_from_template(qss_filepath, palette, tokens, minify=False):
+    """
+    Create QSS file of palette by substituting its values into QSS template.
+
+    SCSS files are compiled only once for all palettes, see compile_qss_template.
+
+    Args:
+        qss_filepath (str): Output path.
+        palette (BasePalette): Palette class.
+        tokens (tuple): QSS template, minified if `minify` is set.
+        minify (bool, optional): Create minified QSS file without header.
+
+    Returns:
+        str: stylesheet.
+    """
+    data = render_qss(palette, tokens, minify=minify)
+
+    with open(qss_filepath, 'w') as f:
+        f.write(data)
+
+    return data
+
+
+def verify_qss_template(palette, tokens, main_scss_filepath=MAIN_SCSS_FILEPATH, minify=False):
+    """
+    Check that QSS rendered from template is identical to QSS compiled by qtsass.
+
+    Returns:
+        bool: True if both stylesheets are identical.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_main_scss_filepath = copy_scss_files(temp_dir, main_scss_filepath)
+        expected = create_qss(qss_filepath=os.path.join(temp_dir, QSS_FILE),
+                              main_scss_filepath=temp_main_scss_filepath,
+                              variables_scss_filepath=os.path.join(temp_dir, VARIABLES_SCSS_FILE),
+                              palette=palette, minify=minify)
+
+    rendered = render_qss(palette, tokens, minify=minify)
+    if rendered != expected:
+        _logger.error("QSS of %s rendered from template differs from qtsass output", palette.__name__)
+        return False
+
+    return True
+
+
 def is_identifier(name):
     """Check that `name` string is a valid identifier in Python."""
     if PY2:
@@ -151,7 +303,8 @@ def create_custom_qss(
     as a lowercased folder (even if the identifier had uppercase letters).
 
     This fuction returns the custom stylesheet pointing to resources stored at
-    .../path/name/.
+    .../path/name/. To create a theme in memory, without writing any files,
+    use qrainbowstyle.create_custom_theme.
     """
     stylesheet = ''
 
@@ -0,0 +1,388 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Animate change of stylesheet from one palette to another.
+
+Intermediate stylesheets are rendered from the pre-compiled QSS template
+with colors interpolated between the palettes, so one frame costs only the
+substitution of template variables and the re-polish by Qt. The time of
+re-polish is measured and frames are spaced, so polishing takes at most
+the frame budget of every frame interval. When the widget tree is too
+large to re-polish at interactive rates, the final stylesheet is set at
+once under a screenshot of the windows, which fades out instead.
+
+.. code-block:: python
+
+    transition = ThemeTransition(LightOrange, style='lightorange', duration=300)
+    transition.start()
+"""
+
+# Standard library imports
+import logging
+import re
+import time
+import weakref
+
+# Third party imports
+from qtpy.QtCore import QEasingCurve, QElapsedTimer, QObject, Qt, QTimer, QVariantAnimation, Signal
+from qtpy.QtGui import QPainter
+from qtpy.QtWidgets import QApplication, QWidget
+
+# Local imports
+import qrainbowstyle
+
+# Interval between frames in ms, about 60 frames per second
+FRAME_INTERVAL = 16
+
+# Time in ms which re-polish may take in every frame interval
+FRAME_BUDGET = 8
+
+# Time of re-polish in ms, above which the rest of transition is cross-faded
+MAX_FRAME_TIME = 50
+
+# Number of widgets which are faded instead of animating their stylesheet
+MAX_ANIMATED_WIDGETS = 500
+
+# Hex colors in stylesheet values
+HEX_COLOR_PATTERN = re.compile(r"(#[0-9a-fA-F]{6}\b|#[0-9a-fA-F]{3}\b)")
+
+# Placeholders of template variables while the template is scoped, e.g. ``\x000\x00``
+PLACEHOLDER_PATTERN = re.compile("\x00([0-9]+)\x00")
+
+_logger = logging.getLogger(__name__)
+
+# Measured re-polish of app or widget trees, target -> (time in ms, number of widgets)
+_polish_times = weakref.WeakKeyDictionary()
+
+# Running transitions of app or widgets, target -> transition
+_running = weakref.WeakKeyDictionary()
+
+# Palettes of widgets set by transitions, widget -> palette, other widgets have the app palette
+_widget_palettes = weakref.WeakKeyDictionary()
+
+
+def _parse_hex(color):
+    color = color[1:]
+    if len(color) == 3:
+        color = ''.join(x * 2 for x in color)
+    return int(color[0:2], 16), int(color[2:4], 16), int(color[4:6], 16)
+
+
+def _compile_value(source, target):
+    """
+    Compile interpolation of text with colors, e.g. ``1px solid #263238``.
+
+    Texts differing in colors only are interpolated color by color, other
+    texts change at the middle of the transition.
+
+    Returns:
+        callable: function of progress in range [0, 1] returning the text.
+    """
+    if source == target:
+        return lambda progress: source
+
+    source_parts = HEX_COLOR_PATTERN.split(source)
+    target_parts = HEX_COLOR_PATTERN.split(target)
+    if len(source_parts) != len(target_parts) or source_parts[::2] != target_parts[::2]:
+        return lambda progress: source if progress < 0.5 else target
+
+    literals = source_parts[::2]
+    colors = [(_parse_hex(a), _parse_hex(b)) for a, b in zip(source_parts[1::2], target_parts[1::2])]
+
+    def _interpolate(progress):
+        if progress <= 0.0:
+            return source
+        if progress >= 1.0:
+            return target
+
+        parts = [literals[0]]
+        for (start, end), literal in zip(colors, literals[1:]):
+            parts.append('#{:02x}{:02x}{:02x}'.format(*(round(a + (b - a) * progress) for a, b in zip(start, end))))
+            parts.append(literal)
+        return ''.join(parts)
+
+    return _interpolate
+
+
+def _scope_tokens(tokens, scope):
+    """Scope rules of QSS template, variables are kept as placeholders while the template is parsed."""
+    from qrainbowstyle.utils.qss import scope_stylesheet
+
+    names = tokens[1::2]
+    parts = list(tokens)
+    parts[1::2] = ["\x00{}\x00".format(index) for index in range(len(names))]
+
+    parts = PLACEHOLDER_PATTERN.split(scope_stylesheet(''.join(parts), scope))
+    parts[1::2] = [names[int(index)] for index in parts[1::2]]
+    return tuple(parts)
+
+
+def compile_transition(source, target, tokens=None, scope=None):
+    """
+    Compile rendering of stylesheets between two palettes.
+
+    Args:
+        source (BasePalette): Palette at the start.
+        target (BasePalette): Palette at the end.
+        tokens (tuple): QSS template. Default is None, i.e. the pre-compiled one.
+        scope (str): Object name of widget to scope the rules to, like load_scoped_stylesheet.
+            Default is None, i.e. rules are not scoped.
+
+    Returns:
+        callable: function of progress in range [0, 1] returning stylesheet.
+    """
+    from qtpy import QT_VERSION
+
+    if tokens is None:
+        from qrainbowstyle.styles._shared.style_template import TOKENS as tokens
+
+    source_patches = qrainbowstyle._apply_stylesheet_patches(source, QT_VERSION)
+    target_patches = qrainbowstyle._apply_stylesheet_patches(target, QT_VERSION)
+    if scope is not None:
+        from qrainbowstyle.utils.qss import scope_stylesheet
+        tokens = _scope_tokens(tokens, scope)
+        source_patches = scope_stylesheet(source_patches, scope)
+        target_patches = scope_stylesheet(target_patches, scope)
+
+    source_values = qrainbowstyle._get_template_values(source)
+    target_values = qrainbowstyle._get_template_values(target)
+    values = {name: _compile_value(source_values[name], target_values[name]) for name in set(tokens[1::2])}
+    patches = _compile_value(source_patches, target_patches)
+    names = tokens[1::2]
+    parts = list(tokens)
+
+    def _render(progress):
+        frame = {name: value(progress) for name, value in values.items()}
+        parts[1::2] = [frame[name] for name in names]
+        return ''.join(parts) + patches(progress)
+
+    return _render
+
+
+class _FadeOverlay(QWidget):
+    """Screenshot of window painted over it with decreasing opacity."""
+
+    def __init__(self, window):
+        super(_FadeOverlay, self).__init__(window)
+
+        self._pixmap = window.grab()
+        self._opacity = 1.0
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self.setGeometry(window.rect())
+        self.show()
+        self.raise_()
+
+    def setOpacity(self, opacity):
+        self._opacity = opacity
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setOpacity(self._opacity)
+        painter.drawPixmap(0, 0, self._pixmap)
+
+
+class ThemeTransition(QObject):
+    """Change stylesheet of app or widget to another palette with animation.
+
+    Colors of the current palette are interpolated to `palette` over `duration` ms.
+    The final stylesheet is loaded from `style`, or rendered from `palette` if no style
+    is given. Only the app target changes the app palette, like create_custom_theme,
+    stylesheets of widgets are scoped to them. Starting a transition stops the one
+    running on the same target. Frames are spaced so re-polish takes at most `frame_budget`
+    of every frame interval. Trees with more than `max_widgets` widgets, or re-polished
+    slower than MAX_FRAME_TIME, are cross-faded from a screenshot instead.
+
+    Args:
+        palette (BasePalette): Target palette. Defaults to None, i.e. palette of `style`.
+        style (str): Target style. Defaults to None, i.e. theme created from `palette`.
+        widget (QWidget): Widget which stylesheet is changed. Defaults to None, i.e. app.
+        duration (int): Duration of the transition in ms.
+        frame_budget (float): Time in ms which re-polish may take in a frame interval.
+        max_widgets (int): Number of widgets which are always cross-faded.
+    """
+
+    finished = Signal()
+
+    def __init__(self, palette=None, style=None, widget=None, duration=300, frame_budget=FRAME_BUDGET,
+                 max_widgets=MAX_ANIMATED_WIDGETS, parent=None):
+        super(ThemeTransition, self).__init__(parent)
+
+        self._style_palette = palette
+        if palette is None:
+            if style is None:
+                raise ValueError("Palette or style of the transition is required")
+            import qrainbowstyle.palette
+            style_dir = qrainbowstyle._get_style_dir(style)
+            palette = getattr(qrainbowstyle.palette, qrainbowstyle._get_manifest()["styles"][style_dir]["palette"])
+
+        self.palette = palette
+        self.style = style
+        self.widget = widget
+        self.duration = duration
+        self.frame_budget = frame_budget
+        self.max_widgets = max_widgets
+
+        self._render = None
+        self._interval = FRAME_INTERVAL
+        self._widget_count = 0
+        self._overlays = []
+        self._clock = QElapsedTimer()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._frame)
+
+        self._fade = QVariantAnimation(self)
+        self._fade.setStartValue(1.0)
+        self._fade.setEndValue(0.0)
+        self._fade.setEasingCurve(QEasingCurve.InOutQuad)
+        self._fade.valueChanged.connect(self._on_fade)
+        self._fade.finished.connect(self._finish)
+
+        self._easing = QEasingCurve(QEasingCurve.InOutQuad)
+
+    def _target(self):
+        return QApplication.instance() if self.widget is None else self.widget
+
+    def _scope(self):
+        """Return object name of widget target, set like setStylesheetOnWidget, None for app."""
+        if self.widget is None or self.style is None:
+            return None
+        if not self.widget.objectName():
+            self.widget.setObjectName("qrainbowstyle_{}".format(id(self.widget)))
+        return self.widget.objectName()
+
+    def _count_widgets(self):
+        if self.widget is None:
+            return len(QApplication.allWidgets())
+        return len(self.widget.findChildren(QWidget)) + 1
+
+    def isRunning(self):
+        """Return True if the transition is running."""
+        return self._timer.isActive() or self._fade.state() == QVariantAnimation.Running
+
+    def start(self):
+        """
+        Start the transition, the final stylesheet is set immediately if there is no loaded palette.
+
+        The call is ignored if the transition is running, other transition of the same target is stopped.
+        """
+        if self.isRunning():
+            return
+
+        running = _running.get(self._target())
+        if running is not None and running is not self:
+            running.stop()
+        _running[self._target()] = self
+
+        try:
+            source = _widget_palettes.get(self.widget) if self.widget is not None else None
+            source = source or qrainbowstyle.getCurrentPalette()
+        except ModuleNotFoundError:
+            source = None
+
+        if self.style is not None and self.widget is None:
+            qrainbowstyle.preloadStylesheet(self.style, self._style_palette)
+
+        self._widget_count = self._count_widgets()
+        if source is None or self.duration <= 0:
+            self._apply_final()
+            self._release()
+            self.finished.emit()
+        elif self._widget_count > self.max_widgets or self._predict() > MAX_FRAME_TIME:
+            _logger.debug("Widget tree is too large, cross-fading %d widgets", self._widget_count)
+            self._cross_fade(self.duration)
+        else:
+            self._render = compile_transition(source, self.palette, scope=self._scope())
+            self._interval = FRAME_INTERVAL
+            self._clock.start()
+            self._frame()
+
+    def stop(self):
+        """Stop the transition and set the final stylesheet."""
+        if self._timer.isActive():
+            self._timer.stop()
+            self._apply_final()
+            self._release()
+            self.finished.emit()
+        elif self._fade.state() == QVariantAnimation.Running:
+            self._fade.stop()
+            self._finish()
+
+    def _frame(self):
+        elapsed = self._clock.elapsed()
+        if elapsed >= self.duration:
+            self._apply_final()
+            self._release()
+            self.finished.emit()
+            return
+
+        stylesheet = self._render(self._easing.valueForProgress(elapsed / self.duration))
+        cost = self._polish(stylesheet)
+
+        if cost > MAX_FRAME_TIME:
+            _logger.debug("Re-polish takes %.1f ms, cross-fading", cost)
+            self._cross_fade(self.duration - self._clock.elapsed())
+            return
+
+        # re-polish takes at most frame_budget of every interval, slow trees get fewer frames
+        self._interval = max(FRAME_INTERVAL, cost * FRAME_INTERVAL / self.frame_budget)
+        self._timer.start(int(self._interval))
+
+    def _cross_fade(self, duration):
+        if self.widget is None:
+            windows = [x for x in QApplication.topLevelWidgets() if x.isVisible()]
+        else:
+            windows = [self.widget] if self.widget.isVisible() else []
+        self._overlays = [_FadeOverlay(x) for x in windows]
+
+        self._apply_final()
+        self._fade.setDuration(max(int(duration), 1))
+        self._fade.start()
+
+    def _predict(self):
+        """Return time of re-polish in ms predicted from previous transitions of the tree."""
+        cost, count = _polish_times.get(self._target(), (0.0, 1))
+        return cost * self._widget_count / max(count, 1)
+
+    def _polish(self, stylesheet):
+        """Set stylesheet, return time of re-polish in ms."""
+        target = self._target()
+        start = time.perf_counter()
+        target.setStyleSheet(stylesheet)
+        cost = (time.perf_counter() - start) * 1000
+
+        _polish_times[target] = (cost, self._widget_count)
+        return cost
+
+    def _on_fade(self, value):
+        for overlay in self._overlays:
+            overlay.setOpacity(value)
+
+    def _finish(self):
+        for overlay in self._overlays:
+            overlay.hide()
+            overlay.deleteLater()
+        self._overlays = []
+        self._release()
+        self.finished.emit()
+
+    def _release(self):
+        target = self._target()
+        if _running.get(target) is self:
+            del _running[target]
+
+    def _apply_final(self):
+        if self.style is None and self.widget is None:
+            stylesheet = qrainbowstyle.create_custom_theme(self.palette)
+        elif self.style is None:
+            # the app palette and current palette belong to the app, not to the widget
+            stylesheet = qrainbowstyle._create_custom_stylesheet(self.palette)
+        elif self.widget is None:
+            stylesheet = qrainbowstyle.load_stylesheet(style=self.style, palette=self._style_palette)
+        else:
+            stylesheet = qrainbowstyle.load_scoped_stylesheet(self._scope(), style=self.style,
+                                                              palette=self._style_palette)
+        if self.widget is not None:
+            _widget_palettes[self.widget] = self.palette
+        self._polish(stylesheet)
@@ -14,7 +14,7 @@ Work in progress...
 """
 import json
 
-from qtpy.QtCore import QObject, Slot, QEvent, Signal, Qt, QUrl
+from qtpy.QtCore import QObject, Slot, Signal, Qt, QUrl
 from qtpy.QtWebEngineWidgets import QWebEngineView, QWebEngineSettings, QWebEnginePage
 from qtpy.QtNetwork import QNetworkProxyFactory
 from qtpy.QtWebChannel import QWebChannel
@@ -404,6 +404,23 @@ class MapsView(QWebEngineView):
 
         self.channel.registerObject("jshelper", self.handler)
 
+    def _followPalette(self):
+        """Load page now and every time palette of loaded stylesheet changes."""
+        theme = qrainbowstyle.getCurrentTheme()
+        theme.paletteChanged.connect(self.loadHtml)
+        if theme.palette() is not None:
+            self.loadHtml(theme.palette())
+
+    def loadHtml(self, palette):
+        """Load map page colored by palette.
+
+        Called on every change of palette of loaded stylesheet, subclasses load their
+        page here. The base view has no page, so it does nothing.
+
+        Args:
+            palette (BasePalette): Palette of loaded stylesheet.
+        """
+
     @Slot(str, object)
     def runScript(self, script, callback):
         """Run Javascript code.
@@ -537,27 +554,28 @@ class GoogleMapsView(MapsView):
     def __init__(self, parent, api_key):
         super(GoogleMapsView, self).__init__(parent)
         self.api_key = api_key
+        self._followPalette()
+
+    def loadHtml(self, palette):
+        """Load map page colored by palette.
 
-    def changeEvent(self, event: QEvent):
-        """Change event handler.
         Args:
-            event (QEvent): Event.
+            palette (BasePalette): Palette of loaded stylesheet.
         """
-        if event.type() == QEvent.StyleChange:
-            self.setHtml(qrainbowstyle.rainbowize(GoogleMapsHtml.html.replace("API_KEY_GOES_HERE", self.api_key)))
-        return super().changeEvent(event)
+        html = GoogleMapsHtml.html.replace("API_KEY_GOES_HERE", self.api_key)
+        self.setHtml(qrainbowstyle.rainbowize(html, palette))
 
 
 class OpenStreetMapsView(MapsView):
 
     def __init__(self, parent):
         super(OpenStreetMapsView, self).__init__(parent)
+        self._followPalette()
+
+    def loadHtml(self, palette):
+        """Load map page colored by palette.
 
-    def changeEvent(self, event: QEvent):
-        """Change event handler.
         Args:
-            event (QEvent): Event.
+            palette (BasePalette): Palette of loaded stylesheet.
         """
-        if event.type() == QEvent.StyleChange:
-            self.setHtml(qrainbowstyle.rainbowize(OpenStreetMapsHtml.html))
-        return super().changeEvent(event)
+        self.setHtml(qrainbowstyle.rainbowize(OpenStreetMapsHtml.html, palette))
@@ -49,6 +49,8 @@ class Painter(QWidget):
 
 
 class _PaletteButton(QPushButton):
+    hovered = Signal()
+
     def __init__(self, color):
         super().__init__()
         side = 128
@@ -67,6 +69,18 @@ class _PaletteButton(QPushButton):
         self.setIconSize(QSize(24, 24))
         self.setStyleSheet(stylesheet)
 
+    def enterEvent(self, event):
+        self.hovered.emit()
+        super().enterEvent(event)
+
+
+def _connect_button(button, preload):
+    name = button.color["name"]
+    button.pressed.connect(lambda: setStylesheetOnQApp(style=name))
+    if preload:
+        # style is prepared in background while the cursor is over button
+        button.hovered.connect(lambda: qrainbowstyle.preloadStylesheet(name))
+
 
 class _PaletteBase(QWidget):
     selected = Signal(object)
@@ -76,7 +90,7 @@ class _PaletteBase(QWidget):
 
 
 class _PaletteLinearBase(_PaletteBase):
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, preload=False, **kwargs):
         super().__init__(*args, **kwargs)
         colors = []
 
@@ -87,7 +101,7 @@ class _PaletteLinearBase(_PaletteBase):
 
         for c in colors:
             b = _PaletteButton(c)
-            b.pressed.connect(lambda color=c: setStylesheetOnQApp(style=color["name"]))
+            _connect_button(b, preload)
             palette.addWidget(b)
 
         self.setLayout(palette)
@@ -102,9 +116,15 @@ class StylePickerVertical(_PaletteLinearBase):
 
 
 class StylePickerGrid(QWidget):
-    """Select application color palette from a grid."""
+    """Select application color palette from a grid.
+
+    Args:
+        n_columns (int): Number of columns in grid.
+        parent (QWidget): Parent widget.
+        preload (bool): Prepare style in background thread when cursor enters its button.
+    """
 
-    def __init__(self, n_columns=5, parent=None):
+    def __init__(self, n_columns=5, parent=None, preload=False):
         super(StylePickerGrid, self).__init__(parent)
         self.setMaximumWidth(150)
         colors = []
@@ -117,7 +137,7 @@ class StylePickerGrid(QWidget):
 
         for c in colors:
             b = _PaletteButton(c)
-            b.pressed.connect(lambda color=c: setStylesheetOnQApp(style=color["name"]))
+            _connect_button(b, preload)
             palette.addWidget(b, row, col)
             col += 1
             if col == n_columns:
@@ -29,7 +29,7 @@ SOFTWARE.
 
 import math
 
-from qtpy.QtCore import Qt, QTimer, QRectF, Signal, QEvent
+from qtpy.QtCore import Qt, QTimer, QRectF, Signal
 from qtpy.QtGui import QColor, QPainter
 from qtpy.QtWidgets import QWidget
 
@@ -89,7 +89,11 @@ class WaitingSpinner(QWidget):
 
         self.setWindowModality(modality)
         self.setAttribute(Qt.WA_TranslucentBackground)
-        self.setColor(qrainbowstyle.getCurrentPalette().COLOR_ACCENT_4)
+
+        theme = qrainbowstyle.getCurrentTheme()
+        theme.paletteChanged.connect(self._onPaletteChanged)
+        if theme.palette() is not None:
+            self.setColor(theme.color("COLOR_ACCENT_4"))
 
     def paintEvent(self, QPaintEvent):
         self.updatePosition()
@@ -124,14 +128,9 @@ class WaitingSpinner(QWidget):
             )
             painter.restore()
 
-    def changeEvent(self, event: QEvent):
-        """Change event handler.
-
-        Args:
-            event (QEvent): Event.
-        """
-        if event.type() == QEvent.StyleChange:
-            self.setColor(qrainbowstyle.getCurrentPalette().COLOR_ACCENT_4)
+    def _onPaletteChanged(self, palette):
+        self.setColor(qrainbowstyle.getCurrentTheme().color("COLOR_ACCENT_4"))
+        self.update()
 
     def start(self):
         self.updatePosition()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Compare time Qt needs to parse and apply expanded and minified stylesheets.
+
+The minified stylesheet is created from the same style with
+qrainbowstyle.utils.qss.minify_qss. Stylesheets are applied on the example UI.
+
+To run the benchmark for all styles, simple do
+
+.. code-block:: python
+
+    python benchmark_qss.py
+
+or for selected styles and number of repeats
+
+.. code-block:: python
+
+    python benchmark_qss.py --style oceanic darkorange --repeat 20
+
+"""
+
+# Standard library imports
+import argparse
+import os
+import statistics
+import sys
+import time
+
+# Make the benchmark runnable without the need to install and include example ui
+SCRIPTS_PATH = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.dirname(SCRIPTS_PATH))
+sys.path.insert(0, os.path.join(os.path.dirname(SCRIPTS_PATH), 'example', 'ui'))
+
+# Third party imports
+from qtpy.QtCore import Qt  # noqa: E402
+from qtpy.QtWidgets import QApplication, QDockWidget, QMainWindow, QWidget  # noqa: E402
+
+# Local imports
+import qrainbowstyle  # noqa: E402
+import qrainbowstyle.windows  # noqa: E402
+from qrainbowstyle.utils.qss import minify_qss  # noqa: E402
+
+UI_MODULES = ['dw_buttons_ui', 'dw_displays_ui', 'dw_inputs_fields_ui', 'dw_inputs_no_fields_ui',
+              'dw_widgets_ui', 'dw_views_ui', 'dw_containers_tabs_ui', 'dw_containers_no_tabs_ui']
+
+
+def create_window():
+    """Create frameless window with all docks of the example."""
+    from mw_menus_ui import Ui_MainWindow
+
+    window = qrainbowstyle.windows.FramelessWindow()
+    widget = QMainWindow(window)
+    widget.setWindowFlags(Qt.Widget)
+    Ui_MainWindow().setupUi(widget)
+    window.addContentWidget(widget)
+
+    for module_name in UI_MODULES:
+        module = __import__(module_name)
+        dock = QDockWidget()
+        module.Ui_DockWidget().setupUi(dock)
+        widget.addDockWidget(Qt.RightDockWidgetArea, dock)
+
+    return window
+
+
+def measure(app, stylesheet, repeat):
+    """Return times of parsing and applying stylesheet to the application, in ms."""
+    parse, polish = [], []
+
+    for _ in range(repeat):
+        widget = QWidget()
+        start = time.perf_counter()
+        widget.setStyleSheet(stylesheet)
+        widget.ensurePolished()
+        parse.append((time.perf_counter() - start) * 1000)
+
+        app.setStyleSheet("")
+        app.processEvents()
+        start = time.perf_counter()
+        app.setStyleSheet(stylesheet)
+        app.processEvents()
+        polish.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(parse), statistics.median(polish)
+
+
+def main(arguments):
+    """Run benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--style', nargs='+', default=qrainbowstyle.getAvailableStyles(),
+                        help="Styles to benchmark.")
+    parser.add_argument('--repeat', default=10, type=int,
+                        help="Number of measurements of each stylesheet.")
+    args = parser.parse_args(arguments)
+
+    app = QApplication.instance() or QApplication([])
+    window = create_window()
+    window.show()
+    app.processEvents()
+
+    print("{:<18}{:>10}{:>12}{:>12}{:>12}".format("style", "mode", "size [kB]", "parse [ms]", "apply [ms]"))
+
+    for style in args.style:
+        expanded = qrainbowstyle.load_stylesheet(style=style)
+        minified = minify_qss(expanded)
+
+        for mode, stylesheet in (('expanded', expanded), ('minified', minified)):
+            parse, polish = measure(app, stylesheet, args.repeat)
+            print("{:<18}{:>10}{:>12.1f}{:>12.2f}{:>12.2f}".format(style, mode, len(stylesheet) / 1024, parse, polish))
+
+    window.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
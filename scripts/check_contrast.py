@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Check contrast of text and background colors of palettes.
+
+Pairs of colors used together in the stylesheet are checked against WCAG 2.1
+level AA, see qrainbowstyle.utils.contrast.CONTRAST_REQUIREMENTS. The script
+exits with status 1 if any palette fails.
+
+To check all built-in palettes, simple do
+
+.. code-block:: python
+
+    python check_contrast.py
+
+or for selected palettes, printing contrast matrix of their colors
+
+.. code-block:: python
+
+    python check_contrast.py --palette Oceanic DarkOrange --matrix
+
+To check palettes generated from random accent colors
+
+.. code-block:: python
+
+    python check_contrast.py --generate 10000 --light
+
+Requires NumPy, install it with ``pip install qrainbowstyle[generator]``.
+"""
+
+# Standard library imports
+import argparse
+import inspect
+import os
+import sys
+import time
+
+# Make the script runnable without the need to install
+SCRIPTS_PATH = os.path.abspath(os.path.dirname(__file__))
+sys.path.insert(0, os.path.dirname(SCRIPTS_PATH))
+
+# Third party imports
+import numpy as np  # noqa: E402
+
+# Local imports
+import qrainbowstyle.palette as source  # noqa: E402
+from qrainbowstyle.utils.contrast import (check_contrast, contrast_matrix, find_violations, palette_colors,  # noqa: E402
+                                          ROLES, violations)
+from qrainbowstyle.utils.palette_generator import GENERATED_VARIABLES, generate_colors  # noqa: E402
+
+
+def get_palettes(names=None):
+    """Return palette classes of palette module, all of them if names are not given."""
+    palettes = [x for _, x in inspect.getmembers(source, inspect.isclass)
+                if issubclass(x, source.BasePalette) and x is not source.BasePalette]
+    if names:
+        lower = {x.lower() for x in names}
+        palettes = [x for x in palettes if x.__name__.lower() in lower]
+    return palettes
+
+
+def print_matrix(palette):
+    """Print contrast ratios of all pairs of palette colors."""
+    ratios = contrast_matrix(palette_colors([palette]))[0]
+    labels = [x.replace('COLOR_', '').replace('TITLE_BAR_', 'TB_') for x in ROLES]
+
+    print(palette.__name__)
+    print(" " * 30 + "".join("{:>6}".format(i) for i in range(len(ROLES))))
+    for index, (label, row) in enumerate(zip(labels, ratios)):
+        print("{:>3} {:<26}".format(index, label) + "".join("{:>6.1f}".format(x) for x in row))
+    print()
+
+
+def check_palettes(args):
+    """Check palettes of palette module, return number of violations."""
+    palettes = get_palettes(args.palette)
+    if args.matrix:
+        for palette in palettes:
+            print_matrix(palette)
+
+    found = find_violations(palettes)
+    for violation in found:
+        print("{:<18}{:<30} on {:<30}{:>6.2f} < {}".format(*violation))
+    print("{} palettes checked, {} violations found".format(len(palettes), len(found)))
+    return len(found)
+
+
+def check_generated(args):
+    """Check palettes generated from random accents, return number of failing palettes."""
+    accents = np.random.default_rng(args.seed).random((args.generate, 3))
+
+    start = time.perf_counter()
+    colors = generate_colors(accents, dark=not args.light)
+    generated = time.perf_counter()
+    ratios, checked = check_contrast(colors, roles=GENERATED_VARIABLES)
+    failed = violations(ratios, checked)
+    checked_time = time.perf_counter()
+
+    print("{:<30} on {:<30}{:>10}".format("foreground", "background", "failing"))
+    for (foreground, background, _), count in zip(checked, failed.sum(axis=0)):
+        print("{:<30} on {:<30}{:>10}".format(foreground, background, count))
+
+    count = int(failed.any(axis=-1).sum())
+    print("{} of {} palettes fail, generated in {:.1f} ms, checked in {:.1f} ms".format(
+        count, args.generate, (generated - start) * 1000, (checked_time - generated) * 1000))
+    return count
+
+
+def main(arguments):
+    """Run the check."""
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--palette', nargs='+', default=None,
+                        help="Palettes to check. Defaults to all palettes.")
+    parser.add_argument('--matrix', action='store_true',
+                        help="Print contrast ratios of all pairs of colors.")
+    parser.add_argument('--generate', default=0, type=int,
+                        help="Check given number of palettes generated from random accents instead.")
+    parser.add_argument('--light', action='store_true',
+                        help="Generate light palettes.")
+    parser.add_argument('--seed', default=None, type=int,
+                        help="Seed of random accents.")
+    args = parser.parse_args(arguments)
+
+    failed = check_generated(args) if args.generate else check_palettes(args)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
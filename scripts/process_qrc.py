@@ -1,24 +1,19 @@
 # -*- coding: utf-8 -*-
 """Script to process QRC files (convert .qrc to _rc.py and .rcc).
 
-The script will attempt to compile the qrc file using the following tools:
+The qrc files are compiled by qrainbowstyle.utils.rcc, a resource compiler
+written in Python, so no external tools are needed. It creates:
 
-    - pyrcc4 for PyQt4 and PyQtGraph (Python)
-    - pyrcc5 for PyQt5 and QtPy (Python)
-    - pyside-rcc for PySide (Python)
-    - pyside2-rcc for PySide2 (Python)
-    - rcc for Qt4 and Qt5 (C++)
+    - _rc.py modules for PyQt4, PyQt5, PySide, PySide2, QtPy and PyQtGraph,
+      in the format of pyrcc5
+    - binary .rcc files for Qt, format version 1 or 2
 
 Delete the compiled files that you don't want to use manually after
 running this script.
 
-Links to understand those tools:
+Links to understand those files:
 
-    - pyrcc4: http://pyqt.sourceforge.net/Docs/PyQt4/resources.html#pyrcc4
     - pyrcc5: http://pyqt.sourceforge.net/Docs/PyQt5/resources.html#pyrcc5
-    - pyside-rcc: https://www.mankier.com/1/pyside-rcc
-    - pyside2-rcc: https://doc.qt.io/qtforpython/overviews/resources.html (Documentation Incomplete)
-    - rcc on Qt4: http://doc.qt.io/archives/qt-4.8/rcc.html
     - rcc on Qt5: http://doc.qt.io/qt-5/rcc.html
 
 """
@@ -27,182 +22,415 @@ Links to understand those tools:
 
 import os
 import sys
-import glob
+import time
+import fnmatch
 import logging
 import argparse
-from subprocess import call
+import importlib
+import threading
+import traceback
 
 # Third party imports
 from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
 
 # Local imports
-from qrainbowstyle import PACKAGE_PATH, STYLES_PATH, QRC_FILE, QSS_FILE
+from qrainbowstyle import (PACKAGE_PATH, STYLES_PATH, SVG_PATH, BUTTONS_NT_PATH, BUTTONS_DARWIN_PATH, QRC_FILE,
+                           QSS_FILE, RCC_FILE, SHARED_RESOURCES_DIR, MAIN_SCSS_FILEPATH, STYLES_SCSS_FILEPATH,
+                           QSS_TEMPLATE_FILEPATH)
 from qrainbowstyle.extras import OutputLogger, qt_message_handler
-from qrainbowstyle.utils.images import create_images, create_palette_image, generate_qrc_file, create_titlebar_images
-from qrainbowstyle.utils.scss import create_qss
+from qrainbowstyle.utils.build_cache import BuildCache, files_fingerprint, fingerprint, tool_versions
+from qrainbowstyle.utils.images import (IMAGE_BLACKLIST, create_image_pool, create_images, create_palette_image,
+                                        generate_qrc_file, create_titlebar_images, get_image_colors,
+                                        get_shared_images, move_shared_images, remove_svg_replaced_images,
+                                        restore_shared_images)
+from qrainbowstyle.utils.manifest import create_manifest
+from qrainbowstyle.utils.rcc import (COMPRESS_LEVEL, COMPRESS_THRESHOLD, RCC_VERSIONS, compile_resources, read_qrc,
+                                     write_rc_py, write_rcc)
+from qrainbowstyle.utils.scss import (create_qss_from_template, create_qss_template, read_qss_template,
+                                      verify_qss_template)
 
 from qtpy.QtCore import qInstallMessageHandler
 
+# Palette variables used in titlebar buttons images
+TITLE_BAR_VARIABLES = ['TITLE_BAR_BACKGROUND_COLOR', 'TITLE_BAR_BUTTONS_HOVER_COLOR',
+                       'TITLE_BAR_BUTTONS_DISABLED_COLOR', 'TITLE_BAR_TEXT_COLOR']
+
+
+# Build steps run by run_process, resources are always compiled after them
+BUILD_STEPS = ('qss_template', 'palette_image', 'images', 'titlebar_images', 'qss')
+
+# Watched files, relative to package directory, and build steps depending on them.
+# 'palettes' means that palette modules have to be reloaded before the build.
+WATCH_DEPENDENCIES = [
+    ('qss/_variables.scss', set()),
+    ('qss/*.scss', {'qss_template', 'qss'}),
+    ('svg/base_palette.svg', {'palette_image'}),
+    ('svg/buttons_*/*.svg', {'titlebar_images'}),
+    ('svg/*.svg', {'images'}),
+    ('colorsystem.py', {'palettes', 'palette_image', 'images', 'titlebar_images', 'qss'}),
+    ('palette.py', {'palettes', 'palette_image', 'images', 'titlebar_images', 'qss'}),
+]
+
+
+def get_affected_steps(paths):
+    """Return build steps depending on changed files, see WATCH_DEPENDENCIES."""
+    steps = set()
+    for path in paths:
+        relpath = os.path.relpath(os.path.abspath(path), PACKAGE_PATH).replace(os.sep, '/')
+        for pattern, dependents in WATCH_DEPENDENCIES:
+            # only the first matching pattern is used
+            if fnmatch.fnmatch(relpath, pattern):
+                steps |= dependents
+                break
+    return steps
+
+
+class BuildFileHandler(FileSystemEventHandler):
+    """Rebuild styles when their sources change.
+
+    Events are collected until no file changes for `delay` seconds, then only
+    build steps depending on changed files are run. Steps skip palettes and
+    images whose inputs did not change, see BuildCache.
+    """
+
+    def __init__(self, parser_args, delay=0.5):
+        """Rebuild styles when their sources change."""
+        super(BuildFileHandler, self).__init__()
+        self.args = parser_args
+        self.delay = delay
+        self._changed = set()
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._timer = None
+
+    def on_any_event(self, event):
+        """Collect changed files and restart debounce timer."""
+        # reading files during build also creates events
+        if event.is_directory or event.event_type not in ('created', 'modified', 'moved', 'deleted'):
+            return
+
+        paths = [x for x in (event.src_path, getattr(event, 'dest_path', '')) if x and get_affected_steps([x])]
+        if not paths:
+            return
+
+        with self._lock:
+            self._changed.update(paths)
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.delay, self.build)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def build(self):
+        """Run build steps affected by collected changes."""
+        with self._build_lock:
+            with self._lock:
+                changed, self._changed = self._changed, set()
+
+            steps = get_affected_steps(changed)
+            if not steps:
+                return
+
+            logging.info("Changed: " + ", ".join(sorted(os.path.relpath(x, PACKAGE_PATH) for x in changed)))
+            if 'palettes' in steps:
+                import qrainbowstyle.colorsystem
+                import qrainbowstyle.palette
+                importlib.reload(qrainbowstyle.colorsystem)
+                importlib.reload(qrainbowstyle.palette)
+
+            try:
+                failed = run_process(self.args, steps=steps)
+            except Exception:
+                logging.exception("Build failed")
+            else:
+                if not failed:
+                    logging.info("Build finished, watching for changes...")
+
+
+def compile_qrc(qrc_filepath, args, palette=None):
+    """Convert .qrc file to _rc.py and/or .rcc files in the same directory."""
+    output_dir, qrc_file = os.path.split(os.path.abspath(qrc_filepath))
+
+    # get name without extension
+    name = os.path.splitext(qrc_file)[0]
+    filename = os.path.join(output_dir, name)
+
+    logging.debug(filename + '...')
+    ext = '_rc.py'
+    ext_c = '.rcc'
+
+    # creating names
+    py_files = {
+        'pyqt': os.path.join(output_dir, 'pyqt_' + name + ext),
+        'pyqt5': os.path.join(output_dir, 'pyqt5_' + name + ext),
+        'pyside': os.path.join(output_dir, 'pyside_' + name + ext),
+        'pyside2': os.path.join(output_dir, 'pyside2_' + name + ext),
+        'qtpy': filename + ext,
+        'pyqtgraph': os.path.join(output_dir, 'pyqtgraph_' + name + ext),
+    }
+
+    # append palette used to generate this file
+    used_palette = ""
+    if palette is not None:
+        used_palette = "\nfrom qrainbowstyle.palette import " + palette.__name__ + "\npalette = " + palette.__name__ + "\n"
+
+    resources = compile_resources(read_qrc(qrc_filepath), compress_level=args.compress,
+                                  compress_threshold=args.threshold)
+
+    for binding, py_file in py_files.items():
+        if args.create in [binding, 'all']:
+            logging.debug("Compiling for {} ...".format(binding))
+            write_rc_py(py_file, resources, binding=binding, footer=used_palette)
+
+    if args.create in ['qt', 'qt5', 'all'] or args.rcc:
+        logging.debug("Compiling binary resources for Qt ...")
+        write_rcc(filename + ext_c, resources, version=args.rcc_version)
+
+
+def _directory_fingerprint(path):
+    """Return fingerprint of all files in directory."""
+    return files_fingerprint([os.path.join(path, fname) for fname in os.listdir(path)])
+
+
+def _get_resource_outputs(output_dir, args):
+    """Return paths to files created by _compile_resources."""
+    outputs = [os.path.join(output_dir, QRC_FILE)]
+    if args.create in ['qtpy', 'all']:
+        outputs.append(os.path.join(output_dir, 'style_rc.py'))
+    if args.create in ['qt', 'qt5', 'all'] or args.rcc:
+        outputs.append(os.path.join(output_dir, RCC_FILE))
+    return outputs
+
+
+def _compile_resources(output_dir, args, palette=None):
+    """Generate qrc file of style or shared resources and compile it."""
+    rc_path = os.path.join(output_dir, 'rc')
+    qrc_path = os.path.join(output_dir, QRC_FILE)
+
+    logging.debug('Generating qrc file in: ' + output_dir)
+    if palette is None:
+        generate_qrc_file(rc_path=rc_path, qrc_path=qrc_path, style_prefix='')
+    else:
+        generate_qrc_file(rc_path=rc_path, qrc_path=qrc_path)
 
-class QSSFileHandler(FileSystemEventHandler):
-    """QSS File observer."""
+    compile_qrc(qrc_path, args, palette=palette)
 
-    def __init__(self, parser_args):
-        """QSS File observer."""
-        super(QSSFileHandler, self).__init__()
-        self.args = parser_args
 
-    def on_modified(self, event):
-        """Handle file system events."""
-        if event.src_path.endswith('.qss'):
-            run_process(self.args)
-            logging.debug('\n')
+def _build_palette(palette, args, cache, inputs):
+    """Create palette image, titlebar images and QSS of palette. Returns updated cache entries."""
+    palette_name = str(palette.__name__)
+    logging.debug("Generating files for: " + palette_name)
 
+    # get paths to output directories for this palette
+    output_dir = os.path.join(STYLES_PATH, palette_name)
+    images_dir = os.path.join(output_dir, 'images')
+    rc_dir = os.path.join(output_dir, 'rc')
 
-def run_process(args):
-    """Process qrc files."""
+    # create directory for every style in palette.py
+    os.makedirs(images_dir, exist_ok=True)
+    os.makedirs(rc_dir, exist_ok=True)
+    open(os.path.join(output_dir, "__init__.py"), "w+").close()
 
-    import inspect
-    import qrainbowstyle.palette as source
+    # shared images are searched again after images of this style are updated
+    restore_shared_images(rc_dir, inputs['shared_rc_dir'])
 
-    palettes = []
-    for name, obj in inspect.getmembers(source):
-        if inspect.isclass(obj) and issubclass(obj, source.BasePalette) and obj is not source.BasePalette:
-            palettes.append(obj)
+    qss_filepath = os.path.join(output_dir, QSS_FILE)
+    versions = inputs['versions']
+    steps = inputs['steps']
 
-    logging.debug("Found palettes: " + str(palettes))
+    if args.svg:
+        # svg images are recolored when the style is loaded, png images are not needed
+        remove_svg_replaced_images(rc_dir)
 
-    for palette in palettes:
-        palette_name = str(palette.__name__)
-        logging.debug("Generating files for: " + palette_name)
+    # Create palette image
+    if 'palette_image' in steps:
+        logging.debug('Generating palette image ...')
+        cache.run('palette_image/' + palette_name, [palette.color_palette(), inputs['base_palette_digest'], versions],
+                  [os.path.join(images_dir, 'palette.svg'), os.path.join(images_dir, 'palette.png')],
+                  create_palette_image, palette=palette, path=images_dir)
 
-        # create directory for every style in palette.py
-        os.chdir(STYLES_PATH)
-        os.makedirs(palette_name, exist_ok=True)
-        os.chdir(os.path.join(STYLES_PATH, palette_name))
-        open("__init__.py", "w+").close()
+    if 'titlebar_images' in steps:
+        logging.debug("Generating images for titlebar buttons")
+        titlebar_colors = {name: getattr(palette, name) for name in TITLE_BAR_VARIABLES}
+        titlebar_outputs = [os.path.join(rc_dir, os.path.basename(path)[:-4] + ext)
+                            for path in inputs['buttons_svg_paths'] for ext in ('.png', '@2x.png')]
+        cache.run('titlebar_images/' + palette_name, [titlebar_colors, inputs['buttons_digest'], versions],
+                  titlebar_outputs, create_titlebar_images, rc_path=rc_dir, palette=palette)
 
-        output_dir = os.path.join(STYLES_PATH, palette_name)
+    # Substitute palette values into QSS template compiled once for all palettes
+    if 'qss' in steps:
+        logging.debug('Rendering QSS from template ...')
+        cache.run('qss/' + palette_name, [palette.to_dict(), inputs['scss_digest'], versions, args.minify],
+                  [qss_filepath], create_qss_from_template, qss_filepath, palette, inputs['qss_template'],
+                  minify=args.minify)
 
-        # get paths to output directories for this palette
-        images_dir = os.path.join(output_dir, 'images')
-        rc_dir = os.path.join(output_dir, 'rc')
-        # qss_dir = os.path.join(output_dir, 'qss')
+    if args.verify:
+        logging.debug('Comparing QSS rendered from template with qtsass output ...')
+        if not verify_qss_template(palette, inputs['qss_template'], minify=args.minify):
+            raise ValueError("QSS rendered from template differs from qtsass output: " + palette_name)
+        logging.info("QSS of %s is identical to qtsass output", palette_name)
 
-        # create directories
-        os.makedirs(images_dir, exist_ok=True)
-        os.makedirs(rc_dir, exist_ok=True)
-        # os.makedirs(qss_dir, exist_ok=True)
+    return cache.updated
 
-        qrc_filepath = os.path.join(output_dir, QRC_FILE)
-        qss_filepath = os.path.join(output_dir, QSS_FILE)
-        # variables_scss_filepath = os.path.join(qss_dir, VARIABLES_SCSS_FILE)
 
-        # Create palette and resources png images
-        logging.debug('Generating palette image ...')
-        create_palette_image(palette=palette, path=images_dir)
+def _build_images(palette, cache, inputs, pool=None):
+    """Create png images of palette whose svg or colors changed, rasterized by all processes of pool."""
+    palette_name = str(palette.__name__)
+    rc_dir = os.path.join(STYLES_PATH, palette_name, 'rc')
 
-        logging.debug('Generating images ...')
-        create_images(palette=palette, rc_path=rc_dir)
+    logging.debug('Generating images for: ' + palette_name)
+    image_digests = {}
+    for svg_fname, svg_digest in inputs['svg_digests'].items():
+        key = 'images/{}/{}'.format(palette_name, svg_fname)
+        image_colors = get_image_colors(svg_fname, palette)
+        digest = fingerprint(svg_digest, image_colors, inputs['versions'])
+        outputs = [os.path.join(rc_dir, fname) for fname in image_colors]
+        if not cache.is_fresh(key, digest, outputs):
+            image_digests[key] = digest
 
-        logging.debug("Generating images for titlebar buttons")
-        create_titlebar_images(rc_path=rc_dir, palette=palette)
+    if image_digests:
+        stale_svg_fnames = [key.rsplit('/', 1)[1] for key in image_digests]
+        create_images(palette=palette, rc_path=rc_dir, pool=pool, svg_fnames=stale_svg_fnames)
+        cache.merge(image_digests)
 
-        logging.debug('Generating qrc ...')
-        generate_qrc_file(rc_path=rc_dir, qrc_path=qrc_filepath)
 
-        logging.debug('Converting .qrc to _rc.py and/or .rcc ...')
+def _build_resources(output_dir, args, cache, inputs, palette=None):
+    """Generate qrc file of style or shared resources and compile it. Returns updated cache entries."""
+    name = os.path.basename(output_dir)
+    logging.debug('Converting .qrc to _rc.py and/or .rcc for: ' + name)
 
-        for qrc_file in glob.glob('*.qrc'):
-            # get name without extension
-            filename = os.path.splitext(qrc_file)[0]
+    step_inputs = [_directory_fingerprint(os.path.join(output_dir, 'rc')),
+                   [args.create, args.rcc, args.rcc_version, args.compress, args.threshold], inputs['versions']]
+    if palette is not None:
+        step_inputs += [files_fingerprint([os.path.join(output_dir, QSS_FILE)]), palette.__name__]
 
-            logging.debug(filename + '...')
-            ext = '_rc.py'
-            ext_c = '.rcc'
+    cache.run('resources/' + name, step_inputs, _get_resource_outputs(output_dir, args),
+              _compile_resources, output_dir, args, palette)
 
-            # Create variables SCSS files and compile SCSS files to QSS
-            logging.debug('Compiling SCSS/SASS files to QSS ...')
-            create_qss(palette=palette, qss_filepath=qss_filepath)
+    return cache.updated
 
-            # creating names
-            py_file_pyqt5 = 'pyqt5_' + filename + ext
-            py_file_pyqt = 'pyqt_' + filename + ext
-            py_file_pyside = 'pyside_' + filename + ext
-            py_file_pyside2 = 'pyside2_' + filename + ext
-            py_file_qtpy = '' + filename + ext
-            py_file_pyqtgraph = 'pyqtgraph_' + filename + ext
 
-            # append palette used to generate this file
-            used_palette = "\nfrom qrainbowstyle.palette import " + palette.__name__ + "\npalette = " + palette.__name__ + "\n"
+def _run_job(job):
+    """Run build job, catching its errors. Returns name of job, updated cache entries and error."""
+    name, func, func_args = job
+    try:
+        return name, func(*func_args), None
+    except Exception:
+        return name, {}, traceback.format_exc()
 
-            # calling external commands
-            if args.create in ['pyqt', 'pyqtgraph', 'all']:
-                logging.debug("Compiling for PyQt4 ...")
-                try:
-                    call(['pyrcc4', '-py3', qrc_file, '-o', py_file_pyqt])
-                    with open(py_file_pyqt, "a+") as f:
-                        f.write(used_palette)
 
-                except FileNotFoundError:
-                    logging.debug("You must install pyrcc4")
+def _run_jobs(jobs, pool, cache, description):
+    """Run build jobs in pool or in this process. Returns names of failed jobs."""
+    failed = []
+    results = map(_run_job, jobs) if pool is None else pool.imap_unordered(_run_job, jobs)
 
-            if args.create in ['pyqt5', 'qtpy', 'all']:
-                logging.debug("Compiling for PyQt5 ...")
-                try:
-                    call(['pyrcc5', qrc_file, '-o', py_file_pyqt5])
-                    with open(py_file_pyqt5, "a+") as f:
-                        f.write(used_palette)
-                except FileNotFoundError:
-                    logging.debug("You must install pyrcc5")
-
-            if args.create in ['pyside', 'all']:
-                logging.debug("Compiling for PySide ...")
-                try:
-                    call(['pyside-rcc', '-py3', qrc_file, '-o', py_file_pyside])
-                    with open(py_file_pyside, "a+") as f:
-                        f.write(used_palette)
-                except FileNotFoundError:
-                    logging.debug("You must install pyside-rcc")
-
-            if args.create in ['pyside2', 'all']:
-                logging.debug("Compiling for PySide 2...")
-                try:
-                    call(['pyside2-rcc', '-py3', qrc_file, '-o', py_file_pyside2])
-                    with open(py_file_pyside2, "a+") as f:
-                        f.write(used_palette)
-                except FileNotFoundError:
-                    logging.debug("You must install pyside2-rcc")
+    for index, (name, updated, error) in enumerate(results, 1):
+        cache.merge(updated)
+        if error is None:
+            logging.info("[%s/%s] %s: %s", index, len(jobs), description, name)
+        else:
+            logging.error("[%s/%s] %s failed: %s\n%s", index, len(jobs), description, name, error)
+            failed.append(name)
 
-            if args.create in ['qtpy', 'all']:
-                logging.debug("Compiling for QtPy ...")
-                # special case - qtpy - syntax is PyQt5
-                with open(py_file_pyqt5, 'r') as file:
-                    filedata = file.read()
+    return failed
 
-                # replace the target string
-                filedata = filedata.replace('from PyQt5', 'from qtpy')
 
-                with open(py_file_qtpy, 'w+') as file:
-                    # write the file out again
-                    file.write(filedata)
+def run_process(args, steps=BUILD_STEPS):
+    """Process qrc files. Returns names of palettes which failed to build.
 
-                if args.create not in ['pyqt5']:
-                    os.remove(py_file_pyqt5)
+    Only `steps` from BUILD_STEPS are run, resources are always compiled.
+    """
+
+    import inspect
+    import qrainbowstyle.palette as source
 
-            if args.create in ['pyqtgraph', 'all']:
-                logging.debug("Compiling for PyQtGraph ...")
-                # special case - pyqtgraph - syntax is PyQt4
-                with open(py_file_pyqt, 'r') as file:
-                    filedata = file.read()
+    palettes = []
+    for name, obj in inspect.getmembers(source):
+        if inspect.isclass(obj) and issubclass(obj, source.BasePalette) and obj is not source.BasePalette:
+            palettes.append(obj)
 
-                # replace the target string
-                filedata = filedata.replace('from PyQt4', 'from pyqtgraph.Qt')
+    logging.debug("Found palettes: " + str(palettes))
 
-                with open(py_file_pyqtgraph, 'w+') as file:
-                    # write the file out again
-                    file.write(filedata)
+    # Build steps are skipped when their inputs did not change since last build
+    cache = BuildCache(enabled=not args.force)
+
+    if args.svg:
+        steps = [step for step in steps if step not in ('images', 'titlebar_images')]
+
+    shared_dir = os.path.join(STYLES_PATH, SHARED_RESOURCES_DIR)
+    svg_fnames = [f for f in os.listdir(SVG_PATH) if f.endswith('.svg') and f[:-4] not in IMAGE_BLACKLIST]
+    buttons_svg_paths = [os.path.join(path, f) for path in (BUTTONS_NT_PATH, BUTTONS_DARWIN_PATH)
+                         for f in os.listdir(path) if f.endswith('.svg')]
+
+    # Inputs shared by all palettes, sent to build jobs
+    inputs = {
+        'versions': tool_versions(),
+        'scss_digest': files_fingerprint([MAIN_SCSS_FILEPATH, STYLES_SCSS_FILEPATH]),
+        'svg_digests': {f: files_fingerprint([os.path.join(SVG_PATH, f)]) for f in svg_fnames},
+        'buttons_svg_paths': buttons_svg_paths,
+        'buttons_digest': files_fingerprint(buttons_svg_paths),
+        'base_palette_digest': files_fingerprint([os.path.join(SVG_PATH, 'base_palette.svg')]),
+        'shared_rc_dir': os.path.join(shared_dir, 'rc'),
+        'steps': set(steps),
+    }
+
+    # Palettes, and images of every palette, are built in parallel when more than one job is requested
+    pool = None
+    if args.jobs != 1:
+        pool = create_image_pool(args.jobs or None)
+
+    try:
+        if 'qss_template' in steps:
+            logging.debug('Compiling QSS template ...')
+            cache.run('qss_template', [inputs['scss_digest'], inputs['versions'], args.minify],
+                      [QSS_TEMPLATE_FILEPATH], create_qss_template, minify=args.minify)
+        inputs['qss_template'] = read_qss_template()
+
+        os.makedirs(shared_dir, exist_ok=True)
+        open(os.path.join(shared_dir, "__init__.py"), "w+").close()
+
+        jobs = [(palette.__name__, _build_palette, (palette, args, cache, inputs)) for palette in palettes]
+        failed = _run_jobs(jobs, pool, cache, 'QSS')
+
+        # Images are rasterized one by one in the pool, not limited by the number of palettes
+        if 'images' in steps:
+            for palette in palettes:
+                if palette.__name__ in failed:
+                    continue
+                try:
+                    _build_images(palette, cache, inputs, pool)
+                except Exception:
+                    logging.error("Images failed: %s\n%s", palette.__name__, traceback.format_exc())
+                    failed.append(palette.__name__)
+                else:
+                    logging.info("Images: %s", palette.__name__)
+
+        if failed:
+            # rc folders of failed palettes may be incomplete, images are not deduplicated
+            logging.warning("Skipping search for shared images, failed palettes: " + ", ".join(failed))
+        else:
+            # Images identical in all styles are registered once from shared resources
+            logging.debug('Searching for images shared by all styles ...')
+            rc_dirs = [os.path.join(STYLES_PATH, palette.__name__, 'rc') for palette in palettes]
+            shared_images = get_shared_images(rc_dirs)
+            move_shared_images(rc_dirs, inputs['shared_rc_dir'], shared_images)
+
+        jobs = [(SHARED_RESOURCES_DIR, _build_resources, (shared_dir, args, cache, inputs))]
+        jobs += [(palette.__name__, _build_resources,
+                  (os.path.join(STYLES_PATH, palette.__name__), args, cache, inputs, palette))
+                 for palette in palettes if palette.__name__ not in failed]
+        failed += _run_jobs(jobs, pool, cache, 'Resources')
+
+        logging.debug('Generating manifest ...')
+        create_manifest(images='svg' if args.svg else 'png')
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+        cache.save()
+
+    return failed
 
 
 def main(arguments):
@@ -218,25 +446,63 @@ def main(arguments):
                         choices=['pyqt', 'pyqt5', 'pyside', 'pyside2', 'qtpy', 'pyqtgraph', 'qt', 'qt5', 'all'],
                         type=str,
                         help="Choose which one would be generated.")
+    parser.add_argument('--rcc',
+                        action='store_true',
+                        help="Also create binary .rcc files.")
+    parser.add_argument('--rcc-version',
+                        default=2,
+                        choices=RCC_VERSIONS,
+                        type=int,
+                        help="Format version of .rcc files, use 1 for Qt older than 5.8.")
+    parser.add_argument('--compress',
+                        default=COMPRESS_LEVEL,
+                        type=int,
+                        help="zlib compression level of resources, 0 disables compression.")
+    parser.add_argument('--threshold',
+                        default=COMPRESS_THRESHOLD,
+                        type=int,
+                        help="Percent of size which compression has to save to be used.")
+    parser.add_argument('--minify',
+                        action='store_true',
+                        help="Minify QSS files, which makes them faster to parse by Qt.")
+    parser.add_argument('--jobs', '-j',
+                        default=1,
+                        type=int,
+                        help="Number of processes building palettes and images, 0 to use all CPUs.")
+    parser.add_argument('--verify',
+                        action='store_true',
+                        help="Check that QSS files rendered from template are identical to qtsass output.")
+    parser.add_argument('--svg',
+                        action='store_true',
+                        help="Do not create png images, styles load svg images recolored at runtime.")
+    parser.add_argument('--force',
+                        action='store_true',
+                        help="Rebuild all files, even if their inputs did not change.")
     parser.add_argument('--watch', '-w',
                         action='store_true',
-                        help="Watch for file changes.")
+                        help="Watch for file changes and rebuild affected files.")
+    parser.add_argument('--delay',
+                        default=0.5,
+                        type=float,
+                        help="Seconds without file changes before rebuild in watch mode.")
 
     args = parser.parse_args(arguments)
 
     if args.watch:
         path = PACKAGE_PATH
         observer = Observer()
-        handler = QSSFileHandler(parser_args=args)
+        handler = BuildFileHandler(parser_args=args, delay=args.delay)
         observer.schedule(handler, path, recursive=True)
+        observer.start()
+        logging.info('Watching SCSS, SVG and palette files for changes...Press Ctrl+C to exit')
         try:
-            logging.debug('Watching QSS file for changes...Press Ctrl+C to exit')
-            observer.start()
+            while observer.is_alive():
+                time.sleep(1)
         except KeyboardInterrupt:
             observer.stop()
         observer.join()
     else:
-        run_process(args)
+        return 1 if run_process(args) else 0
 
 
 if __name__ == '__main__':
@@ -21,6 +21,7 @@ if sys.platform.startswith("win"):
 extras_require = {
     'develop': ['qtsass', 'watchdog'],
     'docs': ['sphinx', 'sphinx_rtd_theme'],
+    'generator': ['numpy'],
     'example': ['pyqt5', 'pyside2']
 }
 
@@ -42,6 +43,8 @@ setup(
     name='qrainbowstyle',
     version=__version__,
     packages=find_packages(),
+    package_data={'qrainbowstyle': ['svg/*.svg', 'svg/*/*.svg'],
+                  'qrainbowstyle.styles': ['*.json', '*/*.rcc']},
     url='https://github.com/desty2k/QRainbowStyleSheet',
     license='MIT',
     author='Wojciech Wentland',
@@ -0,0 +1,47 @@
+#!python
+# -*- coding: utf-8 -*-
+"""Test search of color system colors."""
+
+# Third party imports
+import pytest
+
+np = pytest.importorskip('numpy')
+
+# Local imports
+from qrainbowstyle.colorsystem import Blue, Gray  # noqa: E402
+from qrainbowstyle.palette import Oceanic  # noqa: E402
+from qrainbowstyle.utils.color_index import (find_color, find_steps, nearest_color, nearest_indices,  # noqa: E402
+                                             normalize_hex, snap_colors, snap_palette)
+
+
+def test_find_color():
+    assert find_color(Gray.B130) == ('Gray', 'B130', Gray.B130.lower())
+    assert find_color('#fff') == ('Gray', 'B150', '#ffffff')
+    assert find_color('#123456') is None
+    assert ('Blue', 'B150', '#ffffff') in find_steps('#FFFFFF')
+
+    with pytest.raises(ValueError):
+        normalize_hex('#12345')
+
+
+def test_nearest_color():
+    assert nearest_color(Blue.B70).distance == pytest.approx(0.0, abs=1e-6)
+    assert nearest_color(Blue.B70)[:2] == ('Blue', 'B70')
+    assert nearest_color('#263238').value == Gray.B20.lower()
+    assert snap_colors([]) == []
+
+
+def test_nearest_indices_in_bulk():
+    indices, distances = nearest_indices(np.random.default_rng(0).random((10000, 3)))
+
+    assert indices.shape == distances.shape == (10000, )
+    assert np.all(distances >= 0)
+
+
+def test_snap_palette():
+    snapped = snap_palette(Oceanic).freeze()
+    colors = [snapped[x] for x in snapped.rgba()]
+
+    assert snapped.name == 'OceanicSnapped'
+    assert colors and all(find_color(x) is not None for x in colors)
+    assert snapped.BORDER_1 == '1px solid {}'.format(snapped.COLOR_BACKGROUND_1)
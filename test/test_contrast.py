@@ -0,0 +1,54 @@
+#!python
+# -*- coding: utf-8 -*-
+"""Test contrast checks of palettes."""
+
+# Third party imports
+import pytest
+
+np = pytest.importorskip('numpy')
+
+# Local imports
+from qrainbowstyle.palette import BasePalette, Oceanic  # noqa: E402
+from qrainbowstyle.utils.contrast import (check_contrast, contrast_matrix, contrast_ratio, distance_matrix,  # noqa: E402
+                                          find_violations, palette_colors, violations)
+from qrainbowstyle.utils.palette_generator import GENERATED_VARIABLES, generate_colors  # noqa: E402
+
+
+def test_contrast_ratio():
+    assert contrast_ratio([0, 0, 0], [1, 1, 1]) == pytest.approx(21.0)
+    assert contrast_ratio([1, 1, 1], [0, 0, 0]) == pytest.approx(21.0)
+    assert contrast_ratio([0.5, 0.5, 0.5], [0.5, 0.5, 0.5]) == pytest.approx(1.0)
+
+
+def test_matrices():
+    colors = palette_colors([Oceanic, Oceanic])
+    ratios = contrast_matrix(colors)
+    distances = distance_matrix(colors)
+
+    assert ratios.shape == distances.shape == (2, colors.shape[1], colors.shape[1])
+    assert np.allclose(ratios, ratios.swapaxes(-1, -2))
+    assert np.allclose(np.diagonal(distances, axis1=1, axis2=2), 0.0)
+
+
+def test_find_violations():
+    palette = type('LowContrast', (BasePalette, ), {
+        'COLOR_BACKGROUND_1': '#777777',
+        'COLOR_TEXT_1': '#888888',
+        'COLOR_TEXT_2': '#000000',
+    })
+
+    found = find_violations([palette, Oceanic])
+
+    assert ('LowContrast', 'COLOR_TEXT_1', 'COLOR_BACKGROUND_1') in [x[:3] for x in found]
+    # missing colors are not checked
+    assert all(x.background != 'COLOR_BACKGROUND_2' for x in found if x.palette == 'LowContrast')
+    assert all(x.foreground != 'COLOR_TEXT_2' for x in found if x.palette == 'LowContrast')
+
+
+def test_check_generated_palettes():
+    colors = generate_colors(['#097d74', '#1a72bb', '#f0f0f0'])
+
+    ratios, checked = check_contrast(colors, roles=GENERATED_VARIABLES)
+
+    assert ratios.shape == (3, len(checked))
+    assert violations(ratios, checked).shape == ratios.shape
@@ -0,0 +1,48 @@
+#!python
+# -*- coding: utf-8 -*-
+"""Test frozen palettes."""
+
+# Third party imports
+import pytest
+
+# Local imports
+from qrainbowstyle.palette import FrozenPalette, Oceanic, VARIABLES
+
+
+def test_frozen_palette():
+    frozen = Oceanic.freeze()
+
+    assert Oceanic.freeze() is frozen
+    assert frozen['BORDER_1'] == '1px solid {}'.format(Oceanic.COLOR_BACKGROUND_1)
+    assert frozen.COLOR_ACCENT_5 == Oceanic.COLOR_ACCENT_5
+    assert frozen.rgba('COLOR_BACKGROUND_1') == (0x26, 0x32, 0x38, 255)
+    assert 'OPACITY_TOOLTIP' not in frozen.rgba()
+    assert list(Oceanic.to_dict()) == [x for x in VARIABLES if getattr(Oceanic, x)]
+
+    with pytest.raises(AttributeError):
+        frozen.COLOR_ACCENT_1 = '#000000'
+    with pytest.raises(AttributeError):
+        frozen.MISSING_VARIABLE
+
+    # equal values give equal palettes, usable as cache keys
+    assert FrozenPalette(type('Copy', (Oceanic, ), {})) == frozen
+
+
+def test_frozen_palette_follows_class_changes():
+    palette = type('Changed', (Oceanic, ), {})
+    frozen = palette.freeze()
+
+    palette.COLOR_BACKGROUND_1 = '#abc'
+    changed = palette.freeze()
+
+    assert changed is not frozen
+    assert changed.BORDER_1 == '1px solid #abc'
+    assert changed.rgba('COLOR_BACKGROUND_1') == (0xaa, 0xbb, 0xcc, 255)
+    assert palette.to_dict()['COLOR_BACKGROUND_1'] == '#abc'
+
+
+def test_frozen_palette_qcolors(qapp):
+    frozen = Oceanic.freeze()
+
+    assert frozen.qcolor('COLOR_ACCENT_3').name() == Oceanic.COLOR_ACCENT_3.lower()
+    assert frozen.qcolors() is frozen.qcolors()
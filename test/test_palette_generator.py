@@ -0,0 +1,58 @@
+#!python
+# -*- coding: utf-8 -*-
+"""Test generating palettes from seed colors."""
+
+# Third party imports
+import pytest
+
+np = pytest.importorskip('numpy')
+
+# Local imports
+from qrainbowstyle.palette import BasePalette  # noqa: E402
+from qrainbowstyle.utils.colors import (clip_chroma, hex_to_rgb, in_gamut, oklab_to_oklch, oklab_to_rgb,  # noqa: E402
+                                        oklch_to_oklab, rgb_to_hex, rgb_to_oklab)
+from qrainbowstyle.utils.palette_generator import GENERATED_VARIABLES, generate_colors, generate_palette  # noqa: E402
+
+
+def test_oklab_round_trip():
+    rgb = np.random.default_rng(0).random((1000, 3))
+    assert np.allclose(oklab_to_rgb(rgb_to_oklab(rgb)), rgb)
+    assert rgb_to_hex(hex_to_rgb('#097D74')) == '#097d74'
+    # white has lightness 1 and no chroma
+    assert np.allclose(rgb_to_oklab(hex_to_rgb('#ffffff')), [1, 0, 0], atol=1e-4)
+
+
+def test_clip_chroma():
+    lch = np.array([[0.5, 0.5, 0.0], [0.9, 0.3, 2.0], [0.5, 0.05, 1.0]])
+    clipped = clip_chroma(lch)
+
+    assert in_gamut(oklch_to_oklab(clipped)).all()
+    assert np.allclose(clipped[:, [0, 2]], lch[:, [0, 2]])
+    assert clipped[2, 1] == lch[2, 1]
+
+
+def test_generate_palette():
+    palette = generate_palette('#097D74', name='Teal')
+
+    assert issubclass(palette, BasePalette)
+    assert palette.__name__ == 'Teal'
+    assert palette.COLOR_ACCENT_3 == '#097d74'
+    assert palette.TITLE_BAR_BACKGROUND_COLOR == palette.COLOR_ACCENT_3
+
+    # ramps are monotonic in lightness
+    lightness = oklab_to_oklch(rgb_to_oklab(hex_to_rgb([getattr(palette, x) for x in GENERATED_VARIABLES])))[:, 0]
+    assert np.all(np.diff(lightness[:6]) > 0)
+    assert np.all(np.diff(lightness[6:10]) < 0)
+    assert np.all(np.diff(lightness[10:]) > 0)
+
+    light = generate_palette('#de8044', background='#fafafa', dark=False)
+    assert light.COLOR_BACKGROUND_1 == '#fafafa'
+
+
+def test_generate_colors_batch():
+    accents = np.random.default_rng(1).random((500, 3))
+    colors = generate_colors(accents)
+
+    assert colors.shape == (500, len(GENERATED_VARIABLES), 3)
+    assert np.allclose(colors[:, GENERATED_VARIABLES.index('COLOR_ACCENT_3')], accents)
+    assert np.allclose(colors[7], generate_colors(accents[7:8])[0])
@@ -0,0 +1,31 @@
+#!python
+# -*- coding: utf-8 -*-
+"""Test parsing, scoping and minifying of stylesheets."""
+
+# Local imports
+from qrainbowstyle.utils.qss import minify_qss, parse_qss, scope_selector, scope_stylesheet
+
+
+def test_scope_selector():
+    assert scope_selector('QWidget', 'w') == ['#w QWidget', 'QWidget#w']
+    assert scope_selector('*', 'w') == ['#w *', '#w']
+    assert scope_selector('.QFrame[frameShape="0"]', 'w') == ['#w .QFrame[frameShape="0"]', '.QFrame#w[frameShape="0"]']
+    assert scope_selector('QScrollBar::handle:hover', 'w') == ['#w QScrollBar::handle:hover', 'QScrollBar#w::handle:hover']
+    assert scope_selector('QPushButton#btnClose', 'w') == ['#w QPushButton#btnClose']
+
+
+def test_scope_stylesheet():
+    qss = '/* comment */ QLabel, QFrame[text="{a, b}"] { color: red; }\nQMenu::item { padding: 0px; }'
+    rules = parse_qss(scope_stylesheet(qss, 'w'))
+
+    assert rules == [(['#w QLabel', 'QLabel#w', '#w QFrame[text="{a, b}"]', 'QFrame#w[text="{a, b}"]'], 'color: red;'),
+                     (['#w QMenu::item', 'QMenu#w::item'], 'padding: 0px;')]
+
+
+def test_minify_qss():
+    qss = ('/* comment */\nQLabel  >  QFrame { color: red;\n  border: 1px  solid red; color: blue; }\n'
+           'QMenu { color: green; }\nQMenu { padding: 0px; }\n'
+           'QPushButton { background: url( ":/a  b.png" ); }\nQToolButton {background: url( ":/a  b.png" )}')
+
+    assert minify_qss(qss) == ('QLabel>QFrame{border:1px solid red;color:blue}QMenu{color:green;padding:0px}'
+                               'QPushButton,QToolButton{background:url( ":/a  b.png" )}')
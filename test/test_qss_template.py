@@ -0,0 +1,26 @@
+#!python
+# -*- coding: utf-8 -*-
+"""Test the QSS template renders the same stylesheets as qtsass."""
+
+# Standard library imports
+import os
+
+# Local imports
+from qrainbowstyle import QSS_FILE, STYLES_PATH, getAvailablePalettes, _render_stylesheet
+
+
+def test_render_stylesheet():
+    for palette in getAvailablePalettes():
+        with open(os.path.join(STYLES_PATH, palette.__name__, QSS_FILE), 'r') as fh:
+            qss = fh.read()
+
+        # pre-compiled files start with qtsass header
+        assert qss.endswith(_render_stylesheet(palette))
+
+
+def test_verify_qss_template():
+    from qrainbowstyle.palette import Oceanic
+    from qrainbowstyle.utils.scss import compile_qss_template, verify_qss_template
+
+    for minify in (False, True):
+        assert verify_qss_template(Oceanic, compile_qss_template(minify=minify), minify=minify)
@@ -0,0 +1,21 @@
+#!python
+# -*- coding: utf-8 -*-
+"""Test substitution of palette variable names in text."""
+
+# Local imports
+from qrainbowstyle import rainbowize, rainbowizeMany
+from qrainbowstyle.palette import DarkOrange, Oceanic
+
+
+def test_rainbowize():
+    text = "color: COLOR_ACCENT_1; border: BORDER_1; x: COLOR_ACCENT_1x XCOLOR_TEXT_1 _COLOR_TEXT_1"
+
+    assert rainbowize(text, Oceanic) == ("color: {}; border: 1px solid {}; x: COLOR_ACCENT_1x XCOLOR_TEXT_1 "
+                                         "_COLOR_TEXT_1".format(Oceanic.COLOR_ACCENT_1, Oceanic.COLOR_BACKGROUND_1))
+
+
+def test_rainbowize_many():
+    texts = ["COLOR_BACKGROUND_{}".format(i) for i in range(1, 7)]
+
+    assert rainbowizeMany(texts, DarkOrange) == [getattr(DarkOrange, x) for x in texts]
+    assert rainbowizeMany([], Oceanic) == []
@@ -0,0 +1,61 @@
+#!python
+# -*- coding: utf-8 -*-
+"""Test images rendered for device pixel ratios missing in styles."""
+
+# Standard library imports
+import os
+
+# Third party imports
+import pytest
+from qtpy.QtGui import QImage
+
+# Local imports
+import qrainbowstyle
+from qrainbowstyle.palette import Oceanic
+from qrainbowstyle.utils.rasterizer import ImageCache, rasterize_images
+
+
+def _write(filepath, size):
+    with open(filepath, 'wb') as fh:
+        fh.write(b'x' * size)
+
+
+def test_image_cache_evicts_least_recently_used(tmp_path):
+    cache = ImageCache(str(tmp_path), max_size=250)
+
+    for index, key in enumerate(['a/1.png', 'a/2.png']):
+        cache.put(key, lambda path: _write(path, 100))
+        os.utime(cache.filepath(key), (index, index))
+
+    # reading updates modification time, so 2.png becomes the least recently used file
+    assert cache.get('a/1.png') == b'x' * 100
+    cache.put('b/3.png', lambda path: _write(path, 100))
+
+    assert cache.get('a/2.png') is None
+    assert cache.get('a/1.png') is not None
+    assert cache.get('b/3.png') is not None
+
+    cache.clear()
+    assert cache.get('a/1.png') is None
+
+
+def test_rasterize_images(qapp, tmp_path):
+    cache = ImageCache(str(tmp_path))
+    images = {'checkbox_checked.png': (32, 32), 'button_nt_close.png': (45, 30), 'missing.png': (16, 16)}
+
+    rasterized = rasterize_images(Oceanic, images, 3, cache)
+
+    assert sorted(rasterized) == ['button_nt_close@3x.png', 'checkbox_checked@3x.png']
+    assert QImage.fromData(rasterized['button_nt_close@3x.png']).size().width() == 135
+    assert QImage.fromData(rasterized['checkbox_checked@3x.png']).size().height() == 96
+
+    # images are read from cache
+    assert rasterize_images(Oceanic, images, 3, cache) == rasterized
+
+
+def test_no_images_rendered_for_shipped_ratios(qapp):
+    if not qrainbowstyle._get_screen_dprs(qapp) <= {1, 2}:
+        pytest.skip("screen needs rendered images")
+
+    qrainbowstyle.load_stylesheet(style='oceanic')
+    assert not qrainbowstyle._high_dpi_images
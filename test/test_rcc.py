@@ -0,0 +1,46 @@
+#!python
+# -*- coding: utf-8 -*-
+"""Test compiling resources to .rcc files."""
+
+# Third party imports
+import pytest
+from qtpy.QtCore import QFile, QIODevice, QResource
+
+# Local imports
+from qrainbowstyle.utils.rcc import compile_resources, qt_hash, write_rcc
+
+FILES = {
+    'qss_icons/rc/arrow_up.png': b'\x89PNG' + bytes(range(256)),
+    'qss_icons/rc/empty.png': b'',
+    'qrainbowstyle/style.qss': b'QWidget { color: red; }\n' * 100,
+}
+
+
+def test_qt_hash():
+    assert qt_hash('') == 0
+    assert qt_hash('a') == ord('a')
+    assert qt_hash('ab') == (ord('a') << 4) + ord('b')
+
+
+@pytest.mark.parametrize('version', [1, 2])
+def test_write_rcc(tmp_path, version):
+    rcc_filepath = str(tmp_path / 'style.rcc')
+    root = '/test_rcc_v{}'.format(version)
+    resources = compile_resources(FILES)
+    write_rcc(rcc_filepath, resources, version=version)
+
+    with open(rcc_filepath, 'rb') as fh:
+        data = fh.read()
+    write_rcc(rcc_filepath, compile_resources(FILES), version=version)
+    with open(rcc_filepath, 'rb') as fh:
+        assert fh.read() == data
+
+    assert QResource.registerResource(rcc_filepath, root)
+    try:
+        for path, content in FILES.items():
+            qfile = QFile(':{}/{}'.format(root, path))
+            assert qfile.open(QIODevice.ReadOnly)
+            assert bytes(qfile.readAll()) == content
+            qfile.close()
+    finally:
+        QResource.unregisterResource(rcc_filepath, root)
@@ -0,0 +1,43 @@
+#!python
+# -*- coding: utf-8 -*-
+"""Test caching of loaded stylesheets."""
+
+# Standard library imports
+import sys
+
+# Local imports
+import qrainbowstyle
+from qrainbowstyle.palette import DarkOrange
+
+
+def test_reload_changed_palette(qapp):
+    palette = type('ChangedPalette', (DarkOrange, ), {})
+
+    first = qrainbowstyle.load_stylesheet(style='darkorange', palette=palette)
+    assert qrainbowstyle.load_stylesheet(style='darkorange', palette=palette) is first
+
+    palette.COLOR_ACCENT_3 = '#123456'
+    second = qrainbowstyle.load_stylesheet(style='darkorange', palette=palette)
+    assert '#123456' in second
+    assert '#123456' not in first
+
+
+def test_preloaded_stylesheet(qapp):
+    loaded = qrainbowstyle.load_stylesheet(style='oceanic')
+
+    qrainbowstyle.clearStylesheetCache()
+    qrainbowstyle.preloadStylesheet('oceanic').result()
+    assert qrainbowstyle.load_stylesheet(style='oceanic') == loaded
+
+
+def test_evict_shared_resources(qapp, monkeypatch):
+    monkeypatch.setattr(qrainbowstyle, 'STYLESHEET_CACHE_SIZE', 2)
+    qrainbowstyle.clearStylesheetCache()
+
+    palette = type('EvictedPalette', (DarkOrange, ), {})
+    qrainbowstyle.load_stylesheet(style='darkorange', palette=palette)
+    qrainbowstyle.load_stylesheet(style='darkorange')
+    qrainbowstyle.load_stylesheet(style='oceanic')
+
+    # resources of darkorange are still used by its cached stylesheet
+    assert 'qrainbowstyle.styles.DarkOrange.style_rc' in sys.modules
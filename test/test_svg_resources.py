@@ -0,0 +1,52 @@
+#!python
+# -*- coding: utf-8 -*-
+"""Test svg images recolored at load time replace png images of styles."""
+
+# Standard library imports
+import re
+
+# Third party imports
+from qtpy.QtGui import QImage
+
+# Local imports
+from qrainbowstyle import _use_svg_resources, load_stylesheet
+from qrainbowstyle.palette import Oceanic
+from qrainbowstyle.utils.images import get_svg_images
+
+
+def test_get_svg_images():
+    images = get_svg_images(Oceanic)
+
+    assert 'checkbox_checked.svg' in images
+    assert 'button_nt_close.svg' in images
+    for data in images.values():
+        assert not QImage.fromData(data, 'SVG').isNull()
+
+
+def test_use_svg_resources():
+    stylesheet = _use_svg_resources(load_stylesheet(style='oceanic'), Oceanic)
+    urls = re.findall(r'url\("(:/qrainbowstyle_svg/Oceanic_\d+/[^"]+)"\)', stylesheet)
+
+    assert any(url.endswith('/checkbox_checked.svg') for url in urls)
+    for url in urls:
+        assert not QImage(url).isNull()
+
+
+def test_create_custom_theme():
+    from qrainbowstyle import create_custom_theme
+
+    class Custom(Oceanic):
+        COLOR_BACKGROUND_1 = '#ff0000'
+
+    stylesheet = create_custom_theme(Custom)
+    urls = re.findall(r'url\("(:/qrainbowstyle_theme/Custom_\w+/[^"]+)"\)', stylesheet)
+
+    assert urls
+    assert '#ff0000' in stylesheet
+    for url in urls:
+        assert not QImage(url).isNull()
+
+    # changed palette is registered again, the same palette is reused
+    Custom.COLOR_BACKGROUND_1 = '#00ff00'
+    assert create_custom_theme(Custom) != stylesheet
+    assert create_custom_theme(Custom) == create_custom_theme(Custom)
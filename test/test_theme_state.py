@@ -0,0 +1,43 @@
+#!python
+# -*- coding: utf-8 -*-
+"""Test theme state following palette of loaded stylesheet."""
+
+# Third party imports
+from qtpy.QtGui import QColor
+
+# Local imports
+import qrainbowstyle
+from qrainbowstyle.palette import BasePalette, Oceanic
+from qrainbowstyle.utils import ThemeState
+
+
+def test_theme_state_emits_only_on_change(qapp):
+    theme = ThemeState()
+    emitted = []
+    theme.paletteChanged.connect(emitted.append)
+
+    theme.setPalette(Oceanic)
+    assert emitted == [Oceanic]
+    assert theme.color('COLOR_ACCENT_4') == QColor(Oceanic.COLOR_ACCENT_4)
+    assert theme.brush('COLOR_BACKGROUND_1').color() == QColor(Oceanic.COLOR_BACKGROUND_1)
+    assert 'OPACITY_TOOLTIP' not in theme.colors()
+
+    # palette with the same values does not repaint widgets
+    theme.setPalette(type('Copy', (Oceanic, ), {}))
+    assert emitted == [Oceanic]
+    assert theme.palette().__name__ == 'Copy'
+
+    theme.setPalette(type('Changed', (Oceanic, ), {'COLOR_ACCENT_4': '#ff0000'}))
+    assert len(emitted) == 2
+    assert theme.color('COLOR_ACCENT_4') == QColor('#ff0000')
+
+
+def test_current_theme_follows_loaded_palette(qapp):
+    theme = qrainbowstyle.getCurrentTheme()
+    assert qrainbowstyle.getCurrentTheme() is theme
+
+    palette = type('ThemeTestPalette', (BasePalette, ), {'COLOR_ACCENT_4': '#123456'})
+    qrainbowstyle.create_custom_theme(palette)
+
+    assert theme.palette() is palette
+    assert theme.color('COLOR_ACCENT_4') == QColor('#123456')
@@ -0,0 +1,78 @@
+#!python
+# -*- coding: utf-8 -*-
+"""Test animated transitions between palettes."""
+
+# Third party imports
+from qtpy.QtWidgets import QPushButton, QWidget
+from qtpy import QT_VERSION
+
+# Local imports
+import qrainbowstyle
+from qrainbowstyle.palette import LightOrange, Oceanic
+from qrainbowstyle.utils import ThemeTransition
+from qrainbowstyle.utils.qss import scope_stylesheet
+from qrainbowstyle.utils.transition import compile_transition
+
+
+def _stylesheet(palette):
+    return qrainbowstyle._render_stylesheet(palette) + qrainbowstyle._apply_stylesheet_patches(palette, QT_VERSION)
+
+
+def test_compile_transition():
+    render = compile_transition(Oceanic, LightOrange)
+
+    assert render(0.0) == _stylesheet(Oceanic)
+    assert render(1.0) == _stylesheet(LightOrange)
+    assert render(0.5) not in (_stylesheet(Oceanic), _stylesheet(LightOrange))
+
+
+def test_compile_scoped_transition():
+    render = compile_transition(Oceanic, LightOrange, scope="themed")
+
+    assert render(0.0) == scope_stylesheet(_stylesheet(Oceanic), "themed")
+    assert render(1.0) == scope_stylesheet(_stylesheet(LightOrange), "themed")
+
+
+def _run(qtbot, transition):
+    with qtbot.waitSignal(transition.finished, timeout=5000):
+        transition.start()
+
+
+def test_transition(qapp, qtbot):
+    widget = QWidget()
+    QPushButton("button", widget)
+    qtbot.addWidget(widget)
+    widget.show()
+    widget.setStyleSheet(qrainbowstyle.create_custom_theme(Oceanic))
+
+    app_palette = qapp.palette().color(qapp.palette().Window).name()
+
+    # only the widget changes, not the app palette
+    _run(qtbot, ThemeTransition(LightOrange, widget=widget, duration=100))
+    assert qrainbowstyle.getCurrentPalette() is Oceanic
+    assert qapp.palette().color(qapp.palette().Window).name() == app_palette
+    assert widget.styleSheet() == qrainbowstyle._create_custom_stylesheet(LightOrange)
+
+    # large trees are cross-faded
+    transition = ThemeTransition(Oceanic, widget=widget, duration=100, max_widgets=1)
+    _run(qtbot, transition)
+    assert widget.styleSheet() == qrainbowstyle._create_custom_stylesheet(Oceanic)
+    assert not transition.isRunning()
+    assert not [x for x in widget.findChildren(QWidget) if x.isVisible() and not isinstance(x, QPushButton)]
+
+
+def test_transition_restart(qapp, qtbot):
+    widget = QWidget()
+    qtbot.addWidget(widget)
+    qrainbowstyle.create_custom_theme(Oceanic)
+
+    first = ThemeTransition(LightOrange, widget=widget, duration=1000)
+    first.start()
+    first.start()
+    assert first.isRunning()
+
+    # transition of the same widget stops the running one
+    second = ThemeTransition(Oceanic, widget=widget, duration=100)
+    _run(qtbot, second)
+    assert not first.isRunning()
+    assert widget.styleSheet() == qrainbowstyle._create_custom_stylesheet(Oceanic)